@@ -13,6 +13,8 @@ from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_valid
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from strenum import StrEnum
 
+from .redis_codec import RedisCompression, RedisSerializer
+
 SCHEMA_VERSION = "2.0.0"
 
 ai_horde_ci_settings: AIHordeCISettings = AIHordeCISettings()
@@ -234,6 +236,15 @@ class RedisSettings(BaseModel):
     use_pubsub: bool = True
     """Enable pub/sub for cache invalidation across multiple PRIMARY workers."""
 
+    codec_serializer: RedisSerializer = "json"
+    """How values stored in Redis are serialized. 'msgpack' requires the msgpack package."""
+
+    codec_compression: RedisCompression = "none"
+    """How values stored in Redis are compressed. 'zstd' requires zstandard and 'lz4' requires lz4."""
+
+    codec_min_compress_bytes: int = 1024
+    """Serialized values smaller than this many bytes are stored uncompressed."""
+
 
 class AuditSettings(BaseModel):
     """Settings for audit trail persistence."""
@@ -356,6 +367,70 @@ When True, primary_api_url, github_seed, and redis are ignored and a LocalReadOn
     cache_ttl_seconds: int = 60
     """The time-to-live for in memory caches of model reference files, in seconds."""
 
+    stale_while_revalidate_seconds: int = 0
+    """How long after cache_ttl_seconds expires a REPLICA keeps serving its cached category while one background \
+refresh fetches it from the PRIMARY API. Keeps TTL expiry out of the request path. 0 disables."""
+
+    file_watcher_enabled: bool = False
+    """Watch local model reference files for changes (PRIMARY and offline backends) instead of checking each \
+file's mtime on every cache read. Uses native notifications when watchfiles is installed, polling otherwise."""
+
+    file_watcher_poll_interval_seconds: float = 1.0
+    """How often the file watcher polls the model reference files when native notifications are unavailable."""
+
+    file_watcher_force_polling: bool = False
+    """Poll for file changes even when watchfiles is installed (e.g. for network filesystems)."""
+
+    lazy_record_validation: bool = False
+    """Validate model records on first access instead of when a category is loaded. \
+Cuts cold-start time and memory for consumers that only read a handful of records (e.g. REPLICA workers) through \
+get_model/get_models or get_model_reference_view_or_none. Methods returning a whole category as a dict still \
+validate all of its records on first use."""
+
+    lazy_record_background_validation: bool = False
+    """When lazy_record_validation is enabled, also validate every record of a freshly loaded category on a \
+background thread so invalid records are logged early. Has no effect when lazy_record_validation is False."""
+
+    query_result_cache_size: int = 256
+    """Maximum number of query results (pages plus totals) the manager keeps per process for repeated searches. \
+Entries are keyed by the category's cache generation and the query's plan signature, so they are dropped \
+whenever the category is reloaded or invalidated. Set to 0 to disable."""
+
+    query_columnar_snapshots: bool = True
+    """Evaluate numeric range filters, numeric ordering and histograms over NumPy column arrays built once per \
+cache generation. Only takes effect when NumPy is installed; without it (or when False) queries use the \
+pure-Python path, which returns identical results."""
+
+    backend_fetch_max_workers: int = 8
+    """Maximum number of categories a backend fetches concurrently when loading every category (e.g. a cold \
+REPLICA start). Set to 1 to fetch categories one after another."""
+
+    compute_max_workers: int = 4
+    """Threads in the dedicated pool that runs the service's CPU-heavy search and text model group routes, \
+separately from the threadpool that serves the other sync routes."""
+
+    compute_route_max_concurrency: int = 4
+    """Maximum computations of a single search or text model group route admitted at once; further requests \
+wait for a slot."""
+
+    compute_queue_timeout_seconds: float = 5.0
+    """Seconds a search or text model group request waits for a slot before it is answered with 503 and \
+``Retry-After``."""
+
+    http_pool_max_connections: int = 20
+    """Maximum open connections in each shared outbound HTTP client pool (PRIMARY API, pending provider and AI \
+Horde API requests)."""
+
+    http_pool_max_keepalive_connections: int = 10
+    """Maximum idle connections each shared outbound HTTP client pool keeps open for reuse."""
+
+    http_pool_keepalive_expiry: float = 30.0
+    """Seconds an idle pooled connection is kept open before it is closed."""
+
+    http_pool_http2: bool = True
+    """Negotiate HTTP/2 on the shared outbound HTTP client pools. Only takes effect when the ``h2`` package is \
+installed; otherwise the pools use HTTP/1.1 keep-alive."""
+
     legacy_download_retry_max_attempts: int = 3
     """The maximum number of attempts to retry downloading a legacy model reference file."""
 
@@ -376,6 +451,14 @@ If None, REPLICA clients will only use GitHub. Example: https://models.aihorde.n
     enable_github_fallback: bool = True
     """Whether REPLICA clients should fallback to GitHub if PRIMARY API is unavailable."""
 
+    replica_delta_sync: bool = False
+    """Whether REPLICA clients refresh a cached category by fetching only the models changed since their copy \
+(``/model_references/v2/{category}/changes``), falling back to a full fetch when the PRIMARY cannot provide them."""
+
+    change_log_max_entries: int = 1000
+    """How many model writes per category a PRIMARY remembers for the ``changes`` endpoint. Clients further \
+behind than this fetch the whole category instead."""
+
     github_seed_enabled: bool = False
     """Whether PRIMARY mode should seed from GitHub on first initialization if local files don't exist. \
 Only used in PRIMARY mode. If True, will download and convert legacy references once on startup."""
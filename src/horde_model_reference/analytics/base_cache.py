@@ -7,7 +7,6 @@ pattern when cache hydration is enabled.
 
 from __future__ import annotations
 
-import json
 import time
 from abc import ABC, abstractmethod
 from threading import RLock
@@ -18,6 +17,7 @@ from pydantic import BaseModel
 
 from horde_model_reference import horde_model_reference_settings
 from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
+from horde_model_reference.redis_codec import RedisCodec
 
 if TYPE_CHECKING:
     import redis
@@ -52,6 +52,7 @@ class RedisCache[T: BaseModel](ABC):
     _timestamps: dict[str, float]
     _redis_client: redis.Redis[bytes] | None
     _redis_key_prefix: str
+    _codec: RedisCodec
 
     def __new__(cls) -> Self:
         """Singleton pattern matching ModelReferenceManager."""
@@ -67,6 +68,7 @@ class RedisCache[T: BaseModel](ABC):
         self._timestamps = {}
         self._redis_client = None
         self._redis_key_prefix = self._get_cache_key_prefix()
+        self._codec = RedisCodec()
 
         logger.debug(f"Initializing {self.__class__.__name__} with TTL={self._get_ttl()}s")
 
@@ -75,6 +77,7 @@ class RedisCache[T: BaseModel](ABC):
             try:
                 import redis
 
+                self._codec = RedisCodec.from_settings(horde_model_reference_settings.redis)
                 self._redis_client = redis.from_url(
                     horde_model_reference_settings.redis.url,
                     socket_timeout=horde_model_reference_settings.redis.socket_timeout,
@@ -206,8 +209,7 @@ class RedisCache[T: BaseModel](ABC):
 
                 if cached_bytes:
                     model_class = self._get_model_class()
-                    cached_dict = json.loads(cached_bytes.decode("utf-8"))
-                    result = model_class(**cached_dict)
+                    result = model_class.model_validate(self._codec.decode(cached_bytes))
                     logger.debug(f"{self.__class__.__name__} cache hit (Redis): {cache_key}")
                     return result
             except Exception as e:
@@ -307,7 +309,7 @@ class RedisCache[T: BaseModel](ABC):
         if self._redis_client:
             try:
                 redis_key = self._get_redis_key(cache_key)
-                serialized = result.model_dump_json()
+                serialized = self._codec.encode(result.model_dump(mode="json"))
                 self._redis_client.setex(redis_key, self._get_ttl(), serialized)
                 logger.debug(f"Stored in Redis: {cache_key}")
             except Exception as e:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -11,7 +12,8 @@ import httpx
 from loguru import logger
 from pydantic import BaseModel
 
-from horde_model_reference import ReplicateMode
+from horde_model_reference import ReplicateMode, horde_model_reference_settings
+from horde_model_reference.change_log import CategoryChanges
 from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
 from horde_model_reference.model_reference_metadata import CategoryMetadata
 
@@ -45,6 +47,31 @@ class ModelReferenceBackend(ABC):
         """Get the replicate mode of this backend."""
         return self._replicate_mode
 
+    def _fetch_categories_concurrently(
+        self,
+        fetch: Callable[[MODEL_REFERENCE_CATEGORY], dict[str, Any] | None],
+    ) -> dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None]:
+        """Call *fetch* for every category on a bounded thread pool, returning results in category order.
+
+        The pool holds at most ``backend_fetch_max_workers`` threads; with 1 (or less) the categories are fetched
+        serially on the calling thread. If any fetch raises, the exception propagates once the others finish.
+
+        Args:
+            fetch: Fetches one category (typically a bound ``fetch_category`` with fixed keyword arguments).
+
+        Returns:
+            dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None]: Every category mapped to its fetched data.
+
+        """
+        categories = list(MODEL_REFERENCE_CATEGORY)
+        max_workers = min(horde_model_reference_settings.backend_fetch_max_workers, len(categories))
+        if max_workers <= 1:
+            return {category: fetch(category) for category in categories}
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{type(self).__name__}-fetch") as pool:
+            futures = {category: pool.submit(fetch, category) for category in categories}
+            return {category: future.result() for category, future in futures.items()}
+
     @abstractmethod
     def fetch_category(
         self,
@@ -108,7 +135,8 @@ class ModelReferenceBackend(ABC):
         Implementation Requirements:
             - Return a dictionary mapping each category to its data
             - Use `None` values for categories that cannot be fetched
-            - Typically implemented as a loop over [fetch_category()][(c).fetch_category]
+            - Typically implemented as a loop over [fetch_category()][(c).fetch_category]; backends whose
+              fetches are I/O-bound can fan out with `_fetch_categories_concurrently()` instead
 
         Example Implementation:
             ```python
@@ -940,3 +968,34 @@ class ModelReferenceBackend(ABC):
 
         """
         raise NotImplementedError(f"{self.__class__.__name__} does not support async metadata tracking")
+
+    def supports_change_log(self) -> bool:
+        """Check if this backend records per-category model writes for delta sync.
+
+        Backends that do can answer :meth:`get_changes_since`, letting REPLICA clients refresh a category
+        by fetching only the models changed since their copy. Typically only PRIMARY mode backends do.
+
+        Returns:
+            bool: True if :meth:`get_changes_since` is supported, False otherwise.
+
+        """
+        return False
+
+    def get_changes_since(self, category: MODEL_REFERENCE_CATEGORY, since: str | None) -> CategoryChanges:
+        """Get the models created, updated or deleted in a category since a version.
+
+        This is an optional method that change-log-capable backends can implement.
+        Backends without change log support should leave the default implementation.
+
+        Args:
+            category: The category to get changes for.
+            since: A version token previously returned by this method, or None to only get the current version.
+
+        Returns:
+            CategoryChanges: The current version and, if ``complete``, the changed records.
+
+        Raises:
+            NotImplementedError: If the backend does not support a change log.
+
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support a change log")
@@ -6,6 +6,7 @@ It is the source of truth for PRIMARY mode instances and never interacts with Gi
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import copy
 import csv
@@ -28,6 +29,8 @@ from horde_model_reference import (
 )
 from horde_model_reference.audit import AuditOperation, AuditPayload, AuditTrailWriter
 from horde_model_reference.backends.replica_backend_base import ReplicaBackendBase
+from horde_model_reference.change_log import CategoryChanges, ChangeLog
+from horde_model_reference.json_io import dumps_indented, parse_json, read_json_file, write_json_file
 from horde_model_reference.legacy.text_csv_utils import (
     TextCSVRow,
     csv_rows_to_legacy_dict,
@@ -69,6 +72,17 @@ class AllMetadataPopulationResult(BaseModel):
     )
 
 
+def _file_signature(file_path: Path | None) -> tuple[int, int, int] | None:
+    """Return ``(mtime_ns, size, inode)`` for *file_path*, or None if it does not exist."""
+    if file_path is None:
+        return None
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
 class FileSystemBackend(ReplicaBackendBase):
     """Backend that reads/writes model references directly on the local filesystem."""
 
@@ -105,6 +119,9 @@ class FileSystemBackend(ReplicaBackendBase):
         self.base_path = Path(base_path)
         self._metadata_manager = MetadataManager(self.base_path)
         self._audit_writer = audit_writer
+        self._change_log = ChangeLog(max_entries=horde_model_reference_settings.change_log_max_entries)
+        # File signatures as left by the last write recorded in the change log
+        self._change_log_signatures: dict[MODEL_REFERENCE_CATEGORY, tuple[int, int, int] | None] = {}
 
         logger.debug(f"FileSystemBackend initialized with base_path={self.base_path}")
 
@@ -204,6 +221,23 @@ class FileSystemBackend(ReplicaBackendBase):
         self.mark_stale(category)
         logger.debug(f"Marked category {category} as modified")
 
+    def _record_change(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        file_path: Path,
+        model_name: str,
+        *,
+        deleted: bool,
+    ) -> None:
+        """Record a single-model write in the change log served to delta-syncing REPLICAs."""
+        self._change_log.record(category, model_name, deleted=deleted)
+        self._change_log_signatures[category] = _file_signature(file_path)
+
+    def _reset_change_log(self, category: MODEL_REFERENCE_CATEGORY, file_path: Path | None) -> None:
+        """Forget the recorded changes of a category whose file was rewritten as a whole."""
+        self._change_log.reset(category)
+        self._change_log_signatures[category] = _file_signature(file_path)
+
     def _mark_legacy_category_modified(self, category: MODEL_REFERENCE_CATEGORY, legacy_file_path: Path) -> None:
         """Mark a legacy category as modified after a write operation.
 
@@ -239,6 +273,10 @@ class FileSystemBackend(ReplicaBackendBase):
                 target_path=self.base_path,
             )
             logger.debug(f"Synced legacy->v2 for category {category}")
+            self._reset_change_log(
+                category,
+                horde_model_reference_paths.get_model_reference_file_path(category, base_path=self.base_path),
+            )
         except Exception:
             logger.exception(f"Failed to sync legacy->v2 for category {category}; v2 file may be stale")
 
@@ -477,8 +515,7 @@ class FileSystemBackend(ReplicaBackendBase):
 
             try:
                 # All v2 files are JSON format (including text_generation.json)
-                with open(file_path, encoding="utf-8") as f:
-                    data: dict[str, Any] = json.load(f)
+                data: dict[str, Any] = read_json_file(file_path)
 
                 self._store_in_cache(category, data)
                 logger.debug(f"Loaded {category} from {file_path}")
@@ -497,6 +534,10 @@ class FileSystemBackend(ReplicaBackendBase):
     ) -> dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None]:
         """Fetch model reference data for all categories.
 
+        Categories are read one after another: each read holds the backend lock so it never observes a
+        half-finished atomic replace from a concurrent write, and parsing local JSON is GIL-bound, so a
+        thread pool would not shorten the load.
+
         Args:
             force_refresh: If True, bypass cache for all categories.
 
@@ -520,8 +561,9 @@ class FileSystemBackend(ReplicaBackendBase):
     ) -> dict[str, Any] | None:
         """Asynchronously fetch model reference data for a category.
 
-        Note: File I/O is still synchronous as async file I/O doesn't provide
-        significant benefits for small JSON files.
+        The async lock only guards the cache check and the cache update; the file itself is read without
+        holding it, so concurrent calls for different categories overlap their I/O, while concurrent misses for
+        the same category share a single read.
 
         Args:
             category: The category to fetch.
@@ -536,26 +578,35 @@ class FileSystemBackend(ReplicaBackendBase):
             if not (force_refresh or self.should_fetch_data(category)):
                 return self._get_from_cache(category)
 
-            file_path = horde_model_reference_paths.get_model_reference_file_path(
-                category,
-                base_path=self.base_path,
-            )
-            if not file_path or not file_path.exists():
-                logger.debug(f"File not found for {category}: {file_path}")
-                self._store_in_cache(category, None)
-                return None
-            try:
-                async with aiofiles.open(file_path, encoding="utf-8") as f:
-                    content = await f.read()
-                    data: dict[str, Any] = json.loads(content)
+        if force_refresh:
+            return await self._read_category_async(category)
+        return await self._single_flight_async(category, lambda: self._read_category_async(category))
 
-                self._store_in_cache(category, data)
-                logger.debug(f"Loaded {category} from {file_path} asynchronously")
-                return data
-            except (OSError, json.JSONDecodeError) as e:
-                logger.error(f"Failed to read {file_path} asynchronously: {e}")
+    async def _read_category_async(self, category: MODEL_REFERENCE_CATEGORY) -> dict[str, Any] | None:
+        """Read *category* from disk and update the cache."""
+        file_path = horde_model_reference_paths.get_model_reference_file_path(
+            category,
+            base_path=self.base_path,
+        )
+        if not file_path or not file_path.exists():
+            logger.debug(f"File not found for {category}: {file_path}")
+            async with self._async_lock:
+                self._store_in_cache(category, None)
+            return None
+        try:
+            async with aiofiles.open(file_path, "rb") as f:
+                content = await f.read()
+            data: dict[str, Any] = parse_json(content)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to read {file_path} asynchronously: {e}")
+            async with self._async_lock:
                 self._invalidate_cache(category)
-                return None
+            return None
+
+        async with self._async_lock:
+            self._store_in_cache(category, data)
+        logger.debug(f"Loaded {category} from {file_path} asynchronously")
+        return data
 
     @override
     async def fetch_all_categories_async(
@@ -564,17 +615,19 @@ class FileSystemBackend(ReplicaBackendBase):
         httpx_client: httpx.AsyncClient | None = None,
         force_refresh: bool = False,
     ) -> dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None]:
-        """Asynchronously fetch all categories (delegates to sync method)."""
-        result: dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None] = {}
-
-        for category in MODEL_REFERENCE_CATEGORY:
-            result[category] = await self.fetch_category_async(
-                category,
-                httpx_client=httpx_client,
-                force_refresh=force_refresh,
+        """Asynchronously fetch all categories, reading their files concurrently."""
+        results = await asyncio.gather(
+            *(
+                self.fetch_category_async(
+                    category,
+                    httpx_client=httpx_client,
+                    force_refresh=force_refresh,
+                )
+                for category in MODEL_REFERENCE_CATEGORY
             )
+        )
 
-        return result
+        return dict(zip(MODEL_REFERENCE_CATEGORY, results, strict=True))
 
     @override
     def get_category_file_path(self, category: MODEL_REFERENCE_CATEGORY) -> Path | None:
@@ -648,11 +701,10 @@ class FileSystemBackend(ReplicaBackendBase):
                     if is_csv:
                         data = self._read_legacy_csv_to_dict(legacy_file_path)
                     else:
-                        with open(legacy_file_path, encoding="utf-8") as f:
-                            data = cast(dict[str, Any], json.load(f))
+                        data = cast(dict[str, Any], read_json_file(legacy_file_path))
 
                     # Generate JSON string for cache
-                    content = json.dumps(data, indent=2, ensure_ascii=False)
+                    content = dumps_indented(data).decode("utf-8")
                     self._store_legacy_in_cache(category, data, content)
                     logger.debug(f"Loaded legacy CSV for {category} from {legacy_file_path}")
                     return data
@@ -717,10 +769,9 @@ class FileSystemBackend(ReplicaBackendBase):
                     if is_csv:
                         data = self._read_legacy_csv_to_dict(legacy_file_path)
                     else:
-                        with open(legacy_file_path, encoding="utf-8") as f:
-                            data = cast(dict[str, Any], json.load(f))
+                        data = cast(dict[str, Any], read_json_file(legacy_file_path))
                     # Generate JSON string
-                    content = json.dumps(data, indent=2, ensure_ascii=False)
+                    content = dumps_indented(data).decode("utf-8")
                     self._store_legacy_in_cache(category, data, content)
                     logger.debug(f"Loaded legacy CSV string for {category} from {legacy_file_path}")
                     return content
@@ -800,8 +851,7 @@ class FileSystemBackend(ReplicaBackendBase):
             existing_data: dict[str, Any]
             if file_path.exists():
                 try:
-                    with open(file_path, encoding="utf-8") as f:
-                        existing_data = json.load(f)
+                    existing_data = read_json_file(file_path)
                 except json.JSONDecodeError as e:
                     # V2 files should always be valid JSON - surface corruption errors
                     logger.error(
@@ -854,15 +904,7 @@ class FileSystemBackend(ReplicaBackendBase):
             temp_path = file_path.with_suffix(f".tmp.{time.time()}")
             try:
                 # Write to temp file (v2 format is always JSON)
-                with open(temp_path, "w", encoding="utf-8") as f:
-                    json.dump(existing_data, f, indent=2, ensure_ascii=False)
-                    f.flush()
-                    try:
-                        import os
-
-                        os.fsync(f.fileno())
-                    except OSError:
-                        pass
+                write_json_file(temp_path, existing_data, fsync=True)
 
                 # Atomic replace
                 if file_path.exists():
@@ -906,6 +948,7 @@ class FileSystemBackend(ReplicaBackendBase):
                         request_id=request_id,
                     )
 
+                self._record_change(category, file_path, model_name, deleted=False)
                 self._mark_category_modified(category, file_path)
 
             except (OSError, ValueError, TypeError) as e:
@@ -954,8 +997,7 @@ class FileSystemBackend(ReplicaBackendBase):
 
             # Read existing data (v2 format is always JSON, including text_generation)
             try:
-                with open(file_path, encoding="utf-8") as f:
-                    existing_data = json.load(f)
+                existing_data = read_json_file(file_path)
             except json.JSONDecodeError as e:
                 # V2 files should always be valid JSON - surface corruption errors
                 logger.error(
@@ -976,15 +1018,7 @@ class FileSystemBackend(ReplicaBackendBase):
             temp_path = file_path.with_suffix(f".tmp.{time.time()}")
             try:
                 # Write to temp file (v2 format is always JSON)
-                with open(temp_path, "w", encoding="utf-8") as f:
-                    json.dump(existing_data, f, indent=2, ensure_ascii=False)
-                    f.flush()
-                    try:
-                        import os
-
-                        os.fsync(f.fileno())
-                    except OSError:
-                        pass
+                write_json_file(temp_path, existing_data, fsync=True)
 
                 backup_path = file_path.with_suffix(".bak")
                 file_path.replace(backup_path)
@@ -1016,6 +1050,7 @@ class FileSystemBackend(ReplicaBackendBase):
                         request_id=request_id,
                     )
 
+                self._record_change(category, file_path, model_name, deleted=True)
                 self._mark_category_modified(category, file_path)
 
             except (OSError, ValueError, TypeError) as e:
@@ -1027,6 +1062,59 @@ class FileSystemBackend(ReplicaBackendBase):
                 logger.error(f"Failed to delete model {model_name} from {category}: {e}")
                 raise
 
+    @override
+    def supports_change_log(self) -> bool:
+        """Check if backend records model writes for delta sync (always True for PRIMARY filesystem).
+
+        Returns:
+            bool: Always True.
+
+        """
+        return True
+
+    @override
+    def get_changes_since(self, category: MODEL_REFERENCE_CATEGORY, since: str | None) -> CategoryChanges:
+        """Get the models created, updated or deleted in a category since a version.
+
+        Changes are tracked in memory for writes made through :meth:`update_model` and :meth:`delete_model`.
+        If the category file was changed any other way (a legacy write, metadata population, or an edit on
+        disk), earlier versions are reported as incomplete.
+
+        Args:
+            category: The category to get changes for.
+            since: A version token previously returned by this method, or None to only get the current version.
+
+        Returns:
+            CategoryChanges: The current version and, if ``complete``, the current records of upserted models
+                and the names of deleted ones.
+
+        """
+        with self._lock:
+            file_path = horde_model_reference_paths.get_model_reference_file_path(
+                category,
+                base_path=self.base_path,
+            )
+            if _file_signature(file_path) != self._change_log_signatures.get(category):
+                # Never seen, or rewritten outside update_model/delete_model since the last recorded change
+                self._reset_change_log(category, file_path)
+
+            change_set = self._change_log.changes_since(category, since)
+            if not change_set.complete:
+                return CategoryChanges(version=change_set.version, complete=False)
+            if not change_set.upserted and not change_set.deleted:
+                return CategoryChanges(version=change_set.version, complete=True)
+
+            data = self.fetch_category(category) or {}
+            upserted = {name: data[name] for name in change_set.upserted if name in data}
+            # A recorded upsert whose record is gone is reported as a deletion
+            deleted = [*change_set.deleted, *(name for name in change_set.upserted if name not in data)]
+            return CategoryChanges(
+                version=change_set.version,
+                complete=True,
+                upserted=upserted,
+                deleted=sorted(deleted),
+            )
+
     @override
     def supports_legacy_writes(self) -> bool:
         """Check if backend supports legacy format writes.
@@ -1098,8 +1186,7 @@ class FileSystemBackend(ReplicaBackendBase):
             existing_data: dict[str, Any]
             if legacy_file_path.exists():
                 try:
-                    with open(legacy_file_path, encoding="utf-8") as f:
-                        existing_data = json.load(f)
+                    existing_data = read_json_file(legacy_file_path)
                 except (OSError, json.JSONDecodeError) as e:
                     logger.error(f"Failed to read {legacy_file_path}: {e}")
                     raise
@@ -1117,15 +1204,7 @@ class FileSystemBackend(ReplicaBackendBase):
 
             temp_path = target_write_path.with_suffix(f".tmp.{time.time()}")
             try:
-                with open(temp_path, "w", encoding="utf-8") as f:
-                    json.dump(existing_data, f, indent=2, ensure_ascii=False)
-                    f.flush()
-                    try:
-                        import os
-
-                        os.fsync(f.fileno())
-                    except OSError:
-                        pass
+                write_json_file(temp_path, existing_data, fsync=True)
 
                 if target_write_path.exists():
                     backup_path = target_write_path.with_suffix(".bak")
@@ -1245,7 +1324,7 @@ class FileSystemBackend(ReplicaBackendBase):
 
         # Regenerate the full dict for cache
         full_data = csv_rows_to_legacy_dict(existing_rows, with_backend_prefixes=True)
-        content = json.dumps(full_data, indent=2, ensure_ascii=False)
+        content = dumps_indented(full_data).decode("utf-8")
         self._store_legacy_in_cache(category, full_data, content)
 
         record_snapshot = copy.deepcopy(record_dict)
@@ -1330,7 +1409,7 @@ class FileSystemBackend(ReplicaBackendBase):
 
         # Regenerate the full dict for cache
         full_data = csv_rows_to_legacy_dict(existing_rows, with_backend_prefixes=True)
-        content = json.dumps(full_data, indent=2, ensure_ascii=False)
+        content = dumps_indented(full_data).decode("utf-8")
         self._store_legacy_in_cache(category, full_data, content)
 
         # Capture the deleted record for audit
@@ -1418,8 +1497,7 @@ class FileSystemBackend(ReplicaBackendBase):
                 raise FileNotFoundError(f"Legacy category file not found: {legacy_file_path}")
 
             try:
-                with open(legacy_file_path, encoding="utf-8") as f:
-                    existing_data = json.load(f)
+                existing_data = read_json_file(legacy_file_path)
             except (OSError, json.JSONDecodeError) as e:
                 logger.error(f"Failed to read {legacy_file_path}: {e}")
                 raise
@@ -1432,15 +1510,7 @@ class FileSystemBackend(ReplicaBackendBase):
 
             temp_path = target_write_path.with_suffix(f".tmp.{time.time()}")
             try:
-                with open(temp_path, "w", encoding="utf-8") as f:
-                    json.dump(existing_data, f, indent=2, ensure_ascii=False)
-                    f.flush()
-                    try:
-                        import os
-
-                        os.fsync(f.fileno())
-                    except OSError:
-                        pass
+                write_json_file(temp_path, existing_data, fsync=True)
 
                 if target_write_path.exists():
                     backup_path = target_write_path.with_suffix(".bak")
@@ -1520,8 +1590,7 @@ class FileSystemBackend(ReplicaBackendBase):
                 timestamp = int(time.time())
 
             try:
-                with open(file_path, encoding="utf-8") as f:
-                    data: dict[str, Any] = json.load(f)
+                data: dict[str, Any] = read_json_file(file_path)
             except (OSError, json.JSONDecodeError) as e:
                 logger.error(f"Failed to read {file_path} for metadata population: {e}")
                 return 0
@@ -1541,15 +1610,7 @@ class FileSystemBackend(ReplicaBackendBase):
 
             temp_path = file_path.with_suffix(f".tmp.{time.time()}")
             try:
-                with open(temp_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                    f.flush()
-                    try:
-                        import os
-
-                        os.fsync(f.fileno())
-                    except OSError:
-                        pass
+                write_json_file(temp_path, data, fsync=True)
 
                 backup_path = file_path.with_suffix(".bak")
                 file_path.replace(backup_path)
@@ -1559,6 +1620,7 @@ class FileSystemBackend(ReplicaBackendBase):
                     backup_path.unlink()
 
                 logger.info(f"Populated metadata for {models_updated} models in {category}")
+                self._reset_change_log(category, file_path)
                 self._mark_category_modified(category, file_path)
 
                 return models_updated
@@ -3,6 +3,9 @@
 This backend downloads legacy model reference files from GitHub repositories,
 converts them to the new format, and provides them to REPLICA clients as a fallback
 when the PRIMARY API is unavailable.
+
+Re-downloads are conditional: GitHub's ETag for each file is sent back as ``If-None-Match``,
+and a ``304 Not Modified`` answer keeps the file on disk and skips re-converting it.
 """
 
 from __future__ import annotations
@@ -21,6 +24,7 @@ from tenacity import RetryError
 
 from horde_model_reference import ReplicateMode, horde_model_reference_paths, horde_model_reference_settings
 from horde_model_reference.backends.replica_backend_base import ReplicaBackendBase
+from horde_model_reference.http_clients import HTTPClientPool, get_http_client_pool
 from horde_model_reference.http_retry import http_retry_async, http_retry_sync
 from horde_model_reference.legacy.convert_all_legacy_dbs import (
     convert_all_legacy_model_references,
@@ -57,6 +61,7 @@ class GitHubBackend(ReplicaBackendBase):
         retry_max_attempts: int = horde_model_reference_settings.legacy_download_retry_max_attempts,
         retry_backoff_seconds: float = horde_model_reference_settings.legacy_download_retry_backoff_seconds,
         replicate_mode: ReplicateMode = ReplicateMode.REPLICA,
+        http_clients: HTTPClientPool | None = None,
     ) -> None:
         """Initialize the GitHub backend for REPLICA mode.
 
@@ -66,6 +71,8 @@ class GitHubBackend(ReplicaBackendBase):
             retry_max_attempts: Max download retry attempts.
             retry_backoff_seconds: Backoff time between retries.
             replicate_mode: Must be REPLICA. Defaults to REPLICA.
+            http_clients: Pooled HTTP clients for async downloads made without an explicit client.
+                Defaults to the process-wide pool.
 
         Raises:
             ValueError: If replicate_mode is not REPLICA.
@@ -85,10 +92,15 @@ class GitHubBackend(ReplicaBackendBase):
 
         self.retry_max_attempts = retry_max_attempts
         self.retry_backoff_seconds = retry_backoff_seconds
+        self._http_clients = http_clients or get_http_client_pool()
 
         self._references_paths_cache: dict[MODEL_REFERENCE_CATEGORY, Path | None] = {}
         self._times_downloaded: dict[MODEL_REFERENCE_CATEGORY, int] = {}
 
+        # ETags of the legacy files on disk, and the categories whose latest download was a 304.
+        self._etags: dict[MODEL_REFERENCE_CATEGORY, str] = {}
+        self._not_modified_downloads: set[MODEL_REFERENCE_CATEGORY] = set()
+
         for category in MODEL_REFERENCE_CATEGORY:
             file_path = horde_model_reference_paths.get_legacy_model_reference_file_path(
                 category,
@@ -161,6 +173,9 @@ class GitHubBackend(ReplicaBackendBase):
             # Use helper to determine if we need to fetch
             if force_refresh or self.should_fetch_data(category):
                 self._download_and_convert_single(category, overwrite_existing=force_refresh)
+                unchanged = self._reuse_if_not_modified(category)
+                if unchanged is not None:
+                    return unchanged
                 return self._load_converted_from_disk(category)
 
             # Return cached data
@@ -192,6 +207,10 @@ class GitHubBackend(ReplicaBackendBase):
                 # Use helper to determine if we need to fetch
                 if force_refresh or self.should_fetch_data(category):
                     self._download_legacy(category, overwrite_existing=force_refresh)
+                    unchanged = self._reuse_if_not_modified(category)
+                    if unchanged is not None:
+                        result[category] = unchanged
+                        continue
                     convert_legacy_database_by_category(category, self.base_path, self.base_path)
                     result[category] = self._load_converted_from_disk(category)
                 else:
@@ -231,6 +250,9 @@ class GitHubBackend(ReplicaBackendBase):
                     httpx_client,
                     overwrite_existing=force_refresh,
                 )
+                unchanged = self._reuse_if_not_modified(category)
+                if unchanged is not None:
+                    return unchanged
                 convert_legacy_database_by_category(category, self.base_path, self.base_path)
                 return self._load_converted_from_disk(category)
 
@@ -274,14 +296,21 @@ class GitHubBackend(ReplicaBackendBase):
                         )
                     )
 
+            unchanged: list[MODEL_REFERENCE_CATEGORY] = []
             if tasks:
                 await asyncio.gather(*tasks)
-                convert_all_legacy_model_references()
+                unchanged = [c for c in categories_to_download if self._unchanged_since_download(c)]
+                # Converting everything rewrites every converted file, so only skip it if nothing changed.
+                if len(unchanged) < len(categories_to_download):
+                    convert_all_legacy_model_references()
+                    unchanged = []
 
             # Collect results from cache or disk
             result: dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None] = {}
             for category in MODEL_REFERENCE_CATEGORY:
-                if category in categories_to_download:
+                if category in unchanged:
+                    result[category] = self._reuse_if_not_modified(category)
+                elif category in categories_to_download:
                     result[category] = self._load_converted_from_disk(category)
                 else:
                     result[category] = self._get_from_cache(category)
@@ -556,6 +585,8 @@ class GitHubBackend(ReplicaBackendBase):
     ) -> None:
         """Download a single legacy file and convert it.
 
+        Conversion is skipped when GitHub reports the file unchanged and its converted data is cached.
+
         Args:
             category: The category to download and convert.
             overwrite_existing: If True, overwrite existing files.
@@ -563,8 +594,57 @@ class GitHubBackend(ReplicaBackendBase):
         """
         self._download_legacy(category, overwrite_existing=overwrite_existing)
 
+        if self._unchanged_since_download(category):
+            return
+
         convert_legacy_database_by_category(category, self.base_path, self.base_path)
 
+    def _conditional_headers(self, category: MODEL_REFERENCE_CATEGORY, target_file_path: Path) -> dict[str, str]:
+        """Return ``If-None-Match`` for *category* if the file that ETag describes is still on disk."""
+        with self._lock:
+            etag = self._etags.get(category)
+        if etag is None or not target_file_path.exists():
+            return {}
+        return {"If-None-Match": etag}
+
+    def _record_download(self, category: MODEL_REFERENCE_CATEGORY, etag: str | None) -> None:
+        """Remember the ETag (if any) of a freshly downloaded legacy file."""
+        with self._lock:
+            if etag is None:
+                self._etags.pop(category, None)
+            else:
+                self._etags[category] = etag
+
+    def _record_not_modified(self, category: MODEL_REFERENCE_CATEGORY) -> None:
+        """Keep the legacy file and cache after a ``304 Not Modified``, marking them fresh."""
+        with self._lock:
+            self._not_modified_downloads.add(category)
+            if (
+                self._legacy_json_cache.get(category) is not None
+                or self._legacy_json_string_cache.get(category) is not None
+            ):
+                self._mark_legacy_category_fresh(category)
+        logger.debug(f"GitHub reports {category} unchanged, keeping the downloaded file")
+
+    def _unchanged_since_download(self, category: MODEL_REFERENCE_CATEGORY) -> bool:
+        """Return whether the latest download of *category* was a 304 and its converted data is still cached."""
+        with self._lock:
+            return category in self._not_modified_downloads and self._cache.get(category) is not None
+
+    def _reuse_if_not_modified(self, category: MODEL_REFERENCE_CATEGORY) -> dict[str, Any] | None:
+        """Return (and mark fresh) the cached converted data if the latest download of *category* was a 304.
+
+        Returns:
+            dict[str, Any] | None: The cached converted data, or None if it must be (re)converted and loaded.
+
+        """
+        with self._lock:
+            if not self._unchanged_since_download(category):
+                return None
+            data = self._cache.get(category)
+            self._store_in_cache(category, data)
+            return data
+
     def _download_and_convert_all(self, overwrite_existing: bool = False) -> None:
         """Download all legacy files and convert them."""
         for category in MODEL_REFERENCE_CATEGORY:
@@ -593,6 +673,9 @@ class GitHubBackend(ReplicaBackendBase):
             Path | None: Path to the downloaded file, or None on failure.
 
         """
+        with self._lock:
+            self._not_modified_downloads.discard(category)
+
         if not self._download_allowed():
             return self._references_paths_cache.get(category)
 
@@ -624,6 +707,8 @@ class GitHubBackend(ReplicaBackendBase):
 
             data = None
             raw_json_str = None
+            etag: str | None = None
+            headers = self._conditional_headers(category, target_file_path)
             try:
                 for attempt in http_retry_sync(
                     max_attempts=self.retry_max_attempts,
@@ -631,8 +716,11 @@ class GitHubBackend(ReplicaBackendBase):
                     extra_exceptions=(ujson.JSONDecodeError, OSError, ValueError),
                 ):
                     with attempt:
-                        response = requests.get(target_url, timeout=30)
+                        response = requests.get(target_url, headers=headers, timeout=30)
 
+                        if response.status_code == 304 and headers:
+                            self._record_not_modified(category)
+                            return target_file_path
                         if response.status_code != 200:
                             raise OSError(f"Failed to download {category}: HTTP {response.status_code}")
 
@@ -653,6 +741,7 @@ class GitHubBackend(ReplicaBackendBase):
                             raw_json_str = response.content.decode("utf-8")
                             with open(target_file_path, "wb") as f:
                                 f.write(response.content)
+                        etag = response.headers.get("ETag")
 
                 if data is None or raw_json_str is None:
                     raise ValueError(f"Failed to download {category}: No data retrieved")
@@ -663,6 +752,7 @@ class GitHubBackend(ReplicaBackendBase):
 
                 logger.info(f"Downloaded {category} to {target_file_path}")
                 self._references_paths_cache[category] = target_file_path
+                self._record_download(category, etag)
 
                 self._store_legacy_in_cache(category, data, raw_json_str)
                 logger.debug(f"Populated legacy cache for {category} after download")
@@ -685,20 +775,20 @@ class GitHubBackend(ReplicaBackendBase):
 
         Args:
             category: The category to download.
-            httpx_client: Optional httpx async client for downloads.
+            httpx_client: Optional httpx async client for downloads (defaults to the pooled client).
             overwrite_existing: If True, overwrite existing file.
 
         Returns:
             Path | None: Path to the downloaded file, or None on failure.
 
         """
+        with self._lock:
+            self._not_modified_downloads.discard(category)
+
         if not self._download_allowed():
             logger.debug(f"Replicate mode is not REPLICA, skipping download for {category}")
             return self._references_paths_cache.get(category)
 
-        if httpx_client is None:
-            logger.debug("No httpx_client provided, will create a new one for this download")
-
         target_file_path = horde_model_reference_paths.get_legacy_model_reference_file_path(
             category,
             base_path=self.base_path,
@@ -724,6 +814,8 @@ class GitHubBackend(ReplicaBackendBase):
 
         data = None
         content_str = None
+        etag: str | None = None
+        headers = self._conditional_headers(category, target_file_path)
 
         try:
             async for attempt in http_retry_async(
@@ -732,12 +824,12 @@ class GitHubBackend(ReplicaBackendBase):
                 extra_exceptions=(ujson.JSONDecodeError, OSError, ValueError),
             ):
                 with attempt:
-                    if httpx_client is not None:
-                        response = await httpx_client.get(target_url)
-                    else:
-                        async with httpx.AsyncClient() as client:
-                            response = await client.get(target_url)
+                    client = httpx_client if httpx_client is not None else self._http_clients.async_client()
+                    response = await client.get(target_url, headers=headers)
 
+                    if response.status_code == 304 and headers:
+                        self._record_not_modified(category)
+                        return target_file_path
                     if response.status_code != 200:
                         raise OSError(f"Failed to download {category}: HTTP {response.status_code}")
 
@@ -759,6 +851,7 @@ class GitHubBackend(ReplicaBackendBase):
 
                         async with aiofiles.open(target_file_path, "wb") as f:
                             await f.write(content)
+                    etag = response.headers.get("ETag")
 
             if data is None or content_str is None:
                 raise ValueError(f"Failed to download {category}: No data retrieved")
@@ -769,6 +862,7 @@ class GitHubBackend(ReplicaBackendBase):
 
             logger.info(f"Downloaded {category} to {target_file_path}")
             self._references_paths_cache[category] = target_file_path
+            self._record_download(category, etag)
 
             self._store_legacy_in_cache(category, data, content_str)
             logger.debug(f"Populated legacy cache for {category} after async download")
@@ -2,6 +2,15 @@
 
 This backend fetches model references from the PRIMARY server's API,
 with fallback to GitHub if the PRIMARY is unavailable.
+
+Refreshes are conditional: the ETag of each PRIMARY response is remembered and sent back as
+``If-None-Match``, and a ``304 Not Modified`` answer only refreshes the cache timestamp, keeping
+the cached payload without downloading or parsing it again.
+
+With ``delta_sync`` enabled, a cached category is refreshed from the PRIMARY's ``changes`` endpoint instead:
+only the models created, updated or deleted since the cached copy are downloaded and applied to it. The version
+to ask from comes with each full fetch, in the ``X-Model-Reference-Version`` header. Whenever the PRIMARY cannot
+provide a complete delta (or did not send a version), the category is fetched in full as usual.
 """
 
 from __future__ import annotations
@@ -17,6 +26,8 @@ from tenacity import RetryError
 from horde_model_reference import ReplicateMode, horde_model_reference_paths, horde_model_reference_settings
 from horde_model_reference.backends.github_backend import GitHubBackend
 from horde_model_reference.backends.replica_backend_base import ReplicaBackendBase
+from horde_model_reference.change_log import CHANGE_VERSION_HEADER
+from horde_model_reference.http_clients import HTTPClientPool, get_http_client_pool
 from horde_model_reference.http_retry import (
     RetryableHTTPStatusError,
     http_retry_async,
@@ -46,10 +57,13 @@ class HTTPBackend(ReplicaBackendBase):
         primary_api_url: str,
         github_backend: GitHubBackend,
         cache_ttl_seconds: int = 60,
+        stale_while_revalidate_seconds: int | None = None,
         timeout_seconds: int = horde_model_reference_settings.primary_api_timeout,
         retry_max_attempts: int = 3,
         retry_backoff_seconds: float = 1.0,
         enable_github_fallback: bool = horde_model_reference_settings.enable_github_fallback,
+        http_clients: HTTPClientPool | None = None,
+        delta_sync: bool = horde_model_reference_settings.replica_delta_sync,
     ) -> None:
         """Initialize HTTP backend with GitHub fallback.
 
@@ -58,10 +72,14 @@ class HTTPBackend(ReplicaBackendBase):
                 (e.g., "https://models.aihorde.net/api")
             github_backend: GitHub backend to use as fallback
             cache_ttl_seconds: TTL for local cache in seconds
+            stale_while_revalidate_seconds: How long past the TTL cached data is still served while it is
+                refreshed from PRIMARY in the background. None or 0 refreshes in the request path instead.
             timeout_seconds: HTTP request timeout in seconds
             retry_max_attempts: Max retry attempts for PRIMARY API
             retry_backoff_seconds: Backoff time between retries
             enable_github_fallback: Whether to fallback to GitHub if PRIMARY fails
+            http_clients: Pooled HTTP clients for PRIMARY requests. Defaults to the process-wide pool.
+            delta_sync: Refresh cached categories by applying only the changes since the cached copy.
 
         Raises:
             ValueError: If github_backend is not REPLICA mode
@@ -70,7 +88,11 @@ class HTTPBackend(ReplicaBackendBase):
         if github_backend.replicate_mode != ReplicateMode.REPLICA:
             raise ValueError("HTTPBackend requires a GitHubBackend in REPLICA mode as fallback")
 
-        super().__init__(mode=ReplicateMode.REPLICA, cache_ttl_seconds=cache_ttl_seconds)
+        super().__init__(
+            mode=ReplicateMode.REPLICA,
+            cache_ttl_seconds=cache_ttl_seconds,
+            stale_while_revalidate_seconds=stale_while_revalidate_seconds,
+        )
 
         self._primary_api_url = primary_api_url.rstrip("/")
         self._github_backend = github_backend
@@ -78,10 +100,20 @@ class HTTPBackend(ReplicaBackendBase):
         self._retry_max_attempts = retry_max_attempts
         self._retry_backoff_seconds = retry_backoff_seconds
         self._enable_github_fallback = enable_github_fallback
+        self._http_clients = http_clients or get_http_client_pool()
+        self._delta_sync = delta_sync
 
         self._primary_hits = 0
+        self._primary_not_modified = 0
         self._github_fallbacks = 0
 
+        # ETags of the PRIMARY responses currently held in the v2 and legacy caches.
+        self._etags: dict[MODEL_REFERENCE_CATEGORY, str] = {}
+        self._legacy_etags: dict[MODEL_REFERENCE_CATEGORY, str] = {}
+        # PRIMARY change-log versions of the payloads currently held in the v2 cache (delta sync only).
+        self._versions: dict[MODEL_REFERENCE_CATEGORY, str] = {}
+        self._delta_syncs = 0
+
         logger.debug(f"HTTPBackend initialized with PRIMARY at {self._primary_api_url}")
 
     def _category_api_url(self, category: MODEL_REFERENCE_CATEGORY) -> str:
@@ -110,21 +142,216 @@ class HTTPBackend(ReplicaBackendBase):
         except OSError as e:
             logger.warning(f"HTTPBackend failed to persist {category} to disk: {e}")
 
+    def _changes_api_url(self, category: MODEL_REFERENCE_CATEGORY) -> str:
+        """Get the PRIMARY API URL listing the changes to a category."""
+        return f"{self._category_api_url(category)}/changes"
+
+    def _delta_base(self, category: MODEL_REFERENCE_CATEGORY) -> tuple[dict[str, Any] | None, str | None]:
+        """Return the cached payload and its PRIMARY version, or (None, None) if a delta cannot be applied."""
+        if not self._delta_sync:
+            return None, None
+        with self._lock:
+            previous = self._cache.get(category)
+            version = self._versions.get(category)
+        if previous is None or version is None:
+            return None, None
+        return previous, version
+
+    def _parse_changes_response(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        response: httpx.Response,
+    ) -> dict[str, Any] | None:
+        """Return the decoded body of a ``changes`` response, or None if it cannot be used."""
+        if response.status_code != 200:
+            logger.debug(f"PRIMARY API returned {response.status_code} for {category} changes")
+            return None
+        try:
+            payload: dict[str, Any] = response.json()
+        except ValueError as e:
+            logger.warning(f"PRIMARY API returned invalid JSON for {category} changes: {e}")
+            return None
+        if not isinstance(payload.get("version"), str):
+            return None
+        return payload
+
+    def _fetch_changes(self, category: MODEL_REFERENCE_CATEGORY, since: str | None) -> dict[str, Any] | None:
+        """Fetch the changes to *category* since version *since* from PRIMARY (synchronous), or None on failure."""
+        params = {"since": since} if since is not None else {}
+        try:
+            response = self._http_clients.sync_client.get(
+                self._changes_api_url(category),
+                params=params,
+                timeout=self._timeout_seconds,
+            )
+        except httpx.HTTPError as e:
+            logger.debug(f"Failed to fetch {category} changes from PRIMARY: {e}")
+            return None
+        return self._parse_changes_response(category, response)
+
+    async def _fetch_changes_async(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        since: str | None,
+        client: httpx.AsyncClient,
+    ) -> dict[str, Any] | None:
+        """Async counterpart to :meth:`_fetch_changes`."""
+        params = {"since": since} if since is not None else {}
+        try:
+            response = await client.get(self._changes_api_url(category), params=params, timeout=self._timeout_seconds)
+        except httpx.HTTPError as e:
+            logger.debug(f"Failed to fetch {category} changes from PRIMARY: {e}")
+            return None
+        return self._parse_changes_response(category, response)
+
+    def _apply_changes(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        previous: dict[str, Any],
+        changes: dict[str, Any] | None,
+    ) -> dict[str, Any] | None:
+        """Apply a ``changes`` payload to the cached *previous* payload.
+
+        Returns:
+            The updated payload (*previous* itself if nothing changed), or None if the changes are incomplete
+            and the category must be fetched in full.
+
+        """
+        if changes is None or not changes.get("complete"):
+            return None
+        upserted: dict[str, Any] = changes.get("upserted") or {}
+        deleted: list[str] = changes.get("deleted") or []
+
+        data = previous
+        if upserted or deleted:
+            data = dict(previous)
+            for model_name in deleted:
+                data.pop(model_name, None)
+            data.update(upserted)
+            # The held ETag describes the payload before these changes
+            self._forget_etag(category)
+            self._persist_to_disk(category, data)
+            logger.info(f"Applied {len(upserted)} upserts and {len(deleted)} deletions to {category} from PRIMARY")
+
+        with self._lock:
+            self._versions[category] = changes["version"]
+            self._delta_syncs += 1
+        return data
+
+    def _remember_version(self, category: MODEL_REFERENCE_CATEGORY, version: str | None) -> None:
+        """Record (or forget, if unknown) the PRIMARY version of a fully fetched *category*."""
+        with self._lock:
+            if version is None:
+                self._versions.pop(category, None)
+            else:
+                self._versions[category] = version
+
+    def _remember_response_version(self, category: MODEL_REFERENCE_CATEGORY, response: httpx.Response) -> None:
+        """Record the change version a PRIMARY category response carries (delta sync only).
+
+        A full response without the header forgets the held version. A ``304`` without it keeps the held
+        version, since the cached payload it describes is unchanged.
+        """
+        if not self._delta_sync:
+            return
+        version = response.headers.get(CHANGE_VERSION_HEADER)
+        if version is None and response.status_code == 304:
+            return
+        self._remember_version(category, version)
+
     def _legacy_category_api_url(self, category: MODEL_REFERENCE_CATEGORY) -> str:
         """Get the legacy PRIMARY API URL for a category."""
         return f"{self._primary_api_url}/model_references/v1/{category.value}"
 
+    def _conditional_headers(self, category: MODEL_REFERENCE_CATEGORY, *, legacy: bool = False) -> dict[str, str]:
+        """Return ``If-None-Match`` for *category* if we hold the PRIMARY payload that ETag describes."""
+        with self._lock:
+            if legacy:
+                etag = self._legacy_etags.get(category)
+                held = (
+                    self._legacy_json_cache.get(category) is not None
+                    and self._legacy_json_string_cache.get(category) is not None
+                )
+            else:
+                etag = self._etags.get(category)
+                held = self._cache.get(category) is not None
+        if etag is None or not held:
+            return {}
+        return {"If-None-Match": etag}
+
+    def _remember_etag(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        response: httpx.Response,
+        *,
+        legacy: bool = False,
+    ) -> None:
+        """Record (or forget, if absent) the ETag of a full PRIMARY response for *category*."""
+        etags = self._legacy_etags if legacy else self._etags
+        etag = response.headers.get("ETag")
+        with self._lock:
+            if etag is None:
+                etags.pop(category, None)
+            else:
+                etags[category] = etag
+
+    def _forget_etag(self, category: MODEL_REFERENCE_CATEGORY, *, legacy: bool = False) -> None:
+        """Stop revalidating *category*, e.g. because its cache is about to hold GitHub data instead."""
+        with self._lock:
+            (self._legacy_etags if legacy else self._etags).pop(category, None)
+
+    def _cached_if_not_modified(self, category: MODEL_REFERENCE_CATEGORY) -> dict[str, Any] | None:
+        """Return the cached payload the PRIMARY just confirmed unchanged (``304``), or None if it is gone."""
+        with self._lock:
+            data = self._cache.get(category)
+            if data is not None:
+                self._primary_not_modified += 1
+        if data is None:
+            logger.warning(f"PRIMARY API returned 304 for {category} but no cached copy is held")
+        else:
+            logger.debug(f"PRIMARY API reports {category} unchanged, keeping cached copy")
+        return data
+
+    def _cached_legacy_if_not_modified(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """Return the cached legacy payload the PRIMARY just confirmed unchanged, or (None, None) if it is gone."""
+        with self._lock:
+            legacy_dict = self._legacy_json_cache.get(category)
+            legacy_string = self._legacy_json_string_cache.get(category)
+            if legacy_dict is None or legacy_string is None:
+                legacy_dict, legacy_string = None, None
+            else:
+                self._primary_not_modified += 1
+        if legacy_dict is None:
+            logger.warning(f"PRIMARY API returned 304 for legacy {category} but no cached copy is held")
+        else:
+            logger.debug(f"PRIMARY API reports legacy {category} unchanged, keeping cached copy")
+        return legacy_dict, legacy_string
+
     def _fetch_from_primary(self, category: MODEL_REFERENCE_CATEGORY) -> dict[str, Any] | None:
-        """Fetch from PRIMARY API with retries (synchronous)."""
+        """Fetch from PRIMARY API with retries (synchronous).
+
+        Returns the cached payload itself when the PRIMARY answers ``304 Not Modified``.
+        """
         url = self._category_api_url(category)
+        headers = self._conditional_headers(category)
 
         try:
             for attempt in http_retry_sync(
                 max_attempts=self._retry_max_attempts, min_wait=self._retry_backoff_seconds
             ):
                 with attempt:
-                    response = httpx.get(url, timeout=self._timeout_seconds)
-
+                    response = self._http_clients.sync_client.get(
+                        url,
+                        headers=headers,
+                        timeout=self._timeout_seconds,
+                    )
+
+                    if response.status_code == 304 and headers:
+                        self._remember_response_version(category, response)
+                        return self._cached_if_not_modified(category)
                     if response.status_code == 404:
                         logger.debug(f"PRIMARY API returned 404 for {category}")
                         return None
@@ -136,7 +363,10 @@ class HTTPBackend(ReplicaBackendBase):
 
                     data: dict[str, Any] = response.json()
                     logger.info(f"Fetched {category} from PRIMARY API")
-                    self._primary_hits += 1
+                    self._remember_etag(category, response)
+                    self._remember_response_version(category, response)
+                    with self._lock:
+                        self._primary_hits += 1
                     return data
         except RetryError:
             logger.warning(f"Failed to fetch {category} from PRIMARY after {self._retry_max_attempts} attempts")
@@ -155,14 +385,21 @@ class HTTPBackend(ReplicaBackendBase):
 
         """
         url = self._legacy_category_api_url(category)
+        headers = self._conditional_headers(category, legacy=True)
 
         try:
             for attempt in http_retry_sync(
                 max_attempts=self._retry_max_attempts, min_wait=self._retry_backoff_seconds
             ):
                 with attempt:
-                    response = httpx.get(url, timeout=self._timeout_seconds)
-
+                    response = self._http_clients.sync_client.get(
+                        url,
+                        headers=headers,
+                        timeout=self._timeout_seconds,
+                    )
+
+                    if response.status_code == 304 and headers:
+                        return self._cached_legacy_if_not_modified(category)
                     if response.status_code == 404:
                         logger.debug(f"PRIMARY API returned 404 for legacy {category}")
                         return None, None
@@ -175,7 +412,9 @@ class HTTPBackend(ReplicaBackendBase):
                     legacy_string = response.text
                     legacy_dict: dict[str, Any] = response.json()
                     logger.info(f"Fetched legacy {category} from PRIMARY API")
-                    self._primary_hits += 1
+                    self._remember_etag(category, response, legacy=True)
+                    with self._lock:
+                        self._primary_hits += 1
                     return legacy_dict, legacy_string
         except RetryError:
             logger.warning(f"Failed to fetch legacy {category} from PRIMARY after {self._retry_max_attempts} attempts")
@@ -188,16 +427,23 @@ class HTTPBackend(ReplicaBackendBase):
         category: MODEL_REFERENCE_CATEGORY,
         client: httpx.AsyncClient,
     ) -> dict[str, Any] | None:
-        """Fetch from PRIMARY API with retries (asynchronous)."""
+        """Fetch from PRIMARY API with retries (asynchronous).
+
+        Returns the cached payload itself when the PRIMARY answers ``304 Not Modified``.
+        """
         url = self._category_api_url(category)
+        headers = self._conditional_headers(category)
 
         try:
             async for attempt in http_retry_async(
                 max_attempts=self._retry_max_attempts, min_wait=self._retry_backoff_seconds
             ):
                 with attempt:
-                    response = await client.get(url, timeout=self._timeout_seconds)
+                    response = await client.get(url, headers=headers, timeout=self._timeout_seconds)
 
+                    if response.status_code == 304 and headers:
+                        self._remember_response_version(category, response)
+                        return self._cached_if_not_modified(category)
                     if response.status_code == 404:
                         logger.debug(f"PRIMARY API returned 404 for {category}")
                         return None
@@ -209,7 +455,10 @@ class HTTPBackend(ReplicaBackendBase):
 
                     data: dict[str, Any] = response.json()
                     logger.info(f"Fetched {category} from PRIMARY API (async)")
-                    self._primary_hits += 1
+                    self._remember_etag(category, response)
+                    self._remember_response_version(category, response)
+                    with self._lock:
+                        self._primary_hits += 1
                     return data
         except RetryError:
             logger.warning(f"Failed to fetch {category} from PRIMARY async after {self._retry_max_attempts} attempts")
@@ -229,14 +478,17 @@ class HTTPBackend(ReplicaBackendBase):
 
         """
         url = self._legacy_category_api_url(category)
+        headers = self._conditional_headers(category, legacy=True)
 
         try:
             async for attempt in http_retry_async(
                 max_attempts=self._retry_max_attempts, min_wait=self._retry_backoff_seconds
             ):
                 with attempt:
-                    response = await client.get(url, timeout=self._timeout_seconds)
+                    response = await client.get(url, headers=headers, timeout=self._timeout_seconds)
 
+                    if response.status_code == 304 and headers:
+                        return self._cached_legacy_if_not_modified(category)
                     if response.status_code == 404:
                         logger.debug(f"PRIMARY API returned 404 for legacy {category}")
                         return None, None
@@ -249,7 +501,9 @@ class HTTPBackend(ReplicaBackendBase):
                     legacy_string = response.text
                     legacy_dict: dict[str, Any] = response.json()
                     logger.info(f"Fetched legacy {category} from PRIMARY API (async)")
-                    self._primary_hits += 1
+                    self._remember_etag(category, response, legacy=True)
+                    with self._lock:
+                        self._primary_hits += 1
                     return legacy_dict, legacy_string
         except RetryError:
             logger.warning(
@@ -278,25 +532,45 @@ class HTTPBackend(ReplicaBackendBase):
             Model reference data or None
 
         """
-        # Use helper to determine if we need to fetch
-        if force_refresh or self.should_fetch_data(category):
-            data = self._fetch_from_primary(category)
+        # Use helper to determine if we need to fetch; concurrent misses share one refresh
+        if force_refresh:
+            return self._refresh_category(category, force_refresh=True)
+        if self.should_fetch_data(category):
+            return self._single_flight(category, lambda: self._refresh_category(category, force_refresh=False))
 
-            if data is not None:
-                # The GitHub fallback writes converted files itself; persist PRIMARY hits too.
-                self._persist_to_disk(category, data)
-            elif self._enable_github_fallback:
-                logger.info(f"Falling back to GitHub for {category}")
-                self._github_fallbacks += 1
-                data = self._github_backend.fetch_category(category, force_refresh=force_refresh)
+        # Return cached data
+        return self._get_from_cache(category)
 
+    def _refresh_category(self, category: MODEL_REFERENCE_CATEGORY, *, force_refresh: bool) -> dict[str, Any] | None:
+        """Fetch *category* from PRIMARY (falling back to GitHub) and cache the result."""
+        delta_base, since = self._delta_base(category)
+        if delta_base is not None:
+            data = self._apply_changes(category, delta_base, self._fetch_changes(category, since))
             if data is not None:
                 self._store_in_cache(category, data)
+                return data
 
-            return data
+        with self._lock:
+            previous = self._cache.get(category)
+        data = self._fetch_from_primary(category)
 
-        # Return cached data
-        return self._get_from_cache(category)
+        if data is not None:
+            # The GitHub fallback writes converted files itself; persist PRIMARY hits too.
+            # A 304 hands back the cached payload, which is already on disk.
+            if data is not previous:
+                self._persist_to_disk(category, data)
+        elif self._enable_github_fallback:
+            logger.info(f"Falling back to GitHub for {category}")
+            with self._lock:
+                self._github_fallbacks += 1
+            self._forget_etag(category)
+            self._remember_version(category, None)
+            data = self._github_backend.fetch_category(category, force_refresh=force_refresh)
+
+        if data is not None:
+            self._store_in_cache(category, data)
+
+        return data
 
     @override
     def fetch_all_categories(
@@ -304,13 +578,14 @@ class HTTPBackend(ReplicaBackendBase):
         *,
         force_refresh: bool = False,
     ) -> dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None]:
-        """Fetch all categories from PRIMARY API with GitHub fallback."""
-        result: dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None] = {}
-
-        for category in MODEL_REFERENCE_CATEGORY:
-            result[category] = self.fetch_category(category, force_refresh=force_refresh)
+        """Fetch all categories from PRIMARY API with GitHub fallback, several categories at a time.
 
-        return result
+        Categories are fetched on a bounded thread pool (``backend_fetch_max_workers``), so a cold start takes
+        roughly as long as the slowest category rather than the sum of every round-trip.
+        """
+        return self._fetch_categories_concurrently(
+            lambda category: self.fetch_category(category, force_refresh=force_refresh)
+        )
 
     @override
     async def fetch_category_async(
@@ -324,43 +599,67 @@ class HTTPBackend(ReplicaBackendBase):
 
         Args:
             category: The category to fetch
-            httpx_client: Optional httpx AsyncClient to use for requests
+            httpx_client: Optional httpx AsyncClient to use for requests (defaults to the pooled client)
             force_refresh: If True, bypass local cache
 
         Returns:
             Model reference data or None
 
         """
-        # Use helper to determine if we need to fetch
-        if force_refresh or self.should_fetch_data(category):
-            if httpx_client is None:
-                logger.debug("Creating temporary httpx.AsyncClient for fetch_category_async")
+        # Use helper to determine if we need to fetch; concurrent misses share one refresh
+        client = httpx_client if httpx_client is not None else self._http_clients.async_client()
+        if force_refresh:
+            return await self._refresh_category_async(category, client, force_refresh=True)
+        if self.should_fetch_data(category):
+            return await self._single_flight_async(
+                category,
+                lambda: self._refresh_category_async(category, client, force_refresh=False),
+            )
 
-            if httpx_client is not None:
-                data = await self._fetch_from_primary_async(category, httpx_client)
-            else:
-                async with httpx.AsyncClient() as client:
-                    data = await self._fetch_from_primary_async(category, client)
+        # Return cached data
+        return self._get_from_cache(category)
 
+    async def _refresh_category_async(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        client: httpx.AsyncClient,
+        *,
+        force_refresh: bool,
+    ) -> dict[str, Any] | None:
+        """Async counterpart to :meth:`_refresh_category`."""
+        delta_base, since = self._delta_base(category)
+        if delta_base is not None:
+            changes = await self._fetch_changes_async(category, since, client)
+            data = self._apply_changes(category, delta_base, changes)
             if data is not None:
-                # The GitHub fallback writes converted files itself; persist PRIMARY hits too.
+                self._store_in_cache(category, data)
+                return data
+
+        with self._lock:
+            previous = self._cache.get(category)
+        data = await self._fetch_from_primary_async(category, client)
+
+        if data is not None:
+            # The GitHub fallback writes converted files itself; persist PRIMARY hits too.
+            # A 304 hands back the cached payload, which is already on disk.
+            if data is not previous:
                 self._persist_to_disk(category, data)
-            elif self._enable_github_fallback:
-                logger.info(f"Falling back to GitHub for {category} (async)")
+        elif self._enable_github_fallback:
+            logger.info(f"Falling back to GitHub for {category} (async)")
+            with self._lock:
                 self._github_fallbacks += 1
-                data = await self._github_backend.fetch_category_async(
-                    category,
-                    httpx_client=httpx_client,
-                    force_refresh=force_refresh,
-                )
-
-            if data is not None:
-                self._store_in_cache(category, data)
+            self._forget_etag(category)
+            self._remember_version(category, None)
+            data = await self._github_backend.fetch_category_async(
+                category,
+                httpx_client=client,
+                force_refresh=force_refresh,
+            )
 
-            return data
+        if data is not None:
+            self._store_in_cache(category, data)
 
-        # Return cached data
-        return self._get_from_cache(category)
+        return data
 
     @override
     async def fetch_all_categories_async(
@@ -423,7 +722,9 @@ class HTTPBackend(ReplicaBackendBase):
         # Fallback to GitHub if PRIMARY fails
         if legacy_dict is None and self._enable_github_fallback:
             logger.info(f"Falling back to GitHub for legacy {category}")
-            self._github_fallbacks += 1
+            with self._lock:
+                self._github_fallbacks += 1
+            self._forget_etag(category, legacy=True)
             legacy_dict = self._github_backend.get_legacy_json(category, redownload=redownload)
             # GitHub backend may return string separately, get it if available
             if legacy_dict is not None:
@@ -463,7 +764,9 @@ class HTTPBackend(ReplicaBackendBase):
         # Fallback to GitHub if PRIMARY fails
         if legacy_string is None and self._enable_github_fallback:
             logger.info(f"Falling back to GitHub for legacy {category} string")
-            self._github_fallbacks += 1
+            with self._lock:
+                self._github_fallbacks += 1
+            self._forget_etag(category, legacy=True)
             legacy_string = self._github_backend.get_legacy_json_string(category, redownload=redownload)
             # GitHub backend may return dict separately, get it if available
             if legacy_string is not None and legacy_dict is None:
@@ -482,12 +785,20 @@ class HTTPBackend(ReplicaBackendBase):
         Returns:
             dict containing:
                 - primary_hits: Number of successful PRIMARY API fetches
+                - primary_not_modified: Number of PRIMARY refreshes answered with 304 Not Modified
                 - github_fallbacks: Number of times GitHub fallback was used
+                - delta_syncs: Number of refreshes served by applying PRIMARY changes to the cached copy
+                - coalesced_fetches: Number of callers that joined an in-flight refresh instead of starting one
                 - cache_size: Number of categories in local cache
+                - stale_while_revalidate: Stale serve and background refresh metrics
 
         """
         return {
             "primary_hits": self._primary_hits,
+            "primary_not_modified": self._primary_not_modified,
             "github_fallbacks": self._github_fallbacks,
+            "delta_syncs": self._delta_syncs,
+            "coalesced_fetches": self.coalesced_fetches,
             "cache_size": len(self._cache),
+            "stale_while_revalidate": self.stale_while_revalidate_stats(),
         }
@@ -3,6 +3,11 @@
 This backend wraps a file-based backend and adds distributed caching via Redis.
 It's designed for PRIMARY mode multi-worker deployments where multiple FastAPI
 workers need to share cached model reference data.
+
+Each category has a version counter in Redis that every write increments. Writes made
+through ``update_model``/``delete_model`` publish the new version together with the
+changed record, so other workers patch their in-process copy instead of reloading the
+whole category; a worker that notices a skipped version drops its copy and reloads.
 """
 
 from __future__ import annotations
@@ -11,6 +16,7 @@ import asyncio
 import contextlib
 import json
 import threading
+import time
 from collections.abc import Callable, Iterable
 from pathlib import Path
 from threading import RLock
@@ -30,8 +36,10 @@ except ImportError as _redis_err:
 from horde_model_reference import RedisSettings, ReplicateMode
 from horde_model_reference.backends.base import ModelReferenceBackend
 from horde_model_reference.backends.filesystem_backend import FileSystemBackend
+from horde_model_reference.change_log import CategoryChanges
 from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
 from horde_model_reference.model_reference_metadata import CategoryMetadata
+from horde_model_reference.redis_codec import RedisCodec
 
 
 class RedisBackend(ModelReferenceBackend):
@@ -41,7 +49,10 @@ class RedisBackend(ModelReferenceBackend):
     - File backend is the source of truth
     - Redis provides distributed caching across multiple PRIMARY workers
     - On cache miss, reads from file backend and populates Redis
-    - Pub/sub notifies other workers of cache invalidations
+    - With pub/sub, each worker keeps an in-process copy of every category it has read,
+      tagged with the category's Redis version
+    - Pub/sub carries per-model deltas for writes (on their own channel, alongside a plain invalidation for
+      workers without delta support) and full invalidations for everything else
     - Only usable in PRIMARY mode
     """
 
@@ -49,8 +60,14 @@ class RedisBackend(ModelReferenceBackend):
     _redis_settings: RedisSettings
     _ttl: int
 
+    _codec: RedisCodec
+
     _lock: RLock
     _sync_redis: redis.Redis[bytes]
+    _async_redis: redis.asyncio.Redis[bytes]
+
+    _local: dict[MODEL_REFERENCE_CATEGORY, tuple[int, float, dict[str, Any]]]
+    """In-process copies of categories as ``(version, loaded_at, data)``; only used while pub/sub is running."""
 
     _pubsub: redis.client.PubSub | None
     _pubsub_thread: threading.Thread | None
@@ -73,6 +90,7 @@ class RedisBackend(ModelReferenceBackend):
 
         Raises:
             ValueError: If file_backend is not in PRIMARY mode.
+            ImportError: If the configured Redis codec needs a package that is not installed.
 
         """
         if file_backend.replicate_mode != ReplicateMode.PRIMARY:
@@ -86,11 +104,14 @@ class RedisBackend(ModelReferenceBackend):
         self._file_backend = file_backend
         self._redis_settings = redis_settings
         self._ttl = redis_settings.ttl_seconds or cache_ttl_seconds or 60
+        self._codec = RedisCodec.from_settings(redis_settings)
 
         self._lock = RLock()
+        self._local = {}
 
         try:
             self._sync_redis = self._create_sync_pool()
+            self._async_redis = self._create_async_pool()
             logger.info(f"Redis connection established: {redis_settings.url}")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
@@ -112,10 +133,68 @@ class RedisBackend(ModelReferenceBackend):
             decode_responses=False,
         )
 
+    def _create_async_pool(self) -> redis.asyncio.Redis[bytes]:
+        """Create the asynchronous Redis connection pool shared by every async call."""
+        return redis.asyncio.from_url(
+            self._redis_settings.url,
+            max_connections=self._redis_settings.pool_size,
+            socket_timeout=self._redis_settings.socket_timeout,
+            socket_connect_timeout=self._redis_settings.socket_connect_timeout,
+            decode_responses=False,
+        )
+
+    def _decode_category(self, cached: bytes | str | None) -> dict[str, Any] | None:
+        """Decode a cached category payload, or return None for a miss."""
+        if not cached:
+            return None
+        data: dict[str, Any] = self._codec.decode(cached)
+        return data
+
     def _category_key(self, category: MODEL_REFERENCE_CATEGORY) -> str:
         """Generate Redis key for a category."""
         return f"{self._redis_settings.key_prefix}:category:{category.value}"
 
+    def _version_key(self, category: MODEL_REFERENCE_CATEGORY) -> str:
+        """Generate Redis key for a category's version counter."""
+        return f"{self._redis_settings.key_prefix}:version:{category.value}"
+
+    @staticmethod
+    def _as_version(raw: Any) -> int:  # noqa: ANN401
+        """Parse a version counter read from Redis (a missing counter is version 0)."""
+        return int(raw) if raw else 0
+
+    def _read_version(self, category: MODEL_REFERENCE_CATEGORY) -> int | None:
+        """Return the category's current Redis version, or None if Redis could not be read."""
+        try:
+            return self._as_version(self._retry_redis_operation(self._sync_redis.get, self._version_key(category)))
+        except Exception as e:
+            logger.warning(f"Failed to read Redis version for {category}: {e}")
+            return None
+
+    def _recall(self, category: MODEL_REFERENCE_CATEGORY) -> dict[str, Any] | None:
+        """Return the in-process copy of *category* if pub/sub is keeping it current and it is within the TTL."""
+        if not self._pubsub_running:
+            return None
+        with self._lock:
+            entry = self._local.get(category)
+        if entry is None or time.time() - entry[1] >= self._ttl:
+            return None
+        return entry[2]
+
+    def _remember(self, category: MODEL_REFERENCE_CATEGORY, version: int | None, data: dict[str, Any]) -> None:
+        """Keep *data* as the in-process copy of *category* at *version*, unless a newer copy is already held."""
+        if version is None or not self._pubsub_running:
+            return
+        with self._lock:
+            current = self._local.get(category)
+            if current is None or current[0] <= version:
+                self._local[category] = (version, time.time(), data)
+
+    def _forget(self, category: MODEL_REFERENCE_CATEGORY) -> None:
+        """Drop the in-process copy of *category*."""
+        with self._lock:
+            self._local.pop(category, None)
+
     def _legacy_metadata_key(self, category: MODEL_REFERENCE_CATEGORY) -> str:
         """Generate Redis key for legacy metadata."""
         return f"{self._redis_settings.key_prefix}:meta:legacy:{category.value}"
@@ -128,12 +207,20 @@ class RedisBackend(ModelReferenceBackend):
         """Get the Redis pub/sub channel for invalidations."""
         return f"{self._redis_settings.key_prefix}:invalidate"
 
+    def _delta_channel(self) -> str:
+        """Get the Redis pub/sub channel for per-model write deltas.
+
+        Deltas are kept off the invalidation channel, where workers without delta support expect bare category
+        names.
+        """
+        return f"{self._redis_settings.key_prefix}:delta"
+
     def _setup_pubsub(self) -> None:
         """Set up pub/sub for cache invalidation events."""
         try:
             self._pubsub = self._sync_redis.pubsub(ignore_subscribe_messages=True)
             channel = self._invalidation_channel()
-            self._pubsub.subscribe(channel)
+            self._pubsub.subscribe(channel, self._delta_channel())
 
             self._pubsub_running = True
             self._pubsub_thread = threading.Thread(
@@ -160,6 +247,7 @@ class RedisBackend(ModelReferenceBackend):
             )
             if not isinstance(messages, Iterable):
                 raise ValueError("Expected iterable from pubsub.listen()")
+            delta_channel = self._delta_channel()
             for message in messages:
                 if not self._pubsub_running:
                     break
@@ -168,8 +256,18 @@ class RedisBackend(ModelReferenceBackend):
                     try:
                         data = message["data"]
                         category_str = data.decode("utf-8") if isinstance(data, bytes) else str(data)
+                        channel = message["channel"]
+                        if (channel.decode("utf-8") if isinstance(channel, bytes) else channel) == delta_channel:
+                            self._apply_delta(json.loads(category_str))
+                            continue
+
                         category = MODEL_REFERENCE_CATEGORY(category_str)
+                        if self._local_copy_is_current(category):
+                            logger.debug(f"Ignoring invalidation for {category}: in-process copy is current")
+                            continue
+
                         logger.debug(f"Received invalidation for {category} from another worker")
+                        self._forget(category)
 
                         key = self._category_key(category)
                         try:
@@ -188,12 +286,98 @@ class RedisBackend(ModelReferenceBackend):
         finally:
             logger.debug("Redis pub/sub listener stopped")
 
+    def _local_copy_is_current(self, category: MODEL_REFERENCE_CATEGORY) -> bool:
+        """Return whether the in-process copy of *category* is at the version currently stored in Redis.
+
+        A write publishes a plain invalidation next to its delta for workers without delta support. A worker that
+        already applied the delta (or made the write) skips that invalidation; a real one always bumps the version.
+        """
+        with self._lock:
+            entry = self._local.get(category)
+        return entry is not None and entry[0] == self._read_version(category)
+
+    def _apply_delta(self, delta: dict[str, Any]) -> None:
+        """Apply a per-model change published by a worker's write to the in-process copy.
+
+        The delta applies only on top of the version just before it; a copy that is already at (or past)
+        the delta's version is left alone, and a copy that missed a version is dropped so the next fetch
+        reloads it.
+        """
+        category = MODEL_REFERENCE_CATEGORY(delta["category"])
+        version = int(delta["version"])
+        applied = False
+
+        with self._lock:
+            entry = self._local.get(category)
+            if entry is not None and entry[0] >= version:
+                return
+            if entry is not None and entry[0] == version - 1:
+                models = dict(entry[2])
+                if delta["op"] == "delete":
+                    models.pop(delta["model"], None)
+                else:
+                    models[delta["model"]] = delta["record"]
+                self._local[category] = (version, time.time(), models)
+                applied = True
+            else:
+                self._local.pop(category, None)
+
+        if applied:
+            logger.debug(f"Applied {delta['op']} of {delta['model']} to {category} (version {version})")
+        else:
+            logger.debug(f"No in-process copy of {category} at version {version - 1}; reloading on next fetch")
+            self._file_backend.mark_stale(category)
+        self._notify_invalidation(category)
+
+    def _publish_change(self, category: MODEL_REFERENCE_CATEGORY, model_name: str, *, deleted: bool) -> None:
+        """Store a written category under a new version and publish the per-model delta to the other workers.
+
+        Falls back to a full invalidation (:meth:`mark_stale`) when the written data or Redis is unavailable.
+        """
+        try:
+            data = self._file_backend.fetch_category(category)
+        except Exception as e:
+            logger.warning(f"Failed to read back {category} after writing {model_name}: {e}")
+            data = None
+        if data is None or (not deleted and model_name not in data):
+            self.mark_stale(category)
+            return
+
+        try:
+            pipe = self._sync_redis.pipeline(transaction=True)
+            pipe.incr(self._version_key(category))
+            pipe.setex(self._category_key(category), self._ttl, self._codec.encode(data))
+            version = int(pipe.execute()[0])
+        except Exception as e:
+            logger.warning(f"Failed to store {category} version in Redis, invalidating instead: {e}")
+            self.mark_stale(category)
+            return
+
+        self._remember(category, version, data)
+
+        if self._redis_settings.use_pubsub:
+            delta = {
+                "category": category.value,
+                "version": version,
+                "op": "delete" if deleted else "upsert",
+                "model": model_name,
+                "record": None if deleted else data[model_name],
+            }
+            try:
+                self._retry_redis_operation(self._sync_redis.publish, self._delta_channel(), json.dumps(delta))
+                self._retry_redis_operation(self._sync_redis.publish, self._invalidation_channel(), category.value)
+                logger.debug(f"Published {delta['op']} of {model_name} in {category} (version {version})")
+            except Exception as e:
+                logger.warning(f"Failed to publish change to {category}: {e}")
+
+        self._notify_invalidation(category)
+
     def _retry_redis_operation(
         self,
-        operation: Callable[..., str | bool | bytes | int | None],
-        *args: str | int | float | None,
-        **kwargs: str | int | float | None,
-    ) -> str | bool | int | bytes | None:
+        operation: Callable[..., str | bool | bytes | int | list[Any] | None],
+        *args: str | bytes | int | float | None,
+        **kwargs: str | bytes | int | float | None,
+    ) -> str | bool | int | bytes | list[Any] | None:
         """Retry a Redis operation with full-jitter exponential backoff."""
 
         @retry(
@@ -202,7 +386,7 @@ class RedisBackend(ModelReferenceBackend):
             retry=retry_if_exception_type(redis.ConnectionError),
             reraise=True,
         )
-        def _execute() -> str | bool | bytes | int | None:
+        def _execute() -> str | bool | bytes | int | list[Any] | None:
             return operation(*args, **kwargs)
 
         return _execute()
@@ -214,11 +398,11 @@ class RedisBackend(ModelReferenceBackend):
         *,
         force_refresh: bool = False,
     ) -> dict[str, Any] | None:
-        """Fetch from Redis cache, fallback to file backend on miss.
+        """Fetch from the in-process copy or Redis cache, fallback to file backend on miss.
 
         Args:
             category: The category to fetch.
-            force_refresh: If True, bypass Redis cache and fetch from files.
+            force_refresh: If True, bypass the in-process copy and Redis cache and fetch from files.
 
         Returns:
             dict[str, Any] | None: The model reference data.
@@ -226,30 +410,39 @@ class RedisBackend(ModelReferenceBackend):
         """
         key = self._category_key(category)
         data: dict[str, Any] | None = None
+        version: int | None = None
 
         if not force_refresh:
+            data = self._recall(category)
+            if data is not None:
+                logger.debug(f"In-process cache hit for {category}")
+                return data
             try:
-                cached = self._retry_redis_operation(self._sync_redis.get, key)
-                if cached:
-                    if not isinstance(cached, str):
-                        raise ValueError("Expected str from Redis")
-
-                    data = json.loads(cached)
+                cached_values = self._retry_redis_operation(self._sync_redis.mget, key, self._version_key(category))
+                if not isinstance(cached_values, list):
+                    raise ValueError("Expected list from Redis MGET")
+                cached, raw_version = cached_values
+                version = self._as_version(raw_version)
+                data = self._decode_category(cached)
+                if data is not None:
                     logger.debug(f"Redis cache hit for {category}")
+                    self._remember(category, version, data)
                     return data
                 logger.debug(f"Redis cache miss for {category}")
             except Exception as e:
                 logger.warning(f"Redis fetch failed for {category}, falling back to file: {e}")
+        else:
+            version = self._read_version(category)
 
         data = self._file_backend.fetch_category(category, force_refresh=force_refresh)
 
         if data is not None:
             try:
-                json_data = json.dumps(data)
-                self._retry_redis_operation(self._sync_redis.setex, key, self._ttl, json_data)
+                self._retry_redis_operation(self._sync_redis.setex, key, self._ttl, self._codec.encode(data))
                 logger.debug(f"Populated Redis cache for {category}")
             except Exception as e:
                 logger.warning(f"Failed to cache {category} in Redis: {e}")
+            self._remember(category, version, data)
 
         return data
 
@@ -259,11 +452,59 @@ class RedisBackend(ModelReferenceBackend):
         *,
         force_refresh: bool = False,
     ) -> dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None]:
-        """Fetch all categories, using Redis cache where available."""
-        result: dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None] = {}
+        """Fetch all categories with one ``MGET``, reading misses from files and caching them in one pipeline."""
+        categories = list(MODEL_REFERENCE_CATEGORY)
+        result: dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None] = dict.fromkeys(categories)
+        versions: dict[MODEL_REFERENCE_CATEGORY, int] = {}
 
-        for category in MODEL_REFERENCE_CATEGORY:
-            result[category] = self.fetch_category(category, force_refresh=force_refresh)
+        if not force_refresh:
+            for category in categories:
+                result[category] = self._recall(category)
+        pending = [category for category in categories if result[category] is None]
+        if not pending:
+            logger.debug("In-process cache hit for every category")
+            return result
+
+        payload_keys = [] if force_refresh else [self._category_key(category) for category in pending]
+        try:
+            cached_values = self._retry_redis_operation(
+                self._sync_redis.mget,
+                *payload_keys,
+                *(self._version_key(category) for category in pending),
+            )
+            if not isinstance(cached_values, list):
+                raise ValueError("Expected list from Redis MGET")
+            raw_versions = cached_values[len(payload_keys) :]
+            for category, raw_version in zip(pending, raw_versions, strict=True):
+                versions[category] = self._as_version(raw_version)
+            for category, cached in zip(pending, cached_values[: len(payload_keys)], strict=False):
+                decoded = self._decode_category(cached)
+                result[category] = decoded
+                if decoded is not None:
+                    self._remember(category, versions[category], decoded)
+        except Exception as e:
+            logger.warning(f"Redis MGET failed, falling back to file for every category: {e}")
+
+        misses = [category for category in pending if result[category] is None]
+        if not misses:
+            logger.debug("Redis cache hit for every category")
+            return result
+
+        for category in misses:
+            result[category] = self._file_backend.fetch_category(category, force_refresh=force_refresh)
+
+        to_cache = {category: data for category in misses if (data := result[category]) is not None}
+        if to_cache:
+            try:
+                pipe = self._sync_redis.pipeline(transaction=False)
+                for category, data in to_cache.items():
+                    pipe.setex(self._category_key(category), self._ttl, self._codec.encode(data))
+                pipe.execute()
+                logger.debug(f"Populated Redis cache for {len(to_cache)} categories")
+            except Exception as e:
+                logger.warning(f"Failed to cache {len(to_cache)} categories in Redis: {e}")
+            for category, data in to_cache.items():
+                self._remember(category, versions.get(category), data)
 
         return result
 
@@ -274,12 +515,12 @@ class RedisBackend(ModelReferenceBackend):
         httpx_client: httpx.AsyncClient | None = None,
         force_refresh: bool = False,
     ) -> dict[str, Any] | None:
-        """Asynchronously fetch from Redis, fallback to file backend.
+        """Asynchronously fetch from the in-process copy or Redis, fallback to file backend.
 
         Args:
             category: The category to fetch.
             httpx_client: Optional shared HTTPX client for file backend.
-            force_refresh: If True, bypass Redis cache.
+            force_refresh: If True, bypass the in-process copy and Redis cache.
 
         Returns:
             dict[str, Any] | None: The model reference data.
@@ -287,26 +528,29 @@ class RedisBackend(ModelReferenceBackend):
         """
         key = self._category_key(category)
         data: dict[str, Any] | None = None
+        version: int | None = None
 
         if not force_refresh:
-            cached: bytes | None = None
+            data = self._recall(category)
+            if data is not None:
+                logger.debug(f"In-process cache hit for {category} (async)")
+                return data
             try:
-                async with redis.asyncio.from_url(
-                    self._redis_settings.url,
-                    max_connections=self._redis_settings.pool_size,
-                    socket_timeout=self._redis_settings.socket_timeout,
-                    socket_connect_timeout=self._redis_settings.socket_connect_timeout,
-                    decode_responses=False,
-                ) as async_redis:
-                    cached = await async_redis.get(key)
-
-                if cached:
-                    data = json.loads(cached)
+                cached, raw_version = await self._async_redis.mget([key, self._version_key(category)])
+                version = self._as_version(raw_version)
+                data = self._decode_category(cached)
+                if data is not None:
                     logger.debug(f"Redis cache hit for {category} (async)")
+                    self._remember(category, version, data)
                     return data
                 logger.debug(f"Redis cache miss for {category} (async)")
             except Exception as e:
                 logger.warning(f"Async Redis fetch failed for {category}, falling back to file: {e}")
+        else:
+            try:
+                version = self._as_version(await self._async_redis.get(self._version_key(category)))
+            except Exception as e:
+                logger.warning(f"Failed to read Redis version for {category} (async): {e}")
 
         data = await self._file_backend.fetch_category_async(
             category,
@@ -316,18 +560,11 @@ class RedisBackend(ModelReferenceBackend):
 
         if data is not None:
             try:
-                async with redis.asyncio.from_url(
-                    self._redis_settings.url,
-                    max_connections=self._redis_settings.pool_size,
-                    socket_timeout=self._redis_settings.socket_timeout,
-                    socket_connect_timeout=self._redis_settings.socket_connect_timeout,
-                    decode_responses=False,
-                ) as async_redis:
-                    json_data = json.dumps(data)
-                    await async_redis.setex(key, self._ttl, json_data)
+                await self._async_redis.setex(key, self._ttl, self._codec.encode(data))
                 logger.debug(f"Populated Redis cache for {category} (async)")
             except Exception as e:
                 logger.warning(f"Failed to cache {category} in Redis (async): {e}")
+            self._remember(category, version, data)
 
         return data
 
@@ -337,19 +574,66 @@ class RedisBackend(ModelReferenceBackend):
         httpx_client: httpx.AsyncClient | None = None,
         force_refresh: bool = False,
     ) -> dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None]:
-        """Asynchronously fetch all categories from Redis with PRIMARY API fallback."""
-        tasks = [
-            self.fetch_category_async(
-                category,
-                httpx_client=httpx_client,
-                force_refresh=force_refresh,
+        """Asynchronously fetch all categories with one ``MGET`` and one pipelined write-back of misses."""
+        categories = list(MODEL_REFERENCE_CATEGORY)
+        result: dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None] = dict.fromkeys(categories)
+        versions: dict[MODEL_REFERENCE_CATEGORY, int] = {}
+
+        if not force_refresh:
+            for category in categories:
+                result[category] = self._recall(category)
+        pending = [category for category in categories if result[category] is None]
+        if not pending:
+            logger.debug("In-process cache hit for every category (async)")
+            return result
+
+        payload_keys = [] if force_refresh else [self._category_key(category) for category in pending]
+        try:
+            cached_values = await self._async_redis.mget(
+                [*payload_keys, *(self._version_key(category) for category in pending)]
+            )
+            raw_versions = cached_values[len(payload_keys) :]
+            for category, raw_version in zip(pending, raw_versions, strict=True):
+                versions[category] = self._as_version(raw_version)
+            for category, cached in zip(pending, cached_values[: len(payload_keys)], strict=False):
+                decoded = self._decode_category(cached)
+                result[category] = decoded
+                if decoded is not None:
+                    self._remember(category, versions[category], decoded)
+        except Exception as e:
+            logger.warning(f"Async Redis MGET failed, falling back to file for every category: {e}")
+
+        misses = [category for category in pending if result[category] is None]
+        if not misses:
+            logger.debug("Redis cache hit for every category (async)")
+            return result
+
+        fetched = await asyncio.gather(
+            *(
+                self._file_backend.fetch_category_async(
+                    category,
+                    httpx_client=httpx_client,
+                    force_refresh=force_refresh,
+                )
+                for category in misses
             )
-            for category in MODEL_REFERENCE_CATEGORY
-        ]
+        )
+        result.update(zip(misses, fetched, strict=True))
 
-        results = await asyncio.gather(*tasks)
+        to_cache = {category: data for category, data in zip(misses, fetched, strict=True) if data is not None}
+        if to_cache:
+            try:
+                async with self._async_redis.pipeline(transaction=False) as pipe:
+                    for category, data in to_cache.items():
+                        pipe.setex(self._category_key(category), self._ttl, self._codec.encode(data))
+                    await pipe.execute()
+                logger.debug(f"Populated Redis cache for {len(to_cache)} categories (async)")
+            except Exception as e:
+                logger.warning(f"Failed to cache {len(to_cache)} categories in Redis (async): {e}")
+            for category, data in to_cache.items():
+                self._remember(category, versions.get(category), data)
 
-        return dict(zip(MODEL_REFERENCE_CATEGORY, results, strict=False))
+        return result
 
     @override
     def needs_refresh(self, category: MODEL_REFERENCE_CATEGORY) -> bool:
@@ -360,9 +644,19 @@ class RedisBackend(ModelReferenceBackend):
     def _mark_stale_impl(self, category: MODEL_REFERENCE_CATEGORY) -> None:
         """Mark category as stale and invalidate Redis cache.
 
-        Also publishes invalidation event to notify other workers.
+        Also bumps the category version and publishes an invalidation event to notify other workers.
         """
         key = self._category_key(category)
+        self._forget(category)
+
+        try:
+            pipe = self._sync_redis.pipeline(transaction=True)
+            pipe.delete(key)
+            pipe.incr(self._version_key(category))
+            pipe.execute()
+            logger.debug(f"Invalidated Redis cache for {category}")
+        except Exception as e:
+            logger.warning(f"Failed to invalidate Redis cache for {category}: {e}")
 
         if self._redis_settings.use_pubsub:
             try:
@@ -376,12 +670,6 @@ class RedisBackend(ModelReferenceBackend):
             except Exception as e:
                 logger.warning(f"Failed to publish invalidation for {category}: {e}")
 
-        try:
-            self._retry_redis_operation(self._sync_redis.delete, key)
-            logger.debug(f"Invalidated Redis cache for {category}")
-        except Exception as e:
-            logger.warning(f"Failed to invalidate Redis cache for {category}: {e}")
-
         self._file_backend.mark_stale(category)
 
     @override
@@ -432,6 +720,25 @@ class RedisBackend(ModelReferenceBackend):
         """
         return self._file_backend.supports_metadata()
 
+    @override
+    def supports_change_log(self) -> bool:
+        """Check if backend records model writes for delta sync (delegates to file backend).
+
+        Returns:
+            bool: True if file backend supports a change log.
+
+        """
+        return self._file_backend.supports_change_log()
+
+    @override
+    def get_changes_since(self, category: MODEL_REFERENCE_CATEGORY, since: str | None) -> CategoryChanges:
+        """Get the models changed in a category since a version (delegates to file backend).
+
+        Each worker keeps its own change log, so a version issued by another worker, or one that predates a
+        write made by another worker, is reported as incomplete and the client falls back to a full fetch.
+        """
+        return self._file_backend.get_changes_since(category, since)
+
     @override
     def supports_cache_warming(self) -> bool:
         """Check if backend supports cache warming (True for Redis).
@@ -472,7 +779,7 @@ class RedisBackend(ModelReferenceBackend):
         logical_user_id: str | None = None,
         request_id: str | None = None,
     ) -> None:
-        """Update model via file backend, then invalidate Redis cache."""
+        """Update model via file backend, then store the new version in Redis and publish the change."""
         self._file_backend.update_model(
             category,
             model_name,
@@ -481,7 +788,7 @@ class RedisBackend(ModelReferenceBackend):
             request_id=request_id,
         )
 
-        self.mark_stale(category)
+        self._publish_change(category, model_name, deleted=False)
 
     @override
     def delete_model(
@@ -492,7 +799,7 @@ class RedisBackend(ModelReferenceBackend):
         logical_user_id: str | None = None,
         request_id: str | None = None,
     ) -> None:
-        """Delete model via file backend, then invalidate Redis cache."""
+        """Delete model via file backend, then store the new version in Redis and publish the change."""
         self._file_backend.delete_model(
             category,
             model_name,
@@ -500,7 +807,7 @@ class RedisBackend(ModelReferenceBackend):
             request_id=request_id,
         )
 
-        self.mark_stale(category)
+        self._publish_change(category, model_name, deleted=True)
 
     @override
     def warm_cache(self) -> None:
@@ -586,10 +893,9 @@ class RedisBackend(ModelReferenceBackend):
         try:
             cached = self._retry_redis_operation(self._sync_redis.get, key)
             if cached:
-                if not isinstance(cached, str):
-                    raise ValueError("Expected str from Redis")
-                data = json.loads(cached)
-                return CategoryMetadata(**data)
+                if not isinstance(cached, (bytes, str)):
+                    raise ValueError("Expected bytes or str from Redis")
+                return CategoryMetadata(**self._codec.decode(cached))
         except Exception as e:
             logger.warning(f"Redis fetch failed for legacy metadata {category}, falling back to file: {e}")
 
@@ -599,8 +905,8 @@ class RedisBackend(ModelReferenceBackend):
         # Cache the result in Redis
         if metadata is not None:
             try:
-                json_data = json.dumps(metadata.model_dump(mode="json"))
-                self._retry_redis_operation(self._sync_redis.setex, key, self._ttl, json_data)
+                encoded = self._codec.encode(metadata.model_dump(mode="json"))
+                self._retry_redis_operation(self._sync_redis.setex, key, self._ttl, encoded)
             except Exception as e:
                 logger.warning(f"Failed to cache legacy metadata for {category} in Redis: {e}")
 
@@ -636,10 +942,9 @@ class RedisBackend(ModelReferenceBackend):
         try:
             cached = self._retry_redis_operation(self._sync_redis.get, key)
             if cached:
-                if not isinstance(cached, str):
-                    raise ValueError("Expected str from Redis")
-                data = json.loads(cached)
-                return CategoryMetadata(**data)
+                if not isinstance(cached, (bytes, str)):
+                    raise ValueError("Expected bytes or str from Redis")
+                return CategoryMetadata(**self._codec.decode(cached))
         except Exception as e:
             logger.warning(f"Redis fetch failed for v2 metadata {category}, falling back to file: {e}")
 
@@ -649,8 +954,8 @@ class RedisBackend(ModelReferenceBackend):
         # Cache the result in Redis
         if metadata is not None:
             try:
-                json_data = json.dumps(metadata.model_dump(mode="json"))
-                self._retry_redis_operation(self._sync_redis.setex, key, self._ttl, json_data)
+                encoded = self._codec.encode(metadata.model_dump(mode="json"))
+                self._retry_redis_operation(self._sync_redis.setex, key, self._ttl, encoded)
             except Exception as e:
                 logger.warning(f"Failed to cache v2 metadata for {category} in Redis: {e}")
 
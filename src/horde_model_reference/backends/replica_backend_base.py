@@ -7,9 +7,11 @@ and extensible hooks for custom cache validation logic.
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
 from asyncio import Lock as AsyncLock
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from pathlib import Path
 from threading import RLock
 from typing import Any, override
@@ -18,9 +20,21 @@ from loguru import logger
 
 from horde_model_reference import ReplicateMode
 from horde_model_reference.backends.base import ModelReferenceBackend
+from horde_model_reference.file_watcher import FileWatcher
 from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
 
 
+class _InFlightFetch:
+    """A synchronous fetch in progress, whose result every concurrent caller for the category shares."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: dict[str, Any] | None = None
+        self.error: BaseException | None = None
+
+
 class ReplicaBackendBase(ModelReferenceBackend):
     """Base class providing comprehensive caching infrastructure for model reference backends.
 
@@ -50,7 +64,8 @@ class ReplicaBackendBase(ModelReferenceBackend):
 
         1. **Explicit Staleness**: Categories marked via `mark_stale()` or `_invalidate_cache()`
         2. **TTL Expiration**: Time-based expiration if `cache_ttl_seconds` is set
-        3. **File Modification**: Automatic invalidation when source file mtime changes
+        3. **File Modification**: Automatic invalidation when source file mtime changes (checked on every
+           read, or pushed by a `FileWatcher` after `start_file_watching()`)
         4. **Custom Validation**: Extensible via `_additional_cache_validation()` override
 
     Thread Safety:
@@ -58,9 +73,23 @@ class ReplicaBackendBase(ModelReferenceBackend):
             - `_lock`: `RLock` for synchronous operations
             - `_async_lock`: `AsyncLock` for async operations (if needed)
 
+    Request Coalescing:
+        Cache misses are single-flight: while one fetch for a category is in progress, other callers
+        missing the same category wait for and share its result instead of fetching again. This keeps
+        a TTL expiry from turning every concurrent request into a request to the upstream source.
+            - `_fetch_with_cache()` / `_fetch_with_cache_async()` coalesce automatically
+            - `_single_flight()` / `_single_flight_async()` coalesce any other refresh routine
+
+    Stale-While-Revalidate:
+        With `stale_while_revalidate_seconds` set, a category whose TTL expired less than that many
+        seconds ago is still served from the cache while a single background thread refreshes it
+        (via `fetch_category(force_refresh=True)`), so callers never wait on the upstream source just
+        because the TTL elapsed. Explicit staleness (`mark_stale()`) and file changes are not affected.
+        `stale_while_revalidate_stats()` reports stale serves and refresh durations.
+
     Subclass Integration:
         **For V2/Converted Format:**
-            - Use `_fetch_with_cache()` for standard fetch-and-cache pattern
+            - Use `_fetch_with_cache()` / `_fetch_with_cache_async()` for standard fetch-and-cache pattern
             - Call `_get_from_cache()` to retrieve cached v2 data
             - Call `_store_in_cache()` to store fetched v2 data
             - Override `_get_file_path_for_validation()` to enable mtime validation
@@ -115,17 +144,21 @@ class ReplicaBackendBase(ModelReferenceBackend):
         *,
         mode: ReplicateMode = ReplicateMode.REPLICA,
         cache_ttl_seconds: int | None = None,
+        stale_while_revalidate_seconds: int | None = None,
     ) -> None:
         """Configure shared cache tracking for all backends.
 
         Args:
             mode: The replication mode (REPLICA or PRIMARY).
             cache_ttl_seconds: TTL for cache entries in seconds. None means no expiration.
+            stale_while_revalidate_seconds: How long past the TTL expired data may still be served while it is
+                refreshed in the background. None or 0 disables stale serving.
 
         """
         super().__init__(mode=mode)
 
         self._cache_ttl_seconds = cache_ttl_seconds
+        self._stale_while_revalidate_seconds = stale_while_revalidate_seconds or 0
 
         # V2/Converted format cache infrastructure
         self._cache: dict[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None] = {}
@@ -143,6 +176,24 @@ class ReplicaBackendBase(ModelReferenceBackend):
         self._lock = RLock()
         self._async_lock: AsyncLock = AsyncLock()
 
+        # Single-flight bookkeeping for cache misses
+        self._inflight_lock = threading.Lock()
+        self._inflight: dict[MODEL_REFERENCE_CATEGORY, _InFlightFetch] = {}
+        self._inflight_async: dict[MODEL_REFERENCE_CATEGORY, asyncio.Task[dict[str, Any] | None]] = {}
+        self._coalesced_fetches = 0
+
+        # Stale-while-revalidate bookkeeping
+        self._revalidating: set[MODEL_REFERENCE_CATEGORY] = set()
+        self._stale_serves = 0
+        self._revalidations = 0
+        self._revalidation_failures = 0
+        self._revalidation_seconds_total = 0.0
+        self._last_revalidation_seconds: dict[MODEL_REFERENCE_CATEGORY, float] = {}
+
+        # While a file watcher runs, it marks categories stale on mtime changes and reads skip stat()
+        self._file_watcher: FileWatcher | None = None
+        self._watched_paths: dict[Path, tuple[MODEL_REFERENCE_CATEGORY, bool]] = {}
+
     def _mark_category_fresh(self, category: MODEL_REFERENCE_CATEGORY) -> None:
         """Record that we hold a fresh cache entry for *category*.
 
@@ -203,7 +254,8 @@ class ReplicaBackendBase(ModelReferenceBackend):
             1. **Explicit Staleness**: Returns False if category is in `_stale_categories`
             2. **Cache Existence**: Returns False if category has never been cached
             3. **Timestamp Existence**: Returns False if no timestamp recorded
-            4. **TTL Expiration**: Checks if `cache_ttl_seconds` exceeded (calls `mark_stale()` if expired)
+            4. **TTL Expiration**: Checks if `cache_ttl_seconds` exceeded (calls `mark_stale()` if expired, unless
+               the stale-while-revalidate window still covers it, in which case a background refresh is started)
             5. **File Modification**: Compares current file mtime with cached mtime (calls `mark_stale()` if changed)
             6. **Custom Validation**: Calls `_additional_cache_validation()` for subclass-specific checks
 
@@ -243,11 +295,15 @@ class ReplicaBackendBase(ModelReferenceBackend):
         if self._cache_ttl_seconds is not None:
             elapsed = time.time() - last_updated
             if elapsed > self._cache_ttl_seconds:
-                logger.debug(f"Category {category} TTL expired ({elapsed}s > {self._cache_ttl_seconds}s)")
-                self.mark_stale(category)
-                return False
+                if self._serve_stale(category, elapsed):
+                    with self._lock:
+                        self._stale_serves += 1
+                else:
+                    logger.debug(f"Category {category} TTL expired ({elapsed}s > {self._cache_ttl_seconds}s)")
+                    self.mark_stale(category)
+                    return False
 
-        file_path = self._get_file_path_for_validation(category)
+        file_path = None if self._file_watcher_running() else self._get_file_path_for_validation(category)
         if file_path and file_path.exists():
             try:
                 current_mtime = file_path.stat().st_mtime
@@ -311,13 +367,13 @@ class ReplicaBackendBase(ModelReferenceBackend):
             return False
 
         if self._cache_ttl_seconds is not None:
-            cache_stale = (time.time() - last_updated) > self._cache_ttl_seconds
-            if cache_stale:
+            elapsed = time.time() - last_updated
+            if elapsed > self._cache_ttl_seconds and not self._serve_stale(category, elapsed):
                 logger.debug(f"Category {category} cache is stale, needs refresh")
                 self.mark_stale(category)
                 return True
 
-        file_path = self._get_file_path_for_validation(category)
+        file_path = None if self._file_watcher_running() else self._get_file_path_for_validation(category)
         if file_path and file_path.exists():
             try:
                 current_mtime = file_path.stat().st_mtime
@@ -346,6 +402,198 @@ class ReplicaBackendBase(ModelReferenceBackend):
         """Asyncio lock usable by subclasses when coordinating coroutines."""
         return self._async_lock
 
+    @property
+    def coalesced_fetches(self) -> int:
+        """How many cache misses were served by joining another caller's in-flight fetch."""
+        return self._coalesced_fetches
+
+    @property
+    def stale_while_revalidate_seconds(self) -> int:
+        """How long past the TTL expired data may be served while it is refreshed (0 when disabled)."""
+        return self._stale_while_revalidate_seconds
+
+    def stale_while_revalidate_stats(self) -> dict[str, Any]:
+        """Return stale-while-revalidate metrics.
+
+        Returns:
+            dict[str, Any]: With keys:
+                - stale_serves: Cache reads answered with expired data inside the stale window
+                - revalidations: Background refreshes run, including failed ones
+                - revalidation_failures: Background refreshes that raised or returned no data
+                - revalidations_in_progress: Categories currently being refreshed
+                - revalidation_seconds_total: Summed duration of all background refreshes
+                - last_revalidation_seconds: Duration of the latest refresh, per category
+
+        """
+        with self._lock:
+            return {
+                "stale_serves": self._stale_serves,
+                "revalidations": self._revalidations,
+                "revalidation_failures": self._revalidation_failures,
+                "revalidations_in_progress": len(self._revalidating),
+                "revalidation_seconds_total": self._revalidation_seconds_total,
+                "last_revalidation_seconds": {
+                    category.value: seconds for category, seconds in self._last_revalidation_seconds.items()
+                },
+            }
+
+    def _serve_stale(self, category: MODEL_REFERENCE_CATEGORY, elapsed: float) -> bool:
+        """Return whether TTL-expired *category* may still be served, starting a background refresh if so.
+
+        Args:
+            category: The category whose TTL expired.
+            elapsed: Seconds since the category was last cached.
+
+        Returns:
+            bool: True while *elapsed* is inside the stale-while-revalidate window and cached data exists.
+
+        """
+        if self._cache_ttl_seconds is None or not self._stale_while_revalidate_seconds:
+            return False
+        if elapsed > self._cache_ttl_seconds + self._stale_while_revalidate_seconds:
+            return False
+        with self._lock:
+            if self._cache.get(category) is None:
+                return False
+
+        self._schedule_revalidation(category)
+        return True
+
+    def _schedule_revalidation(self, category: MODEL_REFERENCE_CATEGORY) -> None:
+        """Start a background refresh of *category* unless one is already running."""
+        with self._lock:
+            if category in self._revalidating:
+                return
+            self._revalidating.add(category)
+
+        logger.debug(f"Serving stale {category} while revalidating in the background")
+        threading.Thread(
+            target=self._revalidate,
+            args=(category,),
+            name=f"{type(self).__name__}-revalidate-{category.value}",
+            daemon=True,
+        ).start()
+
+    def _revalidate(self, category: MODEL_REFERENCE_CATEGORY) -> None:
+        """Refresh *category* for the stale-while-revalidate window and notify listeners if it changed.
+
+        The refresh joins (or leads) the single-flight fetch for the category. A failed refresh leaves the
+        stale data in place; once the window closes, callers fall back to fetching it themselves.
+        """
+        with self._lock:
+            previous = self._cache.get(category)
+        started = time.perf_counter()
+        data: dict[str, Any] | None = None
+        try:
+            data = self._single_flight(category, lambda: self.fetch_category(category, force_refresh=True))
+        except Exception as e:
+            logger.warning(f"Background revalidation of {category} failed: {e}")
+        finally:
+            duration = time.perf_counter() - started
+            with self._lock:
+                self._revalidating.discard(category)
+                self._revalidations += 1
+                self._revalidation_seconds_total += duration
+                self._last_revalidation_seconds[category] = duration
+                if data is None:
+                    self._revalidation_failures += 1
+
+        logger.debug(f"Revalidated {category} in {duration:.3f}s")
+        if data is not None and data is not previous:
+            # Consumers holding derived copies (e.g. the manager's pydantic records) must reload them.
+            self._notify_invalidation(category)
+
+    @property
+    def file_watcher(self) -> FileWatcher | None:
+        """The running file watcher, if [start_file_watching()][(c).start_file_watching] was called."""
+        return self._file_watcher
+
+    def _file_watcher_running(self) -> bool:
+        """Whether a live file watcher is reporting changes; if its thread has died, mtimes are checked again."""
+        watcher = self._file_watcher
+        return watcher is not None and watcher.running
+
+    def start_file_watching(
+        self,
+        *,
+        poll_interval_seconds: float = 1.0,
+        force_polling: bool = False,
+    ) -> FileWatcher | None:
+        """Watch the category files for changes instead of checking their mtime on every cache read.
+
+        Changes to a category's v2 or legacy file mark it stale, exactly as a detected mtime change would;
+        in exchange, `is_cache_valid()`, `needs_refresh()` and `is_legacy_cache_valid()` no longer touch
+        the filesystem.
+
+        Args:
+            poll_interval_seconds: Poll interval used when native notifications are unavailable.
+            force_polling: Poll even when ``watchfiles`` is installed.
+
+        Returns:
+            FileWatcher | None: The started watcher, or None if this backend has no files to watch.
+
+        """
+        if self._file_watcher is not None:
+            return self._file_watcher
+
+        watched: dict[Path, tuple[MODEL_REFERENCE_CATEGORY, bool]] = {}
+        for category in MODEL_REFERENCE_CATEGORY:
+            file_path = self._get_file_path_for_validation(category)
+            if file_path is not None:
+                watched[file_path.resolve()] = (category, False)
+            legacy_file_path = self._get_legacy_file_path_for_validation(category)
+            if legacy_file_path is not None:
+                watched.setdefault(legacy_file_path.resolve(), (category, True))
+        if not watched:
+            return None
+
+        watcher = FileWatcher(
+            watched,
+            self._on_watched_file_changed,
+            poll_interval_seconds=poll_interval_seconds,
+            force_polling=force_polling,
+        )
+        self._watched_paths = watched
+        watcher.start()
+        self._file_watcher = watcher
+
+        # Catch changes made after a category was cached but before the watcher started
+        for path, (category, legacy) in watched.items():
+            if category in (self._legacy_last_known_mtimes if legacy else self._last_known_mtimes):
+                self._on_watched_file_changed(path)
+        return watcher
+
+    def stop_file_watching(self) -> None:
+        """Stop the file watcher; cache reads go back to checking file mtimes."""
+        watcher, self._file_watcher = self._file_watcher, None
+        if watcher is not None:
+            watcher.stop()
+
+    def _on_watched_file_changed(self, path: Path) -> None:
+        """Mark the category owning *path* stale, unless the change is one this backend already cached."""
+        entry = self._watched_paths.get(path)
+        if entry is None:
+            return
+        category, legacy = entry
+        try:
+            current_mtime: float | None = path.stat().st_mtime
+        except OSError:
+            current_mtime = None
+
+        if legacy:
+            with self._lock:
+                if current_mtime is not None and current_mtime == self._legacy_last_known_mtimes.get(category):
+                    return
+                self._stale_legacy_categories.add(category)
+            logger.debug(f"Watched legacy file {path.name} changed, legacy {category} is stale")
+            return
+
+        with self._lock:
+            if current_mtime is not None and current_mtime == self._last_known_mtimes.get(category):
+                return
+        logger.debug(f"Watched file {path.name} changed, {category} is stale")
+        self.mark_stale(category)
+
     def _set_cache_ttl_seconds(self, ttl_seconds: int | None) -> None:
         """Allow subclasses to tweak TTL after initialization if desired."""
         self._cache_ttl_seconds = ttl_seconds
@@ -392,7 +640,7 @@ class ReplicaBackendBase(ModelReferenceBackend):
         This helper method implements the recommended fetch pattern:
         1. Check cache if not forcing refresh
         2. Return cached data if valid
-        3. Fetch data using provided function
+        3. Fetch data using provided function, or join the fetch already in flight for the category
         4. Store in cache and return
 
         Use this in your fetch_category() implementations to avoid boilerplate.
@@ -420,17 +668,134 @@ class ReplicaBackendBase(ModelReferenceBackend):
             if cached_data is not None:
                 return cached_data
 
-        # Fetch data
-        data = fetch_fn()
+        def _fetch_and_store() -> dict[str, Any] | None:
+            data = fetch_fn()
+            # Storing None indicates "checked but not found"
+            self._store_in_cache(category, data)
+            return data
+
+        if force_refresh:
+            return _fetch_and_store()
+        return self._single_flight(category, _fetch_and_store)
+
+    async def _fetch_with_cache_async(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        fetch_fn: Callable[[], Coroutine[Any, Any, dict[str, Any] | None]],
+        *,
+        force_refresh: bool = False,
+    ) -> dict[str, Any] | None:
+        """Async counterpart to [_fetch_with_cache()][(c)._fetch_with_cache].
+
+        Args:
+            category: The category to fetch.
+            fetch_fn: Callable returning a coroutine that fetches the data.
+            force_refresh: If True, skip cache check and force fetch.
+
+        Returns:
+            dict[str, Any] | None: The fetched/cached data.
+
+        """
+        if not force_refresh:
+            cached_data = self._get_from_cache(category)
+            if cached_data is not None:
+                return cached_data
 
-        # Store in cache
-        if data is not None:
+        async def _fetch_and_store() -> dict[str, Any] | None:
+            data = await fetch_fn()
             self._store_in_cache(category, data)
-        else:
-            # Store None to indicate "checked but not found"
-            self._store_in_cache(category, None)
+            return data
 
-        return data
+        if force_refresh:
+            return await _fetch_and_store()
+        return await self._single_flight_async(category, _fetch_and_store)
+
+    def _single_flight(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        fetch_fn: Callable[[], dict[str, Any] | None],
+    ) -> dict[str, Any] | None:
+        """Run *fetch_fn* unless a fetch for *category* is already in flight, in which case share its result.
+
+        The first caller runs *fetch_fn*; concurrent callers block until it finishes and receive the same
+        result (or exception). Callers must not hold a lock the leading fetch needs.
+
+        Args:
+            category: The category being fetched.
+            fetch_fn: Fetches (and caches) the category.
+
+        Returns:
+            dict[str, Any] | None: The result of the shared fetch.
+
+        """
+        with self._inflight_lock:
+            flight = self._inflight.get(category)
+            leader = flight is None
+            if flight is None:
+                flight = self._inflight[category] = _InFlightFetch()
+            else:
+                self._coalesced_fetches += 1
+
+        if not leader:
+            logger.debug(f"Joining in-flight fetch for {category}")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fetch_fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(category, None)
+            flight.done.set()
+
+    async def _single_flight_async(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        fetch_fn: Callable[[], Coroutine[Any, Any, dict[str, Any] | None]],
+    ) -> dict[str, Any] | None:
+        """Async counterpart to [_single_flight()][(c)._single_flight].
+
+        The shared fetch runs as a task on the caller's event loop and is shielded, so a cancelled caller
+        does not cancel it for the others. Callers on a different event loop start their own fetch.
+
+        Args:
+            category: The category being fetched.
+            fetch_fn: Returns a coroutine that fetches (and caches) the category.
+
+        Returns:
+            dict[str, Any] | None: The result of the shared fetch.
+
+        """
+        loop = asyncio.get_running_loop()
+        with self._inflight_lock:
+            task = self._inflight_async.get(category)
+            if task is None or task.done() or task.get_loop() is not loop:
+                task = loop.create_task(fetch_fn())
+                self._inflight_async[category] = task
+                task.add_done_callback(lambda finished: self._clear_inflight_async(category, finished))
+            else:
+                self._coalesced_fetches += 1
+                logger.debug(f"Joining in-flight fetch for {category} (async)")
+
+        return await asyncio.shield(task)
+
+    def _clear_inflight_async(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        task: asyncio.Task[dict[str, Any] | None],
+    ) -> None:
+        """Forget a finished async fetch, marking its exception retrieved if every caller was cancelled."""
+        with self._inflight_lock:
+            if self._inflight_async.get(category) is task:
+                del self._inflight_async[category]
+        if not task.cancelled():
+            task.exception()
 
     def _get_from_cache(self, category: MODEL_REFERENCE_CATEGORY) -> dict[str, Any] | None:
         """Get data from cache if valid.
@@ -565,7 +930,9 @@ class ReplicaBackendBase(ModelReferenceBackend):
                 logger.debug(f"Legacy category {category} TTL expired ({elapsed}s > {self._cache_ttl_seconds}s)")
                 return False
 
-        legacy_file_path = self._get_legacy_file_path_for_validation(category)
+        legacy_file_path = (
+            None if self._file_watcher_running() else self._get_legacy_file_path_for_validation(category)
+        )
         if legacy_file_path and legacy_file_path.exists():
             try:
                 current_mtime = legacy_file_path.stat().st_mtime
@@ -0,0 +1,170 @@
+"""In-memory log of per-category model writes, so REPLICA clients can fetch only what changed.
+
+A PRIMARY records every single-model upsert and deletion it performs. Each recorded change advances the
+category's *version*, an opaque token of the form ``<epoch>-<counter>``. A client that remembers the version it
+last synced to can ask for the changes since then and receive just the affected model names, instead of
+downloading the whole category again. Full v2 category responses carry the current version in the
+:data:`CHANGE_VERSION_HEADER` header, so a client learns it without a separate request.
+
+The log is bounded and lives in process memory. Whenever it cannot vouch for a complete answer -- the token
+comes from another process or an earlier run (a different epoch), the entries it needs were evicted, or the
+category was rewritten wholesale and :meth:`ChangeLog.reset` was called -- the result is marked incomplete, and
+the client must fall back to a full fetch.
+"""
+
+from __future__ import annotations
+
+import secrets
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
+
+CHANGE_VERSION_HEADER = "X-Model-Reference-Version"
+"""Response header a PRIMARY sets on full v2 category responses, carrying the category's current version."""
+
+
+class ChangeSet(NamedTuple):
+    """The model names changed in a category since a version, as recorded by a :class:`ChangeLog`."""
+
+    version: str
+    """The category's current version token."""
+    complete: bool
+    """Whether the names below are every change since the requested version."""
+    upserted: tuple[str, ...] = ()
+    """Models created or updated since the requested version, whose latest change was not a deletion."""
+    deleted: tuple[str, ...] = ()
+    """Models whose latest change since the requested version was a deletion."""
+
+
+@dataclass(frozen=True)
+class CategoryChanges:
+    """The records changed in a category since a version, as served by a backend."""
+
+    version: str
+    """The category's current version token; pass it as ``since`` on the next request."""
+    complete: bool
+    """Whether ``upserted`` and ``deleted`` describe every change. If False, a full fetch is required."""
+    upserted: dict[str, Any] = field(default_factory=dict)
+    """The current records of the models created or updated since the requested version."""
+    deleted: list[str] = field(default_factory=list)
+    """The names of the models deleted since the requested version."""
+
+
+@dataclass(slots=True)
+class _CategoryLog:
+    entries: deque[tuple[int, str, bool]]
+    counter: int = 0
+    floor: int = 0
+    """The oldest counter whose subsequent changes are all still held."""
+
+
+class ChangeLog:
+    """A bounded, thread-safe record of the model names written in each category."""
+
+    def __init__(self, *, max_entries: int = 1000) -> None:
+        """Create an empty log.
+
+        Args:
+            max_entries: How many changes to keep per category. Clients further behind than this get an
+                incomplete answer and must fetch the whole category.
+
+        """
+        self._epoch = secrets.token_hex(6)
+        self._max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._logs: dict[MODEL_REFERENCE_CATEGORY, _CategoryLog] = {}
+
+    @property
+    def epoch(self) -> str:
+        """The random prefix of every version this log issues, unique to the process."""
+        return self._epoch
+
+    def _log(self, category: MODEL_REFERENCE_CATEGORY) -> _CategoryLog:
+        log = self._logs.get(category)
+        if log is None:
+            log = _CategoryLog(entries=deque())
+            self._logs[category] = log
+        return log
+
+    def _token(self, counter: int) -> str:
+        return f"{self._epoch}-{counter}"
+
+    def record(self, category: MODEL_REFERENCE_CATEGORY, model_name: str, *, deleted: bool = False) -> str:
+        """Record that *model_name* was upserted (or deleted) in *category* and return the new version."""
+        with self._lock:
+            log = self._log(category)
+            log.counter += 1
+            if len(log.entries) >= self._max_entries:
+                evicted_counter, _, _ = log.entries.popleft()
+                log.floor = evicted_counter
+            log.entries.append((log.counter, model_name, deleted))
+            return self._token(log.counter)
+
+    def reset(self, category: MODEL_REFERENCE_CATEGORY) -> str:
+        """Forget the changes of *category* after it was rewritten wholesale, and return the new version.
+
+        Every version issued before the reset becomes incomplete.
+        """
+        with self._lock:
+            log = self._log(category)
+            log.counter += 1
+            log.floor = log.counter
+            log.entries.clear()
+            return self._token(log.counter)
+
+    def current_version(self, category: MODEL_REFERENCE_CATEGORY) -> str:
+        """Return the current version of *category*."""
+        with self._lock:
+            return self._token(self._log(category).counter)
+
+    def changes_since(self, category: MODEL_REFERENCE_CATEGORY, since: str | None) -> ChangeSet:
+        """Return the model names changed in *category* after version *since*.
+
+        Only the latest change of each model counts: a model updated and then deleted is reported as deleted.
+
+        Args:
+            category: The category to look up.
+            since: A version previously returned by this log. None only asks for the current version and is
+                reported as incomplete.
+
+        Returns:
+            ChangeSet: The current version and, when ``complete``, the changed names.
+
+        """
+        with self._lock:
+            log = self._log(category)
+            version = self._token(log.counter)
+            since_counter = self._parse(since)
+            if since_counter is None or not log.floor <= since_counter <= log.counter:
+                return ChangeSet(version=version, complete=False)
+
+            latest: dict[str, bool] = {}
+            for counter, model_name, deleted in log.entries:
+                if counter > since_counter:
+                    latest[model_name] = deleted
+
+        return ChangeSet(
+            version=version,
+            complete=True,
+            upserted=tuple(sorted(name for name, deleted in latest.items() if not deleted)),
+            deleted=tuple(sorted(name for name, deleted in latest.items() if deleted)),
+        )
+
+    def _parse(self, version: str | None) -> int | None:
+        """Return the counter of *version*, or None if it was not issued by this log."""
+        if version is None:
+            return None
+        epoch, _, counter = version.rpartition("-")
+        if epoch != self._epoch or not counter.isdigit():
+            return None
+        return int(counter)
+
+
+__all__ = [
+    "CategoryChanges",
+    "ChangeLog",
+    "ChangeSet",
+]
@@ -0,0 +1,141 @@
+"""Background watching of model reference files, so cache reads do not have to ``stat()`` them.
+
+Without a watcher, :class:`~horde_model_reference.backends.replica_backend_base.ReplicaBackendBase` checks the
+modification time of a category's file on every cache lookup and every ``needs_refresh`` call. A
+:class:`FileWatcher` moves that work off the request path: it reports changed files to a callback, which marks
+the matching categories stale, and the backend stops stat-ing files itself.
+
+Change notification uses ``watchfiles`` (inotify/FSEvents/ReadDirectoryChangesW, installed with
+``fastapi[standard]``) when it is available, and otherwise falls back to a pure-Python thread that polls the
+watched files every ``poll_interval_seconds``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from loguru import logger
+
+WATCHFILES_AVAILABLE = importlib.util.find_spec("watchfiles") is not None
+"""Whether the ``watchfiles`` package is installed, enabling native change notification."""
+
+type _FileSignature = tuple[int, int] | None
+
+
+def _signature(path: Path) -> _FileSignature:
+    """Return ``(mtime_ns, size)`` for *path*, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileWatcher:
+    """Calls ``on_change(path)`` from a daemon thread whenever a watched file is created, modified or removed."""
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        on_change: Callable[[Path], None],
+        *,
+        poll_interval_seconds: float = 1.0,
+        force_polling: bool = False,
+    ) -> None:
+        """Configure the watcher; nothing is watched until :meth:`start`.
+
+        Args:
+            paths: The files to watch. They do not need to exist yet, but their directories should.
+            on_change: Called with the (resolved) path of each file that changed. Exceptions are logged.
+            poll_interval_seconds: How often the polling fallback checks the files.
+            force_polling: Poll even when ``watchfiles`` is installed (e.g. on network filesystems).
+
+        """
+        self._paths = {Path(path).resolve() for path in paths}
+        self._on_change = on_change
+        self._poll_interval_seconds = poll_interval_seconds
+        self._native = WATCHFILES_AVAILABLE and not force_polling
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._signatures: dict[Path, _FileSignature] = {}
+
+    @property
+    def native(self) -> bool:
+        """Whether changes come from OS notifications (``watchfiles``) rather than polling."""
+        return self._native
+
+    @property
+    def running(self) -> bool:
+        """Whether the watcher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching in a daemon thread. Calling it while already running does nothing."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        directories = {path.parent for path in self._paths}
+        if self._native and not all(directory.is_dir() for directory in directories):
+            logger.warning("Some watched directories do not exist; falling back to polling")
+            self._native = False
+
+        # Snapshot before the thread starts, so changes made right after start() are not missed
+        self._signatures = {path: _signature(path) for path in self._paths}
+        target = self._watch_native if self._native else self._watch_polling
+        self._thread = threading.Thread(target=target, name="model-reference-file-watcher", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Watching {len(self._paths)} model reference file(s) "
+            f"({'native notifications' if self._native else f'polling every {self._poll_interval_seconds}s'})"
+        )
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop watching and wait up to *timeout* seconds for the thread to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _notify(self, path: Path) -> None:
+        try:
+            self._on_change(path)
+        except Exception as e:
+            logger.exception(f"File watcher callback failed for {path}: {e}")
+
+    def _watch_polling(self) -> None:
+        while not self._stop_event.wait(self._poll_interval_seconds):
+            try:
+                for path, previous in self._signatures.items():
+                    current = _signature(path)
+                    if current != previous:
+                        self._signatures[path] = current
+                        self._notify(path)
+            except Exception as e:
+                logger.exception(f"File watcher poll failed: {e}")
+
+    def _watch_native(self) -> None:
+        try:
+            import watchfiles
+
+            directories = sorted({str(path.parent) for path in self._paths})
+            for changes in watchfiles.watch(*directories, stop_event=self._stop_event, recursive=False):
+                for _, changed in changes:
+                    path = Path(changed).resolve()
+                    if path in self._paths:
+                        self._notify(path)
+        except Exception as e:
+            if self._stop_event.is_set():
+                return
+            logger.exception(f"Native file watching failed; falling back to polling: {e}")
+            self._native = False
+            # The signatures are still those taken at start(), so anything changed since is reported on the first poll
+            self._watch_polling()
+
+
+__all__ = [
+    "WATCHFILES_AVAILABLE",
+    "FileWatcher",
+]
@@ -0,0 +1,171 @@
+"""Shared, pooled httpx clients for outbound HTTP calls.
+
+Refreshing categories from the PRIMARY API, fetching pending models and polling the AI Horde API all talk to a
+handful of hosts over and over. Opening a fresh client per request (or per retry attempt) pays a TCP connect and
+TLS handshake every time; an :class:`HTTPClientPool` keeps one sync client and one async client per event loop,
+with keep-alive connections and (when the ``h2`` package is installed) HTTP/2, and hands them to every call site.
+
+The process-wide pool from :func:`get_http_client_pool` is configured from ``horde_model_reference_settings`` and
+closed by the service lifespan on shutdown. Clients are created lazily and re-created after :meth:`close`, so
+closing the pool never breaks later callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import weakref
+from threading import RLock
+
+import httpx
+from loguru import logger
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+"""Whether the ``h2`` package is installed, which httpx requires for HTTP/2."""
+
+
+class HTTPClientPool:
+    """Lazily created, connection-pooled sync and async httpx clients.
+
+    The sync client is shared by all threads (``httpx.Client`` is thread-safe). Async clients are bound to the
+    event loop that first used them, so one is kept per running loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+    ) -> None:
+        """Configure the pool; no client is created until first use.
+
+        Args:
+            max_connections: Maximum open connections per client.
+            max_keepalive_connections: Maximum idle connections kept open per client.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Negotiate HTTP/2 when the ``h2`` package is installed.
+
+        """
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._lock = RLock()
+        self._sync_client: httpx.Client | None = None
+        self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._closing_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def http2(self) -> bool:
+        """Whether the clients negotiate HTTP/2."""
+        return self._http2
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """The connection limits applied to every client."""
+        return self._limits
+
+    @property
+    def sync_client(self) -> httpx.Client:
+        """The shared synchronous client, created on first use."""
+        with self._lock:
+            if self._sync_client is None or self._sync_client.is_closed:
+                self._sync_client = httpx.Client(limits=self._limits, http2=self._http2)
+                logger.debug(f"Created pooled httpx.Client (http2={self._http2})")
+            return self._sync_client
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Return the shared async client for the running event loop, creating it on first use.
+
+        Raises:
+            RuntimeError: If called outside a running event loop.
+
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(limits=self._limits, http2=self._http2)
+                self._async_clients[loop] = client
+                logger.debug(f"Created pooled httpx.AsyncClient (http2={self._http2})")
+            return client
+
+    def close(self) -> None:
+        """Close the sync client and every async client.
+
+        An async client can only be closed on its own event loop. Its ``aclose()`` is scheduled on that loop when
+        the loop is running (in this thread or another) and run to completion when the loop is stopped. A client
+        whose loop is already closed cannot be closed any more; its connections are released when it is collected.
+        Use :meth:`aclose` from async code to wait for the running loop's client to close.
+        """
+        with self._lock:
+            sync_client, self._sync_client = self._sync_client, None
+            async_clients = list(self._async_clients.items())
+            self._async_clients.clear()
+        if sync_client is not None:
+            sync_client.close()
+        for loop, client in async_clients:
+            self._close_on_loop(loop, client)
+
+    def _close_on_loop(self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+        if client.is_closed:
+            return
+        if loop.is_closed():
+            logger.debug("Dropping a pooled httpx.AsyncClient whose event loop is already closed")
+            return
+        if not loop.is_running():
+            loop.run_until_complete(client.aclose())
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            task = loop.create_task(client.aclose())
+            self._closing_tasks.add(task)
+            task.add_done_callback(self._closing_tasks.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def aclose(self) -> None:
+        """Close the running loop's async client, then :meth:`close` the rest."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+        self.close()
+
+
+_default_pool: HTTPClientPool | None = None
+_default_pool_lock = RLock()
+
+
+def get_http_client_pool() -> HTTPClientPool:
+    """Return the process-wide pool, configured from ``horde_model_reference_settings`` on first use."""
+    global _default_pool
+
+    with _default_pool_lock:
+        if _default_pool is None:
+            from horde_model_reference import horde_model_reference_settings
+
+            _default_pool = HTTPClientPool(
+                max_connections=horde_model_reference_settings.http_pool_max_connections,
+                max_keepalive_connections=horde_model_reference_settings.http_pool_max_keepalive_connections,
+                keepalive_expiry=horde_model_reference_settings.http_pool_keepalive_expiry,
+                http2=horde_model_reference_settings.http_pool_http2,
+            )
+        return _default_pool
+
+
+__all__ = [
+    "HTTP2_AVAILABLE",
+    "HTTPClientPool",
+    "get_http_client_pool",
+]
@@ -17,6 +17,7 @@ import httpx
 from loguru import logger
 from tenacity import RetryError
 
+from horde_model_reference.http_clients import HTTPClientPool, get_http_client_pool
 from horde_model_reference.http_retry import (
     RetryableHTTPStatusError,
     horde_api_circuit_breaker,
@@ -70,6 +71,7 @@ class HordeAPIIntegration:
     _ttl: int
     _base_url: str
     _timeout: int
+    _http_clients: HTTPClientPool
 
     def __new__(cls) -> HordeAPIIntegration:
         """Singleton pattern matching ModelReferenceManager."""
@@ -87,6 +89,7 @@ class HordeAPIIntegration:
         self._ttl = horde_model_reference_settings.horde_api_cache_ttl
         self._base_url = str(ai_horde_worker_settings.ai_horde_url).rstrip("/") + "/v2"
         self._timeout = horde_model_reference_settings.horde_api_timeout
+        self._http_clients = get_http_client_pool()
 
         # Initialize in-memory caches
         self._status_cache = {}
@@ -272,16 +275,16 @@ class HordeAPIIntegration:
         if min_count is not None:
             params["min_count"] = str(min_count)
 
+        client = self._http_clients.async_client()
         try:
             data = None
             async for attempt in http_retry_async(max_attempts=3, min_wait=1.0, max_wait=15.0):
                 with attempt:
-                    async with httpx.AsyncClient(timeout=httpx.Timeout(self._timeout)) as client:
-                        response = await client.get(url, params=params)
-                        if is_retryable_status_code(response.status_code):
-                            raise RetryableHTTPStatusError(response)
-                        response.raise_for_status()
-                        data = response.json()
+                    response = await client.get(url, params=params, timeout=self._timeout)
+                    if is_retryable_status_code(response.status_code):
+                        raise RetryableHTTPStatusError(response)
+                    response.raise_for_status()
+                    data = response.json()
 
             if data is None:
                 raise ValueError(f"No data received from Horde API for {url} with params {params}")
@@ -399,17 +402,17 @@ class HordeAPIIntegration:
         url = f"{self._base_url}/{endpoint}"
         params = {"model_state": model_state}
 
+        client = self._http_clients.async_client()
         try:
             data = None
 
             async for attempt in http_retry_async(max_attempts=3, min_wait=1.0, max_wait=15.0):
                 with attempt:
-                    async with httpx.AsyncClient(timeout=httpx.Timeout(self._timeout)) as client:
-                        response = await client.get(url, params=params)
-                        if is_retryable_status_code(response.status_code):
-                            raise RetryableHTTPStatusError(response)
-                        response.raise_for_status()
-                        data = response.json()
+                    response = await client.get(url, params=params, timeout=self._timeout)
+                    if is_retryable_status_code(response.status_code):
+                        raise RetryableHTTPStatusError(response)
+                    response.raise_for_status()
+                    data = response.json()
 
             if data is None:
                 raise ValueError(f"No data received from Horde API for {url} with params {params}")
@@ -524,16 +527,16 @@ class HordeAPIIntegration:
         if model_type is not None:
             params["type"] = model_type
 
+        client = self._http_clients.async_client()
         try:
             async for attempt in http_retry_async(max_attempts=3, min_wait=1.0, max_wait=15.0):
                 with attempt:
-                    async with httpx.AsyncClient(timeout=httpx.Timeout(self._timeout)) as client:
-                        response = await client.get(url, params=params)
-                        if is_retryable_status_code(response.status_code):
-                            raise RetryableHTTPStatusError(response)
-                        response.raise_for_status()
-                        data = response.json()
-                        logger.debug(f"Fetched {len(data)} workers from {url} with params {params}")
+                    response = await client.get(url, params=params, timeout=self._timeout)
+                    if is_retryable_status_code(response.status_code):
+                        raise RetryableHTTPStatusError(response)
+                    response.raise_for_status()
+                    data = response.json()
+                    logger.debug(f"Fetched {len(data)} workers from {url} with params {params}")
 
             horde_api_circuit_breaker.record_success()
             return [HordeWorker.model_validate(item) for item in data]
@@ -0,0 +1,135 @@
+"""Fast reading and writing of model reference JSON files.
+
+Category files such as ``text_generation.json`` run to several megabytes, and the PRIMARY re-reads and
+re-writes a whole file for every single-model write. When the optional ``orjson`` package is installed, these
+helpers parse files straight from a read-only memory map without first decoding them to ``str``, and serialize
+with orjson's native indenter. Without orjson they fall back to the standard library.
+
+The written output matches ``json.dump(data, f, indent=2, ensure_ascii=False)``: two-space indentation,
+``": "`` separators and unescaped non-ASCII characters. orjson formats some floats differently (``1e-05`` as
+``0.00001``) and writes NaN and infinities as ``null``, so data holding such floats is serialized with the
+standard library instead, as are values orjson cannot serialize at all (e.g. integers wider than 64 bits or
+non-string keys). orjson also rejects the ``NaN``/``Infinity`` tokens the standard library reads and writes;
+content it refuses is re-parsed with the standard library before an error is raised.
+Parse errors are raised as :class:`json.JSONDecodeError` (``orjson.JSONDecodeError`` is a subclass).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import mmap
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+ORJSON_AVAILABLE = orjson is not None
+"""Whether ``orjson`` is installed and used for reading and writing."""
+
+MMAP_MIN_BYTES = 64 * 1024
+"""Files smaller than this are read into memory directly; mapping them costs more than it saves."""
+
+
+def parse_json(content: bytes | str) -> Any:  # noqa: ANN401
+    """Parse JSON *content* with orjson when available."""
+    if orjson is not None:
+        return _orjson_loads(content)
+    return json.loads(content)
+
+
+def _orjson_loads(content: bytes | str | memoryview) -> Any:  # noqa: ANN401
+    """Parse *content* with orjson, re-parsing with the standard library what orjson refuses (e.g. ``NaN``)."""
+    assert orjson is not None
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError as orjson_error:
+        try:
+            return json.loads(bytes(content) if isinstance(content, memoryview) else content)
+        except ValueError:
+            raise orjson_error from None
+
+
+def _has_stdlib_only_floats(data: Any) -> bool:  # noqa: ANN401
+    """Return whether *data* holds a float orjson would not write as the standard library does.
+
+    The standard library writes non-finite floats as ``NaN``/``Infinity`` (orjson writes ``null``) and uses
+    exponent notation where orjson may not, so only floats whose ``repr`` is in exponent form, or is not finite,
+    force the fallback.
+    """
+    pending = [data]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value) or "e" in repr(value):
+                return True
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+        elif isinstance(value, list | tuple):
+            pending.extend(value)
+    return False
+
+
+def dumps_indented(data: Any) -> bytes:  # noqa: ANN401
+    """Serialize *data* as UTF-8 JSON with two-space indentation, as the reference files are stored."""
+    if orjson is not None and not _has_stdlib_only_floats(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def read_json_file(path: str | Path) -> Any:  # noqa: ANN401
+    """Read and parse the JSON file at *path*.
+
+    With orjson installed, files of at least :data:`MMAP_MIN_BYTES` are memory-mapped and parsed in place.
+
+    Raises:
+        OSError: If the file cannot be read.
+        json.JSONDecodeError: If the file is not valid JSON.
+
+    """
+    with open(path, "rb") as f:
+        if orjson is not None:
+            size = f.seek(0, 2)
+            if size >= MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                    return _orjson_loads(view)
+            f.seek(0)
+        return parse_json(f.read())
+
+
+def write_json_file(path: str | Path, data: Any, *, fsync: bool = False) -> None:  # noqa: ANN401
+    """Write *data* to *path* as indented JSON.
+
+    Args:
+        path: The file to (over)write.
+        data: The JSON-serializable data.
+        fsync: Flush the file to disk before returning; filesystems that do not support it are ignored.
+
+    Raises:
+        OSError: If the file cannot be written.
+
+    """
+    with open(path, "wb") as f:
+        f.write(dumps_indented(data))
+        if fsync:
+            f.flush()
+            with contextlib.suppress(OSError):
+                os.fsync(f.fileno())
+
+
+__all__ = [
+    "MMAP_MIN_BYTES",
+    "ORJSON_AVAILABLE",
+    "dumps_indented",
+    "parse_json",
+    "read_json_file",
+    "write_json_file",
+]
@@ -0,0 +1,176 @@
+"""Helpers for caching validated records built from raw model reference JSON.
+
+A :class:`LazyRecordMapping` behaves like the ``dict[str, GenericModelRecord]`` the manager normally caches, but
+defers ``record_type.model_validate`` until a record is first read. Validated instances are memoized, so each
+record is converted at most once for the lifetime of the mapping (i.e. until the manager invalidates the category).
+
+:func:`raw_record_fingerprint` gives a stable content hash for a raw record so a reload can tell which records
+actually changed and reuse the pydantic instances of the rest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from loguru import logger
+
+from horde_model_reference.model_reference_records import GenericModelRecord
+
+
+def raw_record_name(key: str, raw_record: Any) -> str:  # noqa: ANN401
+    """Return the name a raw record is cached under: its ``name`` field, falling back to its JSON key."""
+    if isinstance(raw_record, Mapping):
+        name = raw_record.get("name", key)
+        if isinstance(name, str):
+            return name
+    return key
+
+
+def raw_record_fingerprint(raw_record: Any) -> str:  # noqa: ANN401
+    """Return a stable content fingerprint for a raw (JSON-compatible) record.
+
+    Key order does not affect the fingerprint, so a record that was re-serialized without changes keeps its value.
+    """
+    canonical = json.dumps(raw_record, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class LazyRecordMapping[T: GenericModelRecord](Mapping[str, T]):
+    """Read-only ``name -> record`` mapping that validates each record on first access.
+
+    Keys are the record names (the ``name`` field of each raw entry, falling back to its JSON key) so lookups match
+    the eager conversion path exactly. Iteration, ``len()`` and membership tests never trigger validation.
+    """
+
+    __slots__ = ("_category_label", "_raw", "_record_type", "_validated")
+
+    def __init__(
+        self,
+        raw_records: Mapping[str, Any],
+        record_type: type[T],
+        *,
+        category_label: str = "",
+        prevalidated: Mapping[str, T] | None = None,
+    ) -> None:
+        """Index the raw JSON entries by record name without validating them.
+
+        Args:
+            raw_records: The raw category JSON (``key -> record dict``).
+            record_type: The pydantic record class used to validate each entry.
+            category_label: Human-readable category name used in log messages.
+            prevalidated: Already-validated instances to reuse for unchanged records. Entries whose name is not in
+                *raw_records* are ignored.
+
+        """
+        self._raw: dict[str, Any] = {raw_record_name(key, value): value for key, value in raw_records.items()}
+        self._record_type = record_type
+        self._validated: dict[str, T] = {}
+        if prevalidated:
+            self._validated.update((name, record) for name, record in prevalidated.items() if name in self._raw)
+        self._category_label = category_label
+
+    @property
+    def record_type(self) -> type[T]:
+        """The pydantic record class used for validation."""
+        return self._record_type
+
+    @property
+    def validated_count(self) -> int:
+        """Number of records that have been validated (and memoized) so far."""
+        return len(self._validated)
+
+    def get_validated(self, name: str) -> T | None:
+        """Return the memoized record for *name* if it has already been validated, without validating it."""
+        return self._validated.get(name)
+
+    def raw(self, name: str) -> Any:  # noqa: ANN401
+        """Return the unvalidated JSON entry for *name*.
+
+        Raises:
+            KeyError: If *name* is not present.
+
+        """
+        return self._raw[name]
+
+    def __getitem__(self, name: str) -> T:
+        """Return the validated record for *name*, validating it on first access.
+
+        Raises:
+            KeyError: If *name* is not present.
+            pydantic.ValidationError: If the raw entry does not validate against the record type.
+
+        """
+        cached = self._validated.get(name)
+        if cached is not None:
+            return cached
+
+        raw_value = self._raw[name]
+        instance = self._record_type.model_validate(raw_value)
+        # setdefault keeps the first instance if two threads race on the same record.
+        return self._validated.setdefault(name, instance)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._raw
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyRecordMapping(category={self._category_label!r}, records={len(self._raw)}, "
+            f"validated={len(self._validated)})"
+        )
+
+    def validate_all(self) -> list[str]:
+        """Validate every record that has not yet been validated.
+
+        Failures are logged and skipped so one bad record does not prevent the rest from being memoized.
+
+        Returns:
+            list[str]: Names of records that failed validation.
+
+        """
+        failed: list[str] = []
+        for name in list(self._raw):
+            if name in self._validated:
+                continue
+            try:
+                self[name]
+            except Exception as e:
+                failed.append(name)
+                logger.error(f"Record {name!r} in {self._category_label} failed validation: {e}")
+        return failed
+
+    def validate_all_in_background(self) -> threading.Thread:
+        """Start a daemon thread that runs :meth:`validate_all`.
+
+        Returns:
+            threading.Thread: The started thread, so callers (and tests) can ``join()`` it.
+
+        """
+        thread = threading.Thread(
+            target=self._background_validate,
+            name=f"lazy-validate-{self._category_label}",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _background_validate(self) -> None:
+        failed = self.validate_all()
+        if failed:
+            logger.warning(
+                f"Background validation of {self._category_label} found {len(failed)} invalid record(s): {failed}"
+            )
+        else:
+            logger.debug(f"Background validation of {self._category_label} completed ({len(self._raw)} records)")
+
+
+__all__ = ["LazyRecordMapping", "raw_record_fingerprint", "raw_record_name"]
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Generator, Iterable, Mapping
+from collections import OrderedDict
+from collections.abc import Awaitable, Generator, Hashable, Iterable, Mapping
 from pathlib import Path
 from threading import RLock
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar, overload
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar, cast, overload
 
 import httpx
 from loguru import logger
+from pydantic import ValidationError
 from strenum import StrEnum
 
 from horde_model_reference import ReplicateMode, horde_model_reference_paths, horde_model_reference_settings
@@ -24,6 +26,8 @@ from horde_model_reference.backends import (
 from horde_model_reference.group_aliases import GroupAliasStore
 from horde_model_reference.group_families import GroupFamilyStore
 from horde_model_reference.group_schema_store import GroupSchemaStore
+from horde_model_reference.http_clients import HTTPClientPool, get_http_client_pool
+from horde_model_reference.lazy_records import LazyRecordMapping, raw_record_fingerprint, raw_record_name
 from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY, categories_managed_elsewhere
 from horde_model_reference.model_reference_metadata import CategoryMetadata
 from horde_model_reference.model_reference_records import (
@@ -52,12 +56,9 @@ from horde_model_reference.query import (
     ModelQuery,
     TextGenFieldName,
     TextModelQuery,
-    build_controlnet_query,
     build_cross_category_query,
-    build_image_query,
-    build_query,
-    build_text_query,
 )
+from horde_model_reference.query_index import RecordIndex
 from horde_model_reference.source_consts import (
     ANY_SOURCE,
     HORDE_SOURCE_ID,
@@ -69,6 +70,7 @@ from horde_model_reference.source_consts import (
 if TYPE_CHECKING:
     from horde_model_reference.integrations.data_merger import PopularModelResult
     from horde_model_reference.integrations.horde_api_models import HordeModelType
+    from horde_model_reference.name_resolution import NameMatch, NameResolver
     from horde_model_reference.pending_queue import PendingQueueService
 
 
@@ -110,8 +112,26 @@ class ModelReferenceManager:
 
     backend: ModelReferenceBackend
     """The backend provider for model reference data."""
-    _cached_records: dict[MODEL_REFERENCE_CATEGORY, dict[str, GenericModelRecord] | None]
+    _cached_records: dict[
+        MODEL_REFERENCE_CATEGORY, dict[str, GenericModelRecord] | LazyRecordMapping[GenericModelRecord] | None
+    ]
     """Cache of pydantic model records by category."""
+    _record_sources: dict[MODEL_REFERENCE_CATEGORY, dict[str, Any]]
+    """The raw JSON each cached (or retired) category was built from, kept so the next load can diff against it."""
+    _record_fingerprints: dict[MODEL_REFERENCE_CATEGORY, dict[str, str]]
+    """Fingerprints of records in `_record_sources`, computed only while diffing a reload and memoized for the next."""
+    _retired_records: dict[
+        MODEL_REFERENCE_CATEGORY, dict[str, GenericModelRecord] | LazyRecordMapping[GenericModelRecord]
+    ]
+    """Invalidated category records kept only so the next load can reuse instances of unchanged records."""
+    _record_indexes: dict[MODEL_REFERENCE_CATEGORY, tuple[Mapping[str, GenericModelRecord], RecordIndex[Any]]]
+    """Secondary query indexes by category, paired with the cached records they were built from."""
+    _query_results: OrderedDict[tuple[int, Hashable], tuple[tuple[GenericModelRecord, ...], int]]
+    """LRU of ``(page, total)`` query results keyed by ``(index generation, plan signature)``."""
+    _last_index_generation: int
+    """The generation number handed to the most recently built query index."""
+    _name_resolvers: dict[MODEL_REFERENCE_CATEGORY, tuple[RecordIndex[Any], NameResolver]]
+    """Name resolvers by category, paired with the query index (cache generation) they were built from."""
 
     _instance: ModelReferenceManager | None = None
     _replicate_mode: ReplicateMode = ReplicateMode.REPLICA
@@ -120,6 +140,8 @@ class ModelReferenceManager:
     _deferred_prefetch_handle: DeferredPrefetchHandle | None = None
     _async_prefetch_task: asyncio.Task[None] | None = None
     _provider_registry: ModelProviderRegistry
+    _http_clients: HTTPClientPool
+    """Pooled outbound HTTP clients shared by the backend and HTTP-based providers."""
     _audit_writer: AuditTrailWriter | None = None
     _pending_queue_service: PendingQueueService | None = None
     _group_alias_store: GroupAliasStore | None = None
@@ -176,12 +198,23 @@ class ModelReferenceManager:
 
             cls._instance = None
 
+    @staticmethod
+    def _maybe_watch_files(backend: FileSystemBackend | LocalReadOnlyBackend) -> None:
+        """Start watching *backend*'s files when ``file_watcher_enabled`` is set."""
+        if not horde_model_reference_settings.file_watcher_enabled:
+            return
+        backend.start_file_watching(
+            poll_interval_seconds=horde_model_reference_settings.file_watcher_poll_interval_seconds,
+            force_polling=horde_model_reference_settings.file_watcher_force_polling,
+        )
+
     @staticmethod
     def _create_backend(
         base_path: str | Path,
         replicate_mode: ReplicateMode,
         audit_writer: AuditTrailWriter | None,
         offline: bool = False,
+        http_clients: HTTPClientPool | None = None,
     ) -> ModelReferenceBackend:
         """Create the appropriate backend based on mode and settings.
 
@@ -191,6 +224,7 @@ class ModelReferenceManager:
             audit_writer: Optional audit writer used by write-capable backends.
             offline: If True, return a read-only local-disk backend that never downloads,
                 regardless of replicate_mode. Used by subprocesses whose parent owns downloading.
+            http_clients: Pooled HTTP clients for backends that download. Defaults to the process-wide pool.
 
         Returns:
             ModelReferenceBackend: The configured backend instance.
@@ -201,10 +235,12 @@ class ModelReferenceManager:
         )
         if offline:
             logger.info("Using LocalReadOnlyBackend (offline=True); references are read from disk, never downloaded")
-            return LocalReadOnlyBackend(
+            local_backend = LocalReadOnlyBackend(
                 base_path=base_path,
                 cache_ttl_seconds=horde_model_reference_settings.cache_ttl_seconds,
             )
+            ModelReferenceManager._maybe_watch_files(local_backend)
+            return local_backend
 
         if replicate_mode == ReplicateMode.PRIMARY:
             logger.debug("Creating backend for PRIMARY mode")
@@ -236,6 +272,7 @@ class ModelReferenceManager:
                     github_backend = GitHubBackend(
                         base_path=base_path,
                         replicate_mode=ReplicateMode.PRIMARY,
+                        http_clients=http_clients,
                     )
 
                     github_backend.fetch_all_categories(force_refresh=True)
@@ -250,6 +287,8 @@ class ModelReferenceManager:
                     logger.info("Running metadata population check (seeding was skipped)")
                     filesystem_backend.ensure_all_metadata_populated()
 
+            ModelReferenceManager._maybe_watch_files(filesystem_backend)
+
             if horde_model_reference_settings.redis.use_redis:
                 from horde_model_reference.backends.redis_backend import RedisBackend
 
@@ -268,6 +307,7 @@ class ModelReferenceManager:
         github_backend = GitHubBackend(
             base_path=base_path,
             replicate_mode=ReplicateMode.REPLICA,
+            http_clients=http_clients,
         )
 
         if horde_model_reference_settings.primary_api_url:
@@ -276,8 +316,11 @@ class ModelReferenceManager:
                 primary_api_url=horde_model_reference_settings.primary_api_url,
                 github_backend=github_backend,
                 cache_ttl_seconds=horde_model_reference_settings.cache_ttl_seconds,
+                stale_while_revalidate_seconds=horde_model_reference_settings.stale_while_revalidate_seconds,
                 timeout_seconds=horde_model_reference_settings.primary_api_timeout,
                 enable_github_fallback=horde_model_reference_settings.enable_github_fallback,
+                http_clients=http_clients,
+                delta_sync=horde_model_reference_settings.replica_delta_sync,
             )
 
         logger.info("Using GitHubBackend only (no PRIMARY API configured)")
@@ -344,12 +387,15 @@ class ModelReferenceManager:
                         max_file_size_bytes=horde_model_reference_settings.audit.max_segment_bytes,
                     )
 
+                cls._instance._http_clients = get_http_client_pool()
+
                 if backend is None:
                     backend = cls._create_backend(
                         base_path=base_path,
                         replicate_mode=replicate_mode,
                         audit_writer=audit_writer,
                         offline=offline,
+                        http_clients=cls._instance._http_clients,
                     )
 
                 # Offline backends are REPLICA-shaped regardless of the requested mode; align the
@@ -390,6 +436,13 @@ class ModelReferenceManager:
                     cls._instance._group_family_store = None
                     cls._instance._group_schema_store = None
                 cls._instance._cached_records = {}
+                cls._instance._record_sources = {}
+                cls._instance._record_fingerprints = {}
+                cls._instance._retired_records = {}
+                cls._instance._record_indexes = {}
+                cls._instance._query_results = OrderedDict()
+                cls._instance._last_index_generation = 0
+                cls._instance._name_resolvers = {}
                 cls._instance._deferred_prefetch_handle = None
                 cls._instance._async_prefetch_task = None
                 cls._instance._provider_registry = ModelProviderRegistry()
@@ -477,10 +530,27 @@ class ModelReferenceManager:
         with self._lock:
             if category is None:
                 logger.debug("Invalidating entire cached pydantic records.")
+                for cached_category, records in self._cached_records.items():
+                    if records is not None:
+                        self._retired_records[cached_category] = records
                 self._cached_records = {}
+                self._record_indexes = {}
+                self._query_results.clear()
+                self._name_resolvers = {}
             else:
                 logger.debug(f"Invalidating cached pydantic records for category: {category}.")
-                self._cached_records.pop(category, None)
+                records = self._cached_records.pop(category, None)
+                if records is not None:
+                    self._retired_records[category] = records
+                indexed = self._record_indexes.pop(category, None)
+                if indexed is not None:
+                    self._drop_query_results(indexed[1].generation)
+                self._name_resolvers.pop(category, None)
+
+    def _drop_query_results(self, generation: int) -> None:
+        """Forget every cached query result computed over the index of *generation*. Caller holds ``_lock``."""
+        for key in [key for key in self._query_results if key[0] == generation]:
+            del self._query_results[key]
 
     def invalidate_category_cache(self, category: MODEL_REFERENCE_CATEGORY) -> None:
         """Explicitly invalidate cached data for a category.
@@ -548,6 +618,11 @@ class ModelReferenceManager:
         """Return whether this manager reads from local disk only (never downloads)."""
         return self._offline
 
+    @property
+    def http_clients(self) -> HTTPClientPool:
+        """Return the pooled outbound HTTP clients; pass them to HTTP-based providers to share connections."""
+        return self._http_clients
+
     @property
     def pending_queue_service(self) -> PendingQueueService | None:
         """Return the pending queue service when queueing is enabled."""
@@ -757,6 +832,8 @@ class ModelReferenceManager:
         category: MODEL_REFERENCE_CATEGORY,
         file_json_dict: dict[str, Any] | None,
         safe_mode: bool = False,
+        *,
+        reusable: Mapping[str, GenericModelRecord] | None = None,
     ) -> dict[str, GenericModelRecord] | None:
         """Return a model reference object from a JSON dictionary, or None if conversion failed.
 
@@ -765,6 +842,8 @@ class ModelReferenceManager:
             file_json_dict: The dict object representing the model reference.
             safe_mode: Whether to raise exceptions on failure. If False, exceptions are caught
                 and None is returned. Defaults to False.
+            reusable: Already-validated records, keyed by name, whose raw JSON is known to be unchanged.
+                These are reused as-is instead of being validated again.
 
         Returns:
             dict[str, GenericModelRecord] | None: The dict representing the model reference,
@@ -782,7 +861,12 @@ class ModelReferenceManager:
         try:
             record_type = MODEL_RECORD_TYPE_LOOKUP.get(category, GenericModelRecord)
             model_reference: dict[str, GenericModelRecord] = {}
-            for model_value in file_json_dict.values():
+            for model_key, model_value in file_json_dict.items():
+                if reusable:
+                    reused_instance = reusable.get(raw_record_name(model_key, model_value))
+                    if reused_instance is not None:
+                        model_reference[reused_instance.name] = reused_instance
+                        continue
                 model_instance = record_type.model_validate(model_value)
                 model_reference[model_instance.name] = model_instance
 
@@ -794,6 +878,59 @@ class ModelReferenceManager:
                 return None
             raise e
 
+    @staticmethod
+    def _file_json_dict_to_lazy_model_reference(
+        category: MODEL_REFERENCE_CATEGORY,
+        file_json_dict: dict[str, Any] | None,
+        safe_mode: bool = False,
+        *,
+        reusable: Mapping[str, GenericModelRecord] | None = None,
+    ) -> LazyRecordMapping[GenericModelRecord] | None:
+        """Return a lazily-validated model reference backed by the raw JSON, or None if unavailable.
+
+        Records are validated on first access and memoized (see `LazyRecordMapping`); an invalid record raises
+        `pydantic.ValidationError` when it is read. When `lazy_record_background_validation` is enabled, the
+        remaining records are validated on a daemon thread.
+
+        Args:
+            category: The target model reference category to convert.
+            file_json_dict: The dict object representing the model reference.
+            safe_mode: Whether to raise conversion errors now, as the eager path does. If True, every record is
+                validated before returning, giving up the laziness. Defaults to False.
+            reusable: Already-validated records, keyed by name, whose raw JSON is known to be unchanged.
+
+        Returns:
+            LazyRecordMapping[GenericModelRecord] | None: A read-only mapping with the same lookup semantics as the
+                eager conversion, or None if there was nothing to convert.
+
+        Raises:
+            ValueError: If `safe_mode` is True and any record fails validation.
+
+        """
+        if file_json_dict is None:
+            logger.warning(f"File dict json is None for {category}.")
+            return None
+
+        if category in categories_managed_elsewhere:
+            logger.info(f"Skipping conversion for category: {category} (managed elsewhere)")
+            return None
+
+        record_type = MODEL_RECORD_TYPE_LOOKUP.get(category, GenericModelRecord)
+        lazy_reference = LazyRecordMapping(
+            file_json_dict,
+            record_type,
+            category_label=str(category),
+            prevalidated=reusable,
+        )
+        if safe_mode:
+            failed = lazy_reference.validate_all()
+            if failed:
+                raise ValueError(f"{len(failed)} record(s) in {category} failed validation: {failed}")
+        elif horde_model_reference_settings.lazy_record_background_validation:
+            lazy_reference.validate_all_in_background()
+
+        return lazy_reference
+
     @staticmethod
     def model_reference_to_json_dict(
         model_reference: dict[str, GenericModelRecord],
@@ -863,18 +1000,50 @@ class ModelReferenceManager:
         """
         with self._lock:
             logger.debug(f"Returning {len(self._cached_records)} cached pydantic model references.")
-            return dict(self._cached_records)
+            return {
+                category: self._materialize_cached_records(category, safe_mode=safe_mode)
+                for category in list(self._cached_records)
+            }
+
+    def _materialize_cached_records(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        *,
+        safe_mode: bool,
+    ) -> dict[str, GenericModelRecord] | None:
+        """Return the cached records of *category* as a dict, validating a lazy mapping in full first.
+
+        A lazily loaded category is replaced in the cache by the resulting dict (or by None if any record is
+        invalid, as an eager load would have cached), so it is validated and copied only once per generation.
+        Must be called with `_lock` held.
+
+        Raises:
+            ValueError: If `safe_mode` is True and any record of a lazily loaded category fails validation.
+
+        """
+        records = self._cached_records.get(category)
+        if not isinstance(records, LazyRecordMapping):
+            return records
+
+        failed = records.validate_all()
+        if failed:
+            message = f"{len(failed)} record(s) in {category} failed validation: {failed}"
+            if safe_mode:
+                raise ValueError(message)
+            logger.error(f"Failed to convert file dict JSON to model reference for {category}: {message}")
+            materialized = None
+            self._record_sources.pop(category, None)
+            self._record_fingerprints.pop(category, None)
+        else:
+            materialized = {name: records[name] for name in records}
+        self._cached_records[category] = materialized
+        return materialized
 
     def _evaluate_cache_state(
         self,
         *,
         overwrite_existing: bool,
-        safe_mode: bool,
-    ) -> tuple[
-        bool,
-        dict[MODEL_REFERENCE_CATEGORY, dict[str, GenericModelRecord] | None],
-        list[MODEL_REFERENCE_CATEGORY],
-    ]:
+    ) -> tuple[bool, list[MODEL_REFERENCE_CATEGORY]]:
         """Return whether cached data can be reused plus categories needing refresh."""
         with self._lock:
             refresh_map = {category: self.backend.needs_refresh(category) for category in MODEL_REFERENCE_CATEGORY}
@@ -883,7 +1052,7 @@ class ModelReferenceManager:
 
             if not overwrite_existing and all_categories_cached and not needs_backend_refresh:
                 logger.debug("Using fully cached pydantic model references.")
-                return True, self._get_all_cached_model_references(safe_mode=safe_mode), []
+                return True, []
 
             categories_to_load: list[MODEL_REFERENCE_CATEGORY] = []
             for category in MODEL_REFERENCE_CATEGORY:
@@ -896,7 +1065,7 @@ class ModelReferenceManager:
                 ):
                     categories_to_load.append(category)
 
-            return False, {}, categories_to_load
+            return False, categories_to_load
 
     def _load_categories_from_payload(
         self,
@@ -929,14 +1098,84 @@ class ModelReferenceManager:
                     force_refresh=overwrite_existing,
                 )
 
+        lazy = horde_model_reference_settings.lazy_record_validation
         with self._lock:
             for category, file_json in prepared_payload.items():
-                model_reference = self._file_json_dict_to_model_reference(
-                    category,
-                    file_json,
-                    safe_mode=safe_mode,
-                )
+                reusable, fingerprints = self._collect_reusable_records(category, file_json)
+                if lazy:
+                    model_reference = self._file_json_dict_to_lazy_model_reference(
+                        category,
+                        file_json,
+                        safe_mode=safe_mode,
+                        reusable=reusable,
+                    )
+                else:
+                    model_reference = self._file_json_dict_to_model_reference(
+                        category,
+                        file_json,
+                        safe_mode=safe_mode,
+                        reusable=reusable,
+                    )
                 self._cached_records[category] = model_reference
+                self._retired_records.pop(category, None)
+                if model_reference is None or file_json is None:
+                    self._record_sources.pop(category, None)
+                    self._record_fingerprints.pop(category, None)
+                else:
+                    self._record_sources[category] = file_json
+                    self._record_fingerprints[category] = fingerprints
+
+    def _collect_reusable_records(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        file_json: Mapping[str, Any] | None,
+    ) -> tuple[dict[str, GenericModelRecord], dict[str, str]]:
+        """Return previously validated records of *category* whose raw JSON is unchanged in *file_json*.
+
+        Looks at the currently cached records first and falls back to the generation retired by the last
+        invalidation, so a post-write refresh only re-validates the records that were added or edited.
+        Nothing is fingerprinted unless a previous generation exists, and only records that generation actually
+        validated are compared, so a cold start (and a lazy mapping nobody has read from) costs nothing here.
+
+        Args:
+            category: The category being reloaded.
+            file_json: The incoming raw category JSON.
+
+        Returns:
+            tuple[dict[str, GenericModelRecord], dict[str, str]]: Reusable records keyed by name (possibly empty),
+                and the fingerprints computed for incoming records, to be memoized for the next reload.
+
+        """
+        previous_source = self._record_sources.get(category)
+        previous_records = self._cached_records.get(category) or self._retired_records.get(category)
+        if not file_json or not previous_source or not previous_records:
+            return {}, {}
+
+        previous_fingerprints = self._record_fingerprints.get(category, {})
+        reusable: dict[str, GenericModelRecord] = {}
+        fingerprints: dict[str, str] = {}
+        for key, raw_record in file_json.items():
+            name = raw_record_name(key, raw_record)
+            if isinstance(previous_records, LazyRecordMapping):
+                record = previous_records.get_validated(name)
+            else:
+                record = previous_records.get(name)
+            if record is None or key not in previous_source:
+                continue
+
+            previous_fingerprint = previous_fingerprints.get(name)
+            if previous_fingerprint is None:
+                previous_fingerprint = raw_record_fingerprint(previous_source[key])
+            fingerprint = raw_record_fingerprint(raw_record)
+            fingerprints[name] = fingerprint
+            if fingerprint == previous_fingerprint:
+                reusable[name] = record
+
+        logger.debug(
+            f"Reusing {len(reusable)} of {len(file_json)} unchanged records for {category} "
+            f"({len(file_json) - len(reusable)} to validate)."
+        )
+        return reusable, fingerprints
 
     def get_all_model_references_or_none(
         self,
@@ -960,13 +1199,20 @@ class ModelReferenceManager:
                 categories to their corresponding model reference objects.
 
         """
-        use_cache, cached_result, categories_to_load = self._evaluate_cache_state(
-            overwrite_existing=overwrite_existing,
-            safe_mode=safe_mode,
-        )
+        self._refresh_cached_records(overwrite_existing=overwrite_existing, safe_mode=safe_mode)
+        return self._get_all_cached_model_references(safe_mode=safe_mode)
+
+    def _refresh_cached_records(
+        self,
+        *,
+        overwrite_existing: bool,
+        safe_mode: bool,
+    ) -> None:
+        """Load every category that is missing, stale or forced to reload into the record cache."""
+        use_cache, categories_to_load = self._evaluate_cache_state(overwrite_existing=overwrite_existing)
 
         if use_cache:
-            return cached_result
+            return
 
         logger.debug("Fetching model references from backend as needed.")
         backend_payload = self._fetch_from_backend_if_needed(force_refresh=overwrite_existing)
@@ -980,8 +1226,6 @@ class ModelReferenceManager:
                 safe_mode=safe_mode,
             )
 
-        return self._get_all_cached_model_references(safe_mode=safe_mode)
-
     def _build_safe_reference_view(
         self,
         all_references: dict[MODEL_REFERENCE_CATEGORY, dict[str, GenericModelRecord] | None],
@@ -1050,13 +1294,10 @@ class ModelReferenceManager:
             sparse mapping keyed by category.
 
         """
-        use_cache, cached_result, categories_to_load = self._evaluate_cache_state(
-            overwrite_existing=overwrite_existing,
-            safe_mode=safe_mode,
-        )
+        use_cache, categories_to_load = self._evaluate_cache_state(overwrite_existing=overwrite_existing)
 
         if use_cache:
-            return cached_result
+            return self._get_all_cached_model_references(safe_mode=safe_mode)
 
         logger.debug("Asynchronously fetching model references from backend as needed.")
         backend_payload = await self._fetch_from_backend_if_needed_async(
@@ -1282,6 +1523,52 @@ class ModelReferenceManager:
 
         return model_reference
 
+    def get_model_reference_view_or_none(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        overwrite_existing: bool = False,
+    ) -> Mapping[str, GenericModelRecord] | None:
+        """Return the cached canonical records of a category without copying them or validating them up front.
+
+        With `lazy_record_validation` enabled this is the category's `LazyRecordMapping`: each record is validated
+        the first time it is read, and an invalid record raises `pydantic.ValidationError` on that read, where
+        :meth:`get_model_reference_or_none` would log the failure and return None for the whole category.
+        Otherwise it is the dict :meth:`get_model_reference_or_none` returns. The result must not be mutated.
+
+        Args:
+            category: The category to retrieve.
+            overwrite_existing: Whether to force a redownload. Defaults to False.
+
+        Returns:
+            Mapping[str, GenericModelRecord] | None: The category's records, or None if not found.
+
+        """
+        self._refresh_cached_records(overwrite_existing=overwrite_existing, safe_mode=False)
+        with self._lock:
+            return self._cached_records.get(category)
+
+    def _get_canonical_models(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        model_names: Iterable[str],
+        overwrite_existing: bool,
+    ) -> dict[str, GenericModelRecord | None]:
+        """Look up *model_names* in the canonical records of *category*, validating only those records.
+
+        A record that fails lazy validation is logged and reported as None, as an eager load reports its category.
+        """
+        model_reference = self.get_model_reference_view_or_none(category, overwrite_existing=overwrite_existing)
+        models: dict[str, GenericModelRecord | None] = dict.fromkeys(model_names)
+        if model_reference is None:
+            return models
+
+        for model_name in models:
+            try:
+                models[model_name] = model_reference.get(model_name)
+            except ValidationError as e:
+                logger.error(f"Record {model_name!r} in {category} failed validation: {e}")
+        return models
+
     def get_model_or_none(
         self,
         category: MODEL_REFERENCE_CATEGORY,
@@ -1299,9 +1586,12 @@ class ModelReferenceManager:
             source: Which source(s) to read from. See :meth:`get_model_reference_or_none`.
 
         Returns:
-            GenericModelRecord | None: The model record, or None if not found.
+            GenericModelRecord | None: The model record, or None if not found or invalid.
 
         """
+        if self._is_canonical_only(source):
+            return self._get_canonical_models(category, (model_name,), overwrite_existing)[model_name]
+
         model_reference = self.get_model_reference_or_none(
             category,
             overwrite_existing=overwrite_existing,
@@ -1334,12 +1624,21 @@ class ModelReferenceManager:
         Returns:
             GenericModelRecord: The model record.
 
+        Raises:
+            RuntimeError: If the category or the model could not be found or parsed.
+            pydantic.ValidationError: If `lazy_record_validation` is enabled and the record is invalid.
+
         """
-        model_reference = self.get_model_reference(
-            category,
-            overwrite_existing=overwrite_existing,
-            source=source,
-        )
+        if self._is_canonical_only(source):
+            model_reference = self.get_model_reference_view_or_none(category, overwrite_existing=overwrite_existing)
+            if model_reference is None:
+                raise RuntimeError(f"Model reference for category {category} not found or could not be parsed.")
+        else:
+            model_reference = self.get_model_reference(
+                category,
+                overwrite_existing=overwrite_existing,
+                source=source,
+            )
 
         model_record = model_reference.get(model_name)
         if model_record is None:
@@ -1347,6 +1646,43 @@ class ModelReferenceManager:
 
         return model_record
 
+    def get_models(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        model_names: Iterable[str],
+        overwrite_existing: bool = False,
+        *,
+        source: SourceSelector = HORDE_SOURCE_ID,
+    ) -> dict[str, GenericModelRecord | None]:
+        """Return several models from a category with a single read of the category.
+
+        Prefer this over calling :meth:`get_model_or_none` once per name, e.g. to resolve a worker's
+        configured model list.
+
+        Args:
+            category: The category to retrieve.
+            model_names: The names of the models within the category. Duplicates are looked up once.
+            overwrite_existing: Whether to force a redownload. Defaults to False.
+            source: Which source(s) to read from. See :meth:`get_model_reference_or_none`.
+
+        Returns:
+            dict[str, GenericModelRecord | None]: Each requested name, in request order, mapped to its
+                record, or None if it was not found or is invalid.
+
+        """
+        if self._is_canonical_only(source):
+            return self._get_canonical_models(category, model_names, overwrite_existing)
+
+        model_reference = self.get_model_reference_or_none(
+            category,
+            overwrite_existing=overwrite_existing,
+            source=source,
+        )
+        if model_reference is None:
+            return dict.fromkeys(model_names)
+
+        return {model_name: model_reference.get(model_name) for model_name in model_names}
+
     def get_raw_model_reference_json(
         self,
         category: MODEL_REFERENCE_CATEGORY,
@@ -1396,27 +1732,169 @@ class ModelReferenceManager:
 
         return category_json.get(model_name)
 
-    def _get_typed_models(
+    def get_raw_models_json(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        model_names: Iterable[str],
+        overwrite_existing: bool = False,
+    ) -> dict[str, dict[str, Any] | None] | None:
+        """Return the raw JSON dicts of several models in a category with a single read of the category.
+
+        The batch counterpart to :meth:`get_raw_model_json`.
+
+        Args:
+            category: The category to retrieve.
+            model_names: The names of the models within the category. Duplicates are looked up once.
+            overwrite_existing: Whether to force a redownload. Defaults to False.
+
+        Returns:
+            dict[str, dict[str, Any] | None] | None: Each requested name, in request order, mapped to its raw
+                JSON dict or None if it was not found; None if the category itself was not found.
+
+        """
+        category_json = self.backend.fetch_category(category, force_refresh=overwrite_existing)
+
+        if category_json is None:
+            return None
+
+        return {model_name: category_json.get(model_name) for model_name in model_names}
+
+    def _get_record_index(
         self,
         category: MODEL_REFERENCE_CATEGORY,
         *,
         record_type: type[TModelRecord],
-    ) -> dict[str, TModelRecord]:
-        """Return a typed mapping for the requested category."""
+    ) -> RecordIndex[TModelRecord]:
+        """Return the secondary query index for the category's current cache generation.
+
+        The index is built (and the records type-checked) once per generation: it is reused for as long as the
+        manager keeps serving the same cached records object, and rebuilt after any reload or invalidation.
+
+        Raises:
+            RuntimeError: If any cached record is not an instance of *record_type*.
+
+        """
         model_reference = self.get_model_reference(category)
 
-        if len(model_reference) == 0:
-            return {}
+        with self._lock:
+            cached = self._record_indexes.get(category)
+            if cached is not None and cached[0] is model_reference:
+                return cached[1]
 
-        typed_reference: dict[str, TModelRecord] = {}
-        for name, record in model_reference.items():
+        typed_records: list[TModelRecord] = []
+        for record in model_reference.values():
             if not isinstance(record, record_type):
                 raise RuntimeError(
                     f"Some records in {category.value} category are not {record_type.__name__} instances."
                 )
-            typed_reference[name] = record
+            typed_records.append(record)
+
+        with self._lock:
+            self._last_index_generation += 1
+            generation = self._last_index_generation
+        index = RecordIndex(
+            typed_records,
+            generation=generation,
+            columnar=horde_model_reference_settings.query_columnar_snapshots,
+        )
+        with self._lock:
+            if self._cached_records.get(category) is model_reference:
+                previous = self._record_indexes.get(category)
+                if previous is not None:
+                    self._drop_query_results(previous[1].generation)
+                self._record_indexes[category] = (model_reference, index)
+        logger.debug(f"Built query index for {category} ({len(index)} records).")
+        return index
+
+    def cached_query_page(
+        self,
+        query: ModelQuery[TModelRecord, Any],
+    ) -> tuple[list[TModelRecord], int]:
+        """Run *query* like :meth:`~horde_model_reference.query.ModelQuery.to_list_with_total`, memoizing the result.
+
+        Results are cached in an LRU (sized by ``query_result_cache_size``) keyed by the generation of the
+        query's index and its :meth:`~horde_model_reference.query.ModelQuery.plan_signature`. Any reload or
+        invalidation of the category (including backend invalidation callbacks) starts a new generation, so a
+        cached result is never served over stale records. Queries without an index from this manager's current
+        cache (e.g. provider-merged or cross-category queries) or without a plan signature are executed directly.
+
+        Args:
+            query: A query built by :meth:`query`, including any offset/limit.
+
+        Returns:
+            The page of records and the total number of matches ignoring offset/limit.
 
-        return typed_reference
+        """
+        max_entries = horde_model_reference_settings.query_result_cache_size
+        index = query.index
+        signature = query.plan_signature() if max_entries > 0 and index is not None else None
+        if index is None or signature is None:
+            return query.to_list_with_total()
+
+        key = (index.generation, signature)
+        with self._lock:
+            if not any(indexed is index for _, indexed in self._record_indexes.values()):
+                return query.to_list_with_total()
+            hit = self._query_results.get(key)
+            if hit is not None:
+                self._query_results.move_to_end(key)
+                return cast("list[TModelRecord]", list(hit[0])), hit[1]
+
+        page, total = query.to_list_with_total()
+
+        with self._lock:
+            if any(indexed is index for _, indexed in self._record_indexes.values()):
+                self._query_results[key] = (tuple(page), total)
+                self._query_results.move_to_end(key)
+                while len(self._query_results) > max_entries:
+                    self._query_results.popitem(last=False)
+        return page, total
+
+    def resolve_name(
+        self,
+        category: MODEL_REFERENCE_CATEGORY,
+        name: str,
+        *,
+        max_results: int = 5,
+    ) -> list[NameMatch]:
+        """Resolve an approximate model name to the canonical names of *category*, best match first.
+
+        Tolerates wrong case, separator differences, legacy backend prefixes, a missing author segment,
+        quantization suffixes (text generation only) and small typos; see
+        :mod:`horde_model_reference.name_resolution` for the match tiers. The resolver is built once per cache
+        generation of the category (alongside its query index), so a lookup is a few dictionary probes plus,
+        when needed, a trigram lookup - never a scan that re-parses every name.
+
+        Args:
+            category: The category to resolve within.
+            name: The (possibly inexact) model name.
+            max_results: The maximum number of matches to return.
+
+        Returns:
+            list[NameMatch]: Up to *max_results* matches; empty when nothing is similar enough.
+
+        Raises:
+            ValueError: If *max_results* is less than 1.
+
+        """
+        from horde_model_reference.name_resolution import NameResolver
+
+        index = self._get_record_index(category, record_type=GenericModelRecord)
+        with self._lock:
+            cached = self._name_resolvers.get(category)
+        if cached is not None and cached[0] is index:
+            resolver = cached[1]
+        else:
+            resolver = NameResolver(
+                (record.name for record in index.records),
+                text_names=category == MODEL_REFERENCE_CATEGORY.text_generation,
+            )
+            with self._lock:
+                current = self._record_indexes.get(category)
+                if current is not None and current[1] is index:
+                    self._name_resolvers[category] = (index, resolver)
+            logger.debug(f"Built name resolver for {category} ({len(resolver)} names).")
+        return resolver.resolve(name, max_results=max_results)
 
     @property
     def provider_registry(self) -> ModelProviderRegistry:
@@ -1813,9 +2291,8 @@ class ModelReferenceManager:
 
         if category == MODEL_REFERENCE_CATEGORY.image_generation:
             if canonical_only:
-                return build_image_query(
-                    self._get_typed_models(category, record_type=ImageGenerationModelRecord),
-                )
+                img_index = self._get_record_index(category, record_type=ImageGenerationModelRecord)
+                return ImageGenerationQuery(img_index.records, ImageGenerationModelRecord, index=img_index)
             img_records, img_sources, img_status = self._gather_typed_sourced(
                 category,
                 record_type=ImageGenerationModelRecord,
@@ -1830,9 +2307,8 @@ class ModelReferenceManager:
 
         if category == MODEL_REFERENCE_CATEGORY.text_generation:
             if canonical_only:
-                return build_text_query(
-                    self._get_typed_models(category, record_type=TextGenerationModelRecord),
-                )
+                txt_index = self._get_record_index(category, record_type=TextGenerationModelRecord)
+                return TextModelQuery(txt_index.records, TextGenerationModelRecord, index=txt_index)
             txt_records, txt_sources, txt_status = self._gather_typed_sourced(
                 category,
                 record_type=TextGenerationModelRecord,
@@ -1847,9 +2323,8 @@ class ModelReferenceManager:
 
         if category == MODEL_REFERENCE_CATEGORY.controlnet:
             if canonical_only:
-                return build_controlnet_query(
-                    self._get_typed_models(category, record_type=ControlNetModelRecord),
-                )
+                cn_index = self._get_record_index(category, record_type=ControlNetModelRecord)
+                return ControlNetQuery(cn_index.records, ControlNetModelRecord, index=cn_index)
             cn_records, cn_sources, cn_status = self._gather_typed_sourced(
                 category,
                 record_type=ControlNetModelRecord,
@@ -1864,7 +2339,8 @@ class ModelReferenceManager:
 
         record_type = MODEL_RECORD_TYPE_LOOKUP.get(category, GenericModelRecord)
         if canonical_only:
-            return build_query(self._get_typed_models(category, record_type=record_type), record_type)
+            generic_index = self._get_record_index(category, record_type=record_type)
+            return ModelQuery(generic_index.records, record_type, index=generic_index)
         sourced_records, sourced_sources, sourced_status = self._gather_typed_sourced(
             category,
             record_type=record_type,
@@ -1902,12 +2378,26 @@ class ModelReferenceManager:
     ) -> ModelQuery[GenericModelRecord, GenericFieldName | ImageGenFieldName | TextGenFieldName | ControlNetFieldName]:
         """Return a query builder spanning all categories.
 
+        The returned :class:`~horde_model_reference.query.CrossCategoryQuery` walks categories
+        lazily and pushes predicates down into each category's query index, so no combined
+        record list is built.
+
         Returns:
             A ``ModelQuery[GenericModelRecord]`` over every cached record.
 
         """
         all_refs = self.get_all_model_references()
-        return build_cross_category_query(all_refs)
+        indexes: dict[MODEL_REFERENCE_CATEGORY, RecordIndex[GenericModelRecord]] = {}
+        for category, records in all_refs.items():
+            if not records:
+                continue
+            index = self._get_record_index(category, record_type=GenericModelRecord)
+            with self._lock:
+                indexed = self._record_indexes.get(category)
+            # Only attach the index if it was built over this exact snapshot (no reload in between).
+            if indexed is not None and indexed[0] is records and indexed[1] is index:
+                indexes[category] = index
+        return build_cross_category_query(all_refs, indexes=indexes)
 
     _CATEGORY_TO_HORDE_TYPE: ClassVar[dict[MODEL_REFERENCE_CATEGORY, HordeModelType]] = {
         MODEL_REFERENCE_CATEGORY.image_generation: "image",
@@ -0,0 +1,196 @@
+"""Resolve approximate model names (wrong case, backend prefixes, quant suffixes, typos) to canonical names.
+
+A :class:`NameResolver` is built once over the names of one category snapshot. Every name is parsed and
+normalized at build time, so :meth:`NameResolver.resolve` answers most lookups with a few dictionary probes
+and only falls back to trigram similarity - touching just the names that share a trigram with the query - when
+the cheaper tiers do not fill the requested number of results.
+
+Match tiers, best first:
+
+1. ``exact``: the name as given.
+2. ``case_insensitive``: the lowercased name.
+3. ``normalized``: separators (``-``, ``.``, spaces) and legacy backend prefixes are ignored, and the name may
+   omit the author segment (``koboldcpp/Model`` resolves to ``Author/Model``).
+4. ``quant_stripped``: like ``normalized`` with the quantization suffix removed (text categories only).
+5. ``fuzzy``: trigram (Jaccard) similarity of the normalized, author-less names.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Literal
+
+from horde_model_reference.analytics.text_model_parser import normalize_model_name, parse_text_model_name
+from horde_model_reference.text_backend_names import has_legacy_text_backend_prefix, strip_backend_prefix
+
+type NameMatchType = Literal["exact", "case_insensitive", "normalized", "quant_stripped", "fuzzy"]
+
+_TIER_ORDER: dict[NameMatchType, int] = {
+    "exact": 0,
+    "case_insensitive": 1,
+    "normalized": 2,
+    "quant_stripped": 3,
+    "fuzzy": 4,
+}
+
+DEFAULT_MIN_SIMILARITY = 0.3
+"""Minimum trigram similarity for a ``fuzzy`` match."""
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    """A canonical model name matched by :meth:`NameResolver.resolve`.
+
+    Attributes:
+        name: The model name as stored in the reference.
+        match_type: The tier that matched (see the module docstring).
+        score: ``1.0`` for every tier except ``fuzzy``, which reports the trigram similarity.
+
+    """
+
+    name: str
+    match_type: NameMatchType
+    score: float
+
+
+def _without_author(name: str) -> str:
+    return name.split("/", 1)[1] if "/" in name else name
+
+
+def _normalized_keys(name: str) -> set[str]:
+    """Return the separator-insensitive keys for *name*: with and without its author segment."""
+    stripped = strip_backend_prefix(name)
+    return {normalize_model_name(stripped), normalize_model_name(_without_author(stripped))}
+
+
+def _quant_stripped_keys(name: str) -> set[str]:
+    """Return the normalized keys of *name* with its quantization suffix removed (empty if it has none)."""
+    stripped = strip_backend_prefix(name)
+    quant = parse_text_model_name(_without_author(stripped)).quant
+    if not quant:
+        return set()
+    return {key for key in _normalized_keys(stripped.replace(quant, "")) if key}
+
+
+def _trigrams(key: str) -> frozenset[str]:
+    padded = f"  {key} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class NameResolver:
+    """Index over one snapshot of model names for tiered name resolution."""
+
+    __slots__ = (
+        "_by_lower",
+        "_by_normalized",
+        "_by_quant_stripped",
+        "_fuzzy_keys",
+        "_min_similarity",
+        "_names",
+        "_text_names",
+        "_trigram_postings",
+    )
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        *,
+        text_names: bool = False,
+        min_similarity: float = DEFAULT_MIN_SIMILARITY,
+    ) -> None:
+        """Build the lookup tables for *names*.
+
+        Args:
+            names: The canonical model names of one category.
+            text_names: Whether the names are text generation model names; enables quant-suffix stripping and
+                ranks backend-prefixed duplicates after their canonical names.
+            min_similarity: Minimum trigram similarity (0-1) for ``fuzzy`` matches.
+
+        """
+        self._names: frozenset[str] = frozenset(names)
+        self._text_names = text_names
+        self._min_similarity = min_similarity
+        self._by_lower: dict[str, set[str]] = {}
+        self._by_normalized: dict[str, set[str]] = {}
+        self._by_quant_stripped: dict[str, set[str]] = {}
+        self._fuzzy_keys: dict[str, frozenset[str]] = {}
+        self._trigram_postings: dict[str, set[str]] = {}
+
+        for name in self._names:
+            self._by_lower.setdefault(name.lower(), set()).add(name)
+            for key in _normalized_keys(name):
+                self._by_normalized.setdefault(key, set()).add(name)
+            if text_names:
+                for key in _quant_stripped_keys(name):
+                    self._by_quant_stripped.setdefault(key, set()).add(name)
+            trigrams = _trigrams(normalize_model_name(_without_author(strip_backend_prefix(name))))
+            self._fuzzy_keys[name] = trigrams
+            for trigram in trigrams:
+                self._trigram_postings.setdefault(trigram, set()).add(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _rank(self, match: NameMatch) -> tuple[int, float, bool, str]:
+        prefixed = self._text_names and has_legacy_text_backend_prefix(match.name)
+        return (_TIER_ORDER[match.match_type], -match.score, prefixed, match.name)
+
+    def _fuzzy_matches(self, query: str) -> list[NameMatch]:
+        query_trigrams = _trigrams(normalize_model_name(_without_author(strip_backend_prefix(query))))
+        shared: dict[str, int] = {}
+        for trigram in query_trigrams:
+            for name in self._trigram_postings.get(trigram, ()):
+                shared[name] = shared.get(name, 0) + 1
+
+        matches: list[NameMatch] = []
+        for name, common in shared.items():
+            similarity = common / (len(query_trigrams) + len(self._fuzzy_keys[name]) - common)
+            if similarity >= self._min_similarity:
+                matches.append(NameMatch(name, "fuzzy", round(similarity, 4)))
+        return matches
+
+    def resolve(self, name: str, *, max_results: int = 5) -> list[NameMatch]:
+        """Return up to *max_results* canonical names matching *name*, best match first.
+
+        Each canonical name appears at most once, under the best tier that matched it. Within a tier, higher
+        scores come first, then (for text names) unprefixed names, then names in alphabetical order.
+
+        Raises:
+            ValueError: If *max_results* is less than 1.
+
+        """
+        if max_results < 1:
+            raise ValueError(f"max_results must be at least 1, got {max_results}")
+
+        best: dict[str, NameMatch] = {}
+
+        def _add(candidates: Iterable[str], match_type: NameMatchType) -> None:
+            for candidate in candidates:
+                best.setdefault(candidate, NameMatch(candidate, match_type, 1.0))
+
+        if name in self._names:
+            _add((name,), "exact")
+        _add(self._by_lower.get(name.lower(), ()), "case_insensitive")
+        for key in _normalized_keys(name):
+            _add(self._by_normalized.get(key, ()), "normalized")
+        if self._text_names:
+            quant_keys = _quant_stripped_keys(name)
+            for key in quant_keys:
+                _add(self._by_normalized.get(key, ()), "quant_stripped")
+            for key in _normalized_keys(name) | quant_keys:
+                _add(self._by_quant_stripped.get(key, ()), "quant_stripped")
+
+        if len(best) < max_results:
+            for match in self._fuzzy_matches(name):
+                best.setdefault(match.name, match)
+
+        return sorted(best.values(), key=self._rank)[:max_results]
+
+
+__all__ = [
+    "DEFAULT_MIN_SIMILARITY",
+    "NameMatch",
+    "NameMatchType",
+    "NameResolver",
+]
@@ -0,0 +1,211 @@
+"""Streaming NDJSON export of the model reference, one record per line.
+
+Bulk consumers (indexers, mirrors) that want every record would otherwise fetch each category as one JSON
+document and hold it in memory whole, on both ends. The PRIMARY's ``/model_references/v2/export.ndjson`` endpoint
+instead streams newline-delimited JSON built with :func:`iter_export_chunks`, and :func:`stream_export_records`
+(or :func:`astream_export_records`) reads it back line by line, validating one record at a time. Peak memory on
+either side is bounded by the largest single record rather than the size of the reference.
+
+Each line is an object of the form ``{"category": ..., "name": ..., "record": {...}}``, where ``record`` is the
+record exactly as stored in the v2 category file.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Mapping
+from typing import Any, NamedTuple
+
+import httpx
+
+from horde_model_reference import horde_model_reference_settings
+from horde_model_reference.http_clients import HTTPClientPool, get_http_client_pool
+from horde_model_reference.json_io import parse_json
+from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
+from horde_model_reference.model_reference_records import GenericModelRecord, get_record_type_for_category
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+"""The media type of the export stream."""
+
+EXPORT_CHUNK_BYTES = 64 * 1024
+"""Lines are sent in chunks of about this size, rather than one write per record."""
+
+
+class ExportedRecord(NamedTuple):
+    """One record read from an NDJSON export."""
+
+    category: MODEL_REFERENCE_CATEGORY | str
+    """The record's category. Categories unknown to this library version are kept as plain strings."""
+    name: str
+    """The key of the record in its category."""
+    record: GenericModelRecord
+    """The validated record, typed for its category."""
+
+
+def _dump_line(value: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def iter_export_lines(
+    categories: Iterable[tuple[MODEL_REFERENCE_CATEGORY, Mapping[str, Any] | None]],
+) -> Iterator[bytes]:
+    """Yield one encoded NDJSON line per record of each ``(category, raw records)`` pair.
+
+    *categories* is consumed lazily, so a generator can load each category only when its turn comes.
+    """
+    for category, records in categories:
+        if not records:
+            continue
+        for name, record in list(records.items()):
+            yield _dump_line({"category": category.value, "name": name, "record": record})
+
+
+def iter_export_chunks(
+    categories: Iterable[tuple[MODEL_REFERENCE_CATEGORY, Mapping[str, Any] | None]],
+    *,
+    chunk_bytes: int = EXPORT_CHUNK_BYTES,
+) -> Iterator[bytes]:
+    """Like :func:`iter_export_lines`, but joins consecutive lines into chunks of about *chunk_bytes*."""
+    buffer: list[bytes] = []
+    size = 0
+    for line in iter_export_lines(categories):
+        buffer.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            yield b"".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def parse_export_line(line: bytes | str) -> ExportedRecord | None:
+    """Parse and validate one NDJSON export line, or return None for a blank line.
+
+    Raises:
+        json.JSONDecodeError: If the line is not valid JSON.
+        KeyError: If the line is missing ``category``, ``name`` or ``record``.
+        pydantic.ValidationError: If the record does not validate against its category's record type.
+
+    """
+    if not line.strip():
+        return None
+    entry: dict[str, Any] = parse_json(line)
+    category_name: str = entry["category"]
+    try:
+        category: MODEL_REFERENCE_CATEGORY | str = MODEL_REFERENCE_CATEGORY(category_name)
+    except ValueError:
+        category = category_name
+    record = get_record_type_for_category(category).model_validate(entry["record"])
+    return ExportedRecord(category=category, name=entry["name"], record=record)
+
+
+def iter_export_records(lines: Iterable[bytes | str]) -> Iterator[ExportedRecord]:
+    """Validate NDJSON export *lines* into records one at a time, skipping blank lines."""
+    for line in lines:
+        exported = parse_export_line(line)
+        if exported is not None:
+            yield exported
+
+
+async def aiter_export_records(lines: AsyncIterable[bytes | str]) -> AsyncIterator[ExportedRecord]:
+    """Async counterpart to :func:`iter_export_records`."""
+    async for line in lines:
+        exported = parse_export_line(line)
+        if exported is not None:
+            yield exported
+
+
+def _export_request(
+    primary_api_url: str | None,
+    categories: Iterable[MODEL_REFERENCE_CATEGORY] | None,
+) -> tuple[str, dict[str, list[str]]]:
+    base_url = primary_api_url or horde_model_reference_settings.primary_api_url
+    if base_url is None:
+        raise ValueError("No PRIMARY API URL given or configured (primary_api_url)")
+    params = {"category": [category.value for category in categories]} if categories is not None else {}
+    return f"{base_url.rstrip('/')}/model_references/v2/export.ndjson", params
+
+
+def stream_export_records(
+    primary_api_url: str | None = None,
+    *,
+    categories: Iterable[MODEL_REFERENCE_CATEGORY] | None = None,
+    http_clients: HTTPClientPool | None = None,
+    timeout_seconds: float = horde_model_reference_settings.primary_api_timeout,
+) -> Iterator[ExportedRecord]:
+    """Stream every record (or those of *categories*) from a PRIMARY's NDJSON export.
+
+    Args:
+        primary_api_url: Base URL of the PRIMARY API, including the ``/api`` root path. Defaults to the
+            ``primary_api_url`` setting.
+        categories: Only export these categories. Defaults to all of them.
+        http_clients: Pooled HTTP clients to use. Defaults to the process-wide pool.
+        timeout_seconds: Timeout for connecting and for each read of the stream.
+
+    Yields:
+        ExportedRecord: Each record as soon as its line arrives.
+
+    Raises:
+        ValueError: If no PRIMARY API URL is given or configured.
+        httpx.HTTPStatusError: If the PRIMARY answers with an error status.
+
+    """
+    url, params = _export_request(primary_api_url, categories)
+    client = (http_clients or get_http_client_pool()).sync_client
+    with client.stream("GET", url, params=params, timeout=timeout_seconds) as response:
+        response.raise_for_status()
+        yield from iter_export_records(response.iter_lines())
+
+
+async def astream_export_records(
+    primary_api_url: str | None = None,
+    *,
+    categories: Iterable[MODEL_REFERENCE_CATEGORY] | None = None,
+    httpx_client: httpx.AsyncClient | None = None,
+    timeout_seconds: float = horde_model_reference_settings.primary_api_timeout,
+) -> AsyncIterator[ExportedRecord]:
+    """Async counterpart to :func:`stream_export_records`.
+
+    Args:
+        primary_api_url: Base URL of the PRIMARY API, including the ``/api`` root path. Defaults to the
+            ``primary_api_url`` setting.
+        categories: Only export these categories. Defaults to all of them.
+        httpx_client: The client to use. Defaults to the pooled client of the running event loop.
+        timeout_seconds: Timeout for connecting and for each read of the stream.
+
+    Yields:
+        ExportedRecord: Each record as soon as its line arrives.
+
+    Raises:
+        ValueError: If no PRIMARY API URL is given or configured.
+        httpx.HTTPStatusError: If the PRIMARY answers with an error status.
+
+    """
+    url, params = _export_request(primary_api_url, categories)
+    client = httpx_client if httpx_client is not None else get_http_client_pool().async_client()
+    async with client.stream("GET", url, params=params, timeout=timeout_seconds) as response:
+        response.raise_for_status()
+        async for exported in aiter_export_records(response.aiter_lines()):
+            yield exported
+
+
+__all__ = [
+    "EXPORT_CHUNK_BYTES",
+    "NDJSON_MEDIA_TYPE",
+    "ExportedRecord",
+    "aiter_export_records",
+    "astream_export_records",
+    "iter_export_chunks",
+    "iter_export_lines",
+    "iter_export_records",
+    "parse_export_line",
+    "stream_export_records",
+]
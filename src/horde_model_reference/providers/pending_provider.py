@@ -18,9 +18,9 @@ import threading
 import time
 from typing import Any, override
 
-import httpx
 from loguru import logger
 
+from horde_model_reference.http_clients import HTTPClientPool, get_http_client_pool
 from horde_model_reference.http_retry import (
     RetryableHTTPStatusError,
     http_retry_async,
@@ -59,6 +59,7 @@ class PendingModelProvider(ModelProvider):
         timeout_seconds: float = 10.0,
         retry_max_attempts: int = 3,
         retry_backoff_seconds: float = 1.0,
+        http_clients: HTTPClientPool | None = None,
     ) -> None:
         """Configure the provider.
 
@@ -71,6 +72,7 @@ class PendingModelProvider(ModelProvider):
             timeout_seconds: Per-request HTTP timeout.
             retry_max_attempts: Max attempts for transient HTTP failures.
             retry_backoff_seconds: Minimum backoff between retries.
+            http_clients: Pooled HTTP clients to send requests through. Defaults to the process-wide pool.
         """
         self._primary_api_url = primary_api_url.rstrip("/")
         self._apikey = apikey
@@ -79,6 +81,7 @@ class PendingModelProvider(ModelProvider):
         self._timeout_seconds = timeout_seconds
         self._retry_max_attempts = retry_max_attempts
         self._retry_backoff_seconds = retry_backoff_seconds
+        self._http_clients = http_clients or get_http_client_pool()
 
         self._lock = threading.RLock()
         self._cache: dict[MODEL_REFERENCE_CATEGORY, tuple[float, dict[str, GenericModelRecord]]] = {}
@@ -163,7 +166,7 @@ class PendingModelProvider(ModelProvider):
                 min_wait=self._retry_backoff_seconds,
             ):
                 with attempt:
-                    response = httpx.get(
+                    response = self._http_clients.sync_client.get(
                         url,
                         headers={"apikey": self._apikey},
                         timeout=self._timeout_seconds,
@@ -199,18 +202,18 @@ class PendingModelProvider(ModelProvider):
                 return cached
 
         url = self._category_url(resolved)
+        client = self._http_clients.async_client()
         try:
             async for attempt in http_retry_async(
                 max_attempts=self._retry_max_attempts,
                 min_wait=self._retry_backoff_seconds,
             ):
                 with attempt:
-                    async with httpx.AsyncClient() as client:
-                        response = await client.get(
-                            url,
-                            headers={"apikey": self._apikey},
-                            timeout=self._timeout_seconds,
-                        )
+                    response = await client.get(
+                        url,
+                        headers={"apikey": self._apikey},
+                        timeout=self._timeout_seconds,
+                    )
                     if is_retryable_status_code(response.status_code):
                         raise RetryableHTTPStatusError(response)
                     if response.status_code != 200:
@@ -21,8 +21,12 @@ Usage::
 
 from __future__ import annotations
 
+import bisect
+import functools
+import heapq
+import itertools
 import operator
-from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
 from typing import Any, Literal, Protocol, Self, overload, runtime_checkable
 
 from horde_model_reference.meta_consts import (
@@ -38,7 +42,9 @@ from horde_model_reference.model_reference_records import (
     ImageGenerationModelRecord,
     TextGenerationModelRecord,
 )
-from horde_model_reference.query_fields import FieldRef, OrderSpec, Predicate
+from horde_model_reference.query_columns import ColumnarSnapshot
+from horde_model_reference.query_fields import FieldRef, IndexHint, OrderSpec, Predicate, PredicateSignature
+from horde_model_reference.query_index import QUANTIZED_INDEX_KEY, TEXT_BACKEND_INDEX_KEY, RecordIndex, plan_predicates
 from horde_model_reference.source_consts import HORDE_SOURCE_ID, SourceOutcome
 from horde_model_reference.text_backend_names import (
     TEXT_LEGACY_BACKEND_PREFIXES,
@@ -146,10 +152,13 @@ _COMPARISON_OPS: dict[str, Callable[[Any, Any], bool]] = {
 }
 
 
-def _resolve_field_value(record: GenericModelRecord, field_path: str) -> object:
-    """Resolve a nested field path like ``finetune_series__name`` or raise on missing segments."""
-    obj: object = record
-    for part in field_path.split("__"):
+type FieldAccessor = Callable[[object], object]
+"""A compiled field-path reader: takes a record, returns the (possibly nested) field value."""
+
+
+def _walk_field_segments(obj: object, field_path: str, parts: tuple[str, ...]) -> object:
+    """Resolve the already-split *parts* of *field_path* starting from *obj* or raise on missing segments."""
+    for part in parts:
         if obj is None:
             raise ValueError(f"Field path '{field_path}' is missing segment '{part}' (encountered None)")
 
@@ -167,6 +176,48 @@ def _resolve_field_value(record: GenericModelRecord, field_path: str) -> object:
     return obj
 
 
+@functools.lru_cache(maxsize=1024)
+def _field_accessor(record_type: type[GenericModelRecord], field_path: str) -> FieldAccessor:
+    """Compile *field_path* (e.g. ``finetune_series__name``) into an accessor for records of *record_type*.
+
+    The path is split once per ``(record_type, field_path)``. A top-level segment declared on *record_type* is
+    read with ``operator.attrgetter``; the remaining segments (and undeclared top-level segments) fall back to the
+    same checked walk as :func:`_resolve_field_value`, so missing segments raise the same ``ValueError``.
+    """
+    parts = tuple(field_path.split("__"))
+    head, rest = parts[0], parts[1:]
+
+    if head not in record_type.model_fields:
+
+        def _walk(record: object) -> object:
+            return _walk_field_segments(record, field_path, parts)
+
+        return _walk
+
+    get_head = operator.attrgetter(head)
+
+    def _read_head(record: object) -> object:
+        try:
+            return get_head(record)
+        except AttributeError:
+            raise ValueError(
+                f"Field path '{field_path}' is missing attribute '{head}' on {type(record).__name__}"
+            ) from None
+
+    if not rest:
+        return _read_head
+
+    def _read_nested(record: object) -> object:
+        return _walk_field_segments(_read_head(record), field_path, rest)
+
+    return _read_nested
+
+
+def _resolve_field_value(record: GenericModelRecord, field_path: str) -> object:
+    """Resolve a nested field path like ``finetune_series__name`` or raise on missing segments."""
+    return _field_accessor(type(record), field_path)(record)
+
+
 def _validate_field_exists(record_type: type[GenericModelRecord], field_name: str) -> None:
     """Validate that *field_name* (top-level segment) exists on the Pydantic model.
 
@@ -180,6 +231,13 @@ def _validate_field_exists(record_type: type[GenericModelRecord], field_name: st
         raise ValueError(f"Field '{top_level}' does not exist on {record_type.__name__}. Valid fields: {valid}")
 
 
+_TAGS_FIELD = FieldRef("tags")
+"""Field reference backing the ``tags_*`` helpers (their predicates are index-able on every category)."""
+
+_NAME_FIELD = FieldRef("name")
+"""Field reference backing the ``name_contains``/``name_startswith`` helpers (served by the name index)."""
+
+
 def _field_name(field: FieldRef | str) -> str:
     """Resolve a typed :class:`FieldRef` (or a plain field-name string) to its field name.
 
@@ -189,11 +247,53 @@ def _field_name(field: FieldRef | str) -> str:
     return field.field_name if isinstance(field, FieldRef) else field
 
 
+def _is_number(value: object) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _validate_histogram_edges(edges: Sequence[float]) -> None:
+    """Raise ``ValueError`` unless *edges* holds at least two strictly increasing numbers."""
+    if len(edges) < 2:
+        raise ValueError(f"A histogram needs at least two bin edges, got {len(edges)}")
+    if not all(_is_number(edge) for edge in edges):
+        raise ValueError(f"Histogram bin edges must be numbers, got {list(edges)!r}")
+    if any(left >= right for left, right in itertools.pairwise(edges)):
+        raise ValueError(f"Histogram bin edges must be strictly increasing, got {list(edges)!r}")
+
+
+def _histogram_counts(field: str, values: Iterable[object], edges: Sequence[float]) -> list[int]:
+    """Bin *values* by *edges* in pure Python (same semantics as ``ColumnarSnapshot.histogram``)."""
+    counts = [0] * (len(edges) - 1)
+    last_bin = len(counts) - 1
+    for value in values:
+        if value is None:
+            continue
+        if not _is_number(value):
+            raise ValueError(
+                f"Cannot build a histogram of field '{field}': value of type {type(value).__name__} is not numeric"
+            )
+        assert isinstance(value, (int, float))
+        if not edges[0] <= value <= edges[-1]:  # also skips NaN
+            continue
+        counts[min(bisect.bisect_right(edges, value) - 1, last_bin)] += 1
+    return counts
+
+
 def _is_non_string_iterable(value: object) -> bool:
     """Return True when *value* is an iterable but not a string/bytes."""
     return isinstance(value, Iterable) and not isinstance(value, (str, bytes))
 
 
+def _all_hashable(values: Iterable[object]) -> bool:
+    """Return True when every item of *values* is hashable."""
+    try:
+        for value in values:
+            hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 def _to_hashable(field: str, value: object) -> Hashable:
     """Convert *value* into a hashable form or raise a helpful error."""
     if isinstance(value, list):
@@ -228,6 +328,11 @@ class ModelQuery[T: GenericModelRecord, F: str]:
     de-duplicated by name keeping the first (highest-priority) occurrence, so the
     canonical source wins collisions by default. Use :meth:`duplicate_names` /
     :meth:`has_duplicate_names` to detect when a collision occurred.
+
+    Indexing: when constructed with a :class:`~horde_model_reference.query_index.RecordIndex`
+    over the same records, predicates carrying an index hint (field-DSL comparisons,
+    keyword equality, ``tags_*`` and the category helpers) are answered by intersecting
+    posting sets; only the remaining predicates are evaluated per record.
     """
 
     _records: Sequence[T]
@@ -240,6 +345,7 @@ class ModelQuery[T: GenericModelRecord, F: str]:
     _sources: Sequence[str] | None
     _source_predicates: Sequence[Callable[[str], bool]]
     _source_status: dict[str, SourceOutcome] | None
+    _index: RecordIndex[T] | None
 
     def __init__(  # noqa: D107
         self,
@@ -254,11 +360,16 @@ class ModelQuery[T: GenericModelRecord, F: str]:
         sources: Sequence[str] | None = None,
         source_predicates: Sequence[Callable[[str], bool]] | None = None,
         source_status: Mapping[str, SourceOutcome] | None = None,
+        index: RecordIndex[T] | None = None,
     ) -> None:
         if sources is not None and len(sources) != len(records):
             raise ValueError(
                 f"sources length ({len(sources)}) must match records length ({len(records)}).",
             )
+        if index is not None and len(index) != len(records):
+            raise ValueError(
+                f"index length ({len(index)}) must match records length ({len(records)}).",
+            )
         self._records = records
         self._record_type = record_type
         self._predicates = list(predicates) if predicates else []
@@ -269,6 +380,7 @@ class ModelQuery[T: GenericModelRecord, F: str]:
         self._sources = list(sources) if sources is not None else None
         self._source_predicates = list(source_predicates) if source_predicates else []
         self._source_status = dict(source_status) if source_status is not None else None
+        self._index = index
 
     def _clone(
         self,
@@ -290,6 +402,7 @@ class ModelQuery[T: GenericModelRecord, F: str]:
         ``_records``, ``_sources`` and ``_source_status`` are passed through unchanged
         (fluent methods only ever adjust predicates/sort/pagination), so the records
         stay aligned with their provenance and the per-source outcome map is preserved.
+        The index is only carried over while the records are unchanged.
         """
         return type(self)(
             records=records if records is not None else self._records,
@@ -302,6 +415,37 @@ class ModelQuery[T: GenericModelRecord, F: str]:
             sources=self._sources,
             source_predicates=(source_predicates if source_predicates is not None else list(self._source_predicates)),
             source_status=self._source_status,
+            index=self._index if records is None else None,
+        )
+
+    @property
+    def index(self) -> RecordIndex[T] | None:
+        """The secondary index this query plans against, or ``None`` for an unindexed query."""
+        return self._index
+
+    def plan_signature(self) -> Hashable | None:
+        """Return a hashable, canonical description of this query, or ``None`` if it has none.
+
+        Two queries with equal signatures return identical results over the same records, so the
+        signature can key a result cache. Predicate order is normalized away (every predicate is
+        ANDed). Queries using opaque callables (``filter()`` with a plain function) or carrying
+        per-record provenance have no signature.
+        """
+        if self._sources is not None or self._source_predicates:
+            return None
+        signatures: list[PredicateSignature] = []
+        for predicate in self._predicates:
+            signature = getattr(predicate, "signature", None)
+            if signature is None:
+                return None
+            signatures.append(signature)
+        return (
+            self._record_type,
+            frozenset(signatures),
+            self._sort_key,
+            self._sort_descending,
+            self._offset_value,
+            self._limit_value,
         )
 
     def where(self, *predicates: Predicate, **kwargs: object) -> Self:
@@ -337,13 +481,13 @@ class ModelQuery[T: GenericModelRecord, F: str]:
                 op_name = "in"
 
             if op_name is None:
-                pred = self._eq_predicate(field_name, value)
+                pred = self._eq_predicate(self._record_type, field_name, value)
             else:
                 if op_name not in _COMPARISON_OPS:
                     raise ValueError(
                         f"Unknown operator '{op_name}'. Valid operators: {sorted(_COMPARISON_OPS.keys())}"
                     )
-                pred = self._cmp_predicate(field_name, op_name, value)
+                pred = self._cmp_predicate(self._record_type, field_name, op_name, value)
 
             new_preds.append(pred)
 
@@ -364,47 +508,35 @@ class ModelQuery[T: GenericModelRecord, F: str]:
                 return False
             return purpose is None or cls.purpose == purpose
 
-        new_preds.append(_classification_pred)
+        new_preds.append(Predicate(_classification_pred, signature=("classification", domain, purpose)))
         return self._clone(predicates=new_preds)
 
     def tags_any(self, tags: Iterable[str]) -> Self:
         """Keep records whose ``tags`` field contains **any** of *tags*."""
-        tag_set = set(tags)
         _validate_field_exists(self._record_type, "tags")
-
-        def _pred(record: T) -> bool:
-            record_tags: list[str] | None = getattr(record, "tags", None)
-            if not record_tags:
-                return False
-            return bool(tag_set & set(record_tags))
-
-        return self._clone(predicates=[*self._predicates, _pred])
+        return self._clone(predicates=[*self._predicates, _TAGS_FIELD.contains_any(tags)])
 
     def tags_all(self, tags: Iterable[str]) -> Self:
         """Keep records whose ``tags`` field contains **all** of *tags*."""
-        tag_set = set(tags)
         _validate_field_exists(self._record_type, "tags")
-
-        def _pred(record: T) -> bool:
-            record_tags: list[str] | None = getattr(record, "tags", None)
-            if not record_tags:
-                return False
-            return tag_set <= set(record_tags)
-
-        return self._clone(predicates=[*self._predicates, _pred])
+        return self._clone(predicates=[*self._predicates, _TAGS_FIELD.contains_all(tags)])
 
     def tags_none(self, tags: Iterable[str]) -> Self:
         """Exclude records whose ``tags`` field contains **any** of *tags*."""
-        tag_set = set(tags)
         _validate_field_exists(self._record_type, "tags")
+        return self._clone(predicates=[*self._predicates, _TAGS_FIELD.contains_none(tags)])
 
-        def _pred(record: T) -> bool:
-            record_tags: list[str] | None = getattr(record, "tags", None)
-            if not record_tags:
-                return True
-            return not (tag_set & set(record_tags))
+    def name_contains(self, text: str) -> Self:
+        """Keep records whose name contains *text*, ignoring case.
+
+        With an index attached, candidates come from the index's name trigrams (needles shorter than three
+        characters scan its precomputed lowercase names), so no name is lowercased per query.
+        """
+        return self._clone(predicates=[*self._predicates, _NAME_FIELD.icontains(text)])
 
-        return self._clone(predicates=[*self._predicates, _pred])
+    def name_startswith(self, text: str) -> Self:
+        """Keep records whose name starts with *text*, ignoring case (answered from the sorted name index)."""
+        return self._clone(predicates=[*self._predicates, _NAME_FIELD.istartswith(text)])
 
     def filter(self, predicate: Callable[[T], bool]) -> Self:
         """Apply an arbitrary predicate function."""
@@ -467,66 +599,181 @@ class ModelQuery[T: GenericModelRecord, F: str]:
         """Skip the first *n* results."""
         return self._clone(offset_value=n)
 
-    def _filtered_pairs(self) -> list[tuple[T, str]]:
-        """Return ``(record, source)`` pairs after applying record + source predicates.
+    def _iter_filtered_rows(self) -> Iterator[tuple[int, T, str]]:
+        """Yield ``(position, record, source)`` rows that pass the record + source predicates.
 
-        No de-duplication, sorting, or pagination is performed. When the query has
-        no provenance, every source is :data:`HORDE_SOURCE_ID`.
+        *position* indexes the query's records (and so its index, when attached). No
+        de-duplication, sorting, or pagination is performed. When the query has no
+        provenance, every source is :data:`HORDE_SOURCE_ID`. With an index, the
+        index-answerable predicates narrow the candidate positions first and only the
+        residual predicates are evaluated.
         """
-        if self._sources is None:
-            paired: list[tuple[T, str]] = [(r, HORDE_SOURCE_ID) for r in self._records]
+        predicates: Sequence[Callable[..., bool]] = self._predicates
+        positions: list[int] | None = None
+        if self._index is not None and predicates:
+            positions, predicates = plan_predicates(self._index, predicates)
+
+        rows: Iterable[tuple[int, T, str]]
+        if positions is None:
+            if self._sources is None:
+                rows = ((i, r, HORDE_SOURCE_ID) for i, r in enumerate(self._records))
+            else:
+                rows = ((i, r, s) for i, (r, s) in enumerate(zip(self._records, self._sources, strict=True)))
+        elif self._sources is None:
+            rows = ((i, self._records[i], HORDE_SOURCE_ID) for i in positions)
         else:
-            paired = list(zip(self._records, self._sources, strict=True))
+            rows = ((i, self._records[i], self._sources[i]) for i in positions)
 
-        return [
-            (record, source)
-            for record, source in paired
-            if all(p(record) for p in self._predicates) and all(sp(source) for sp in self._source_predicates)
-        ]
+        source_predicates = self._source_predicates
+        for row in rows:
+            if all(p(row[1]) for p in predicates) and all(sp(row[2]) for sp in source_predicates):
+                yield row
 
-    def _execute_with_sources(self) -> tuple[list[T], list[str]]:
-        """Apply predicates, canonical-wins de-duplication, sorting, and pagination.
+    def _iter_filtered_pairs(self) -> Iterator[tuple[T, str]]:
+        """Yield the ``(record, source)`` pairs of :meth:`_iter_filtered_rows`."""
+        for _, record, source in self._iter_filtered_rows():
+            yield record, source
 
-        Returns the surviving records and their aligned source ids. De-duplication
-        keeps the first occurrence of each model name; because the manager supplies
-        records canonical-first, the canonical source wins collisions by default.
-        """
-        paired = self._filtered_pairs()
-        if not paired:
-            return [], []
+    def _filtered_pairs(self) -> list[tuple[T, str]]:
+        """Return the :meth:`_iter_filtered_pairs` pairs as a list."""
+        return list(self._iter_filtered_pairs())
+
+    def _iter_deduped_pairs(self) -> Iterator[tuple[T, str]]:
+        """Yield filtered pairs with canonical-wins de-duplication applied.
 
+        De-duplication keeps the first occurrence of each model name; because the manager
+        supplies records canonical-first, the canonical source wins collisions by default.
+        """
         seen_names: set[str] = set()
-        deduped: list[tuple[T, str]] = []
-        for record, source in paired:
+        for record, source in self._iter_filtered_pairs():
             if record.name in seen_names:
                 continue
             seen_names.add(record.name)
-            deduped.append((record, source))
-        paired = deduped
-
-        if self._sort_key is not None:
-            key_field = self._sort_key
-
-            def _sort_key(item: tuple[T, str]) -> tuple[int, object]:
-                val = _resolve_field_value(item[0], key_field)
-                if val is None:
-                    return (1, "")
-                return (0, val)
-
-            try:
-                paired.sort(key=_sort_key, reverse=self._sort_descending)
-            except TypeError as exc:  # pragma: no cover - exercised via tests
-                value_types = {type(_resolve_field_value(r, key_field)).__name__ for r, _ in paired}
-                raise ValueError(
-                    "Cannot order by field "
-                    f"'{key_field}' because values are not mutually comparable: {sorted(value_types)}"
-                ) from exc
+            yield record, source
+
+    def _iter_deduped_rows(self) -> Iterator[tuple[int, T, str]]:
+        """Yield filtered ``(position, record, source)`` rows with canonical-wins de-duplication applied."""
+        seen_names: set[str] = set()
+        for row in self._iter_filtered_rows():
+            if row[1].name in seen_names:
+                continue
+            seen_names.add(row[1].name)
+            yield row
+
+    def _columnar_snapshot(self) -> ColumnarSnapshot | None:
+        """Return the attached index's numeric columns, or ``None`` when vectorized evaluation is unavailable."""
+        return self._index.columns if self._index is not None else None
+
+    def _page_end(self) -> int | None:
+        """Return ``offset + limit`` when both are non-negative and a limit is set, else ``None``."""
+        if self._limit_value is None or self._limit_value < 0 or self._offset_value < 0:
+            return None
+        return self._offset_value + self._limit_value
 
+    def _paginate[V](self, items: Sequence[V]) -> Sequence[V]:
+        """Apply offset then limit to already-ordered *items* using plain slice semantics."""
         if self._offset_value:
-            paired = paired[self._offset_value :]
+            items = items[self._offset_value :]
         if self._limit_value is not None:
-            paired = paired[: self._limit_value]
+            items = items[: self._limit_value]
+        return items
+
+    def _sort_key_function(self, key_field: str) -> Callable[[tuple[T, str]], tuple[int, object]]:
+        """Return the ``(record, source)`` sort key for *key_field*; ``None`` values sort last (ascending)."""
+        read_key = _field_accessor(self._record_type, key_field)
+
+        def _sort_key(item: tuple[T, str]) -> tuple[int, object]:
+            val = read_key(item[0])
+            if val is None:
+                return (1, "")
+            return (0, val)
+
+        return _sort_key
+
+    def _incomparable_sort_error(self, key_field: str, paired: Iterable[tuple[T, str]]) -> ValueError:
+        """Build the error raised when *key_field* values of *paired* cannot be ordered."""
+        read_key = _field_accessor(self._record_type, key_field)
+        value_types = {type(read_key(r)).__name__ for r, _ in paired}
+        return ValueError(
+            f"Cannot order by field '{key_field}' because values are not mutually comparable: {sorted(value_types)}"
+        )
+
+    def _sorted_page_window(
+        self,
+        paired: list[tuple[T, str]],
+        key_field: str,
+        end: int | None,
+    ) -> list[tuple[T, str]]:
+        """Order *paired* by *key_field*, keeping only the first *end* entries when *end* is given.
+
+        With a page end smaller than the input, ``heapq.nsmallest``/``nlargest`` select the
+        top-K without sorting everything; both are documented to be equivalent to
+        ``sorted(...)[:end]`` (including stability), so results match a full sort.
+        """
+        sort_key = self._sort_key_function(key_field)
+        try:
+            if end is not None and end < len(paired):
+                select = heapq.nlargest if self._sort_descending else heapq.nsmallest
+                return select(end, paired, key=sort_key)
+            return sorted(paired, key=sort_key, reverse=self._sort_descending)
+        except TypeError as exc:  # pragma: no cover - exercised via tests
+            raise self._incomparable_sort_error(key_field, paired) from exc
+
+    def _run(self, *, with_total: bool) -> tuple[list[tuple[T, str]], int | None]:
+        """Execute the query in a single pass over the records.
+
+        Args:
+            with_total: Also count every de-duplicated match (ignoring offset/limit).
+
+        Returns:
+            The page of ``(record, source)`` pairs and the total, or ``None`` for the total
+            when *with_total* is false. Unsorted queries stop as soon as the page is full
+            unless a total was requested; sorted queries select only the top ``offset + limit``.
+
+        """
+        deduped = self._iter_deduped_pairs()
+        end = self._page_end()
+
+        if self._sort_key is None:
+            if end is None:
+                everything = list(deduped)
+                return list(self._paginate(everything)), len(everything)
+            if not with_total:
+                return list(itertools.islice(deduped, self._offset_value, end)), None
+            page: list[tuple[T, str]] = []
+            total = 0
+            for pair in deduped:
+                if self._offset_value <= total < end:
+                    page.append(pair)
+                total += 1
+            return page, total
+
+        columns = self._columnar_snapshot()
+        if columns is not None and columns.column(self._sort_key) is not None:
+            rows = list(self._iter_deduped_rows())
+            ordered = columns.order_positions(
+                self._sort_key,
+                [position for position, _, _ in rows],
+                descending=self._sort_descending,
+                limit=end,
+            )
+            if ordered is not None:
+                by_position = {position: (record, source) for position, record, source in rows}
+                window = [by_position[position] for position in ordered]
+                return list(self._paginate(window) if end is None else window[self._offset_value :]), len(rows)
 
+        matched = list(deduped)
+        if not matched:
+            return [], 0
+        window = self._sorted_page_window(matched, self._sort_key, end)
+        return list(self._paginate(window) if end is None else window[self._offset_value :]), len(matched)
+
+    def _execute_with_sources(self) -> tuple[list[T], list[str]]:
+        """Apply predicates, canonical-wins de-duplication, sorting, and pagination.
+
+        Returns the surviving records and their aligned source ids.
+        """
+        paired, _ = self._run(with_total=False)
         records = [record for record, _ in paired]
         sources = [source for _, source in paired]
         return records, sources
@@ -631,8 +878,27 @@ class ModelQuery[T: GenericModelRecord, F: str]:
         return results[0] if results else None
 
     def count(self) -> int:
-        """Execute the query and return the number of matching records."""
-        return len(self._execute())
+        """Execute the query and return the number of matching records (after offset/limit).
+
+        Sorting never changes how many records match, so the records are only counted, not ordered.
+        """
+        matched = sum(1 for _ in self._iter_deduped_pairs())
+        return len(self._paginate(range(matched)))
+
+    def to_list_with_total(self) -> tuple[list[T], int]:
+        """Execute the query once, returning the requested page and the total match count.
+
+        The total counts every de-duplicated match and ignores :meth:`offset`/:meth:`limit`, which makes
+        this the single-pass equivalent of ``(q.offset(o).limit(n).to_list(), q.count())``. When the query
+        is sorted, only the top ``offset + limit`` records are ordered.
+
+        Returns:
+            A ``(records, total)`` tuple.
+
+        """
+        paired, total = self._run(with_total=True)
+        assert total is not None
+        return [record for record, _ in paired], total
 
     def distinct(self, field: FieldRef | F) -> list[object]:
         """Return unique values of *field* across matching records (raises on unhashable values).
@@ -641,10 +907,11 @@ class ModelQuery[T: GenericModelRecord, F: str]:
         """
         field_name = _field_name(field)
         _validate_field_exists(self._record_type, field_name)
+        read_field = _field_accessor(self._record_type, field_name)
         seen: set[Hashable] = set()
         result: list[object] = []
         for record in self._execute():
-            val = _resolve_field_value(record, field_name)
+            val = read_field(record)
             hashable_val = _to_hashable(field_name, val)
             if hashable_val not in seen:
                 seen.add(hashable_val)
@@ -662,13 +929,46 @@ class ModelQuery[T: GenericModelRecord, F: str]:
         """
         field_name = _field_name(field)
         _validate_field_exists(self._record_type, field_name)
+        read_field = _field_accessor(self._record_type, field_name)
         groups: dict[Hashable, list[T]] = {}
         for record in self._execute():
-            val = _resolve_field_value(record, field_name)
+            val = read_field(record)
             key = _to_hashable(field_name, val)
             groups.setdefault(key, []).append(record)
         return groups
 
+    def histogram(self, field: FieldRef | F, edges: Sequence[float]) -> list[int]:
+        """Count matching records per bin of a numeric *field*.
+
+        Bin ``i`` covers ``edges[i] <= value < edges[i + 1]``; the last bin also includes its right edge
+        (the ``numpy.histogram`` convention). ``None`` values and values outside the edges are not counted.
+        When NumPy columns are available for the query's index and no offset/limit is set, the counts are
+        computed in bulk; otherwise matching records are binned in Python, with identical results.
+
+        Args:
+            field: A numeric top-level field name or ``FieldRef``.
+            edges: At least two strictly increasing bin edges.
+
+        Returns:
+            One count per bin (``len(edges) - 1`` entries).
+
+        Raises:
+            ValueError: If the edges are invalid or a matching record has a non-numeric value for *field*.
+
+        """
+        field_name = _field_name(field)
+        _validate_field_exists(self._record_type, field_name)
+        _validate_histogram_edges(edges)
+
+        columns = self._columnar_snapshot()
+        if columns is not None and not self._offset_value and self._limit_value is None:
+            counts = columns.histogram(field_name, [position for position, _, _ in self._iter_deduped_rows()], edges)
+            if counts is not None:
+                return counts
+
+        read_field = _field_accessor(self._record_type, field_name)
+        return _histogram_counts(field_name, (read_field(record) for record in self._execute()), edges)
+
     @staticmethod
     def _parse_key(raw_key: str) -> tuple[str, str | None]:
         """Split ``field__op`` into ``(field, op)`` or ``(field, None)``."""
@@ -686,21 +986,35 @@ class ModelQuery[T: GenericModelRecord, F: str]:
         return raw_key, None
 
     @staticmethod
-    def _eq_predicate(field_name: str, value: object) -> Callable[[GenericModelRecord], bool]:
-        """Build an equality predicate for *field_name*."""
+    def _eq_predicate(
+        record_type: type[GenericModelRecord],
+        field_name: str,
+        value: object,
+    ) -> Callable[[GenericModelRecord], bool]:
+        """Build an equality predicate for *field_name* on records of *record_type*."""
+        read_field = _field_accessor(record_type, field_name)
 
         def _pred(record: GenericModelRecord) -> bool:
-            return _resolve_field_value(record, field_name) == value
+            return read_field(record) == value
 
-        return _pred
+        if not _all_hashable((value,)):
+            return _pred
+        hint = None if "__" in field_name else IndexHint("eq", field_name, value)  # type: ignore[arg-type]
+        return Predicate(_pred, hint, signature=("where", field_name, "eq", value))
 
     @staticmethod
-    def _cmp_predicate(field_name: str, op_name: str, value: object) -> Callable[[GenericModelRecord], bool]:
-        """Build a comparison predicate for *field_name* using *op_name*."""
+    def _cmp_predicate(
+        record_type: type[GenericModelRecord],
+        field_name: str,
+        op_name: str,
+        value: object,
+    ) -> Callable[[GenericModelRecord], bool]:
+        """Build a comparison predicate for *field_name* on records of *record_type* using *op_name*."""
         cmp_fn = _COMPARISON_OPS[op_name]
+        read_field = _field_accessor(record_type, field_name)
 
         def _pred(record: GenericModelRecord) -> bool:
-            field_val = _resolve_field_value(record, field_name)
+            field_val = read_field(record)
             if field_val is None:
                 return False
             if op_name == "in":
@@ -713,7 +1027,62 @@ class ModelQuery[T: GenericModelRecord, F: str]:
                 return cmp_fn(field_val, value)
             return cmp_fn(field_val, value)
 
-        return _pred
+        hint = None if "__" in field_name else ModelQuery._cmp_hint(field_name, op_name, value)
+        signature = ModelQuery._cmp_signature(field_name, op_name, value)
+        if hint is None and signature is None:
+            return _pred
+        return Predicate(_pred, hint, signature=signature)
+
+    @staticmethod
+    def _cmp_signature(field_name: str, op_name: str, value: object) -> PredicateSignature | None:
+        """Return the predicate signature of a keyword comparison, or ``None`` if *value* is unhashable."""
+        operand: object = value
+        if op_name == "in":
+            if not _is_non_string_iterable(value) or not isinstance(value, (Sequence, set, frozenset)):
+                return None
+            if not _all_hashable(value):
+                return None
+            operand = frozenset(value)
+        elif not _all_hashable((value,)):
+            return None
+        return ("where", field_name, op_name, operand)  # type: ignore[return-value]
+
+    @staticmethod
+    def _cmp_hint(field_name: str, op_name: str, value: object) -> IndexHint | None:
+        """Return the index hint equivalent to a keyword comparison, or ``None`` if there is none."""
+        if op_name == "in":
+            if not _is_non_string_iterable(value) or not isinstance(value, (Sequence, set, frozenset)):
+                return None
+            if not _all_hashable(value):
+                return None
+            # A None field value never matches, even when None is one of the choices.
+            return IndexHint("in", field_name, frozenset(v for v in value if v is not None))
+        if op_name == "contains":
+            return IndexHint("tags_any", field_name, frozenset((value,))) if _all_hashable((value,)) else None
+        if op_name == "ne":
+            if not _all_hashable((value,)):
+                return None
+            return IndexHint(
+                "and",
+                children=(
+                    IndexHint("not", children=(IndexHint("eq", field_name, value),)),  # type: ignore[arg-type]
+                    IndexHint("not", children=(IndexHint("eq", field_name, None),)),
+                ),
+            )
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        return IndexHint("range", field_name, (op_name, value))
+
+
+_TRUTHY_HINTS: dict[str, IndexHint] = {
+    field: IndexHint("in", field, frozenset((True,))) for field in ("nsfw", "inpainting")
+}
+"""Hints for ``bool(record.<field>)`` on the boolean-or-None indexed fields."""
+
+_FALSY_HINTS: dict[str, IndexHint] = {
+    field: IndexHint("in", field, frozenset((False, None))) for field in ("nsfw", "inpainting")
+}
+"""Hints for ``not record.<field>`` on the boolean-or-None indexed fields."""
 
 
 class ImageGenerationQuery(ModelQuery[ImageGenerationModelRecord, ImageGenFieldName]):
@@ -730,7 +1099,8 @@ class ImageGenerationQuery(ModelQuery[ImageGenerationModelRecord, ImageGenFieldN
         def _pred(record: ImageGenerationModelRecord) -> bool:
             return record.baseline == baseline
 
-        return self._clone(predicates=[*self._predicates, _pred])
+        predicate = Predicate(_pred, IndexHint("eq", "baseline", baseline), signature=("for_baseline", baseline))
+        return self._clone(predicates=[*self._predicates, predicate])
 
     def only_nsfw(self) -> Self:
         """Keep only NSFW models."""
@@ -738,7 +1108,8 @@ class ImageGenerationQuery(ModelQuery[ImageGenerationModelRecord, ImageGenFieldN
         def _pred(record: ImageGenerationModelRecord) -> bool:
             return record.nsfw
 
-        return self._clone(predicates=[*self._predicates, _pred])
+        predicate = Predicate(_pred, _TRUTHY_HINTS["nsfw"], signature=("only_nsfw",))
+        return self._clone(predicates=[*self._predicates, predicate])
 
     def exclude_nsfw(self) -> Self:
         """Remove NSFW models."""
@@ -746,7 +1117,8 @@ class ImageGenerationQuery(ModelQuery[ImageGenerationModelRecord, ImageGenFieldN
         def _pred(record: ImageGenerationModelRecord) -> bool:
             return not record.nsfw
 
-        return self._clone(predicates=[*self._predicates, _pred])
+        predicate = Predicate(_pred, _FALSY_HINTS["nsfw"], signature=("exclude_nsfw",))
+        return self._clone(predicates=[*self._predicates, predicate])
 
     def only_inpainting(self) -> Self:
         """Keep only inpainting models."""
@@ -754,7 +1126,8 @@ class ImageGenerationQuery(ModelQuery[ImageGenerationModelRecord, ImageGenFieldN
         def _pred(record: ImageGenerationModelRecord) -> bool:
             return bool(record.inpainting)
 
-        return self._clone(predicates=[*self._predicates, _pred])
+        predicate = Predicate(_pred, _TRUTHY_HINTS["inpainting"], signature=("only_inpainting",))
+        return self._clone(predicates=[*self._predicates, predicate])
 
     def exclude_inpainting(self) -> Self:
         """Remove inpainting models."""
@@ -762,7 +1135,8 @@ class ImageGenerationQuery(ModelQuery[ImageGenerationModelRecord, ImageGenFieldN
         def _pred(record: ImageGenerationModelRecord) -> bool:
             return not record.inpainting
 
-        return self._clone(predicates=[*self._predicates, _pred])
+        predicate = Predicate(_pred, _FALSY_HINTS["inpainting"], signature=("exclude_inpainting",))
+        return self._clone(predicates=[*self._predicates, predicate])
 
 
 class TextModelQuery(ModelQuery[TextGenerationModelRecord, TextGenFieldName]):
@@ -785,7 +1159,8 @@ class TextModelQuery(ModelQuery[TextGenerationModelRecord, TextGenFieldName]):
         def _pred(record: TextGenerationModelRecord) -> bool:
             return record.name.startswith(prefix)
 
-        return self._clone(predicates=[*self._predicates, _pred])
+        hint = IndexHint("eq", TEXT_BACKEND_INDEX_KEY, backend)
+        return self._clone(predicates=[*self._predicates, Predicate(_pred, hint, signature=("for_backend", backend))])
 
     def exclude_backend_variations(self) -> Self:
         """Remove models that carry any legacy backend prefix."""
@@ -793,7 +1168,9 @@ class TextModelQuery(ModelQuery[TextGenerationModelRecord, TextGenFieldName]):
         def _pred(record: TextGenerationModelRecord) -> bool:
             return not has_legacy_text_backend_prefix(record.name)
 
-        return self._clone(predicates=[*self._predicates, _pred])
+        hint = IndexHint("eq", TEXT_BACKEND_INDEX_KEY, None)
+        predicate = Predicate(_pred, hint, signature=("exclude_backend_variations",))
+        return self._clone(predicates=[*self._predicates, predicate])
 
     def only_quantized(self) -> Self:
         """Keep only quantized model variants."""
@@ -802,7 +1179,8 @@ class TextModelQuery(ModelQuery[TextGenerationModelRecord, TextGenFieldName]):
         def _pred(record: TextGenerationModelRecord) -> bool:
             return is_quantized_variant(record.name)
 
-        return self._clone(predicates=[*self._predicates, _pred])
+        hint = IndexHint("eq", QUANTIZED_INDEX_KEY, True)
+        return self._clone(predicates=[*self._predicates, Predicate(_pred, hint, signature=("only_quantized",))])
 
     def exclude_quantized(self) -> Self:
         """Remove quantized model variants."""
@@ -811,7 +1189,8 @@ class TextModelQuery(ModelQuery[TextGenerationModelRecord, TextGenFieldName]):
         def _pred(record: TextGenerationModelRecord) -> bool:
             return not is_quantized_variant(record.name)
 
-        return self._clone(predicates=[*self._predicates, _pred])
+        hint = IndexHint("eq", QUANTIZED_INDEX_KEY, False)
+        return self._clone(predicates=[*self._predicates, Predicate(_pred, hint, signature=("exclude_quantized",))])
 
     def group_by_base_model(self) -> dict[str, list[TextGenerationModelRecord]]:
         """Group matching records by their parsed base model name.
@@ -842,7 +1221,7 @@ class ControlNetQuery(ModelQuery[GenericModelRecord, ControlNetFieldName]):
         def _pred(record: GenericModelRecord) -> bool:
             return getattr(record, "controlnet_style", None) == style
 
-        return self._clone(predicates=[*self._predicates, _pred])
+        return self._clone(predicates=[*self._predicates, Predicate(_pred, signature=("for_style", style))])
 
     def group_by_style(self) -> dict[str, list[GenericModelRecord]]:
         """Group matching records by their ControlNet style.
@@ -859,6 +1238,148 @@ class ControlNetQuery(ModelQuery[GenericModelRecord, ControlNetFieldName]):
         return groups
 
 
+class _ChainedRecords[T](Sequence[T]):
+    """Read-only view that concatenates several record sequences without copying them."""
+
+    __slots__ = ("_length", "_parts")
+
+    def __init__(self, parts: Sequence[Sequence[T]]) -> None:
+        self._parts = tuple(parts)
+        self._length = sum(len(part) for part in self._parts)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[T]:
+        return itertools.chain.from_iterable(self._parts)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | Sequence[T]:
+        if isinstance(index, slice):
+            return list(self)[index]
+        position = index + self._length if index < 0 else index
+        if not 0 <= position < self._length:
+            raise IndexError("record index out of range")
+        for part in self._parts:
+            if position < len(part):
+                return part[position]
+            position -= len(part)
+        raise IndexError("record index out of range")  # pragma: no cover - guarded above
+
+
+class CrossCategoryQuery(ModelQuery[GenericModelRecord, str]):
+    """Query spanning several categories, executed category by category.
+
+    Behaves exactly like a ``ModelQuery`` over the concatenation of every category's records
+    (in category order, first occurrence of a name wins), but never builds that list:
+
+    - Predicates are pushed down into each category's own query, so hinted predicates
+      (field-DSL comparisons such as ``FieldRef("nsfw") == False``, ``FieldRef("tags").contains_any``)
+      are answered from that category's :class:`~horde_model_reference.query_index.RecordIndex`.
+    - Unsorted pages stop walking categories as soon as the page is full.
+    - Sorted pages order each category's matches separately (top ``offset + limit`` only) and
+      combine them with ``heapq.merge``.
+
+    Fields are validated against :class:`GenericModelRecord`; use ``FieldRef`` predicates for
+    category-specific fields (missing attributes read as ``None``).
+    """
+
+    _parts: tuple[ModelQuery[Any, Any], ...] = ()
+
+    @classmethod
+    def from_parts(cls, parts: Iterable[ModelQuery[Any, Any]]) -> CrossCategoryQuery:
+        """Create a cross-category query over per-category queries (without provenance), in priority order."""
+        part_tuple = tuple(parts)
+        for part in part_tuple:
+            if part._sources is not None:
+                raise ValueError("Cross-category parts must not carry per-record sources.")
+        query = cls(_ChainedRecords([part._records for part in part_tuple]), GenericModelRecord)
+        query._parts = part_tuple
+        return query
+
+    def _clone(
+        self,
+        records: Sequence[GenericModelRecord] | None = None,
+        record_type: type[GenericModelRecord] | None = None,
+        predicates: Sequence[Callable[..., bool]] | None = None,
+        sort_key: str | None = None,
+        sort_descending: bool | None = None,
+        offset_value: int | None = None,
+        limit_value: int | None = None,
+        source_predicates: Sequence[Callable[[str], bool]] | None = None,
+    ) -> Self:
+        """Clone like :meth:`ModelQuery._clone`, keeping the per-category parts while the records are unchanged."""
+        clone = super()._clone(
+            records=records,
+            record_type=record_type,
+            predicates=predicates,
+            sort_key=sort_key,
+            sort_descending=sort_descending,
+            offset_value=offset_value,
+            limit_value=limit_value,
+            source_predicates=source_predicates,
+        )
+        if records is None:
+            clone._parts = self._parts
+        return clone
+
+    def _iter_part_streams(self) -> Iterator[Iterator[tuple[GenericModelRecord, str]]]:
+        """Yield, per category, the filtered pairs with this query's predicates pushed down."""
+        source_predicates = self._source_predicates
+        for part in self._parts:
+            pushed = part._clone(predicates=[*part._predicates, *self._predicates])
+            yield (
+                (record, source)
+                for record, source in pushed._iter_filtered_pairs()
+                if all(sp(source) for sp in source_predicates)
+            )
+
+    def _iter_filtered_pairs(self) -> Iterator[tuple[GenericModelRecord, str]]:
+        """Yield filtered pairs category by category (see :meth:`ModelQuery._iter_filtered_pairs`)."""
+        if not self._parts:
+            yield from super()._iter_filtered_pairs()
+            return
+        for stream in self._iter_part_streams():
+            yield from stream
+
+    def _run(self, *, with_total: bool) -> tuple[list[tuple[GenericModelRecord, str]], int | None]:
+        """Execute like :meth:`ModelQuery._run`, merging per-category sorted streams for ordered queries."""
+        if self._sort_key is None or not self._parts:
+            return super()._run(with_total=with_total)
+
+        key_field = self._sort_key
+        seen_names: set[str] = set()
+        per_category: list[list[tuple[GenericModelRecord, str]]] = []
+        for stream in self._iter_part_streams():
+            survivors: list[tuple[GenericModelRecord, str]] = []
+            for record, source in stream:
+                if record.name in seen_names:
+                    continue
+                seen_names.add(record.name)
+                survivors.append((record, source))
+            if survivors:
+                per_category.append(survivors)
+
+        total = sum(len(survivors) for survivors in per_category)
+        end = self._page_end()
+        windows = [self._sorted_page_window(survivors, key_field, end) for survivors in per_category]
+        try:
+            # heapq.merge is stable across inputs (earlier category first on ties), like sorting the concatenation.
+            merged = heapq.merge(*windows, key=self._sort_key_function(key_field), reverse=self._sort_descending)
+            ordered = list(itertools.islice(merged, end))
+        except TypeError as exc:
+            raise self._incomparable_sort_error(key_field, itertools.chain.from_iterable(windows)) from exc
+
+        if end is None:
+            return list(self._paginate(ordered)), total
+        return ordered[self._offset_value :], total
+
+
 def build_query[T: GenericModelRecord](
     records: dict[str, T],
     record_type: type[T],
@@ -953,29 +1474,37 @@ def build_controlnet_query(
 
 
 def build_cross_category_query(
-    all_references: dict[MODEL_REFERENCE_CATEGORY, dict[str, GenericModelRecord]],
-) -> ModelQuery[GenericModelRecord, str]:
-    """Create a ``ModelQuery`` spanning all categories.
+    all_references: Mapping[MODEL_REFERENCE_CATEGORY, Mapping[str, GenericModelRecord]],
+    *,
+    indexes: Mapping[MODEL_REFERENCE_CATEGORY, RecordIndex[GenericModelRecord]] | None = None,
+) -> CrossCategoryQuery:
+    """Create a ``CrossCategoryQuery`` spanning all categories.
 
     Args:
         all_references: Mapping returned by ``ModelReferenceManager.get_all_model_references()``.
+        indexes: Optional per-category indexes over the same records; categories with an index
+            answer pushed-down predicates from it.
 
     Returns:
-        A ``ModelQuery[GenericModelRecord]`` over every record in every category.
+        A ``CrossCategoryQuery`` over every record in every category.
 
     """
-    all_records: list[GenericModelRecord] = []
-    for category_records in all_references.values():
-        all_records.extend(category_records.values())
-    return ModelQuery(
-        records=all_records,
-        record_type=GenericModelRecord,
-    )
+    parts: list[ModelQuery[GenericModelRecord, str]] = []
+    for category, category_records in all_references.items():
+        if not category_records:
+            continue
+        index = indexes.get(category) if indexes is not None else None
+        if index is not None:
+            parts.append(ModelQuery(index.records, GenericModelRecord, index=index))
+        else:
+            parts.append(ModelQuery(tuple(category_records.values()), GenericModelRecord))
+    return CrossCategoryQuery.from_parts(parts)
 
 
 __all__ = [
     "ControlNetFieldName",
     "ControlNetQuery",
+    "CrossCategoryQuery",
     "GenericFieldName",
     "ImageGenFieldName",
     "ImageGenerationQuery",
@@ -0,0 +1,217 @@
+"""Optional NumPy-backed numeric columns over an indexed record snapshot.
+
+A :class:`ColumnarSnapshot` extracts top-level numeric fields (``parameters_count``, ``size_on_disk_bytes``, ...)
+of a :class:`~horde_model_reference.query_index.RecordIndex` snapshot into arrays on first use, so ``ModelQuery``
+can evaluate range comparisons, ordering and histograms in bulk instead of calling a closure per record.
+
+NumPy is optional: when it is not installed, :func:`build_columnar_snapshot` returns ``None`` and the query engine
+keeps using its pure-Python path. A column is only built when the vectorized result is guaranteed to equal the
+Python one - every value must be ``None`` or a non-boolean ``int``/``float`` that float64 represents exactly, and
+no value may be NaN. Any other field yields no column, and the caller falls back.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import Any, TypeGuard
+
+from horde_model_reference.model_reference_records import GenericModelRecord
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None  # type: ignore[assignment]
+
+NUMPY_AVAILABLE = np is not None
+"""Whether NumPy could be imported (and so whether columnar snapshots are available)."""
+
+_MAX_EXACT_FLOAT_INT = 2**53
+"""Largest integer magnitude float64 represents exactly; larger ints make a column non-exact."""
+
+_MISSING = object()
+
+
+def _is_exact_number(value: object) -> TypeGuard[int | float]:
+    """Return whether *value* is a non-boolean number float64 can hold without changing comparisons."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    if isinstance(value, int):
+        return abs(value) <= _MAX_EXACT_FLOAT_INT
+    return not math.isnan(value)
+
+
+class NumericColumn:
+    """One numeric field of a snapshot: float64 values plus a mask of which records have a value."""
+
+    __slots__ = ("_ranks", "present", "values")
+
+    def __init__(self, values: Any, present: Any) -> None:  # noqa: ANN401
+        """Wrap the aligned ``values`` (float64) and ``present`` (bool) arrays."""
+        self.values = values
+        self.present = present
+        self._ranks: dict[bool, Any] = {}
+
+    def compare(self, op_name: str, bound: object) -> Any | None:  # noqa: ANN401
+        """Return a boolean mask of records whose value is ``<op_name> bound``, or ``None`` if not exact.
+
+        ``None`` values never match, mirroring the query engine's comparison predicates.
+        """
+        if not _is_exact_number(bound):
+            return None
+        if op_name == "lt":
+            matched = self.values < bound
+        elif op_name == "lte":
+            matched = self.values <= bound
+        elif op_name == "gt":
+            matched = self.values > bound
+        elif op_name == "gte":
+            matched = self.values >= bound
+        else:
+            return None
+        return self.present & matched
+
+    def ranks(self, *, descending: bool) -> Any:  # noqa: ANN401
+        """Return each record's rank in the query engine's sort order for this field.
+
+        Matches a stable ``sorted()`` over ``(is_none, value)`` keys: ascending puts ``None`` last,
+        ``descending`` (``reverse=True``) puts ``None`` first, and ties keep record order either way.
+        """
+        cached = self._ranks.get(descending)
+        if cached is not None:
+            return cached
+
+        assert np is not None
+        with_value = np.flatnonzero(self.present)
+        without_value = np.flatnonzero(~self.present)
+        keys = -self.values[with_value] if descending else self.values[with_value]
+        ordered_with_value = with_value[np.argsort(keys, kind="stable")]
+        if descending:
+            order = np.concatenate((without_value, ordered_with_value))
+        else:
+            order = np.concatenate((ordered_with_value, without_value))
+
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(len(order), dtype=np.int64)
+        self._ranks[descending] = ranks
+        return ranks
+
+
+class ColumnarSnapshot:
+    """Lazily built numeric columns over an immutable record sequence."""
+
+    __slots__ = ("_columns", "_records")
+
+    def __init__(self, records: Sequence[GenericModelRecord]) -> None:
+        """Remember *records*; columns are extracted per field on first use."""
+        self._records = records
+        self._columns: dict[str, NumericColumn | None] = {}
+
+    def column(self, field: str) -> NumericColumn | None:
+        """Return the column for top-level *field*, or ``None`` if it cannot be vectorized exactly."""
+        if field in self._columns:
+            return self._columns[field]
+        column = self._build_column(field)
+        self._columns[field] = column
+        return column
+
+    def _build_column(self, field: str) -> NumericColumn | None:
+        assert np is not None
+        if "__" in field:
+            return None
+        values = np.zeros(len(self._records), dtype=np.float64)
+        present = np.zeros(len(self._records), dtype=bool)
+        for position, record in enumerate(self._records):
+            value = getattr(record, field, _MISSING)
+            if value is None:
+                continue
+            if value is _MISSING or not _is_exact_number(value):
+                return None
+            values[position] = float(value)
+            present[position] = True
+        return NumericColumn(values, present)
+
+    def positions_matching(self, field: str, op_name: str, bound: object) -> frozenset[int] | None:
+        """Return the positions whose *field* satisfies ``<op_name> bound`` exactly, or ``None`` to fall back."""
+        column = self.column(field)
+        if column is None:
+            return None
+        mask = column.compare(op_name, bound)
+        if mask is None:
+            return None
+        assert np is not None
+        return frozenset(np.flatnonzero(mask).tolist())
+
+    def order_positions(
+        self,
+        field: str,
+        positions: Sequence[int],
+        *,
+        descending: bool,
+        limit: int | None = None,
+    ) -> list[int] | None:
+        """Order *positions* by *field* (query-engine sort semantics), keeping the first *limit*.
+
+        Args:
+            field: The top-level field to order by.
+            positions: Snapshot positions to order, in ascending position order.
+            descending: Whether to sort descending (``None`` values first, as with ``reverse=True``).
+            limit: Keep only this many leading positions (top-K selection); ``None`` keeps all.
+
+        Returns:
+            list[int] | None: The ordered positions, or ``None`` if *field* cannot be vectorized.
+
+        """
+        column = self.column(field)
+        if column is None:
+            return None
+        assert np is not None
+        selected = np.asarray(positions, dtype=np.intp)
+        ranks = column.ranks(descending=descending)[selected]
+        if limit is not None and limit < len(selected):
+            if limit <= 0:
+                return []
+            top = np.argpartition(ranks, limit - 1)[:limit]
+            order = top[np.argsort(ranks[top])]
+        else:
+            order = np.argsort(ranks)
+        ordered: list[int] = selected[order].tolist()
+        return ordered
+
+    def histogram(self, field: str, positions: Sequence[int], edges: Sequence[float]) -> list[int] | None:
+        """Count *positions* per ``[edges[i], edges[i + 1])`` bin of *field* (last bin closed).
+
+        ``None`` values and values outside the edges are not counted.
+
+        Returns:
+            list[int] | None: One count per bin, or ``None`` if *field* (or an edge) cannot be vectorized.
+
+        """
+        column = self.column(field)
+        if column is None or not all(_is_exact_number(edge) for edge in edges):
+            return None
+        assert np is not None
+        selected = np.asarray(positions, dtype=np.intp)
+        values = column.values[selected][column.present[selected]]
+        edge_array = np.asarray(edges, dtype=np.float64)
+        bins = np.searchsorted(edge_array, values, side="right") - 1
+        # A value equal to the last edge belongs to the last (closed) bin.
+        bins[values == edge_array[-1]] = len(edges) - 2
+        in_range = (bins >= 0) & (bins < len(edges) - 1)
+        counts: list[int] = np.bincount(bins[in_range], minlength=len(edges) - 1).tolist()
+        return counts
+
+
+def build_columnar_snapshot(records: Sequence[GenericModelRecord]) -> ColumnarSnapshot | None:
+    """Return a columnar snapshot over *records*, or ``None`` when NumPy is not installed."""
+    if not NUMPY_AVAILABLE:
+        return None
+    return ColumnarSnapshot(records)
+
+
+__all__ = [
+    "NUMPY_AVAILABLE",
+    "ColumnarSnapshot",
+    "NumericColumn",
+    "build_columnar_snapshot",
+]
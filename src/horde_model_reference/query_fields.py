@@ -19,17 +19,91 @@ Usage::
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
-from typing import Any
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+type IndexHintOp = Literal[
+    "eq",
+    "in",
+    "range",
+    "tags_any",
+    "tags_all",
+    "tags_none",
+    "text_contains",
+    "text_startswith",
+    "and",
+    "or",
+    "not",
+]
+
+type PredicateSignature = tuple[Hashable, ...]
+"""A hashable, canonical description of what a :class:`Predicate` tests (used as a result-cache key)."""
+
+
+@dataclass(frozen=True, slots=True)
+class IndexHint:
+    """Declarative description of a predicate that a secondary index may be able to answer.
+
+    Attached to :class:`Predicate` objects built by the field DSL and the query helpers so the
+    query planner (see :mod:`horde_model_reference.query_index`) can resolve them from posting
+    sets instead of calling the predicate on every record. A hint never replaces the predicate:
+    whenever the planner cannot answer a hint exactly, the predicate is still evaluated.
+    """
+
+    op: IndexHintOp
+    """The operation: a leaf comparison (``eq``/``in``/``range``/``tags_*``/``text_*``) or a boolean combinator."""
+
+    field: str = ""
+    """The indexed field (or derived ``@key``) the leaf operation applies to."""
+
+    value: Hashable = None
+    """The comparison operand. ``in``/``tags_*`` use a ``frozenset``; ``range`` uses ``(op_name, bound)``; \
+``text_*`` use the lowercased needle."""
+
+    children: tuple[IndexHint | None, ...] = ()
+    """Operands of ``and``/``or``/``not``. ``None`` marks an operand without a hint."""
+
+
+def _is_hashable(value: object) -> bool:
+    """Return whether *value* can be used as a posting-set key."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
 
 
 class Predicate:
-    """A composable predicate for use with ``ModelQuery.where()`` and ``filter()``."""
+    """A composable predicate for use with ``ModelQuery.where()`` and ``filter()``.
+
+    Predicates built by the field DSL and the query helpers also carry a *signature*: a hashable
+    value that two predicates share only if they test exactly the same thing. Predicates wrapping
+    arbitrary callables have no signature, which makes any query using them uncacheable.
+    """
 
-    __slots__ = ("_fn",)
+    __slots__ = ("_fn", "_hint", "_signature")
 
-    def __init__(self, fn: Callable[[Any], bool]) -> None:  # noqa: D107
+    def __init__(  # noqa: D107
+        self,
+        fn: Callable[[Any], bool],
+        hint: IndexHint | None = None,
+        *,
+        signature: PredicateSignature | None = None,
+    ) -> None:
         self._fn = fn
+        self._hint = hint
+        self._signature = signature
+
+    @property
+    def index_hint(self) -> IndexHint | None:
+        """The index hint describing this predicate, if it is index-able."""
+        return self._hint
+
+    @property
+    def signature(self) -> PredicateSignature | None:
+        """The canonical description of this predicate, or ``None`` if it wraps an opaque callable."""
+        return self._signature
 
     def __call__(self, record: object) -> bool:
         """Evaluate the predicate against *record*."""
@@ -38,17 +112,31 @@ class Predicate:
     def __and__(self, other: Predicate) -> Predicate:
         """Combine this predicate with *other* using logical AND (short-circuit)."""
         left, right = self._fn, other._fn
-        return Predicate(lambda r: left(r) and right(r))
+        hint = None
+        if self._hint is not None or other._hint is not None:
+            hint = IndexHint("and", children=(self._hint, other._hint))
+        return Predicate(lambda r: left(r) and right(r), hint, signature=self._combined_signature("and", other))
 
     def __or__(self, other: Predicate) -> Predicate:
         """Combine this predicate with *other* using logical OR (short-circuit)."""
         left, right = self._fn, other._fn
-        return Predicate(lambda r: left(r) or right(r))
+        hint = None
+        if self._hint is not None and other._hint is not None:
+            hint = IndexHint("or", children=(self._hint, other._hint))
+        return Predicate(lambda r: left(r) or right(r), hint, signature=self._combined_signature("or", other))
 
     def __invert__(self) -> Predicate:
         """Return the logical NOT of this predicate."""
         fn = self._fn
-        return Predicate(lambda r: not fn(r))
+        hint = IndexHint("not", children=(self._hint,)) if self._hint is not None else None
+        signature = ("not", self._signature) if self._signature is not None else None
+        return Predicate(lambda r: not fn(r), hint, signature=signature)
+
+    def _combined_signature(self, op: str, other: Predicate) -> PredicateSignature | None:
+        """Return the signature of ``self <op> other``, or ``None`` if either side has none."""
+        if self._signature is None or other._signature is None:
+            return None
+        return (op, self._signature, other._signature)
 
     def __repr__(self) -> str:
         """Return a debug representation of this predicate."""
@@ -93,57 +181,170 @@ class FieldRef:
         field = self._field_name
         if isinstance(other, FieldRef):
             other_field = other._field_name
-            return Predicate(lambda r: getattr(r, field, None) == getattr(r, other_field, None))
-        return Predicate(lambda r: getattr(r, field, None) == other)
+            return Predicate(
+                lambda r: getattr(r, field, None) == getattr(r, other_field, None),
+                signature=self._signature("eq_field", other_field),
+            )
+        return Predicate(
+            lambda r: getattr(r, field, None) == other,
+            self._eq_hint(other),
+            signature=self._signature("eq", other),
+        )
 
     def __ne__(self, other: Any) -> Predicate:  # type: ignore # noqa It's idiomatic for __ne__ to return a non-bool in this DSL context
         """Return a predicate that tests field inequality to *other*."""
         field = self._field_name
         if isinstance(other, FieldRef):
             other_field = other._field_name
-            return Predicate(lambda r: getattr(r, field, None) != getattr(r, other_field, None))
-        return Predicate(lambda r: getattr(r, field, None) != other)
+            return Predicate(
+                lambda r: getattr(r, field, None) != getattr(r, other_field, None),
+                signature=self._signature("ne_field", other_field),
+            )
+        eq_hint = self._eq_hint(other)
+        hint = IndexHint("not", children=(eq_hint,)) if eq_hint is not None else None
+        return Predicate(lambda r: getattr(r, field, None) != other, hint, signature=self._signature("ne", other))
+
+    def _eq_hint(self, other: object) -> IndexHint | None:
+        """Return an ``eq`` hint for comparing this field to *other*, or ``None`` if *other* is unhashable."""
+        if not _is_hashable(other):
+            return None
+        return IndexHint("eq", self._field_name, other)  # type: ignore[arg-type]
+
+    def _signature(self, op: str, operand: object = None) -> PredicateSignature | None:
+        """Return the predicate signature for ``<this field> <op> operand``, or ``None`` if *operand* is unhashable."""
+        if not _is_hashable(operand):
+            return None
+        return ("field", op, self._field_name, operand)  # type: ignore[return-value]
+
+    def _range_hint(self, op_name: str, other: object) -> IndexHint | None:
+        """Return a ``range`` hint for numeric bounds, or ``None`` for anything else."""
+        if isinstance(other, bool) or not isinstance(other, (int, float)):
+            return None
+        return IndexHint("range", self._field_name, (op_name, other))
 
     def __lt__(self, other: object) -> Predicate:
         """Return a predicate for field value less-than comparison."""
         field = self._field_name
-        return Predicate(lambda r: (v := getattr(r, field, None)) is not None and v < other)
+        return Predicate(
+            lambda r: (v := getattr(r, field, None)) is not None and v < other,
+            self._range_hint("lt", other),
+            signature=self._signature("lt", other),
+        )
 
     def __le__(self, other: object) -> Predicate:
         """Return a predicate for field value less-than-or-equal comparison."""
         field = self._field_name
-        return Predicate(lambda r: (v := getattr(r, field, None)) is not None and v <= other)
+        return Predicate(
+            lambda r: (v := getattr(r, field, None)) is not None and v <= other,
+            self._range_hint("lte", other),
+            signature=self._signature("lte", other),
+        )
 
     def __gt__(self, other: object) -> Predicate:
         """Return a predicate for field value greater-than comparison."""
         field = self._field_name
-        return Predicate(lambda r: (v := getattr(r, field, None)) is not None and v > other)
+        return Predicate(
+            lambda r: (v := getattr(r, field, None)) is not None and v > other,
+            self._range_hint("gt", other),
+            signature=self._signature("gt", other),
+        )
 
     def __ge__(self, other: object) -> Predicate:
         """Return a predicate for field value greater-than-or-equal comparison."""
         field = self._field_name
-        return Predicate(lambda r: (v := getattr(r, field, None)) is not None and v >= other)
+        return Predicate(
+            lambda r: (v := getattr(r, field, None)) is not None and v >= other,
+            self._range_hint("gte", other),
+            signature=self._signature("gte", other),
+        )
 
     def contains(self, item: object) -> Predicate:
         """Check whether the field value (an iterable) contains *item*."""
         field = self._field_name
-        return Predicate(lambda r: item in (getattr(r, field, None) or []))
+        hint = IndexHint("tags_any", field, frozenset((item,))) if _is_hashable(item) else None
+        return Predicate(
+            lambda r: item in (getattr(r, field, None) or []),
+            hint,
+            signature=self._signature("contains", item),
+        )
+
+    def contains_any(self, items: Iterable[object]) -> Predicate:
+        """Check whether the field value (an iterable) contains **any** of *items*; ``None``/empty never matches."""
+        field = self._field_name
+        item_set = frozenset(items)
+        return Predicate(
+            lambda r: bool(item_set.intersection(getattr(r, field, None) or ())),
+            IndexHint("tags_any", field, item_set),
+            signature=self._signature("contains_any", item_set),
+        )
+
+    def contains_all(self, items: Iterable[object]) -> Predicate:
+        """Check whether the field value (an iterable) contains **all** of *items*; ``None``/empty never matches."""
+        field = self._field_name
+        item_set = frozenset(items)
+        return Predicate(
+            lambda r: bool(v := getattr(r, field, None)) and item_set.issubset(v),
+            IndexHint("tags_all", field, item_set),
+            signature=self._signature("contains_all", item_set),
+        )
+
+    def contains_none(self, items: Iterable[object]) -> Predicate:
+        """Check whether the field value (an iterable) contains **none** of *items*; ``None``/empty always matches."""
+        field = self._field_name
+        item_set = frozenset(items)
+        return Predicate(
+            lambda r: not item_set.intersection(getattr(r, field, None) or ()),
+            IndexHint("tags_none", field, item_set),
+            signature=self._signature("contains_none", item_set),
+        )
+
+    def icontains(self, text: str) -> Predicate:
+        """Check whether the field value (a string) contains *text*, ignoring case; non-strings never match."""
+        field = self._field_name
+        needle = text.lower()
+        return Predicate(
+            lambda r: isinstance(v := getattr(r, field, None), str) and needle in v.lower(),
+            IndexHint("text_contains", field, needle),
+            signature=self._signature("icontains", needle),
+        )
+
+    def istartswith(self, text: str) -> Predicate:
+        """Check whether the field value (a string) starts with *text*, ignoring case; non-strings never match."""
+        field = self._field_name
+        needle = text.lower()
+        return Predicate(
+            lambda r: isinstance(v := getattr(r, field, None), str) and v.lower().startswith(needle),
+            IndexHint("text_startswith", field, needle),
+            signature=self._signature("istartswith", needle),
+        )
 
     def is_in(self, choices: Iterable[object]) -> Predicate:
         """Check whether the field value is a member of *choices*."""
         choice_set = set(choices)
         field = self._field_name
-        return Predicate(lambda r: getattr(r, field, None) in choice_set)
+        return Predicate(
+            lambda r: getattr(r, field, None) in choice_set,
+            IndexHint("in", field, frozenset(choice_set)),
+            signature=self._signature("in", frozenset(choice_set)),
+        )
 
     def is_none(self) -> Predicate:
         """Check whether the field value is ``None``."""
         field = self._field_name
-        return Predicate(lambda r: getattr(r, field, None) is None)
+        return Predicate(
+            lambda r: getattr(r, field, None) is None,
+            IndexHint("eq", field, None),
+            signature=self._signature("is_none"),
+        )
 
     def is_not_none(self) -> Predicate:
         """Check whether the field value is not ``None``."""
         field = self._field_name
-        return Predicate(lambda r: getattr(r, field, None) is not None)
+        return Predicate(
+            lambda r: getattr(r, field, None) is not None,
+            IndexHint("not", children=(IndexHint("eq", field, None),)),
+            signature=self._signature("is_not_none"),
+        )
 
     def is_true(self) -> Predicate:
         """Check whether the field value is ``True``.
@@ -151,7 +352,11 @@ class FieldRef:
         For boolean fields, prefer this over ``FieldRef == true()``.
         """
         field = self._field_name
-        return Predicate(lambda r: getattr(r, field, None) is True)
+        return Predicate(
+            lambda r: getattr(r, field, None) is True,
+            IndexHint("eq", field, True),
+            signature=self._signature("is_true"),
+        )
 
     def is_false(self) -> Predicate:
         """Check whether the field value is ``False``.
@@ -159,7 +364,11 @@ class FieldRef:
         For boolean fields, prefer this over ``FieldRef == false()``.
         """
         field = self._field_name
-        return Predicate(lambda r: getattr(r, field, None) is False)
+        return Predicate(
+            lambda r: getattr(r, field, None) is False,
+            IndexHint("eq", field, False),
+            signature=self._signature("is_false"),
+        )
 
     def asc(self) -> OrderSpec:
         """Return an ascending ``OrderSpec`` for this field."""
@@ -0,0 +1,420 @@
+"""Secondary (inverted) indexes over a snapshot of model records, and the planner that uses them.
+
+A :class:`RecordIndex` is built once per cache generation of a category (the manager rebuilds it whenever the
+category's cached records are replaced). It maps values of a few high-traffic fields to *posting sets* - frozensets
+of positions into the snapshot's record tuple - so ``ModelQuery`` can answer index-able predicates by intersecting
+sets instead of calling a closure on every record.
+
+Indexed keys:
+
+- Single-valued fields: ``baseline``, ``nsfw``, ``inpainting``, ``style``.
+- ``tags``: one posting per tag (multi-valued).
+- ``@text_backend``: the legacy backend prefix(es) a name starts with (``None`` for unprefixed names).
+- ``@quantized``: whether the name parses as a quantized text model variant.
+- ``parameters_count``: power-of-two buckets, used to narrow numeric range comparisons.
+- ``name``: a lowercase-name table, a trigram index (case-insensitive substring search) and a sorted lowercase
+  name list (case-insensitive prefix search).
+
+When built with ``columnar=True`` and NumPy is installed, the index also exposes a
+:class:`~horde_model_reference.query_columns.ColumnarSnapshot`, which answers range comparisons on any numeric
+top-level field exactly (instead of as a bucketed superset) and backs vectorized ordering and histograms.
+
+Posting sets are computed lazily per key on first use, so a category that is never filtered by, say, quantization
+never pays for parsing every name.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Any
+
+from horde_model_reference.model_reference_records import GenericModelRecord
+from horde_model_reference.query_columns import ColumnarSnapshot, build_columnar_snapshot
+from horde_model_reference.query_fields import IndexHint
+from horde_model_reference.text_backend_names import TEXT_LEGACY_BACKEND_PREFIXES
+
+SINGLE_VALUE_INDEX_FIELDS: tuple[str, ...] = ("baseline", "nsfw", "inpainting", "style")
+"""Record fields indexed by exact value."""
+
+TAGS_INDEX_FIELD = "tags"
+TEXT_BACKEND_INDEX_KEY = "@text_backend"
+QUANTIZED_INDEX_KEY = "@quantized"
+PARAMETERS_BUCKET_FIELD = "parameters_count"
+NAME_INDEX_FIELD = "name"
+
+NGRAM_SIZE = 3
+"""Length of the name n-grams indexed for substring search; shorter needles scan the lowercase-name table."""
+
+_UNBUCKETED = -1
+"""Bucket for values that cannot be placed in a power-of-two bucket (negative or non-numeric)."""
+
+
+def _text_backends_for_name(name: str) -> list[Hashable]:
+    backends: list[Hashable] = [
+        backend for backend, prefix in TEXT_LEGACY_BACKEND_PREFIXES.items() if name.startswith(prefix)
+    ]
+    return backends or [None]
+
+
+def _is_quantized_name(name: str) -> bool:
+    from horde_model_reference.analytics.text_model_parser import is_quantized_variant
+
+    return is_quantized_variant(name)
+
+
+def _name_ngrams(lower_name: str) -> set[str]:
+    return {lower_name[i : i + NGRAM_SIZE] for i in range(len(lower_name) - NGRAM_SIZE + 1)}
+
+
+def _parameters_bucket(value: object) -> int | None:
+    """Return the power-of-two bucket for a numeric value, ``None`` for ``None``, or ``_UNBUCKETED``."""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0 or not math.isfinite(value):
+        return _UNBUCKETED
+    return int(value).bit_length()
+
+
+type Postings = dict[Hashable, frozenset[int]]
+type PlanResult = tuple[frozenset[int], bool]
+"""Candidate positions and whether they are *exactly* the matching records (vs. a superset)."""
+
+
+class RecordIndex[T: GenericModelRecord]:
+    """Inverted indexes over an immutable snapshot of records.
+
+    Positions in every posting set refer to :attr:`records`. The index never mutates after construction except
+    for lazily filling in posting sets, which is idempotent (a race simply builds the same set twice).
+    """
+
+    __slots__ = (
+        "_all_positions",
+        "_columnar",
+        "_columns",
+        "_columns_built",
+        "_generation",
+        "_lower_names",
+        "_name_ngrams",
+        "_postings",
+        "_records",
+        "_sorted_lower_names",
+        "_tagged_positions",
+    )
+
+    def __init__(self, records: Iterable[T], *, generation: int = 0, columnar: bool = False) -> None:
+        """Snapshot *records* (order is preserved) without building any posting sets yet.
+
+        Args:
+            records: The records to index.
+            generation: Identifier of the cache generation the records belong to. The manager assigns a
+                unique, increasing value per build so results computed over this snapshot can be cached.
+            columnar: Expose NumPy-backed numeric columns via :attr:`columns` (ignored without NumPy).
+
+        """
+        self._records: tuple[T, ...] = tuple(records)
+        self._generation = generation
+        self._all_positions = frozenset(range(len(self._records)))
+        self._postings: dict[str, Postings | None] = {}
+        self._tagged_positions: frozenset[int] | None = None
+        self._columnar = columnar
+        self._columns: ColumnarSnapshot | None = None
+        self._columns_built = False
+        self._lower_names: tuple[str, ...] | None = None
+        self._name_ngrams: dict[str, frozenset[int]] | None = None
+        self._sorted_lower_names: list[tuple[str, int]] | None = None
+
+    @property
+    def records(self) -> tuple[T, ...]:
+        """The indexed records, in the order posting positions refer to."""
+        return self._records
+
+    @property
+    def generation(self) -> int:
+        """The cache generation the indexed records belong to."""
+        return self._generation
+
+    @property
+    def columns(self) -> ColumnarSnapshot | None:
+        """The numeric column snapshot, or ``None`` when columnar evaluation is disabled or NumPy is missing."""
+        if not self._columns_built:
+            self._columns = build_columnar_snapshot(self._records) if self._columnar else None
+            self._columns_built = True
+        return self._columns
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _build_postings(self, key: str, values_for: Callable[[GenericModelRecord], Iterable[Hashable]]) -> Postings:
+        building: dict[Hashable, set[int]] = {}
+        for position, record in enumerate(self._records):
+            for value in values_for(record):
+                building.setdefault(value, set()).add(position)
+        return {value: frozenset(positions) for value, positions in building.items()}
+
+    def postings(self, key: str) -> Postings | None:
+        """Return the posting sets for *key*, building them on first use.
+
+        Returns:
+            Postings | None: ``value -> positions``, or ``None`` if *key* is not index-able for these records
+                (unknown key, or a record holds an unhashable value).
+
+        """
+        if key in self._postings:
+            return self._postings[key]
+
+        postings: Postings | None
+        try:
+            if key in SINGLE_VALUE_INDEX_FIELDS:
+                postings = self._build_postings(key, lambda r: (getattr(r, key, None),))
+            elif key == TAGS_INDEX_FIELD:
+                postings = self._build_postings(key, lambda r: getattr(r, TAGS_INDEX_FIELD, None) or ())
+            elif key == TEXT_BACKEND_INDEX_KEY:
+                postings = self._build_postings(key, lambda r: _text_backends_for_name(r.name))
+            elif key == QUANTIZED_INDEX_KEY:
+                postings = self._build_postings(key, lambda r: (_is_quantized_name(r.name),))
+            elif key == PARAMETERS_BUCKET_FIELD:
+                postings = self._build_postings(
+                    key,
+                    lambda r: (_parameters_bucket(getattr(r, PARAMETERS_BUCKET_FIELD, None)),),
+                )
+            else:
+                postings = None
+        except TypeError:
+            # An unhashable value in the field; this key cannot be indexed for this snapshot.
+            postings = None
+
+        self._postings[key] = postings
+        return postings
+
+    @property
+    def lower_names(self) -> tuple[str, ...]:
+        """Every record's name lowercased once, aligned with :attr:`records`."""
+        if self._lower_names is None:
+            self._lower_names = tuple(record.name.lower() for record in self._records)
+        return self._lower_names
+
+    def _ngram_postings(self) -> dict[str, frozenset[int]]:
+        if self._name_ngrams is None:
+            building: dict[str, set[int]] = {}
+            for position, lower_name in enumerate(self.lower_names):
+                for ngram in _name_ngrams(lower_name):
+                    building.setdefault(ngram, set()).add(position)
+            self._name_ngrams = {ngram: frozenset(positions) for ngram, positions in building.items()}
+        return self._name_ngrams
+
+    def _sorted_names(self) -> list[tuple[str, int]]:
+        if self._sorted_lower_names is None:
+            self._sorted_lower_names = sorted((name, position) for position, name in enumerate(self.lower_names))
+        return self._sorted_lower_names
+
+    def _tagged(self) -> frozenset[int]:
+        if self._tagged_positions is None:
+            self._tagged_positions = frozenset(
+                position for position, record in enumerate(self._records) if getattr(record, TAGS_INDEX_FIELD, None)
+            )
+        return self._tagged_positions
+
+    def plan(self, hint: IndexHint | None) -> PlanResult | None:
+        """Resolve *hint* to candidate positions.
+
+        Returns:
+            PlanResult | None: ``(positions, exact)``, or ``None`` when the hint cannot be answered from the
+                index at all. When ``exact`` is ``False`` the positions are a superset and the originating
+                predicate must still be evaluated on them.
+
+        """
+        if hint is None:
+            return None
+
+        op = hint.op
+        if op == "eq":
+            return self._plan_in(hint.field, (hint.value,))
+        if op == "in":
+            if not isinstance(hint.value, frozenset):
+                return None
+            return self._plan_in(hint.field, hint.value)
+        if op in ("tags_any", "tags_all", "tags_none"):
+            return self._plan_tags(op, hint.field, hint.value)
+        if op == "range":
+            return self._plan_range(hint.field, hint.value)
+        if op in ("text_contains", "text_startswith"):
+            return self._plan_name_text(op, hint.field, hint.value)
+        if op == "and":
+            return self._plan_and(hint.children)
+        if op == "or":
+            return self._plan_or(hint.children)
+        if op == "not":
+            child = self.plan(hint.children[0]) if hint.children else None
+            if child is None or not child[1]:
+                return None
+            return self._all_positions - child[0], True
+        return None
+
+    def _plan_in(self, key: str, values: Iterable[Hashable]) -> PlanResult | None:
+        postings = self.postings(key) if key in SINGLE_VALUE_INDEX_FIELDS or key.startswith("@") else None
+        if postings is None:
+            return None
+        matched: set[int] = set()
+        for value in values:
+            matched.update(postings.get(value, ()))
+        return frozenset(matched), True
+
+    def _plan_tags(self, op: str, key: str, value: Hashable) -> PlanResult | None:
+        if key != TAGS_INDEX_FIELD or not isinstance(value, frozenset):
+            return None
+        postings = self.postings(TAGS_INDEX_FIELD)
+        if postings is None:
+            return None
+
+        if op == "tags_all":
+            matched = self._tagged()
+            for tag in value:
+                matched = matched & postings.get(tag, frozenset())
+                if not matched:
+                    break
+            return matched, True
+
+        any_matched: set[int] = set()
+        for tag in value:
+            any_matched.update(postings.get(tag, ()))
+        if op == "tags_any":
+            return frozenset(any_matched), True
+        return self._all_positions - any_matched, True
+
+    def _plan_name_text(self, op: str, key: str, needle: Hashable) -> PlanResult | None:
+        if key != NAME_INDEX_FIELD or not isinstance(needle, str):
+            return None
+        if not needle:
+            return self._all_positions, True
+        lower_names = self.lower_names
+
+        if op == "text_startswith":
+            sorted_names = self._sorted_names()
+            matched: set[int] = set()
+            for i in range(bisect.bisect_left(sorted_names, (needle, -1)), len(sorted_names)):
+                lower_name, position = sorted_names[i]
+                if not lower_name.startswith(needle):
+                    break
+                matched.add(position)
+            return frozenset(matched), True
+
+        if len(needle) < NGRAM_SIZE:
+            return frozenset(p for p, lower_name in enumerate(lower_names) if needle in lower_name), True
+        postings = self._ngram_postings()
+        candidates: frozenset[int] | None = None
+        for ngram in sorted(_name_ngrams(needle), key=lambda g: len(postings.get(g, ()))):
+            positions = postings.get(ngram, frozenset())
+            candidates = positions if candidates is None else candidates & positions
+            if not candidates:
+                return frozenset(), True
+        assert candidates is not None
+        # Every trigram being present does not imply the substring is; confirm against the lowercase table.
+        return frozenset(p for p in candidates if needle in lower_names[p]), True
+
+    def _plan_range(self, key: str, value: Hashable) -> PlanResult | None:
+        if not isinstance(value, tuple) or len(value) != 2:
+            return None
+        op_name, bound = value
+        columns = self.columns
+        if columns is not None:
+            exact_matches = columns.positions_matching(key, op_name, bound)
+            if exact_matches is not None:
+                return exact_matches, True
+        if key != PARAMETERS_BUCKET_FIELD:
+            return None
+        if isinstance(bound, bool) or not isinstance(bound, (int, float)) or not math.isfinite(bound):
+            return None
+        postings = self.postings(PARAMETERS_BUCKET_FIELD)
+        if postings is None:
+            return None
+
+        bound_bucket = math.floor(bound).bit_length() if bound >= 0 else None
+        matched: set[int] = set(postings.get(_UNBUCKETED, ()))
+        for bucket, positions in postings.items():
+            if not isinstance(bucket, int) or bucket == _UNBUCKETED:
+                continue
+            if op_name in ("gt", "gte"):
+                keep = bound_bucket is None or bucket >= bound_bucket
+            elif op_name in ("lt", "lte"):
+                keep = bound_bucket is not None and bucket <= bound_bucket
+            else:
+                return None
+            if keep:
+                matched.update(positions)
+        return frozenset(matched), False
+
+    def _plan_and(self, children: Sequence[IndexHint | None]) -> PlanResult | None:
+        result: frozenset[int] | None = None
+        exact = True
+        for child in children:
+            planned = self.plan(child)
+            if planned is None:
+                exact = False
+                continue
+            positions, child_exact = planned
+            result = positions if result is None else result & positions
+            exact = exact and child_exact
+        if result is None:
+            return None
+        return result, exact
+
+    def _plan_or(self, children: Sequence[IndexHint | None]) -> PlanResult | None:
+        result: set[int] = set()
+        exact = True
+        for child in children:
+            planned = self.plan(child)
+            if planned is None:
+                return None
+            result.update(planned[0])
+            exact = exact and planned[1]
+        return frozenset(result), exact
+
+
+def plan_predicates[P](
+    index: RecordIndex[Any],
+    predicates: Sequence[P],
+) -> tuple[list[int] | None, list[P]]:
+    """Split *predicates* into index-answerable candidates and residual predicates.
+
+    Every predicate is considered ANDed with the others. Predicates whose hint resolves exactly are dropped from
+    the residual list; the rest (no hint, unanswerable hint, or superset-only answer) must still be evaluated.
+
+    Args:
+        index: The index built over the query's records.
+        predicates: The query's record predicates, in order.
+
+    Returns:
+        tuple[list[int] | None, list[P]]: Sorted candidate positions (``None`` if no predicate used the index)
+            and the residual predicates, in their original order.
+
+    """
+    candidates: frozenset[int] | None = None
+    residual: list[P] = []
+    for predicate in predicates:
+        planned = index.plan(getattr(predicate, "index_hint", None))
+        if planned is None:
+            residual.append(predicate)
+            continue
+        positions, exact = planned
+        candidates = positions if candidates is None else candidates & positions
+        if not exact:
+            residual.append(predicate)
+
+    if candidates is None:
+        return None, residual
+    return sorted(candidates), residual
+
+
+__all__ = [
+    "NAME_INDEX_FIELD",
+    "NGRAM_SIZE",
+    "PARAMETERS_BUCKET_FIELD",
+    "QUANTIZED_INDEX_KEY",
+    "SINGLE_VALUE_INDEX_FIELDS",
+    "TAGS_INDEX_FIELD",
+    "TEXT_BACKEND_INDEX_KEY",
+    "RecordIndex",
+    "plan_predicates",
+]
@@ -0,0 +1,215 @@
+"""Binary encoding for values stored in Redis: category payloads, metadata and analytics cache entries.
+
+By default values are stored as plain JSON text, exactly as before. Choosing a different serializer (``msgpack``)
+or a compression (``zlib``, ``zstd``, ``lz4``) through :class:`~horde_model_reference.RedisSettings` stores a
+framed payload instead: a format version byte, a serializer id, a compression id, then the body. Large categories
+such as ``text_generation`` then take far less Redis memory and network transfer per hit.
+
+Decoding reads the frame header rather than the local settings, so workers configured with different codecs
+(for example during a rolling settings change) can still read each other's entries, and entries written before
+the codec existed keep decoding as plain JSON.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import threading
+import zlib
+from collections.abc import Callable
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from horde_model_reference import RedisSettings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+type RedisSerializer = Literal["json", "msgpack"]
+type RedisCompression = Literal["none", "zlib", "zstd", "lz4"]
+
+CODEC_FORMAT_VERSION = 1
+"""First byte of every framed payload. Plain JSON never starts with a control byte, so the two cannot be confused."""
+
+_JSON_WHITESPACE = b" \t\n\r"
+
+_SERIALIZER_IDS: dict[RedisSerializer, int] = {"json": ord("j"), "msgpack": ord("m")}
+_COMPRESSION_IDS: dict[RedisCompression, int] = {"none": ord("n"), "zlib": ord("z"), "zstd": ord("s"), "lz4": ord("l")}
+_SERIALIZERS_BY_ID = {value: key for key, value in _SERIALIZER_IDS.items()}
+_COMPRESSIONS_BY_ID = {value: key for key, value in _COMPRESSION_IDS.items()}
+
+_OPTIONAL_PACKAGES: dict[str, str] = {"msgpack": "msgpack", "zstd": "zstandard", "lz4": "lz4"}
+
+
+def _import_optional(name: str, module: str) -> ModuleType:
+    """Import the optional package backing codec component *name*, with an install hint on failure."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"The '{name}' Redis codec requires the '{_OPTIONAL_PACKAGES[name]}' package. "
+            f"Install it with: pip install {_OPTIONAL_PACKAGES[name]}"
+        ) from e
+
+
+def _dump_json(value: Any) -> bytes:  # noqa: ANN401
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json(body: bytes) -> Any:  # noqa: ANN401
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _serializer_functions(serializer: RedisSerializer) -> tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    if serializer == "msgpack":
+        msgpack = _import_optional("msgpack", "msgpack")
+        return (
+            lambda value: msgpack.packb(value, use_bin_type=True),
+            lambda body: msgpack.unpackb(body, raw=False),
+        )
+    return _dump_json, _load_json
+
+
+def _identity(body: bytes) -> bytes:
+    return body
+
+
+def _zstd_functions() -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """Return zstd (de)compression functions; zstandard contexts are not thread-safe, so each thread gets its own."""
+    zstandard = _import_optional("zstd", "zstandard")
+    contexts = threading.local()
+
+    def compress(body: bytes) -> bytes:
+        compressor = getattr(contexts, "compressor", None)
+        if compressor is None:
+            compressor = contexts.compressor = zstandard.ZstdCompressor()
+        return compressor.compress(body)
+
+    def decompress(body: bytes) -> bytes:
+        decompressor = getattr(contexts, "decompressor", None)
+        if decompressor is None:
+            decompressor = contexts.decompressor = zstandard.ZstdDecompressor()
+        return decompressor.decompress(body)
+
+    return compress, decompress
+
+
+def _compression_functions(
+    compression: RedisCompression,
+) -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    if compression == "zlib":
+        return zlib.compress, zlib.decompress
+    if compression == "zstd":
+        return _zstd_functions()
+    if compression == "lz4":
+        lz4_frame = _import_optional("lz4", "lz4.frame")
+        return lz4_frame.compress, lz4_frame.decompress
+    return _identity, _identity
+
+
+def _frame_decoder(serializer: RedisSerializer, compression: RedisCompression) -> Callable[[bytes], Any]:
+    """Return the function decoding a frame body written with *serializer* and *compression*."""
+    _, decompress = _compression_functions(compression)
+    _, load = _serializer_functions(serializer)
+    if decompress is _identity:
+        return load
+    return lambda body: load(decompress(body))
+
+
+class RedisCodec:
+    """Encodes values for Redis and decodes any payload written by a :class:`RedisCodec` or as plain JSON."""
+
+    def __init__(
+        self,
+        *,
+        serializer: RedisSerializer = "json",
+        compression: RedisCompression = "none",
+        min_compress_bytes: int = 1024,
+    ) -> None:
+        """Configure how values are encoded.
+
+        Args:
+            serializer: How values are serialized. ``json`` uses orjson when it is installed.
+            compression: How serialized values are compressed. ``zstd`` and ``lz4`` need their optional packages.
+            min_compress_bytes: Serialized values smaller than this are stored uncompressed.
+
+        Raises:
+            ImportError: If the serializer or compression needs a package that is not installed.
+
+        """
+        self._serializer = serializer
+        self._compression = compression
+        self._min_compress_bytes = min_compress_bytes
+        self._dump, _ = _serializer_functions(serializer)
+        self._compress, _ = _compression_functions(compression)
+        self._framed = serializer != "json" or compression != "none"
+        self._frame_decoders: dict[tuple[RedisSerializer, RedisCompression], Callable[[bytes], Any]] = {}
+
+    @classmethod
+    def from_settings(cls, redis_settings: RedisSettings) -> RedisCodec:
+        """Build the codec configured by *redis_settings*."""
+        return cls(
+            serializer=redis_settings.codec_serializer,
+            compression=redis_settings.codec_compression,
+            min_compress_bytes=redis_settings.codec_min_compress_bytes,
+        )
+
+    @property
+    def framed(self) -> bool:
+        """Whether :meth:`encode` writes framed payloads (False means plain JSON text)."""
+        return self._framed
+
+    def encode(self, value: Any) -> bytes:  # noqa: ANN401
+        """Serialize (and, past the size threshold, compress) *value* for storage in Redis."""
+        body = self._dump(value)
+        if not self._framed:
+            return body
+
+        compression: RedisCompression = "none"
+        if self._compression != "none" and len(body) >= self._min_compress_bytes:
+            body = self._compress(body)
+            compression = self._compression
+        header = bytes((CODEC_FORMAT_VERSION, _SERIALIZER_IDS[self._serializer], _COMPRESSION_IDS[compression]))
+        return header + body
+
+    def decode(self, payload: bytes | str) -> Any:  # noqa: ANN401
+        """Decode a payload read from Redis, whichever codec wrote it.
+
+        Raises:
+            ValueError: If the payload is framed with an unknown version, serializer or compression.
+            ImportError: If the payload needs an optional package that is not installed.
+
+        """
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        if not payload or payload[0] >= 0x20 or payload[0] in _JSON_WHITESPACE:
+            return _load_json(payload)
+        if payload[0] != CODEC_FORMAT_VERSION:
+            raise ValueError(f"Unsupported Redis payload format version {payload[0]}")
+        if len(payload) < 3:
+            raise ValueError("Truncated Redis payload header")
+
+        serializer = _SERIALIZERS_BY_ID.get(payload[1])
+        compression = _COMPRESSIONS_BY_ID.get(payload[2])
+        if serializer is None or compression is None:
+            raise ValueError(f"Unknown Redis payload codec {payload[1:3]!r}")
+
+        decoder = self._frame_decoders.get((serializer, compression))
+        if decoder is None:
+            decoder = self._frame_decoders[serializer, compression] = _frame_decoder(serializer, compression)
+        return decoder(payload[3:])
+
+
+__all__ = [
+    "CODEC_FORMAT_VERSION",
+    "RedisCodec",
+    "RedisCompression",
+    "RedisSerializer",
+]
@@ -16,6 +16,7 @@ import horde_model_reference.service.v1.routers.metadata as v1_metadata
 import horde_model_reference.service.v1.routers.pending_queue as v1_pending_queue
 import horde_model_reference.service.v1.routers.pending_queue_audit as v1_pending_queue_audit
 import horde_model_reference.service.v1.routers.references as v1_references
+import horde_model_reference.service.v2.routers.export as v2_export
 import horde_model_reference.service.v2.routers.metadata as v2_metadata
 import horde_model_reference.service.v2.routers.pending_queue as v2_pending_queue
 import horde_model_reference.service.v2.routers.pending_queue_audit as v2_pending_queue_audit
@@ -47,7 +48,8 @@ class HeartbeatResponse(BaseModel):
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     """Manage application lifespan events.
 
-    Starts background cache hydration on startup and stops it on shutdown.
+    Starts background cache hydration on startup and stops it on shutdown, then closes the pooled
+    outbound HTTP clients and stops the compute executor's threads.
     """
     # Startup
     if horde_model_reference_settings.cache_hydration_enabled:
@@ -71,6 +73,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         logger.info("Stopping cache hydration on application shutdown...")
         await hydrator.stop()
 
+    from horde_model_reference.http_clients import get_http_client_pool
+
+    await get_http_client_pool().aclose()
+
+    from horde_model_reference.service.compute import get_compute_executor
+
+    get_compute_executor().shutdown(wait=False)
+
 
 try:
     _SERVICE_VERSION = version("horde_model_reference")
@@ -195,6 +205,7 @@ app.include_router(v2_search.router, prefix=v2_prefix, tags=["v2", "search"])
 app.include_router(v2_pending_queue.router, prefix=v2_prefix, tags=["v2", "pending_queue"])
 app.include_router(v2_pending_queue_audit.router, prefix=v2_prefix, tags=["v2", "pending_queue", "audit"])
 app.include_router(v2_user.router, prefix=v2_prefix, tags=["v2", "user"])
+app.include_router(v2_export.router, prefix=v2_prefix, tags=["v2", "export"])
 app.include_router(v2_references.router, prefix=v2_prefix, tags=["v2"])
 app.include_router(ref_statistics.router, prefix=statistics_prefix, tags=["v2", "statistics"])
 app.include_router(ref_deletion_risk.router, prefix=statistics_prefix, tags=["v2", "deletion-risk"])
@@ -0,0 +1,149 @@
+"""A dedicated, bounded thread pool for the API's CPU-heavy route handlers.
+
+Search scans and text model group analysis used to run as sync routes on Starlette's shared threadpool, where a
+burst of them could take every thread and starve all other sync routes and dependencies. Those handlers are now
+``async`` and hand their work to :func:`run_compute` instead, which runs it on a separate pool of
+``compute_max_workers`` threads and lets at most ``compute_route_max_concurrency`` computations of the same route
+run (or wait for a thread) at once. A request that cannot get a slot within ``compute_queue_timeout_seconds`` is
+answered with ``503 Service Unavailable`` and ``Retry-After`` rather than queueing without bound.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import math
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
+
+from fastapi import HTTPException, status
+from loguru import logger
+
+from horde_model_reference import horde_model_reference_settings
+
+
+class ComputeExecutor:
+    """A lazily created thread pool with per-route admission limits for async route handlers.
+
+    Admission is tracked with one ``asyncio.Semaphore`` per route and event loop, since semaphores are bound to
+    the loop that first waits on them.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 4,
+        route_max_concurrency: int = 4,
+        queue_timeout_seconds: float = 5.0,
+    ) -> None:
+        """Configure the executor; no thread is started until first use.
+
+        Args:
+            max_workers: Threads in the pool.
+            route_max_concurrency: Computations of a single route admitted at once; the rest wait.
+            queue_timeout_seconds: How long a computation waits for admission before the request is rejected.
+
+        """
+        self._max_workers = max(1, max_workers)
+        self._route_max_concurrency = max(1, route_max_concurrency)
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._lock = RLock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._rejected = 0
+
+    @property
+    def max_workers(self) -> int:
+        """Threads in the pool."""
+        return self._max_workers
+
+    @property
+    def rejected(self) -> int:
+        """Number of computations rejected because their route stayed saturated past the queue timeout."""
+        return self._rejected
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="api-compute")
+            return self._executor
+
+    def _semaphore(self, route: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            route_semaphores = self._semaphores.setdefault(loop, {})
+            semaphore = route_semaphores.get(route)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self._route_max_concurrency)
+                route_semaphores[route] = semaphore
+            return semaphore
+
+    async def run[**P, T](self, route: str, func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run ``func(*args, **kwargs)`` on the pool once *route* has a free slot, and return its result.
+
+        The slot is held until the computation finishes, even if the awaiting request is cancelled, so a route
+        never has more than ``route_max_concurrency`` computations in flight.
+
+        Raises:
+            HTTPException: 503 if *route* has no free slot within the queue timeout.
+
+        """
+        semaphore = self._semaphore(route)
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self._queue_timeout_seconds)
+        except TimeoutError:
+            with self._lock:
+                self._rejected += 1
+            logger.warning(f"Rejected '{route}' computation: no free slot within {self._queue_timeout_seconds}s")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Too many concurrent '{route}' requests, retry shortly",
+                headers={"Retry-After": str(max(1, math.ceil(self._queue_timeout_seconds)))},
+            ) from None
+
+        context = contextvars.copy_context()
+
+        def call() -> T:
+            return context.run(func, *args, **kwargs)
+
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self._get_executor(), call)
+        except BaseException:
+            semaphore.release()
+            raise
+        future.add_done_callback(lambda _: semaphore.release())
+        return await asyncio.shield(future)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the pool's threads. A later :meth:`run` starts a new pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_compute_executor: ComputeExecutor | None = None
+_compute_executor_lock = RLock()
+
+
+def get_compute_executor() -> ComputeExecutor:
+    """Return the process-wide compute executor, configured from ``horde_model_reference_settings``."""
+    global _compute_executor
+
+    with _compute_executor_lock:
+        if _compute_executor is None:
+            _compute_executor = ComputeExecutor(
+                max_workers=horde_model_reference_settings.compute_max_workers,
+                route_max_concurrency=horde_model_reference_settings.compute_route_max_concurrency,
+                queue_timeout_seconds=horde_model_reference_settings.compute_queue_timeout_seconds,
+            )
+        return _compute_executor
+
+
+async def run_compute[**P, T](route: str, func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run ``func(*args, **kwargs)`` on the process-wide compute executor under *route*'s admission limit."""
+    return await get_compute_executor().run(route, func, *args, **kwargs)
@@ -0,0 +1,267 @@
+"""Strong ETags and ``If-None-Match`` handling for full-category reference responses.
+
+REPLICA backends re-request whole categories from the PRIMARY every time their cache TTL expires. The v1/v2
+category endpoints tag each response with a strong ETag (a SHA-256 of the exact response body) and answer
+``304 Not Modified`` when the client already holds that body, so an unchanged category costs a round-trip
+without a payload.
+
+Bodies and their ETags are cached per route and category for as long as the backend keeps handing out the same
+payload object (backends return their cached dict/string until the category changes), so repeated requests for
+an unchanged category neither re-serialize nor re-hash it.
+
+Each cached body also keeps its compressed variants (``gzip`` always; ``br`` and ``zstd`` when the ``brotli`` and
+``zstandard`` packages are installed). A variant is compressed the first time a client accepts it and then
+reused until the category changes, and the response's ``Content-Encoding`` is negotiated from the request's
+``Accept-Encoding``. Variants carry their own strong ETag (the identity ETag with the coding appended).
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import importlib
+import json
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any, NamedTuple
+
+from fastapi import status
+from fastapi.responses import Response
+
+ETAG_HEADER = "ETag"
+"""Response header carrying the strong validator."""
+
+MIN_COMPRESS_BYTES = 1024
+"""Bodies smaller than this are always sent uncompressed."""
+
+
+def _optional_compressor(
+    module: str,
+    compress: Callable[[Any], Callable[[bytes], bytes]],
+) -> Callable[[bytes], bytes] | None:
+    """Return the compressor built by *compress* from optional *module*, or None if it is not installed."""
+    try:
+        return compress(importlib.import_module(module))
+    except ImportError:
+        return None
+
+
+_COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    name: compress
+    for name, compress in {
+        "zstd": _optional_compressor("zstandard", lambda zstandard: zstandard.ZstdCompressor(level=12).compress),
+        "br": _optional_compressor("brotli", lambda brotli: lambda body: brotli.compress(body, quality=9)),
+        "gzip": lambda body: gzip.compress(body, compresslevel=9, mtime=0),
+    }.items()
+    if compress is not None
+}
+
+SUPPORTED_ENCODINGS: tuple[str, ...] = tuple(_COMPRESSORS)
+"""Content codings the service can produce, in order of preference."""
+
+
+def strong_etag(body: bytes) -> str:
+    """Return the strong ETag (quoted SHA-256 hex digest) for a response *body*."""
+    return f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header value matches *etag*.
+
+    ``If-None-Match`` uses the weak comparison (RFC 9110 section 13.1.2): a ``W/`` prefix on either side is
+    ignored, the header may list several tags, and ``*`` matches any current representation.
+    """
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def negotiate_encoding(accept_encoding: str | None, available: tuple[str, ...] = SUPPORTED_ENCODINGS) -> str | None:
+    """Pick the content coding for a response from an ``Accept-Encoding`` header value.
+
+    Codings with ``q=0`` are refused, ``*`` stands for any coding not listed, and ties are broken by the order
+    of *available* (the server's preference).
+
+    Returns:
+        str | None: The chosen coding, or None to send the body uncompressed.
+
+    """
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best: str | None = None
+    best_weight = 0.0
+    for coding in available:
+        weight = weights.get(coding, wildcard)
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+class EncodedBody(NamedTuple):
+    """A rendered body in the content coding negotiated for one request."""
+
+    body: bytes
+    """The (possibly compressed) response body."""
+    etag: str
+    """The strong ETag of this variant."""
+    content_encoding: str | None
+    """The ``Content-Encoding`` of *body*, or None for identity."""
+    identity_etag: str
+    """The ETag of the uncompressed body; clients holding it still have the current representation."""
+
+
+class _RenderedEntry:
+    """A rendered body, its ETag and the compressed variants built from it so far."""
+
+    __slots__ = ("body", "content", "etag", "variants")
+
+    def __init__(self, content: object, body: bytes, etag: str) -> None:
+        self.content = content
+        self.body = body
+        self.etag = etag
+        self.variants: dict[str, bytes] = {}
+
+
+def _render_body(content: Any) -> bytes:  # noqa: ANN401
+    """Encode *content* exactly as the reference endpoints send it (``JSONResponse`` rendering for objects)."""
+    if isinstance(content, str):
+        return content.encode("utf-8")
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class RenderedBodyCache:
+    """Rendered response bodies and their ETags, reused while the same payload object is being served."""
+
+    def __init__(self) -> None:
+        """Start with no rendered bodies."""
+        self._entries: dict[Hashable, _RenderedEntry] = {}
+        self._lock = Lock()
+
+    def render(self, key: Hashable, content: Any) -> tuple[bytes, str]:  # noqa: ANN401
+        """Return ``(body, etag)`` for *content*, rendering only when *key* last served a different object.
+
+        Args:
+            key: Identifies the route and category serving *content*.
+            content: The payload: a JSON-serializable object, or an already-serialized JSON string.
+
+        Returns:
+            tuple[bytes, str]: The UTF-8 response body and its strong ETag.
+
+        """
+        entry = self._entry(key, content)
+        return entry.body, entry.etag
+
+    def render_encoded(self, key: Hashable, content: Any, accept_encoding: str | None) -> EncodedBody:  # noqa: ANN401
+        """Like :meth:`render`, but in the content coding negotiated from *accept_encoding*.
+
+        Compressed variants are built on first use and kept until *key* serves a different payload object.
+
+        Args:
+            key: Identifies the route and category serving *content*.
+            content: The payload: a JSON-serializable object, or an already-serialized JSON string.
+            accept_encoding: The request's ``Accept-Encoding`` header, if any.
+
+        Returns:
+            EncodedBody: The body, its ETag and its ``Content-Encoding``.
+
+        """
+        entry = self._entry(key, content)
+        encoding = negotiate_encoding(accept_encoding) if len(entry.body) >= MIN_COMPRESS_BYTES else None
+        if encoding is None:
+            return EncodedBody(entry.body, entry.etag, None, entry.etag)
+
+        with self._lock:
+            variant = entry.variants.get(encoding)
+        if variant is None:
+            variant = _COMPRESSORS[encoding](entry.body)
+            with self._lock:
+                variant = entry.variants.setdefault(encoding, variant)
+        return EncodedBody(variant, f'{entry.etag[:-1]}-{encoding}"', encoding, entry.etag)
+
+    def _entry(self, key: Hashable, content: Any) -> _RenderedEntry:  # noqa: ANN401
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.content is content:
+            return entry
+
+        body = _render_body(content)
+        entry = _RenderedEntry(content, body, strong_etag(body))
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def clear(self) -> None:
+        """Forget every rendered body."""
+        with self._lock:
+            self._entries.clear()
+
+
+reference_body_cache = RenderedBodyCache()
+"""Process-wide cache of rendered full-category reference bodies."""
+
+NOT_MODIFIED_RESPONSE_DOC: dict[int | str, dict[str, object]] = {
+    304: {"description": "The client's cached copy (sent as If-None-Match) is current; no body."},
+}
+"""OpenAPI ``responses`` entry for endpoints answering conditional requests."""
+
+
+def conditional_response(
+    body: bytes,
+    etag: str,
+    if_none_match: str | None,
+    *,
+    media_type: str = "application/json",
+) -> Response:
+    """Return ``304 Not Modified`` when *if_none_match* matches *etag*, otherwise *body*; both carry the ETag."""
+    headers = {ETAG_HEADER: etag}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def encoded_conditional_response(
+    encoded: EncodedBody,
+    if_none_match: str | None,
+    *,
+    media_type: str = "application/json",
+) -> Response:
+    """Like :func:`conditional_response` for a negotiated :class:`EncodedBody`.
+
+    The response varies on ``Accept-Encoding``. A client revalidating with either the variant's ETag or the
+    identity ETag holds the current content and gets ``304 Not Modified``.
+    """
+    headers = {ETAG_HEADER: encoded.etag, "Vary": "Accept-Encoding"}
+    if etag_matches(if_none_match, encoded.etag) or etag_matches(if_none_match, encoded.identity_etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if encoded.content_encoding is not None:
+        headers["Content-Encoding"] = encoded.content_encoding
+    return Response(content=encoded.body, media_type=media_type, headers=headers)
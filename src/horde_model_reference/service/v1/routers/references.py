@@ -3,7 +3,7 @@
 import json
 from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from fastapi.responses import Response
 from haidra_core.service_base import ContainsMessage
 
@@ -11,6 +11,13 @@ import horde_model_reference.service.v1.routers.create_update as v1_router_creat
 from horde_model_reference import ModelReferenceManager
 from horde_model_reference.analytics.text_model_parser import compute_group_summaries, get_base_model_name
 from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
+from horde_model_reference.service.conditional import (
+    NOT_MODIFIED_RESPONSE_DOC,
+    conditional_response,
+    encoded_conditional_response,
+    reference_body_cache,
+    strong_etag,
+)
 from horde_model_reference.service.shared import (
     RouteNames,
     get_model_reference_manager,
@@ -102,6 +109,7 @@ route_registry.register_route(
         200: {
             "description": "All text generation models",
         },
+        **NOT_MODIFIED_RESPONSE_DOC,
         404: {"description": "Text generation models not found or empty"},
     },
     summary="Get text generation models with optional grouping field",
@@ -114,6 +122,8 @@ async def read_legacy_text_generation_reference(
         default=False,
         description="Include text_model_group field for grouping model variants together",
     ),
+    if_none_match: Annotated[str | None, Header()] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
 ) -> Response:
     """Get all text generation models with optional text_model_group field.
 
@@ -123,6 +133,8 @@ async def read_legacy_text_generation_reference(
     Set include_group=true to dynamically compute and include the text_model_group
     field, which contains the base model group name for grouping model variants
     together (e.g., models with different quantization levels).
+
+    Responses carry a strong ETag; a matching ``If-None-Match`` gets ``304 Not Modified`` without a body.
     """
     raw_json_string = manager.backend.get_legacy_json_string(MODEL_REFERENCE_CATEGORY.text_generation)
 
@@ -171,7 +183,16 @@ async def read_legacy_text_generation_reference(
 
             logger.warning(f"Failed to parse JSON for text_model_group computation: {e}")
 
-    return Response(content=raw_json_string, media_type="application/json")
+    if include_group:
+        body = raw_json_string.encode("utf-8")
+        return conditional_response(body, strong_etag(body), if_none_match)
+
+    encoded = reference_body_cache.render_encoded(
+        (v1_prefix, MODEL_REFERENCE_CATEGORY.text_generation),
+        raw_json_string,
+        accept_encoding,
+    )
+    return encoded_conditional_response(encoded, if_none_match)
 
 
 get_reference_by_category_route_subpath = "/{model_category_name}"
@@ -189,6 +210,7 @@ route_registry.register_route(
         200: {
             "description": "All models in the category",
         },
+        **NOT_MODIFIED_RESPONSE_DOC,
         404: {"description": "Model category not found or empty"},
         422: {"description": "Invalid model category"},
     },
@@ -199,10 +221,13 @@ route_registry.register_route(
 async def read_legacy_reference(
     model_category_name: MODEL_REFERENCE_CATEGORY | Literal["stable_diffusion"] | str,
     manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
+    if_none_match: Annotated[str | None, Header()] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
 ) -> Response:
     """Get all models in a specific legacy model reference category.
 
-    Returns the complete legacy format JSON for the requested category.
+    Returns the complete legacy format JSON for the requested category, tagged with a strong ETag. A request
+    whose ``If-None-Match`` matches the current ETag gets ``304 Not Modified`` without a body.
 
     **Note:** `stable_diffusion` is an alias for `image_generation`.
     """
@@ -234,7 +259,12 @@ async def read_legacy_reference(
     if not raw_json_string or raw_json_string.strip() in ("", "{}", "null"):
         raise HTTPException(status_code=404, detail=f"Model category '{model_category_name}' not found or is empty")
 
-    return Response(content=raw_json_string, media_type="application/json")
+    encoded = reference_body_cache.render_encoded(
+        (v1_prefix, model_reference_category),
+        raw_json_string,
+        accept_encoding,
+    )
+    return encoded_conditional_response(encoded, if_none_match)
 
 
 if get_model_reference_manager().backend.supports_legacy_writes():
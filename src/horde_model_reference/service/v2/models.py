@@ -1,6 +1,6 @@
 """Request and response models for the v2 API."""
 
-from typing import Annotated
+from typing import Annotated, Any
 
 from pydantic import BaseModel, Field
 
@@ -43,6 +43,46 @@ class UserRolesResponse(BaseModel):
     """Whether the user has requestor privileges for the pending queue."""
 
 
+class CategoryChangesResponse(BaseModel):
+    """Response model for the category changes endpoint."""
+
+    category: str
+    """The model reference category."""
+
+    since: str | None
+    """The version the changes were requested since, as sent by the client."""
+
+    version: str
+    """The category's current version. Send it as ``since`` on the next request."""
+
+    complete: bool
+    """Whether ``upserted`` and ``deleted`` describe every change since ``since``. \
+If False, they are empty and the client must fetch the whole category."""
+
+    upserted: dict[str, Any] = Field(default_factory=dict)
+    """The current records of the models created or updated since ``since``, keyed by model name."""
+
+    deleted: list[str] = Field(default_factory=list)
+    """The names of the models deleted since ``since``."""
+
+
+class BatchGetModelsRequest(BaseModel):
+    """Request model for the batch model lookup endpoint."""
+
+    names: list[str] = Field(min_length=1, max_length=1000)
+    """The names of the models to look up. Duplicates are looked up once."""
+
+
+class BatchGetModelsResponse(BaseModel):
+    """Response model for the batch model lookup endpoint."""
+
+    found: dict[str, Any]
+    """The records of the requested models that exist, keyed by model name in request order."""
+
+    missing: list[str]
+    """The requested names that do not exist in the category, in request order."""
+
+
 ModelRecordUnion = Annotated[
     ImageGenerationModelRecord
     | TextGenerationModelRecord
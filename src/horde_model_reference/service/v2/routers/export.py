@@ -0,0 +1,55 @@
+"""Streaming NDJSON export of the v2 model reference."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from horde_model_reference import ModelReferenceManager
+from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
+from horde_model_reference.ndjson_export import NDJSON_MEDIA_TYPE, iter_export_chunks
+from horde_model_reference.service.shared import get_model_reference_manager
+
+router = APIRouter()
+
+
+def _cached_categories(
+    manager: ModelReferenceManager,
+    categories: list[MODEL_REFERENCE_CATEGORY],
+) -> Iterator[tuple[MODEL_REFERENCE_CATEGORY, dict[str, Any] | None]]:
+    """Yield each category's cached raw records, loading a category only when the stream reaches it."""
+    for category in categories:
+        yield category, manager.get_raw_model_reference_json(category)
+
+
+@router.get(
+    "/export.ndjson",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": 'One `{"category": ..., "name": ..., "record": {...}}` object per line',
+            "content": {NDJSON_MEDIA_TYPE: {}},
+        },
+        422: {"description": "Invalid model category"},
+    },
+    summary="Stream every v2 model record as newline-delimited JSON",
+    operation_id="export_v2_references_ndjson",
+)
+async def export_v2_references_ndjson(
+    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
+    category: Annotated[list[MODEL_REFERENCE_CATEGORY] | None, Query()] = None,
+) -> StreamingResponse:
+    """Stream the records of every category (or only the given ``category`` values), one per line.
+
+    Records are written straight from the cached category data as the response is sent, so neither this
+    server nor the client holds a whole category document in memory. The library reads the stream back
+    with ``horde_model_reference.ndjson_export.stream_export_records``.
+    """
+    categories = list(dict.fromkeys(category)) if category else list(MODEL_REFERENCE_CATEGORY)
+    return StreamingResponse(
+        iter_export_chunks(_cached_categories(manager, categories)),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
@@ -1,12 +1,13 @@
 from types import GenericAlias
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import JSONResponse, Response
 from haidra_core.service_base import ContainsMessage
 
 from horde_model_reference import ModelReferenceManager, horde_model_reference_settings
 from horde_model_reference.audit.events import AuditOperation
+from horde_model_reference.change_log import CHANGE_VERSION_HEADER
 from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
 from horde_model_reference.model_reference_records import (
     MODEL_RECORD_TYPE_LOOKUP,
@@ -20,6 +21,11 @@ from horde_model_reference.pending_queue import (
     PendingQueueService,
 )
 from horde_model_reference.pending_queue.materialize import materialize_pending_records
+from horde_model_reference.service.conditional import (
+    NOT_MODIFIED_RESPONSE_DOC,
+    encoded_conditional_response,
+    reference_body_cache,
+)
 from horde_model_reference.service.pending_queue.dependencies import require_pending_queue_service
 from horde_model_reference.service.shared import (
     READ_ERROR_RESPONSES,
@@ -34,7 +40,12 @@ from horde_model_reference.service.shared import (
     v2_prefix,
     validate_model_name,
 )
-from horde_model_reference.service.v2.models import ModelRecordUnion
+from horde_model_reference.service.v2.models import (
+    BatchGetModelsRequest,
+    BatchGetModelsResponse,
+    CategoryChangesResponse,
+    ModelRecordUnion,
+)
 from horde_model_reference.service.v2.routers.write_validations import assert_v2_write_enabled
 
 router = APIRouter(
@@ -342,6 +353,13 @@ async def read_v2_reference_names(
     return list(manager.get_all_model_references().keys())
 
 
+def _category_change_version(manager: ModelReferenceManager, category: MODEL_REFERENCE_CATEGORY) -> str | None:
+    """Return the category's current change version for the version header, or None without a change log."""
+    if not manager.backend.supports_change_log():
+        return None
+    return manager.backend.get_changes_since(category, None).version
+
+
 get_reference_by_category_route_subpath = f"/{{{PathVariables.model_category_name}}}"
 """/{model_category_name}"""
 route_registry.register_route(
@@ -377,6 +395,7 @@ route_registry.register_route(
                 },
             },
         },
+        **NOT_MODIFIED_RESPONSE_DOC,
         404: {"description": "Model category not found or empty"},
         422: {"description": "Invalid model category"},
     },
@@ -386,11 +405,17 @@ route_registry.register_route(
 async def read_v2_reference(
     model_category_name: MODEL_REFERENCE_CATEGORY,
     manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
-) -> JSONResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
+) -> Response:
     """Get all models in a specific v2 model reference category.
 
-    Returns the complete v2 format JSON for the requested category.
+    Returns the complete v2 format JSON for the requested category, tagged with a strong ETag. A request whose
+    ``If-None-Match`` matches the current ETag gets ``304 Not Modified`` without a body. When the backend tracks
+    changes, the category's change version is sent in the ``X-Model-Reference-Version`` header.
     """
+    # Read the version before the body, so a write landing in between is replayed by the client's next delta
+    version = _category_change_version(manager, model_category_name)
     raw_json = manager.get_raw_model_reference_json(model_category_name)
 
     if raw_json is None:
@@ -399,7 +424,11 @@ async def read_v2_reference(
             detail=f"Model category '{model_category_name}' not found",
         )
 
-    return JSONResponse(content=raw_json, media_type="application/json")
+    encoded = reference_body_cache.render_encoded((v2_prefix, model_category_name), raw_json, accept_encoding)
+    response = encoded_conditional_response(encoded, if_none_match)
+    if version is not None:
+        response.headers[CHANGE_VERSION_HEADER] = version
+    return response
 
 
 single_model_route_subpath = f"/{{{PathVariables.model_category_name}}}/model/{{{PathVariables.model_name}}}"
@@ -483,6 +512,44 @@ async def read_v2_single_model(
     return JSONResponse(content=raw_json[model_name], media_type="application/json")
 
 
+batch_get_models_route_subpath = f"/{{{PathVariables.model_category_name}}}/models:batchGet"
+"""/{model_category_name}/models:batchGet"""
+
+
+@router.post(
+    batch_get_models_route_subpath,
+    response_model=BatchGetModelsResponse,
+    responses={
+        200: {"description": "The requested models that exist, and the names that do not"},
+        404: {"description": "Model category not found", "model": ErrorResponse},
+        422: {"description": "Invalid model category or request body"},
+    },
+    summary="Get several models of a category in one request",
+    operation_id="batch_get_v2_models",
+)
+async def batch_get_v2_models(
+    model_category_name: MODEL_REFERENCE_CATEGORY,
+    request: BatchGetModelsRequest,
+    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
+) -> JSONResponse:
+    """Look up several models of a category at once, e.g. every model a worker is configured to serve.
+
+    The category is read once for the whole batch. Names that exist are returned under ``found`` with
+    their raw records; names that do not are listed under ``missing``.
+    """
+    raw_models = manager.get_raw_models_json(model_category_name, dict.fromkeys(request.names))
+
+    if raw_models is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Model category '{model_category_name}' not found",
+        )
+
+    found = {name: record for name, record in raw_models.items() if record is not None}
+    missing = [name for name, record in raw_models.items() if record is None]
+    return JSONResponse(content={"found": found, "missing": missing}, media_type="application/json")
+
+
 pending_route_subpath = f"/{{{PathVariables.model_category_name}}}/pending"
 """/{model_category_name}/pending"""
 
@@ -531,6 +598,50 @@ async def read_v2_reference_pending(
     return JSONResponse(content=records, media_type="application/json")
 
 
+changes_route_subpath = f"/{{{PathVariables.model_category_name}}}/changes"
+"""/{model_category_name}/changes"""
+
+
+@router.get(
+    changes_route_subpath,
+    response_model=CategoryChangesResponse,
+    responses={
+        200: {"description": "The category's current version and the models changed since `since`"},
+        503: {"description": "Change tracking not available on this deployment", "model": ErrorResponse},
+    },
+    summary="Get the models changed in a category since a version",
+    operation_id="read_v2_reference_changes",
+)
+async def read_v2_reference_changes(
+    model_category_name: MODEL_REFERENCE_CATEGORY,
+    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
+    since: str | None = None,
+) -> CategoryChangesResponse:
+    """Return only the models created, updated or deleted in a category since version ``since``.
+
+    REPLICA clients use this to refresh a cached category without downloading it again: take the version
+    from the ``X-Model-Reference-Version`` header of a full fetch (or omit ``since`` here to only get the
+    current version), then pass it as ``since`` on the next refresh. When ``complete`` is false (an unknown
+    or expired version, or the category was rewritten wholesale since), the client must fetch the full
+    category instead.
+    """
+    if not manager.backend.supports_change_log():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Change tracking is not available on this deployment",
+        )
+
+    changes = manager.backend.get_changes_since(model_category_name, since)
+    return CategoryChangesResponse(
+        category=model_category_name.value,
+        since=since,
+        version=changes.version,
+        complete=changes.complete,
+        upserted=changes.upserted,
+        deleted=changes.deleted,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Typed per-category write/read routes
 #
@@ -622,14 +733,21 @@ def _register_typed_category_routes(
 
     async def get_all_handler(
         manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
-    ) -> JSONResponse:
+        if_none_match: Annotated[str | None, Header()] = None,
+        accept_encoding: Annotated[str | None, Header()] = None,
+    ) -> Response:
+        version = _category_change_version(manager, category)
         raw_json = manager.get_raw_model_reference_json(category)
         if raw_json is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Model category '{category}' not found",
             )
-        return JSONResponse(content=raw_json, media_type="application/json")
+        encoded = reference_body_cache.render_encoded((v2_prefix, category), raw_json, accept_encoding)
+        response = encoded_conditional_response(encoded, if_none_match)
+        if version is not None:
+            response.headers[CHANGE_VERSION_HEADER] = version
+        return response
 
     async def get_one_handler(
         model_name: str,
@@ -679,7 +797,10 @@ def _register_typed_category_routes(
         get_all_handler,
         methods=["GET"],
         response_model=GenericAlias(dict, (str, record_type)),
-        responses={404: {"description": "Category not found or empty", "model": ErrorResponse}},
+        responses={
+            **NOT_MODIFIED_RESPONSE_DOC,
+            404: {"description": "Category not found or empty", "model": ErrorResponse},
+        },
         summary=f"Get all {cat} models",
         operation_id=f"read_v2_{cat}_all",
         tags=["v2"],
@@ -10,6 +10,9 @@ from pydantic import BaseModel
 from horde_model_reference import ModelReferenceManager
 from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
 from horde_model_reference.model_reference_records import GenericModelRecord
+from horde_model_reference.query import ModelQuery
+from horde_model_reference.query_fields import FieldRef
+from horde_model_reference.service.compute import run_compute
 from horde_model_reference.service.shared import get_model_reference_manager
 
 router = APIRouter()
@@ -37,6 +40,33 @@ class SearchResponse(BaseModel):
     """Whether more results exist beyond the current page."""
 
 
+class NameMatchResponse(BaseModel):
+    """One canonical model name matched by a name resolution request."""
+
+    name: str
+    """The model name as stored in the reference."""
+
+    match_type: Literal["exact", "case_insensitive", "normalized", "quant_stripped", "fuzzy"]
+    """How the requested name matched (best tier first)."""
+
+    score: float
+    """1.0 for every match type except ``fuzzy``, which reports trigram similarity (0-1)."""
+
+
+class ResolveResponse(BaseModel):
+    """Name resolution response."""
+
+    query: str
+    """The name that was resolved."""
+
+    matches: list[NameMatchResponse]
+    """Matching canonical names, best match first."""
+
+
+MAX_RESOLVE_RESULTS = 50
+DEFAULT_RESOLVE_RESULTS = 5
+
+
 def _validate_category(category_name: str) -> MODEL_REFERENCE_CATEGORY:
     try:
         return MODEL_REFERENCE_CATEGORY(category_name)
@@ -69,7 +99,7 @@ def _apply_generic_filters(
     quantized: bool | None,
     source: str,
 ) -> SearchResponse:
-    """Build a query from parameters, execute, and return a SearchResponse."""
+    """Build a query from parameters, execute, and return a SearchResponse. Runs on the compute executor."""
     q = manager.query(category, source=source)
 
     try:
@@ -94,8 +124,7 @@ def _apply_generic_filters(
         raise HTTPException(status_code=400, detail=f"Filter not supported for this category: {exc}") from None
 
     if name_contains is not None:
-        lower_q = name_contains.lower()
-        q = q.filter(lambda r: lower_q in r.name.lower())
+        q = q.name_contains(name_contains)
 
     # Text-generation-specific filters
     if category == MODEL_REFERENCE_CATEGORY.text_generation:
@@ -117,10 +146,8 @@ def _apply_generic_filters(
         except (ValueError, AttributeError) as exc:
             raise HTTPException(status_code=400, detail=f"Invalid sort_by field: {exc}") from None
 
-    total = q.count()
-
-    q = q.offset(offset).limit(limit)
-    matched = q.to_list()
+    page: ModelQuery[Any, Any] = q.offset(offset).limit(limit)
+    matched, total = manager.cached_query_page(page)
 
     return SearchResponse(
         results=[_serialize_record(r) for r in matched],
@@ -136,7 +163,7 @@ def _apply_generic_filters(
     response_model=SearchResponse,
     summary="Search models in a category",
 )
-def search_category(
+async def search_category(
     model_category_name: str,
     manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
     nsfw: Annotated[bool | None, Query(description="Filter by NSFW status")] = None,
@@ -162,7 +189,9 @@ def search_category(
     """Search models within a specific category with filtering, sorting, and pagination."""
     category = _validate_category(model_category_name)
     try:
-        return _apply_generic_filters(
+        return await run_compute(
+            "search_category",
+            _apply_generic_filters,
             manager,
             category,
             nsfw=nsfw,
@@ -185,49 +214,36 @@ def search_category(
         raise HTTPException(status_code=400, detail=f"Unknown source: {exc}") from None
 
 
-@router.get(
-    "/search",
-    response_model=SearchResponse,
-    summary="Search models across all categories",
-)
-def search_all(
-    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
-    nsfw: Annotated[bool | None, Query(description="Filter by NSFW status")] = None,
-    name_contains: Annotated[str | None, Query(description="Case-insensitive name substring match")] = None,
-    tags_any: Annotated[list[str] | None, Query(description="Models with any of these tags")] = None,
-    tags_all: Annotated[list[str] | None, Query(description="Models with all of these tags")] = None,
-    tags_none: Annotated[list[str] | None, Query(description="Models with none of these tags")] = None,
-    sort_by: Annotated[str | None, Query(description="Field name to sort by")] = None,
-    sort_desc: Annotated[bool, Query(description="Sort descending")] = False,
-    limit: Annotated[
-        int, Query(ge=1, le=MAX_SEARCH_LIMIT, description="Max results to return")
-    ] = DEFAULT_SEARCH_LIMIT,
-    offset: Annotated[int, Query(ge=0, description="Number of results to skip")] = 0,
+def _search_all(
+    manager: ModelReferenceManager,
+    *,
+    nsfw: bool | None,
+    name_contains: str | None,
+    tags_any: list[str] | None,
+    tags_all: list[str] | None,
+    tags_none: list[str] | None,
+    sort_by: str | None,
+    sort_desc: bool,
+    limit: int,
+    offset: int,
 ) -> SearchResponse:
-    """Search models across all categories with generic filters only."""
+    """Query every category with the generic filters and return a SearchResponse."""
     q = manager.query_all()
 
     if nsfw is not None:
-        nsfw_val = nsfw
-        q = q.filter(lambda r: getattr(r, "nsfw", None) == nsfw_val)
+        q = q.where(FieldRef("nsfw") == nsfw)
 
     if name_contains is not None:
-        lower_q = name_contains.lower()
-        q = q.filter(lambda r: lower_q in r.name.lower())
+        q = q.name_contains(name_contains)
 
     if tags_any is not None:
-        tag_set_any = set(tags_any)
-        q = q.filter(lambda r: bool(tag_set_any & set(getattr(r, "tags", None) or [])))
+        q = q.where(FieldRef("tags").contains_any(tags_any))
 
     if tags_all is not None:
-        tag_set_all = set(tags_all)
-        q = q.filter(lambda r: tag_set_all <= set(getattr(r, "tags", None) or []))
+        q = q.where(FieldRef("tags").contains_all(tags_all))
 
     if tags_none is not None:
-        tag_set_none = set(tags_none)
-        q = q.filter(
-            lambda r: not bool(tag_set_none & set(getattr(r, "tags", None) or [])),
-        )
+        q = q.where(FieldRef("tags").contains_none(tags_none))
 
     if sort_by is not None:
         try:
@@ -235,10 +251,7 @@ def search_all(
         except (ValueError, AttributeError) as exc:
             raise HTTPException(status_code=400, detail=f"Invalid sort_by field: {exc}") from None
 
-    total = q.count()
-
-    q = q.offset(offset).limit(limit)
-    all_results = q.to_list()
+    all_results, total = q.offset(offset).limit(limit).to_list_with_total()
 
     return SearchResponse(
         results=[_serialize_record(r) for r in all_results],
@@ -249,6 +262,64 @@ def search_all(
     )
 
 
+@router.get(
+    "/search",
+    response_model=SearchResponse,
+    summary="Search models across all categories",
+)
+async def search_all(
+    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
+    nsfw: Annotated[bool | None, Query(description="Filter by NSFW status")] = None,
+    name_contains: Annotated[str | None, Query(description="Case-insensitive name substring match")] = None,
+    tags_any: Annotated[list[str] | None, Query(description="Models with any of these tags")] = None,
+    tags_all: Annotated[list[str] | None, Query(description="Models with all of these tags")] = None,
+    tags_none: Annotated[list[str] | None, Query(description="Models with none of these tags")] = None,
+    sort_by: Annotated[str | None, Query(description="Field name to sort by")] = None,
+    sort_desc: Annotated[bool, Query(description="Sort descending")] = False,
+    limit: Annotated[
+        int, Query(ge=1, le=MAX_SEARCH_LIMIT, description="Max results to return")
+    ] = DEFAULT_SEARCH_LIMIT,
+    offset: Annotated[int, Query(ge=0, description="Number of results to skip")] = 0,
+) -> SearchResponse:
+    """Search models across all categories with generic filters only."""
+    return await run_compute(
+        "search_all",
+        _search_all,
+        manager,
+        nsfw=nsfw,
+        name_contains=name_contains,
+        tags_any=tags_any,
+        tags_all=tags_all,
+        tags_none=tags_none,
+        sort_by=sort_by,
+        sort_desc=sort_desc,
+        limit=limit,
+        offset=offset,
+    )
+
+
+@router.get(
+    "/{model_category_name}/resolve",
+    response_model=ResolveResponse,
+    summary="Resolve an approximate model name to canonical names",
+)
+async def resolve_model_name(
+    model_category_name: str,
+    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
+    name: Annotated[str, Query(min_length=1, description="The (possibly inexact) model name to resolve")],
+    max_results: Annotated[
+        int, Query(ge=1, le=MAX_RESOLVE_RESULTS, description="Max matches to return")
+    ] = DEFAULT_RESOLVE_RESULTS,
+) -> ResolveResponse:
+    """Resolve a model name with wrong case, separators, backend prefix, quant suffix or typos."""
+    category = _validate_category(model_category_name)
+    matches = await run_compute("resolve_model_name", manager.resolve_name, category, name, max_results=max_results)
+    return ResolveResponse(
+        query=name,
+        matches=[NameMatchResponse(name=m.name, match_type=m.match_type, score=m.score) for m in matches],
+    )
+
+
 @router.get(
     "/{model_category_name}/popular",
     summary="Get popular models ranked by live Horde usage",
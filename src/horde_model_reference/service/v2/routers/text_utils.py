@@ -25,6 +25,7 @@ from horde_model_reference.group_families import GroupFamilyStore, detect_famili
 from horde_model_reference.group_schema_store import GroupSchemaStore
 from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
 from horde_model_reference.model_reference_records import TextModelGroupNameSchema
+from horde_model_reference.service.compute import run_compute
 from horde_model_reference.service.pending_queue.dependencies import require_pending_queue_service
 from horde_model_reference.service.shared import (
     authenticate_queue_requestor,
@@ -377,17 +378,8 @@ def parse_name(
     )
 
 
-@router.get(
-    "/text_generation/group",
-    response_model=GroupMembersResponse,
-    summary="Get all members of a text model group",
-    tags=["text_utils"],
-)
-def get_group(
-    group_name: GroupNameQuery,
-    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
-) -> GroupMembersResponse:
-    """Get all models in a text model group with parsed name info and common fields."""
+def _get_group(manager: ModelReferenceManager, group_name: str) -> GroupMembersResponse:
+    """Build the members, parsed name parts and naming schema of *group_name*."""
     all_models = _get_all_text_models(manager)
     raw_members = _get_group_members(all_models, group_name)
 
@@ -555,15 +547,21 @@ def get_group(
 
 
 @router.get(
-    "/text_generation/distinct_baselines",
-    response_model=DistinctBaselinesResponse,
-    summary="Get unique baseline values for text generation models",
+    "/text_generation/group",
+    response_model=GroupMembersResponse,
+    summary="Get all members of a text model group",
     tags=["text_utils"],
 )
-def get_distinct_baselines(
+async def get_group(
+    group_name: GroupNameQuery,
     manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
-) -> DistinctBaselinesResponse:
-    """Return sorted unique non-empty baselines from text_generation models."""
+) -> GroupMembersResponse:
+    """Get all models in a text model group with parsed name info and common fields."""
+    return await run_compute("get_group", _get_group, manager, group_name)
+
+
+def _get_distinct_baselines(manager: ModelReferenceManager) -> DistinctBaselinesResponse:
+    """Collect the distinct text model baselines."""
     all_models = _get_all_text_models(manager)
     baselines = {
         baseline.strip()
@@ -575,6 +573,19 @@ def get_distinct_baselines(
     return DistinctBaselinesResponse(baselines=sorted(baselines))
 
 
+@router.get(
+    "/text_generation/distinct_baselines",
+    response_model=DistinctBaselinesResponse,
+    summary="Get unique baseline values for text generation models",
+    tags=["text_utils"],
+)
+async def get_distinct_baselines(
+    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
+) -> DistinctBaselinesResponse:
+    """Return sorted unique non-empty baselines from text_generation models."""
+    return await run_compute("get_distinct_baselines", _get_distinct_baselines, manager)
+
+
 @router.post(
     "/text_generation/compose_name",
     response_model=ComposeNameResponse,
@@ -696,23 +707,28 @@ async def update_group_common_fields(
     )
 
 
+def _list_groups(manager: ModelReferenceManager) -> GroupListResponse:
+    """Collect the distinct text model group names."""
+    all_models = _get_all_text_models(manager)
+    groups: set[str] = set()
+    for data in all_models.values():
+        group = data.get("text_model_group")
+        if isinstance(group, str) and group:
+            groups.add(group)
+    return GroupListResponse(groups=sorted(groups))
+
+
 @router.get(
     "/text_generation/groups",
     response_model=GroupListResponse,
     summary="List all text model group names",
     tags=["text_utils"],
 )
-def list_groups(
+async def list_groups(
     manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
 ) -> GroupListResponse:
     """Return sorted distinct ``text_model_group`` values across all text models."""
-    all_models = _get_all_text_models(manager)
-    groups: set[str] = set()
-    for data in all_models.values():
-        group = data.get("text_model_group")
-        if isinstance(group, str) and group:
-            groups.add(group)
-    return GroupListResponse(groups=sorted(groups))
+    return await run_compute("list_groups", _list_groups, manager)
 
 
 def _collect_group_health_issues(
@@ -792,19 +808,8 @@ def _collect_group_health_issues(
     return issues
 
 
-@router.get(
-    "/text_generation/groups/summary",
-    response_model=GroupsSummaryResponse,
-    summary="Enriched overview of all text model groups",
-    tags=["text_utils"],
-)
-def list_groups_summary(
-    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
-) -> GroupsSummaryResponse:
-    """Return per-group metadata including member counts, family/alias info, and health flags.
-
-    Designed to power a group management overview UI in a single request.
-    """
+def _list_groups_summary(manager: ModelReferenceManager) -> GroupsSummaryResponse:
+    """Build the per-group overview of every text model group."""
     all_models = _get_all_text_models(manager)
 
     # Bucket models by group
@@ -897,19 +902,23 @@ def list_groups_summary(
 
 
 @router.get(
-    "/text_generation/groups/health",
-    response_model=GroupHealthResponse,
-    summary="Health check across all text model groups",
+    "/text_generation/groups/summary",
+    response_model=GroupsSummaryResponse,
+    summary="Enriched overview of all text model groups",
     tags=["text_utils"],
 )
-def check_groups_health(
+async def list_groups_summary(
     manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
-) -> GroupHealthResponse:
-    """Scan all text model groups for common problems.
+) -> GroupsSummaryResponse:
+    """Return per-group metadata including member counts, family/alias info, and health flags.
 
-    Returns an aggregate list of issues sorted by severity, useful for
-    admin triage dashboards.
+    Designed to power a group management overview UI in a single request.
     """
+    return await run_compute("list_groups_summary", _list_groups_summary, manager)
+
+
+def _check_groups_health(manager: ModelReferenceManager) -> GroupHealthResponse:
+    """Collect the health issues of every text model group."""
     all_models = _get_all_text_models(manager)
 
     groups_map: dict[str, list[tuple[str, dict[str, Any]]]] = {}
@@ -941,6 +950,23 @@ def check_groups_health(
     )
 
 
+@router.get(
+    "/text_generation/groups/health",
+    response_model=GroupHealthResponse,
+    summary="Health check across all text model groups",
+    tags=["text_utils"],
+)
+async def check_groups_health(
+    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
+) -> GroupHealthResponse:
+    """Scan all text model groups for common problems.
+
+    Returns an aggregate list of issues sorted by severity, useful for
+    admin triage dashboards.
+    """
+    return await run_compute("check_groups_health", _check_groups_health, manager)
+
+
 def _require_group_schema_store(manager: ModelReferenceManager) -> GroupSchemaStore:
     """Return the group schema store or raise 503 if unavailable."""
     store = manager.group_schema_store
@@ -1381,21 +1407,13 @@ def list_families(
     )
 
 
-@router.get(
-    "/text_generation/families/detect",
-    response_model=DetectFamiliesResponse,
-    summary="Auto-detect family suggestions from current model groups",
-    tags=["text_utils"],
-)
-def detect_family_suggestions(
-    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
-    min_prefix_length: Annotated[int, Query(ge=2, le=20)] = 3,
-    min_family_size: Annotated[int, Query(ge=2, le=50)] = 2,
+def _detect_family_suggestions(
+    manager: ModelReferenceManager,
+    *,
+    min_prefix_length: int,
+    min_family_size: int,
 ) -> DetectFamiliesResponse:
-    """Run prefix-based heuristics over current group names to suggest families.
-
-    Results are suggestions only - they are not persisted automatically.
-    """
+    """Suggest families from the prefixes of the current group names."""
     all_models = _get_all_text_models(manager)
     if not all_models:
         return DetectFamiliesResponse(
@@ -1432,6 +1450,30 @@ def detect_family_suggestions(
     )
 
 
+@router.get(
+    "/text_generation/families/detect",
+    response_model=DetectFamiliesResponse,
+    summary="Auto-detect family suggestions from current model groups",
+    tags=["text_utils"],
+)
+async def detect_family_suggestions(
+    manager: Annotated[ModelReferenceManager, Depends(get_model_reference_manager)],
+    min_prefix_length: Annotated[int, Query(ge=2, le=20)] = 3,
+    min_family_size: Annotated[int, Query(ge=2, le=50)] = 2,
+) -> DetectFamiliesResponse:
+    """Run prefix-based heuristics over current group names to suggest families.
+
+    Results are suggestions only - they are not persisted automatically.
+    """
+    return await run_compute(
+        "detect_family_suggestions",
+        _detect_family_suggestions,
+        manager,
+        min_prefix_length=min_prefix_length,
+        min_family_size=min_family_size,
+    )
+
+
 @router.get(
     "/text_generation/families/{family_name}",
     response_model=GroupFamilyResponse,
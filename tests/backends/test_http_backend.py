@@ -1,3 +1,5 @@
+import threading
+import time
 from pathlib import Path
 from typing import Any, cast, override
 
@@ -9,6 +11,8 @@ from horde_model_reference import ReplicateMode
 from horde_model_reference.backends.github_backend import GitHubBackend
 from horde_model_reference.backends.http_backend import HTTPBackend
 from horde_model_reference.backends.replica_backend_base import ReplicaBackendBase
+from horde_model_reference.change_log import CHANGE_VERSION_HEADER
+from horde_model_reference.http_clients import HTTPClientPool
 from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
 
 
@@ -142,6 +146,157 @@ def test_http_backend_primary_success_and_cache(
     assert github_stub.sync_calls == 0
 
 
+def test_http_backend_revalidates_with_etag_and_keeps_cache_on_304(
+    monkeypatch: pytest.MonkeyPatch,
+    httpx_mock: HTTPXMock,
+) -> None:
+    """An expired category is revalidated with If-None-Match; a 304 keeps the cached payload and refreshes it."""
+    category = MODEL_REFERENCE_CATEGORY.image_generation
+    github_stub = StubGitHubBackend({})
+    backend = HTTPBackend(
+        primary_api_url="https://primary",
+        github_backend=cast(GitHubBackend, github_stub),
+        cache_ttl_seconds=60,
+    )
+    current_time = 1_500.0
+
+    def fake_time() -> float:
+        return current_time
+
+    monkeypatch.setattr("horde_model_reference.backends.replica_backend_base.time.time", fake_time)
+
+    url = "https://primary/model_references/v2/image_generation"
+    httpx_mock.add_response(url=url, json={"source": "primary"}, headers={"ETag": '"v1"'})
+    httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"v1"'})
+
+    first = backend.fetch_category(category)
+    assert "If-None-Match" not in httpx_mock.get_requests()[0].headers
+
+    current_time += 61
+    revalidated = backend.fetch_category(category)
+    cached = backend.fetch_category(category)
+
+    assert revalidated is first
+    assert cached is first
+    assert len(httpx_mock.get_requests()) == 2
+    stats = backend.get_statistics()
+    assert stats["primary_hits"] == 1
+    assert stats["primary_not_modified"] == 1
+
+
+def test_http_backend_delta_sync_applies_primary_changes(
+    monkeypatch: pytest.MonkeyPatch,
+    httpx_mock: HTTPXMock,
+) -> None:
+    """With delta sync, an expired category is refreshed from the changes endpoint instead of a full fetch."""
+    category = MODEL_REFERENCE_CATEGORY.image_generation
+    github_stub = StubGitHubBackend({})
+    backend = HTTPBackend(
+        primary_api_url="https://primary",
+        github_backend=cast(GitHubBackend, github_stub),
+        cache_ttl_seconds=60,
+        delta_sync=True,
+    )
+    current_time = 1_550.0
+
+    def fake_time() -> float:
+        return current_time
+
+    monkeypatch.setattr("horde_model_reference.backends.replica_backend_base.time.time", fake_time)
+
+    url = "https://primary/model_references/v2/image_generation"
+    httpx_mock.add_response(
+        url=url,
+        json={"kept": {"v": 1}, "gone": {"v": 1}, "edited": {"v": 1}},
+        headers={CHANGE_VERSION_HEADER: "e-1"},
+    )
+    httpx_mock.add_response(
+        url=f"{url}/changes?since=e-1",
+        json={"version": "e-3", "complete": True, "upserted": {"edited": {"v": 2}}, "deleted": ["gone"]},
+    )
+    httpx_mock.add_response(url=f"{url}/changes?since=e-3", json={"version": "e-4", "complete": False})
+    httpx_mock.add_response(url=url, json={"kept": {"v": 1}}, headers={CHANGE_VERSION_HEADER: "e-4"})
+
+    backend.fetch_category(category)
+    # The version comes with the full fetch; no separate changes request is made
+    assert [request.url.path for request in httpx_mock.get_requests()] == ["/model_references/v2/image_generation"]
+    current_time += 61
+    assert backend.fetch_category(category) == {"kept": {"v": 1}, "edited": {"v": 2}}
+    assert backend.get_statistics()["delta_syncs"] == 1
+
+    # An incomplete delta falls back to a full fetch
+    current_time += 61
+    assert backend.fetch_category(category) == {"kept": {"v": 1}}
+    assert backend.get_statistics()["primary_hits"] == 2
+    assert len(httpx_mock.get_requests()) == 4
+
+
+def test_http_backend_delta_sync_without_version_header_fetches_in_full(
+    monkeypatch: pytest.MonkeyPatch,
+    httpx_mock: HTTPXMock,
+) -> None:
+    """A PRIMARY that sends no version cannot be delta-synced, so refreshes stay plain full fetches."""
+    category = MODEL_REFERENCE_CATEGORY.image_generation
+    github_stub = StubGitHubBackend({})
+    backend = HTTPBackend(
+        primary_api_url="https://primary",
+        github_backend=cast(GitHubBackend, github_stub),
+        cache_ttl_seconds=60,
+        delta_sync=True,
+    )
+    current_time = 1_575.0
+
+    def fake_time() -> float:
+        return current_time
+
+    monkeypatch.setattr("horde_model_reference.backends.replica_backend_base.time.time", fake_time)
+
+    url = "https://primary/model_references/v2/image_generation"
+    httpx_mock.add_response(url=url, json={"model": {"v": 1}}, headers={"ETag": '"v1"'})
+    httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"v1"'})
+
+    first = backend.fetch_category(category)
+    current_time += 61
+    assert backend.fetch_category(category) is first
+
+    assert all(not request.url.path.endswith("/changes") for request in httpx_mock.get_requests())
+    assert backend.get_statistics()["delta_syncs"] == 0
+
+
+def test_http_backend_legacy_revalidates_with_etag(
+    monkeypatch: pytest.MonkeyPatch,
+    httpx_mock: HTTPXMock,
+) -> None:
+    """Legacy refreshes send the stored ETag and keep the cached dict and string on 304."""
+    category = MODEL_REFERENCE_CATEGORY.image_generation
+    github_stub = StubGitHubBackend({})
+    backend = HTTPBackend(
+        primary_api_url="https://primary",
+        github_backend=cast(GitHubBackend, github_stub),
+        cache_ttl_seconds=60,
+    )
+    current_time = 1_600.0
+
+    def fake_time() -> float:
+        return current_time
+
+    monkeypatch.setattr("horde_model_reference.backends.replica_backend_base.time.time", fake_time)
+
+    url = "https://primary/model_references/v1/image_generation"
+    legacy_string = '{"legacy": "data"}'
+    httpx_mock.add_response(url=url, text=legacy_string, headers={"ETag": '"legacy-v1"'})
+    httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"legacy-v1"'})
+
+    first = backend.get_legacy_json(category)
+    current_time += 61
+    revalidated = backend.get_legacy_json(category)
+
+    assert revalidated is first
+    assert backend.get_legacy_json_string(category) == legacy_string
+    assert len(httpx_mock.get_requests()) == 2
+    assert backend.get_statistics()["primary_not_modified"] == 1
+
+
 def test_http_backend_persists_primary_hits_for_offline_replica(
     tmp_path: Path,
     httpx_mock: HTTPXMock,
@@ -242,6 +397,45 @@ def test_http_backend_disable_fallback_returns_none(httpx_mock: HTTPXMock) -> No
     assert github_stub.sync_calls == 0
 
 
+@pytest.mark.parametrize(("max_workers", "expect_parallel"), [(4, True), (1, False)])
+def test_http_backend_fetch_all_categories_bounded_fan_out(
+    monkeypatch: pytest.MonkeyPatch,
+    max_workers: int,
+    expect_parallel: bool,
+) -> None:
+    """fetch_all_categories fetches up to backend_fetch_max_workers categories at once, in category order."""
+    from horde_model_reference import horde_model_reference_settings
+
+    monkeypatch.setattr(horde_model_reference_settings, "backend_fetch_max_workers", max_workers)
+    backend = HTTPBackend(
+        primary_api_url="https://primary",
+        github_backend=cast(GitHubBackend, StubGitHubBackend({})),
+        cache_ttl_seconds=60,
+    )
+    counter_lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def fake_fetch_category(category: MODEL_REFERENCE_CATEGORY, *, force_refresh: bool = False) -> dict[str, Any]:
+        nonlocal active, peak
+        with counter_lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with counter_lock:
+            active -= 1
+        return {"category": category.value}
+
+    monkeypatch.setattr(backend, "fetch_category", fake_fetch_category)
+
+    result = backend.fetch_all_categories()
+
+    assert list(result) == list(MODEL_REFERENCE_CATEGORY)
+    assert all(result[category] == {"category": category.value} for category in MODEL_REFERENCE_CATEGORY)
+    assert peak <= max_workers
+    assert (peak > 1) is expect_parallel
+
+
 def test_http_backend_force_refresh_triggers_refetch(
     monkeypatch: pytest.MonkeyPatch,
     httpx_mock: HTTPXMock,
@@ -473,3 +667,24 @@ def test_http_backend_legacy_json_disable_fallback(httpx_mock: HTTPXMock) -> Non
     assert string_result is None
     assert github_stub.legacy_json_calls == 0
     assert github_stub.legacy_json_string_calls == 0
+
+
+def test_http_backend_uses_injected_client_pool(httpx_mock: HTTPXMock) -> None:
+    """Requests go through the injected pool's shared client instead of a per-request client."""
+    pool = HTTPClientPool()
+    backend = HTTPBackend(
+        primary_api_url="https://primary",
+        github_backend=cast(GitHubBackend, StubGitHubBackend({})),
+        cache_ttl_seconds=60,
+        http_clients=pool,
+    )
+    httpx_mock.add_response(url="https://primary/model_references/v2/image_generation", json={"a": 1})
+    httpx_mock.add_response(url="https://primary/model_references/v2/text_generation", json={"b": 2})
+
+    client = pool.sync_client
+    backend.fetch_category(MODEL_REFERENCE_CATEGORY.image_generation)
+    backend.fetch_category(MODEL_REFERENCE_CATEGORY.text_generation)
+
+    assert pool.sync_client is client
+    assert len(httpx_mock.get_requests()) == 2
+    pool.close()
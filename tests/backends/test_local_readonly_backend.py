@@ -5,6 +5,8 @@ process already populated, and no network access ever occurs.
 """
 
 import json
+import os
+import threading
 import time
 from pathlib import Path
 from typing import Any
@@ -127,3 +129,78 @@ def test_manager_offline_selects_local_readonly_backend(
     reference = manager.get_model_reference(category)
     assert reference is not None
     assert "offline_model" in reference
+
+
+def test_local_readonly_file_watcher_marks_changed_category_stale(
+    primary_base: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With a file watcher running, cache reads skip stat() and the watcher marks rewritten files stale."""
+    monkeypatch.setattr("requests.get", _explode_if_network)
+
+    category = MODEL_REFERENCE_CATEGORY.miscellaneous
+    file_path = _write_category_file(primary_base, category, _minimal_record_dict("first"))
+
+    backend = LocalReadOnlyBackend(base_path=primary_base, cache_ttl_seconds=60)
+    assert "first" in (backend.fetch_category(category) or {})
+
+    watcher = backend.start_file_watching(poll_interval_seconds=0.02, force_polling=True)
+    assert watcher is not None
+    try:
+        stat_calls = 0
+        original_stat = Path.stat
+
+        def counting_stat(self: Path, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            nonlocal stat_calls
+            if threading.current_thread() is threading.main_thread():
+                stat_calls += 1
+            return original_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "stat", counting_stat)
+        assert backend.is_cache_valid(category)
+        assert not backend.needs_refresh(category)
+        assert stat_calls == 0
+        monkeypatch.setattr(Path, "stat", original_stat)
+
+        file_path.write_text(json.dumps(_minimal_record_dict("second")))
+        new_mtime = time.time() + 5
+        os.utime(file_path, (new_mtime, new_mtime))
+
+        deadline = time.monotonic() + 5
+        while not backend.needs_refresh(category) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert backend.needs_refresh(category)
+        assert "second" in (backend.fetch_category(category) or {})
+    finally:
+        backend.stop_file_watching()
+
+
+def test_local_readonly_checks_mtimes_again_when_watcher_thread_dies(
+    primary_base: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """If the watcher thread is no longer alive, cache reads go back to detecting changes with stat()."""
+    monkeypatch.setattr("requests.get", _explode_if_network)
+
+    category = MODEL_REFERENCE_CATEGORY.miscellaneous
+    file_path = _write_category_file(primary_base, category, _minimal_record_dict("first"))
+
+    backend = LocalReadOnlyBackend(base_path=primary_base, cache_ttl_seconds=60)
+    assert "first" in (backend.fetch_category(category) or {})
+
+    watcher = backend.start_file_watching(poll_interval_seconds=0.02, force_polling=True)
+    assert watcher is not None
+    try:
+        watcher.stop()
+        assert backend.file_watcher is watcher
+        assert not watcher.running
+
+        file_path.write_text(json.dumps(_minimal_record_dict("second")))
+        new_mtime = time.time() + 5
+        os.utime(file_path, (new_mtime, new_mtime))
+
+        assert backend.needs_refresh(category)
+        assert "second" in (backend.fetch_category(category) or {})
+    finally:
+        backend.stop_file_watching()
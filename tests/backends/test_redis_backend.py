@@ -15,6 +15,7 @@ from horde_model_reference import MODEL_REFERENCE_CATEGORY, RedisSettings, Repli
 from horde_model_reference.backends.base import ModelReferenceBackend
 from horde_model_reference.backends.filesystem_backend import FileSystemBackend
 from horde_model_reference.backends.redis_backend import RedisBackend
+from horde_model_reference.redis_codec import CODEC_FORMAT_VERSION
 
 
 class StubFileSystemBackend(ModelReferenceBackend):
@@ -386,6 +387,75 @@ class TestRedisSyncCacheOperations:
         assert MODEL_REFERENCE_CATEGORY.text_generation in result
         assert result[MODEL_REFERENCE_CATEGORY.image_generation] == {"model1": {"name": "model1"}}
 
+    def test_fetch_all_categories_reads_hits_with_one_mget_and_caches_misses(
+        self,
+        stub_file_backend: StubFileSystemBackend,
+        redis_settings: RedisSettings,
+        fake_redis_server: fakeredis.FakeRedis,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Cached categories come from Redis; only misses hit the file backend and are written back."""
+        monkeypatch.setattr(
+            "horde_model_reference.backends.redis_backend.redis.from_url",
+            lambda *args, **kwargs: fake_redis_server,
+        )
+
+        redis_settings.use_pubsub = False
+        backend = RedisBackend(
+            file_backend=cast(FileSystemBackend, stub_file_backend),
+            redis_settings=redis_settings,
+        )
+
+        cached_category = MODEL_REFERENCE_CATEGORY.image_generation
+        fake_redis_server.setex(backend._category_key(cached_category), 60, json.dumps({"cached": "data"}))
+
+        result = backend.fetch_all_categories()
+
+        assert result[cached_category] == {"cached": "data"}
+        assert result[MODEL_REFERENCE_CATEGORY.text_generation] == {"model2": {"name": "model2"}}
+        assert cached_category not in stub_file_backend.fetch_calls
+        assert set(stub_file_backend.fetch_calls) == set(MODEL_REFERENCE_CATEGORY) - {cached_category}
+
+        text_key = backend._category_key(MODEL_REFERENCE_CATEGORY.text_generation)
+        cached = fake_redis_server.get(text_key)
+        assert cached is not None
+        assert json.loads(cached) == {"model2": {"name": "model2"}}
+
+        stub_file_backend.fetch_calls.clear()
+        backend.fetch_all_categories()
+        assert MODEL_REFERENCE_CATEGORY.text_generation not in stub_file_backend.fetch_calls
+
+    def test_fetch_category_with_compressed_codec(
+        self,
+        stub_file_backend: StubFileSystemBackend,
+        redis_settings: RedisSettings,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """With compression configured, categories are stored framed and compressed and still served from Redis."""
+        binary_redis = fakeredis.FakeRedis(decode_responses=False)
+        monkeypatch.setattr(
+            "horde_model_reference.backends.redis_backend.redis.from_url",
+            lambda *args, **kwargs: binary_redis,
+        )
+
+        redis_settings.use_pubsub = False
+        redis_settings.codec_compression = "zlib"
+        redis_settings.codec_min_compress_bytes = 0
+        backend = RedisBackend(
+            file_backend=cast(FileSystemBackend, stub_file_backend),
+            redis_settings=redis_settings,
+        )
+
+        category = MODEL_REFERENCE_CATEGORY.image_generation
+        backend.fetch_category(category)
+        stored = binary_redis.get(backend._category_key(category))
+        assert stored is not None
+        assert stored[:3] == bytes((CODEC_FORMAT_VERSION, ord("j"), ord("z")))
+
+        stub_file_backend.fetch_calls.clear()
+        assert backend.fetch_category(category) == {"model1": {"name": "model1"}}
+        assert category not in stub_file_backend.fetch_calls
+
 
 class TestRedisBackendAsyncCache:
     """Tests for asynchronous cache operations in RedisBackend."""
@@ -529,6 +599,47 @@ class TestRedisBackendAsyncCache:
         assert MODEL_REFERENCE_CATEGORY.image_generation in result
         assert MODEL_REFERENCE_CATEGORY.text_generation in result
 
+    @pytest.mark.asyncio
+    async def test_async_reads_reuse_one_pool_and_pipeline_misses(
+        self,
+        stub_file_backend: StubFileSystemBackend,
+        redis_settings: RedisSettings,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The async client is created once at init; fetch-all writes misses back and then serves them."""
+        fake_async_redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        async_pools_created = 0
+
+        def fake_from_url(*args: object, **kwargs: object) -> fakeredis.FakeAsyncRedis:
+            nonlocal async_pools_created
+            async_pools_created += 1
+            return fake_async_redis
+
+        monkeypatch.setattr("horde_model_reference.backends.redis_backend.redis.asyncio.from_url", fake_from_url)
+
+        fake_sync_redis = fakeredis.FakeRedis(decode_responses=True)
+        monkeypatch.setattr(
+            "horde_model_reference.backends.redis_backend.redis.from_url",
+            lambda *args, **kwargs: fake_sync_redis,
+        )
+
+        redis_settings.use_pubsub = False
+        backend = RedisBackend(
+            file_backend=cast(FileSystemBackend, stub_file_backend),
+            redis_settings=redis_settings,
+        )
+
+        await backend.fetch_category_async(MODEL_REFERENCE_CATEGORY.image_generation)
+        first = await backend.fetch_all_categories_async()
+        stub_file_backend.fetch_calls.clear()
+        second = await backend.fetch_all_categories_async()
+
+        assert async_pools_created == 1
+        assert first[MODEL_REFERENCE_CATEGORY.text_generation] == {"model2": {"name": "model2"}}
+        assert second[MODEL_REFERENCE_CATEGORY.text_generation] == {"model2": {"name": "model2"}}
+        assert MODEL_REFERENCE_CATEGORY.image_generation not in stub_file_backend.fetch_calls
+        assert MODEL_REFERENCE_CATEGORY.text_generation not in stub_file_backend.fetch_calls
+
 
 class RedisCacheInvalidationTests:
     """Tests for cache invalidation in RedisBackend."""
@@ -1150,7 +1261,7 @@ class TestRedisMultiWorkerScenarios:
         fake_redis_server: fakeredis.FakeRedis,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Worker A writes, Worker B should see invalidation and fetch fresh data."""
+        """Worker A writes, Worker B should apply the published delta and serve fresh data."""
         monkeypatch.setattr(
             "horde_model_reference.backends.redis_backend.redis.from_url",
             lambda *args, **kwargs: fake_redis_server,
@@ -1196,8 +1307,9 @@ class TestRedisMultiWorkerScenarios:
 
         time.sleep(0.2)
 
-        cached_after_invalidation = fake_redis_server.get(key)
-        assert cached_after_invalidation is None
+        cached_after_write = json.loads(fake_redis_server.get(key) or "{}")
+        assert cached_after_write["model1"]["description"] == "updated"
+        assert int(fake_redis_server.get(backend_a._version_key(category)) or 0) == 1
 
         result_b_after = backend_b.fetch_category(category)
         assert result_b_after is not None
@@ -1217,7 +1329,7 @@ class TestRedisMultiWorkerScenarios:
         fake_redis_server: fakeredis.FakeRedis,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Worker A deletes, Worker B should see invalidation."""
+        """Worker A deletes, Worker B should apply the published delta."""
         monkeypatch.setattr(
             "horde_model_reference.backends.redis_backend.redis.from_url",
             lambda *args, **kwargs: fake_redis_server,
@@ -1261,8 +1373,9 @@ class TestRedisMultiWorkerScenarios:
         time.sleep(0.2)
 
         key = backend_a._category_key(category)
-        cached_after_delete = fake_redis_server.get(key)
-        assert cached_after_delete is None
+        cached_after_delete = json.loads(fake_redis_server.get(key) or "{}")
+        assert "model1" not in cached_after_delete
+        assert "model2" in cached_after_delete
 
         result_b_after = backend_b.fetch_category(category)
         assert result_b_after is not None
@@ -1276,6 +1389,138 @@ class TestRedisMultiWorkerScenarios:
         if backend_b._pubsub_thread:
             backend_b._pubsub_thread.join(timeout=1)
 
+    def test_delta_is_applied_without_reloading_the_category(
+        self,
+        primary_base: Path,
+        redis_settings: RedisSettings,
+        fake_redis_server: fakeredis.FakeRedis,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Worker B patches its in-process copy from the delta instead of re-reading Redis or disk."""
+        monkeypatch.setattr(
+            "horde_model_reference.backends.redis_backend.redis.from_url",
+            lambda *args, **kwargs: fake_redis_server,
+        )
+
+        category = MODEL_REFERENCE_CATEGORY.miscellaneous
+        redis_settings.use_pubsub = True
+        backend_a = RedisBackend(
+            file_backend=FileSystemBackend(
+                base_path=primary_base, cache_ttl_seconds=60, replicate_mode=ReplicateMode.PRIMARY
+            ),
+            redis_settings=redis_settings,
+        )
+        file_backend_b = FileSystemBackend(
+            base_path=primary_base, cache_ttl_seconds=60, replicate_mode=ReplicateMode.PRIMARY
+        )
+        backend_b = RedisBackend(file_backend=file_backend_b, redis_settings=redis_settings)
+        notified: list[MODEL_REFERENCE_CATEGORY] = []
+        backend_b.register_invalidation_callback(notified.append)
+
+        file_path = primary_base / "miscellaneous.json"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(json.dumps({"model1": {"name": "model1", "description": "initial"}}))
+        backend_b.fetch_category(category)
+
+        backend_a.update_model(category, "model2", {"name": "model2", "description": "new"})
+        time.sleep(0.2)
+
+        fake_redis_server.delete(backend_a._category_key(category))
+        reads: list[MODEL_REFERENCE_CATEGORY] = []
+        monkeypatch.setattr(file_backend_b, "fetch_category", lambda c, **kwargs: reads.append(c))
+
+        result_b = backend_b.fetch_category(category)
+
+        assert notified == [category]
+        assert reads == []
+        assert result_b is not None
+        assert set(result_b) == {"model1", "model2"}
+        assert backend_b._local[category][0] == 1
+
+        for backend in (backend_a, backend_b):
+            backend._pubsub_running = False
+            if backend._pubsub_thread:
+                backend._pubsub_thread.join(timeout=1)
+
+    def test_write_publishes_plain_invalidation_for_workers_without_delta_support(
+        self,
+        primary_base: Path,
+        redis_settings: RedisSettings,
+        fake_redis_server: fakeredis.FakeRedis,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Deltas go on their own channel; the invalidation channel still only ever carries category names."""
+        monkeypatch.setattr(
+            "horde_model_reference.backends.redis_backend.redis.from_url",
+            lambda *args, **kwargs: fake_redis_server,
+        )
+
+        category = MODEL_REFERENCE_CATEGORY.miscellaneous
+        redis_settings.use_pubsub = True
+        backend = RedisBackend(
+            file_backend=FileSystemBackend(
+                base_path=primary_base, cache_ttl_seconds=60, replicate_mode=ReplicateMode.PRIMARY
+            ),
+            redis_settings=redis_settings,
+        )
+        file_path = primary_base / "miscellaneous.json"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(json.dumps({"model1": {"name": "model1"}}))
+        backend.fetch_category(category)
+
+        older_worker = fake_redis_server.pubsub(ignore_subscribe_messages=True)
+        older_worker.subscribe(backend._invalidation_channel())
+        delta_listener = fake_redis_server.pubsub(ignore_subscribe_messages=True)
+        delta_listener.subscribe(backend._delta_channel())
+
+        backend.update_model(category, "model2", {"name": "model2"})
+        time.sleep(0.2)
+
+        invalidations = [older_worker.get_message(timeout=0.1) for _ in range(3)]
+        assert [message["data"] for message in invalidations if message] == [category.value]
+        deltas = [delta_listener.get_message(timeout=0.1) for _ in range(3)]
+        assert [json.loads(message["data"])["model"] for message in deltas if message] == ["model2"]
+
+        assert fake_redis_server.get(backend._category_key(category)) is not None
+        assert backend._local[category][0] == 1
+
+        backend._pubsub_running = False
+        if backend._pubsub_thread:
+            backend._pubsub_thread.join(timeout=1)
+
+    def test_version_gap_drops_in_process_copy(
+        self,
+        stub_file_backend: StubFileSystemBackend,
+        redis_settings: RedisSettings,
+        fake_redis_server: fakeredis.FakeRedis,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A delta that skips a version is not applied; the worker reloads the category on next fetch."""
+        monkeypatch.setattr(
+            "horde_model_reference.backends.redis_backend.redis.from_url",
+            lambda *args, **kwargs: fake_redis_server,
+        )
+
+        redis_settings.use_pubsub = True
+        backend = RedisBackend(
+            file_backend=cast(FileSystemBackend, stub_file_backend),
+            redis_settings=redis_settings,
+        )
+        category = MODEL_REFERENCE_CATEGORY.image_generation
+        backend.fetch_category(category)
+        assert backend._local[category][0] == 0
+
+        backend._apply_delta(
+            {"category": category.value, "version": 3, "op": "upsert", "model": "m", "record": {"name": "m"}}
+        )
+
+        assert category not in backend._local
+        assert category in stub_file_backend.mark_stale_calls
+
+        backend._pubsub_running = False
+        if backend._pubsub_thread:
+            backend._pubsub_thread.join(timeout=1)
+
     def test_pubsub_listener_actually_deletes_redis_key(
         self,
         primary_base: Path,
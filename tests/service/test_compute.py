@@ -0,0 +1,96 @@
+"""Tests for the bounded compute executor used by the search and text_utils routes."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from horde_model_reference.service.compute import ComputeExecutor
+
+
+class TestComputeExecutor:
+    """Tests for running work off the event loop with per-route admission limits."""
+
+    def test_runs_on_a_pool_thread_and_returns_result(self) -> None:
+        """The function runs on an ``api-compute`` thread and its result is returned."""
+        executor = ComputeExecutor(max_workers=2)
+
+        def _work(a: int, *, b: int) -> tuple[int, str]:
+            return a + b, threading.current_thread().name
+
+        try:
+            result, thread_name = asyncio.run(executor.run("route", _work, 1, b=2))
+        finally:
+            executor.shutdown()
+
+        assert result == 3
+        assert thread_name.startswith("api-compute")
+
+    def test_exceptions_propagate(self) -> None:
+        """Errors raised by the function reach the awaiting handler."""
+        executor = ComputeExecutor()
+
+        def _fail() -> None:
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                asyncio.run(executor.run("route", _fail))
+        finally:
+            executor.shutdown()
+
+    def test_route_concurrency_is_capped(self) -> None:
+        """No more than ``route_max_concurrency`` computations of one route run at once."""
+        executor = ComputeExecutor(max_workers=8, route_max_concurrency=2, queue_timeout_seconds=10.0)
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def _work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            threading.Event().wait(0.05)
+            with lock:
+                running -= 1
+
+        async def _burst() -> None:
+            await asyncio.gather(*(executor.run("route", _work) for _ in range(6)))
+
+        try:
+            asyncio.run(_burst())
+        finally:
+            executor.shutdown()
+
+        assert peak == 2
+
+    def test_saturated_route_is_rejected_with_retry_after(self) -> None:
+        """A request that cannot get a slot within the queue timeout gets 503 and Retry-After."""
+        executor = ComputeExecutor(max_workers=2, route_max_concurrency=1, queue_timeout_seconds=0.05)
+        release = threading.Event()
+
+        async def _saturate() -> HTTPException:
+            blocker = asyncio.ensure_future(executor.run("route", release.wait, 5))
+            await asyncio.sleep(0.01)
+            try:
+                with pytest.raises(HTTPException) as exc_info:
+                    await executor.run("route", lambda: None)
+                # Other routes keep their own slots.
+                assert await executor.run("other", lambda: "ok") == "ok"
+            finally:
+                release.set()
+                await blocker
+            return exc_info.value
+
+        try:
+            error = asyncio.run(_saturate())
+        finally:
+            executor.shutdown()
+
+        assert error.status_code == 503
+        assert error.headers == {"Retry-After": "1"}
+        assert executor.rejected == 1
@@ -0,0 +1,83 @@
+"""Tests for ETag helpers used by the full-category reference endpoints."""
+
+import gzip
+
+import pytest
+
+from horde_model_reference.service.conditional import (
+    SUPPORTED_ENCODINGS,
+    RenderedBodyCache,
+    etag_matches,
+    negotiate_encoding,
+    strong_etag,
+)
+
+_ETAG = strong_etag(b'{"a":1}')
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "matches"),
+    [
+        (None, False),
+        ("", False),
+        (_ETAG, True),
+        (f"W/{_ETAG}", True),
+        (f'"other", {_ETAG}', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+)
+def test_etag_matches_uses_weak_comparison(if_none_match: str | None, matches: bool) -> None:
+    """If-None-Match ignores W/ prefixes, accepts tag lists and ``*``."""
+    assert etag_matches(if_none_match, _ETAG) is matches
+
+
+def test_rendered_body_cache_reuses_body_for_same_payload_object() -> None:
+    """The same payload object is rendered once; a new object (even if equal) is rendered again."""
+    cache = RenderedBodyCache()
+    payload = {"b": 2, "a": 1}
+
+    body, etag = cache.render("key", payload)
+    assert body == b'{"b":2,"a":1}'
+    assert etag == strong_etag(body)
+    assert cache.render("key", payload)[0] is body
+
+    changed = {"b": 3, "a": 1}
+    assert cache.render("key", changed)[1] != etag
+    assert cache.render("key", '{"raw": true}') == (b'{"raw": true}', strong_etag(b'{"raw": true}'))
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("GZIP;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        ("*", SUPPORTED_ENCODINGS[0]),
+        ("*;q=0.1, gzip;q=0", next((coding for coding in SUPPORTED_ENCODINGS if coding != "gzip"), None)),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str | None, expected: str | None) -> None:
+    """Accept-Encoding q-values and wildcards pick the coding; q=0 refuses it."""
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+def test_render_encoded_compresses_once_per_payload_object() -> None:
+    """The gzip variant is built once, tagged with its own ETag, and small bodies are never compressed."""
+    cache = RenderedBodyCache()
+    payload = {f"model_{index}": {"description": "x" * 64} for index in range(50)}
+
+    encoded = cache.render_encoded("key", payload, "gzip, deflate")
+    body, etag = cache.render("key", payload)
+    assert encoded.content_encoding == "gzip"
+    assert gzip.decompress(encoded.body) == body
+    assert encoded.identity_etag == etag
+    assert encoded.etag == f'{etag[:-1]}-gzip"'
+    assert cache.render_encoded("key", payload, "gzip").body is encoded.body
+
+    small = cache.render_encoded("small", {"a": 1}, "gzip")
+    assert small.content_encoding is None
+    assert small.etag == small.identity_etag
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
@@ -199,3 +202,155 @@ def test_fetch_with_cache_helper(monkeypatch: pytest.MonkeyPatch) -> None:
     result = probe._fetch_with_cache(category, mock_fetch, force_refresh=False)
     assert result == {"data": "fetch_3"}
     assert fetch_count == 3
+
+
+def test_fetch_with_cache_coalesces_concurrent_misses() -> None:
+    """Threads missing the cache for the same category share one fetch."""
+    probe = _ReplicaBackendProbe(cache_ttl_seconds=10)
+    category = MODEL_REFERENCE_CATEGORY.image_generation
+    release = threading.Event()
+    fetch_count = 0
+
+    def slow_fetch() -> dict[str, Any]:
+        nonlocal fetch_count
+        fetch_count += 1
+        release.wait(timeout=5)
+        return {"data": "shared"}
+
+    results: list[dict[str, Any] | None] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(probe._fetch_with_cache(category, slow_fetch)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    while probe.coalesced_fetches < len(threads) - 1:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert fetch_count == 1
+    assert results == [{"data": "shared"}] * len(threads)
+    assert probe._get_from_cache(category) == {"data": "shared"}
+
+
+def test_fetch_with_cache_shares_errors_with_waiters() -> None:
+    """A failing fetch raises in every coalesced caller and the next miss fetches again."""
+    probe = _ReplicaBackendProbe(cache_ttl_seconds=10)
+    category = MODEL_REFERENCE_CATEGORY.image_generation
+    release = threading.Event()
+    errors: list[BaseException] = []
+
+    def failing_fetch() -> dict[str, Any]:
+        release.wait(timeout=5)
+        raise RuntimeError("boom")
+
+    def call() -> None:
+        try:
+            probe._fetch_with_cache(category, failing_fetch)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while probe.coalesced_fetches < len(threads) - 1:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(errors) == len(threads)
+    assert probe._fetch_with_cache(category, lambda: {"data": "recovered"}) == {"data": "recovered"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_with_cache_async_coalesces_concurrent_misses() -> None:
+    """Concurrent coroutines missing the cache for the same category await one fetch."""
+    probe = _ReplicaBackendProbe(cache_ttl_seconds=10)
+    category = MODEL_REFERENCE_CATEGORY.image_generation
+    fetch_count = 0
+
+    async def slow_fetch() -> dict[str, Any]:
+        nonlocal fetch_count
+        fetch_count += 1
+        await asyncio.sleep(0.01)
+        return {"data": "shared"}
+
+    results = await asyncio.gather(*(probe._fetch_with_cache_async(category, slow_fetch) for _ in range(8)))
+
+    assert fetch_count == 1
+    assert results == [{"data": "shared"}] * 8
+    assert probe.coalesced_fetches == 7
+
+
+def test_stale_while_revalidate_serves_expired_data_and_refreshes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Inside the stale window, expired data is served while one background refresh replaces it."""
+    probe = _ReplicaBackendProbe(cache_ttl_seconds=10)
+    probe._stale_while_revalidate_seconds = 30
+    category = MODEL_REFERENCE_CATEGORY.image_generation
+    current_time = 1_000.0
+    release = threading.Event()
+    refreshed = threading.Event()
+    fetch_count = 0
+    invalidated: list[MODEL_REFERENCE_CATEGORY] = []
+
+    def fake_time() -> float:
+        return current_time
+
+    def refresh(category: MODEL_REFERENCE_CATEGORY, *, force_refresh: bool = False) -> dict[str, Any]:
+        nonlocal fetch_count
+        assert force_refresh
+        fetch_count += 1
+        release.wait(timeout=5)
+        probe._store_in_cache(category, {"data": "fresh"})
+        return {"data": "fresh"}
+
+    monkeypatch.setattr("horde_model_reference.backends.replica_backend_base.time.time", fake_time)
+    monkeypatch.setattr(probe, "fetch_category", refresh)
+
+    def on_invalidated(cat: MODEL_REFERENCE_CATEGORY) -> None:
+        invalidated.append(cat)
+        refreshed.set()
+
+    probe.register_invalidation_callback(on_invalidated)
+
+    probe._store_in_cache(category, {"data": "stale"})
+    current_time += 15
+
+    assert probe._get_from_cache(category) == {"data": "stale"}
+    assert not probe.should_fetch_data(category)
+    assert not probe.needs_refresh(category)
+
+    release.set()
+    assert refreshed.wait(timeout=5)
+
+    assert fetch_count == 1
+    assert invalidated == [category]
+    assert probe._get_from_cache(category) == {"data": "fresh"}
+    stats = probe.stale_while_revalidate_stats()
+    assert stats["stale_serves"] >= 1
+    assert stats["revalidations"] == 1
+    assert stats["revalidation_failures"] == 0
+    assert category.value in stats["last_revalidation_seconds"]
+
+
+def test_stale_while_revalidate_window_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Past the stale window (or with it disabled), expired data is a cache miss as before."""
+    probe = _ReplicaBackendProbe(cache_ttl_seconds=10)
+    probe._stale_while_revalidate_seconds = 30
+    category = MODEL_REFERENCE_CATEGORY.image_generation
+    current_time = 1_000.0
+
+    def fake_time() -> float:
+        return current_time
+
+    monkeypatch.setattr("horde_model_reference.backends.replica_backend_base.time.time", fake_time)
+
+    probe._store_in_cache(category, {"data": "stale"})
+    current_time += 41
+
+    assert probe._get_from_cache(category) is None
+    assert probe.needs_refresh(category)
+    assert probe.stale_while_revalidate_stats()["stale_serves"] == 0
@@ -444,6 +444,35 @@ class TestGetLegacyReference:
         assert data["test_model"]["custom_field"] == "custom_value"
         assert data["test_model"]["nested"]["key"] == "value"
 
+    def test_get_legacy_reference_supports_conditional_requests(
+        self,
+        api_client: TestClient,
+        v1_canonical_manager: ModelReferenceManager,
+        primary_base: Path,
+    ) -> None:
+        """GET /{category} should tag the body with a strong ETag and answer a matching If-None-Match with 304."""
+        category = MODEL_REFERENCE_CATEGORY.image_generation
+        _create_legacy_json_file(primary_base, category, {"model_1": {"name": "model_1"}})
+        url = route_registry.url_for(
+            RouteNames.get_reference_by_category,
+            {PathVariables.model_category_name: category.value},
+            v1_prefix,
+        )
+
+        first = api_client.get(url)
+        etag = first.headers["etag"]
+        assert etag.startswith('"') and not etag.startswith("W/")
+        assert api_client.get(url).headers["etag"] == etag
+
+        not_modified = api_client.get(url, headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+
+        stale = api_client.get(url, headers={"If-None-Match": '"some-older-version"'})
+        assert stale.status_code == 200
+        assert stale.json() == first.json()
+
     def test_get_legacy_reference_invalid_category(
         self,
         api_client: TestClient,
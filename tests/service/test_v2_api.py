@@ -1,5 +1,6 @@
 """Tests for v2 API CRUD operations."""
 
+import asyncio
 from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,7 @@ from horde_model_reference import (
     ReplicateMode,
 )
 from horde_model_reference.audit.events import AuditOperation
+from horde_model_reference.change_log import CHANGE_VERSION_HEADER
 from horde_model_reference.pending_queue.models import PendingChangeStatus
 from horde_model_reference.service.shared import (
     PathVariables,
@@ -208,6 +210,40 @@ def _assert_error_response(
     assert expected_substring.lower() in data["detail"].lower()
 
 
+class TestBatchGetModels:
+    """Tests for POST /{category}/models:batchGet endpoint."""
+
+    def test_batch_get_returns_found_and_missing(
+        self,
+        api_client: TestClient,
+        primary_manager_for_api: ModelReferenceManager,
+    ) -> None:
+        """Existing names are returned with their records; the rest are listed as missing."""
+        category = MODEL_REFERENCE_CATEGORY.miscellaneous
+        for name in ("batch_a", "batch_b"):
+            primary_manager_for_api.backend.update_model(category, name, _create_minimal_model_dict(name, category))
+
+        response = api_client.post(
+            f"{v2_prefix}/{category.value}/models:batchGet",
+            json={"names": ["batch_b", "nope", "batch_a", "batch_b"]},
+        )
+
+        data = _assert_success_response(response)
+        assert list(data["found"]) == ["batch_b", "batch_a"]
+        assert data["found"]["batch_a"]["name"] == "batch_a"
+        assert data["missing"] == ["nope"]
+
+    def test_batch_get_requires_names(
+        self,
+        api_client: TestClient,
+        primary_manager_for_api: ModelReferenceManager,
+    ) -> None:
+        """An empty name list is a validation error."""
+        category = MODEL_REFERENCE_CATEGORY.miscellaneous
+        response = api_client.post(f"{v2_prefix}/{category.value}/models:batchGet", json={"names": []})
+        assert response.status_code == 422
+
+
 class TestGetSingleModel:
     """Tests for GET model by category and name endpoint."""
 
@@ -1928,3 +1964,206 @@ class TestRouteCollisionRemediation:
             path for path in route_paths if path.endswith("/{model_name}") and "/model/{model_name}" not in path
         ]
         assert not offending, f"Per-model routes must be nested under '/model/': {offending}"
+
+
+class TestConditionalCategoryRequests:
+    """Tests for ETag / If-None-Match handling on the full-category GET endpoint."""
+
+    def test_category_etag_round_trip(
+        self,
+        api_client: TestClient,
+        primary_manager_for_api: ModelReferenceManager,
+    ) -> None:
+        """A matching If-None-Match gets 304 until the category changes, which yields a new ETag."""
+        category = MODEL_REFERENCE_CATEGORY.image_generation
+        primary_manager_for_api.backend.update_model(
+            category,
+            "etag_model",
+            _create_minimal_model_dict("etag_model", category),
+        )
+        url = f"{v2_prefix}/{category.value}"
+
+        first = api_client.get(url)
+        data = _assert_success_response(first)
+        assert "etag_model" in data
+        etag = first.headers["etag"]
+
+        not_modified = api_client.get(url, headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+
+        primary_manager_for_api.backend.update_model(
+            category,
+            "etag_model",
+            _create_minimal_model_dict("etag_model", category, description="changed"),
+        )
+
+        changed = api_client.get(url, headers={"If-None-Match": etag})
+        data = _assert_success_response(changed)
+        assert data["etag_model"]["description"] == "changed"
+        assert changed.headers["etag"] != etag
+
+    def test_category_body_is_compressed_when_accepted(
+        self,
+        api_client: TestClient,
+        primary_manager_for_api: ModelReferenceManager,
+    ) -> None:
+        """Accept-Encoding selects a gzip variant with its own ETag; an identity request gets the plain body."""
+        category = MODEL_REFERENCE_CATEGORY.image_generation
+        for index in range(20):
+            name = f"compressed_model_{index}"
+            primary_manager_for_api.backend.update_model(
+                category,
+                name,
+                _create_minimal_model_dict(name, category, description="A description long enough to matter."),
+            )
+        url = f"{v2_prefix}/{category.value}"
+
+        compressed = api_client.get(url, headers={"Accept-Encoding": "gzip"})
+        data = _assert_success_response(compressed)
+        assert "compressed_model_0" in data
+        assert compressed.headers["content-encoding"] == "gzip"
+        vary_tokens = {token.strip().lower() for token in compressed.headers["vary"].split(",")}
+        assert "accept-encoding" in vary_tokens
+        assert compressed.headers["etag"].endswith('-gzip"')
+
+        identity = api_client.get(url, headers={"Accept-Encoding": "identity"})
+        assert _assert_success_response(identity) == data
+        assert "content-encoding" not in identity.headers
+        assert identity.headers["etag"] != compressed.headers["etag"]
+
+        not_modified = api_client.get(
+            url,
+            headers={"Accept-Encoding": "gzip", "If-None-Match": identity.headers["etag"]},
+        )
+        assert not_modified.status_code == 304
+
+
+class TestCategoryChanges:
+    """Tests for the GET /{category}/changes delta endpoint."""
+
+    def test_changes_since_version(
+        self,
+        api_client: TestClient,
+        primary_manager_for_api: ModelReferenceManager,
+    ) -> None:
+        """Only models written after the given version are returned, with their latest state."""
+        category = MODEL_REFERENCE_CATEGORY.image_generation
+        backend = primary_manager_for_api.backend
+        backend.update_model(category, "untouched", _create_minimal_model_dict("untouched", category))
+        backend.update_model(category, "to_delete", _create_minimal_model_dict("to_delete", category))
+        url = f"{v2_prefix}/{category.value}/changes"
+
+        baseline = _assert_success_response(api_client.get(url))
+        assert baseline["complete"] is False
+        assert baseline["upserted"] == {}
+
+        backend.update_model(category, "added", _create_minimal_model_dict("added", category))
+        backend.delete_model(category, "to_delete")
+
+        changes = _assert_success_response(api_client.get(url, params={"since": baseline["version"]}))
+        assert changes["complete"] is True
+        assert changes["since"] == baseline["version"]
+        assert list(changes["upserted"]) == ["added"]
+        assert changes["deleted"] == ["to_delete"]
+        assert changes["version"] != baseline["version"]
+
+        unchanged = _assert_success_response(api_client.get(url, params={"since": changes["version"]}))
+        assert unchanged["complete"] is True
+        assert unchanged["upserted"] == {}
+        assert unchanged["deleted"] == []
+
+    def test_category_response_carries_change_version(
+        self,
+        api_client: TestClient,
+        primary_manager_for_api: ModelReferenceManager,
+    ) -> None:
+        """Full and 304 category responses carry the version the changes endpoint reports."""
+        category = MODEL_REFERENCE_CATEGORY.image_generation
+        backend = primary_manager_for_api.backend
+        backend.update_model(category, "model", _create_minimal_model_dict("model", category))
+        url = f"{v2_prefix}/{category.value}"
+
+        full = api_client.get(url)
+        current = _assert_success_response(api_client.get(f"{url}/changes"))
+        assert full.status_code == 200
+        assert full.headers[CHANGE_VERSION_HEADER] == current["version"]
+
+        not_modified = api_client.get(url, headers={"If-None-Match": full.headers["etag"]})
+        assert not_modified.status_code == 304
+        assert not_modified.headers[CHANGE_VERSION_HEADER] == current["version"]
+
+    def test_typed_category_response_carries_change_version(
+        self,
+        api_client: TestClient,
+        primary_manager_for_api: ModelReferenceManager,
+    ) -> None:
+        """The typed per-category GET handler sends the same version header as the generic route."""
+        from fastapi.routing import APIRoute
+
+        from horde_model_reference.service.v2.routers.references import router
+
+        category = MODEL_REFERENCE_CATEGORY.image_generation
+        primary_manager_for_api.backend.update_model(category, "model", _create_minimal_model_dict("model", category))
+        (route,) = [
+            route
+            for route in router.routes
+            if isinstance(route, APIRoute) and route.operation_id == f"read_v2_{category.value}_all"
+        ]
+
+        response = asyncio.run(route.endpoint(manager=primary_manager_for_api))
+
+        current = _assert_success_response(api_client.get(f"{v2_prefix}/{category.value}/changes"))
+        assert response.status_code == 200
+        assert response.headers[CHANGE_VERSION_HEADER] == current["version"]
+
+    def test_unknown_version_is_incomplete(
+        self,
+        api_client: TestClient,
+        primary_manager_for_api: ModelReferenceManager,
+    ) -> None:
+        """A version from another process or run asks the client for a full fetch."""
+        category = MODEL_REFERENCE_CATEGORY.image_generation
+        response = api_client.get(f"{v2_prefix}/{category.value}/changes", params={"since": "unknown-1"})
+
+        data = _assert_success_response(response)
+        assert data["complete"] is False
+        assert data["upserted"] == {}
+
+
+class TestNDJSONExport:
+    """Tests for the GET /export.ndjson streaming endpoint."""
+
+    def test_export_streams_one_record_per_line(
+        self,
+        api_client: TestClient,
+        primary_manager_for_api: ModelReferenceManager,
+    ) -> None:
+        """Each record of the requested categories is one line, readable by the library reader."""
+        from horde_model_reference.ndjson_export import NDJSON_MEDIA_TYPE, iter_export_records
+
+        backend = primary_manager_for_api.backend
+        image = MODEL_REFERENCE_CATEGORY.image_generation
+        misc = MODEL_REFERENCE_CATEGORY.miscellaneous
+        backend.update_model(image, "export_image", _create_minimal_model_dict("export_image", image))
+        backend.update_model(misc, "export_misc", _create_minimal_model_dict("export_misc", misc))
+
+        response = api_client.get(f"{v2_prefix}/export.ndjson", params={"category": [image.value, misc.value]})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+        records = list(iter_export_records(response.iter_lines()))
+        exported = {(record.category, record.name) for record in records}
+        assert (image, "export_image") in exported
+        assert (misc, "export_misc") in exported
+        assert {record.category for record in records} == {image, misc}
+
+    def test_export_rejects_unknown_category(
+        self,
+        api_client: TestClient,
+        primary_manager_for_api: ModelReferenceManager,
+    ) -> None:
+        """An invalid category filter is a validation error."""
+        response = api_client.get(f"{v2_prefix}/export.ndjson", params={"category": "not_a_category"})
+        assert response.status_code == 422
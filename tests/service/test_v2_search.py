@@ -258,6 +258,35 @@ class TestCategorySearch:
         assert data2["has_more"] is True
         assert data2["results"][0]["name"] != first_name
 
+    def test_repeated_search_reflects_backend_updates(
+        self,
+        api_client: TestClient,
+        primary_manager_for_search: ModelReferenceManager,
+    ) -> None:
+        """Validate a cached search result is not served after the category changes."""
+        params = {"nsfw": "false", "sort_by": "name"}
+        first = api_client.get(f"{_V2}/image_generation/search", params=params).json()
+        assert api_client.get(f"{_V2}/image_generation/search", params=params).json() == first
+        assert first["total"] == 2
+
+        primary_manager_for_search.backend.update_model(
+            MODEL_REFERENCE_CATEGORY.image_generation,
+            "img_safe_flux",
+            {
+                "name": "img_safe_flux",
+                "record_type": "image_generation",
+                "model_classification": {"domain": "image", "purpose": "generation"},
+                "baseline": "flux_1",
+                "nsfw": False,
+                "inpainting": False,
+                "tags": ["photo"],
+            },
+        )
+
+        updated = api_client.get(f"{_V2}/image_generation/search", params=params).json()
+        assert updated["total"] == 3
+        assert "img_safe_flux" in {r["name"] for r in updated["results"]}
+
     def test_search_invalid_category(
         self,
         api_client: TestClient,
@@ -333,6 +362,60 @@ class TestCrossCategorySearch:
         assert data["total"] >= 5
 
 
+class TestResolveName:
+    """Tests for the per-category name resolution endpoint."""
+
+    def test_resolve_tiers(
+        self,
+        api_client: TestClient,
+        primary_manager_for_search: ModelReferenceManager,
+    ) -> None:
+        """Wrong case and separators resolve to the canonical name; typos resolve fuzzily."""
+        resp = api_client.get(f"{_V2}/image_generation/resolve", params={"name": "IMG-SAFE-SD1"})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["query"] == "IMG-SAFE-SD1"
+        assert data["matches"][0] == {"name": "img_safe_sd1", "match_type": "normalized", "score": 1.0}
+
+        fuzzy = api_client.get(f"{_V2}/image_generation/resolve", params={"name": "img_nsfw_xll", "max_results": 1})
+        assert fuzzy.status_code == 200
+        assert [(m["name"], m["match_type"]) for m in fuzzy.json()["matches"]] == [("img_nsfw_xl", "fuzzy")]
+
+    def test_resolve_reflects_backend_updates(
+        self,
+        api_client: TestClient,
+        primary_manager_for_search: ModelReferenceManager,
+    ) -> None:
+        """The resolver is rebuilt with the category's cache, so newly added names resolve."""
+        params = {"name": "img_new_model"}
+        before = api_client.get(f"{_V2}/image_generation/resolve", params=params).json()
+        assert all(m["match_type"] == "fuzzy" for m in before["matches"])
+
+        primary_manager_for_search.backend.update_model(
+            MODEL_REFERENCE_CATEGORY.image_generation,
+            "img_new_model",
+            {
+                "name": "img_new_model",
+                "record_type": "image_generation",
+                "model_classification": {"domain": "image", "purpose": "generation"},
+                "baseline": "stable_diffusion_1",
+                "nsfw": False,
+            },
+        )
+
+        after = api_client.get(f"{_V2}/image_generation/resolve", params=params).json()
+        assert after["matches"][0] == {"name": "img_new_model", "match_type": "exact", "score": 1.0}
+
+    def test_resolve_invalid_category(
+        self,
+        api_client: TestClient,
+        primary_manager_for_search: ModelReferenceManager,
+    ) -> None:
+        """Validate resolve on a nonexistent category returns 422."""
+        resp = api_client.get(f"{_V2}/bogus_category/resolve", params={"name": "x"})
+        assert resp.status_code == 422
+
+
 class TestPopularModels:
     """Tests for the popular models endpoint."""
 
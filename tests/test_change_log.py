@@ -0,0 +1,79 @@
+"""Tests for the in-memory per-category change log."""
+
+from __future__ import annotations
+
+from horde_model_reference.change_log import ChangeLog
+from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
+
+CATEGORY = MODEL_REFERENCE_CATEGORY.image_generation
+
+
+class TestChangeLog:
+    """Tests for recording, querying and resetting changes."""
+
+    def test_latest_change_per_model_wins(self) -> None:
+        """A model updated and then deleted is reported once, as deleted."""
+        log = ChangeLog()
+        since = log.current_version(CATEGORY)
+        log.record(CATEGORY, "a")
+        log.record(CATEGORY, "b")
+        version = log.record(CATEGORY, "a", deleted=True)
+
+        changes = log.changes_since(CATEGORY, since)
+
+        assert changes.complete
+        assert changes.version == version
+        assert changes.upserted == ("b",)
+        assert changes.deleted == ("a",)
+
+    def test_only_changes_after_since_are_returned(self) -> None:
+        """Changes recorded before the requested version are not repeated."""
+        log = ChangeLog()
+        since = log.record(CATEGORY, "a")
+        log.record(CATEGORY, "b")
+
+        assert log.changes_since(CATEGORY, since).upserted == ("b",)
+        assert log.changes_since(CATEGORY, log.current_version(CATEGORY)).upserted == ()
+
+    def test_categories_are_independent(self) -> None:
+        """Writes to one category do not show up in another."""
+        log = ChangeLog()
+        other = MODEL_REFERENCE_CATEGORY.text_generation
+        since = log.current_version(other)
+        log.record(CATEGORY, "a")
+
+        changes = log.changes_since(other, since)
+        assert changes.complete
+        assert changes.upserted == ()
+
+    def test_unknown_versions_are_incomplete(self) -> None:
+        """Missing, foreign, malformed or future versions cannot be answered."""
+        log = ChangeLog()
+        log.record(CATEGORY, "a")
+
+        assert not log.changes_since(CATEGORY, None).complete
+        assert not log.changes_since(CATEGORY, ChangeLog().current_version(CATEGORY)).complete
+        assert not log.changes_since(CATEGORY, f"{log.epoch}-x").complete
+        assert not log.changes_since(CATEGORY, f"{log.epoch}-5").complete
+
+    def test_evicted_changes_make_older_versions_incomplete(self) -> None:
+        """Clients further behind than max_entries must fetch the whole category."""
+        log = ChangeLog(max_entries=2)
+        oldest = log.current_version(CATEGORY)
+        first = log.record(CATEGORY, "a")
+        log.record(CATEGORY, "b")
+        log.record(CATEGORY, "c")
+
+        assert not log.changes_since(CATEGORY, oldest).complete
+        assert log.changes_since(CATEGORY, first).upserted == ("b", "c")
+
+    def test_reset_invalidates_earlier_versions(self) -> None:
+        """After a wholesale rewrite, only the version returned by reset is complete."""
+        log = ChangeLog()
+        since = log.record(CATEGORY, "a")
+        version = log.reset(CATEGORY)
+
+        assert not log.changes_since(CATEGORY, since).complete
+        changes = log.changes_since(CATEGORY, version)
+        assert changes.complete
+        assert changes.upserted == ()
@@ -0,0 +1,113 @@
+"""Tests for the model reference file watcher."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from horde_model_reference import file_watcher
+from horde_model_reference.file_watcher import FileWatcher
+
+
+def _touch(path: Path, content: str, offset: float) -> None:
+    path.write_text(content)
+    mtime = time.time() + offset
+    os.utime(path, (mtime, mtime))
+
+
+class TestFileWatcher:
+    """Tests for the polling fallback."""
+
+    def test_polling_reports_changes_to_watched_files_only(self, tmp_path: Path) -> None:
+        """Modifying a watched file calls on_change with its path; other files are ignored."""
+        watched = tmp_path / "watched.json"
+        other = tmp_path / "other.json"
+        watched.write_text("{}")
+        other.write_text("{}")
+        changed: list[Path] = []
+        seen = threading.Event()
+
+        def on_change(path: Path) -> None:
+            changed.append(path)
+            seen.set()
+
+        watcher = FileWatcher([watched], on_change, poll_interval_seconds=0.02, force_polling=True)
+        watcher.start()
+        try:
+            assert not watcher.native
+            _touch(other, '{"a": 1}', 5)
+            _touch(watched, '{"a": 1}', 5)
+            assert seen.wait(timeout=5)
+        finally:
+            watcher.stop()
+
+        assert changed == [watched.resolve()]
+        assert not watcher.running
+
+    def test_polling_reports_created_files(self, tmp_path: Path) -> None:
+        """A watched file that did not exist yet is reported once it is created."""
+        path = tmp_path / "later.json"
+        seen = threading.Event()
+
+        watcher = FileWatcher([path], lambda _: seen.set(), poll_interval_seconds=0.02, force_polling=True)
+        watcher.start()
+        try:
+            path.write_text("{}")
+            assert seen.wait(timeout=5)
+        finally:
+            watcher.stop()
+
+    def test_callback_errors_do_not_stop_the_watcher(self, tmp_path: Path) -> None:
+        """An exception in on_change is logged and watching continues."""
+        path = tmp_path / "watched.json"
+        path.write_text("{}")
+        calls: list[Path] = []
+        second = threading.Event()
+
+        def on_change(changed: Path) -> None:
+            calls.append(changed)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            second.set()
+
+        watcher = FileWatcher([path], on_change, poll_interval_seconds=0.02, force_polling=True)
+        watcher.start()
+        try:
+            _touch(path, '{"a": 1}', 5)
+            deadline = time.monotonic() + 5
+            while not calls and time.monotonic() < deadline:
+                time.sleep(0.01)
+            _touch(path, '{"a": 2}', 10)
+            assert second.wait(timeout=5)
+        finally:
+            watcher.stop()
+
+    def test_native_watch_failure_falls_back_to_polling(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """If native notifications fail, the error is logged and the watcher keeps going by polling."""
+
+        def failing_watch(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            raise OSError("inotify watch limit reached")
+
+        monkeypatch.setattr(file_watcher, "WATCHFILES_AVAILABLE", True)
+        monkeypatch.setitem(sys.modules, "watchfiles", types.SimpleNamespace(watch=failing_watch))
+        path = tmp_path / "watched.json"
+        path.write_text("{}")
+        seen = threading.Event()
+
+        watcher = FileWatcher([path], lambda _: seen.set(), poll_interval_seconds=0.02)
+        assert watcher.native
+        watcher.start()
+        try:
+            _touch(path, '{"a": 1}', 5)
+            assert seen.wait(timeout=5)
+            assert watcher.running
+            assert not watcher.native
+        finally:
+            watcher.stop()
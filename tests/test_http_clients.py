@@ -0,0 +1,111 @@
+"""Tests for the shared, pooled httpx clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from horde_model_reference.http_clients import HTTP2_AVAILABLE, HTTPClientPool, get_http_client_pool
+
+
+class TestHTTPClientPool:
+    """Tests for client reuse, per-loop async clients and closing."""
+
+    def test_sync_client_is_reused(self) -> None:
+        """Every caller gets the same sync client until the pool is closed."""
+        pool = HTTPClientPool()
+        try:
+            assert pool.sync_client is pool.sync_client
+        finally:
+            pool.close()
+
+    def test_sync_client_is_recreated_after_close(self) -> None:
+        """Closing the pool does not break later callers."""
+        pool = HTTPClientPool()
+        first = pool.sync_client
+        pool.close()
+
+        assert first.is_closed
+        second = pool.sync_client
+        assert second is not first
+        assert not second.is_closed
+        pool.close()
+
+    def test_limits_are_applied(self) -> None:
+        """The configured limits are shared by every client."""
+        pool = HTTPClientPool(max_connections=7, max_keepalive_connections=3, keepalive_expiry=5.0)
+        assert pool.limits.max_connections == 7
+        assert pool.limits.max_keepalive_connections == 3
+        assert pool.limits.keepalive_expiry == 5.0
+
+    def test_http2_requires_h2(self) -> None:
+        """HTTP/2 is only negotiated when requested and the h2 package is installed."""
+        assert HTTPClientPool(http2=True).http2 is HTTP2_AVAILABLE
+        assert HTTPClientPool(http2=False).http2 is False
+
+    def test_async_client_is_per_event_loop(self) -> None:
+        """Each event loop gets its own async client, reused within that loop."""
+        pool = HTTPClientPool()
+
+        async def _get_twice() -> tuple[object, object]:
+            first = pool.async_client()
+            second = pool.async_client()
+            await pool.aclose()
+            return first, second
+
+        first_a, second_a = asyncio.run(_get_twice())
+        first_b, _ = asyncio.run(_get_twice())
+
+        assert first_a is second_a
+        assert first_b is not first_a
+
+    def test_close_closes_async_clients_on_a_stopped_loop(self) -> None:
+        """Sync close() runs aclose() on a loop that is not running rather than leaving the client open."""
+        pool = HTTPClientPool()
+        loop = asyncio.new_event_loop()
+        try:
+
+            async def _get() -> httpx.AsyncClient:
+                return pool.async_client()
+
+            client = loop.run_until_complete(_get())
+            pool.close()
+            assert client.is_closed
+        finally:
+            loop.close()
+
+    def test_close_closes_async_clients_on_a_loop_running_elsewhere(self) -> None:
+        """Sync close() schedules aclose() on a loop running in another thread."""
+        pool = HTTPClientPool()
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+
+            async def _get() -> httpx.AsyncClient:
+                return pool.async_client()
+
+            client = asyncio.run_coroutine_threadsafe(_get(), loop).result(timeout=5)
+            pool.close()
+
+            async def _noop() -> None:
+                return None
+
+            asyncio.run_coroutine_threadsafe(_noop(), loop).result(timeout=5)
+            assert client.is_closed
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+
+    def test_async_client_requires_running_loop(self) -> None:
+        """Async clients are bound to a loop, so one cannot be requested outside of it."""
+        with pytest.raises(RuntimeError):
+            HTTPClientPool().async_client()
+
+    def test_default_pool_is_process_wide(self) -> None:
+        """get_http_client_pool returns the same pool on every call."""
+        assert get_http_client_pool() is get_http_client_pool()
@@ -0,0 +1,88 @@
+"""Tests for the fast JSON file helpers."""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from horde_model_reference import json_io
+
+SAMPLE = {
+    "model": {
+        "name": "modèle ☃",
+        "description": "x" * 100,
+        "nested": {"list": [1, 2.5, None, True], "empty": {}, "empty_list": []},
+    },
+}
+
+requires_orjson = pytest.mark.skipif(not json_io.ORJSON_AVAILABLE, reason="orjson is not installed")
+
+
+class TestJsonIO:
+    """Tests for reading and writing reference files."""
+
+    def test_written_output_matches_stdlib_format(self, tmp_path: Path) -> None:
+        """Files are written byte-for-byte as json.dump(indent=2, ensure_ascii=False) would."""
+        path = tmp_path / "category.json"
+        json_io.write_json_file(path, SAMPLE, fsync=True)
+
+        assert path.read_text(encoding="utf-8") == json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+
+    @requires_orjson
+    def test_orjson_path_matches_stdlib_format(self, tmp_path: Path) -> None:
+        """With orjson installed, output stays identical to the standard library's, floats included."""
+        data = {
+            **SAMPLE,
+            "floats": [0.5, 1e-05, 1.5e300, 1e16, 123456789.125, -0.0],
+            "non_finite": [math.nan, math.inf, -math.inf],
+        }
+        path = tmp_path / "category.json"
+        json_io.write_json_file(path, data)
+
+        assert path.read_text(encoding="utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+
+    @requires_orjson
+    def test_orjson_path_reads_non_finite_tokens(self, tmp_path: Path) -> None:
+        """Files holding NaN/Infinity, which the standard library writes, are still read with orjson installed."""
+        content = json.dumps({"value": [math.inf, -math.inf, math.nan], "pad": "x" * json_io.MMAP_MIN_BYTES})
+        path = tmp_path / "non_finite.json"
+        path.write_text(content)
+
+        for parsed in (json_io.read_json_file(path), json_io.parse_json(content)):
+            assert parsed["value"][:2] == [math.inf, -math.inf]
+            assert math.isnan(parsed["value"][2])
+
+    def test_values_orjson_rejects_fall_back_to_stdlib(self) -> None:
+        """Integers wider than 64 bits are still serialized."""
+        data = {"big": 2**70}
+        assert json.loads(json_io.dumps_indented(data)) == data
+
+    def test_large_files_round_trip(self, tmp_path: Path) -> None:
+        """Files past the memory-map threshold are parsed correctly."""
+        data = {f"model_{i}": {"name": f"model_{i}", "description": "é" * 64} for i in range(2000)}
+        path = tmp_path / "large.json"
+        json_io.write_json_file(path, data)
+
+        assert path.stat().st_size >= json_io.MMAP_MIN_BYTES
+        assert json_io.read_json_file(path) == data
+
+    @pytest.mark.parametrize("content", ["", "{not json"])
+    def test_invalid_files_raise_json_decode_error(self, tmp_path: Path, content: str) -> None:
+        """Empty and malformed files raise json.JSONDecodeError, as json.load does."""
+        path = tmp_path / "broken.json"
+        path.write_text(content)
+
+        with pytest.raises(json.JSONDecodeError):
+            json_io.read_json_file(path)
+
+    def test_stdlib_fallback(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without orjson, the same files are read and written with the standard library."""
+        monkeypatch.setattr(json_io, "orjson", None)
+        path = tmp_path / "category.json"
+        json_io.write_json_file(path, SAMPLE)
+
+        assert path.read_text(encoding="utf-8") == json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+        assert json_io.read_json_file(path) == SAMPLE
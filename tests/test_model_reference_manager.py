@@ -7,9 +7,10 @@ import pytest
 from pydantic import ValidationError
 from pytest import LogCaptureFixture
 
-from horde_model_reference import PrefetchStrategy, ReplicateMode
+from horde_model_reference import PrefetchStrategy, ReplicateMode, horde_model_reference_settings
 from horde_model_reference.backends.base import ModelReferenceBackend
 from horde_model_reference.backends.filesystem_backend import FileSystemBackend
+from horde_model_reference.lazy_records import LazyRecordMapping, raw_record_fingerprint
 from horde_model_reference.meta_consts import (
     KNOWN_IMAGE_GENERATION_BASELINE,
     MODEL_DOMAIN,
@@ -359,6 +360,127 @@ class TestCacheAndStaleness:
         assert fetch_called["count"] == 1
 
 
+@pytest.mark.usefixtures("restore_manager_singleton")
+class TestIncrementalReload:
+    """Test that category reloads only re-validate records whose raw JSON changed."""
+
+    @staticmethod
+    def _misc_record(name: str, description: str) -> dict[str, Any]:
+        return {
+            "name": name,
+            "description": description,
+            "model_classification": {"domain": "image", "purpose": "miscellaneous"},
+        }
+
+    def test_reload_reuses_unchanged_instances(self, restore_manager_singleton: None) -> None:
+        """Unchanged records keep their pydantic instance across an invalidation; edited ones are rebuilt."""
+        category = MODEL_REFERENCE_CATEGORY.miscellaneous
+        backend = _InMemoryReplicaBackend()
+        backend._data[category] = {
+            "model_a": self._misc_record("model_a", "first"),
+            "model_b": self._misc_record("model_b", "second"),
+        }
+        manager = ModelReferenceManager(
+            backend=backend,
+            replicate_mode=ReplicateMode.REPLICA,
+            prefetch_strategy=PrefetchStrategy.LAZY,
+        )
+
+        before = manager.get_model_reference(category)
+        record_a = before["model_a"]
+        record_b = before["model_b"]
+
+        backend._data[category] = {
+            "model_a": self._misc_record("model_a", "first"),
+            "model_b": self._misc_record("model_b", "edited"),
+            "model_c": self._misc_record("model_c", "added"),
+        }
+        backend.mark_stale(category)
+
+        after = manager.get_model_reference(category)
+        assert after["model_a"] is record_a
+        assert after["model_b"] is not record_b
+        assert after["model_b"].description == "edited"
+        assert set(after) == {"model_a", "model_b", "model_c"}
+
+    def test_removed_records_are_dropped_on_reload(self, restore_manager_singleton: None) -> None:
+        """Records missing from the new payload are not carried over from the previous generation."""
+        category = MODEL_REFERENCE_CATEGORY.miscellaneous
+        backend = _InMemoryReplicaBackend()
+        backend._data[category] = {
+            "model_a": self._misc_record("model_a", "first"),
+            "model_b": self._misc_record("model_b", "second"),
+        }
+        manager = ModelReferenceManager(
+            backend=backend,
+            replicate_mode=ReplicateMode.REPLICA,
+            prefetch_strategy=PrefetchStrategy.LAZY,
+        )
+        manager.get_model_reference(category)
+
+        backend._data[category] = {"model_a": self._misc_record("model_a", "first")}
+        backend.mark_stale(category)
+
+        assert set(manager.get_model_reference(category)) == {"model_a"}
+
+    @patch("horde_model_reference.model_reference_manager.raw_record_fingerprint", wraps=raw_record_fingerprint)
+    def test_first_load_computes_no_fingerprints(
+        self,
+        fingerprint: MagicMock,
+        restore_manager_singleton: None,
+    ) -> None:
+        """A cold load has nothing to diff against, so no record is fingerprinted until the first reload."""
+        category = MODEL_REFERENCE_CATEGORY.miscellaneous
+        backend = _InMemoryReplicaBackend()
+        backend._data[category] = {"model_a": self._misc_record("model_a", "first")}
+        manager = ModelReferenceManager(
+            backend=backend,
+            replicate_mode=ReplicateMode.REPLICA,
+            prefetch_strategy=PrefetchStrategy.LAZY,
+        )
+
+        manager.get_model_reference(category)
+        fingerprint.assert_not_called()
+
+        backend._data[category] = {"model_a": self._misc_record("model_a", "first")}
+        backend.mark_stale(category)
+        manager.get_model_reference(category)
+        assert fingerprint.call_count == 2
+
+    @patch("horde_model_reference.model_reference_manager.raw_record_fingerprint", wraps=raw_record_fingerprint)
+    def test_lazy_reload_only_fingerprints_validated_records(
+        self,
+        fingerprint: MagicMock,
+        restore_manager_singleton: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """In lazy mode only records the previous generation actually validated are compared on reload."""
+        monkeypatch.setattr(horde_model_reference_settings, "lazy_record_validation", True)
+        monkeypatch.setattr(horde_model_reference_settings, "lazy_record_background_validation", False)
+        category = MODEL_REFERENCE_CATEGORY.miscellaneous
+        backend = _InMemoryReplicaBackend()
+        backend._data[category] = {
+            "model_a": self._misc_record("model_a", "first"),
+            "model_b": self._misc_record("model_b", "second"),
+        }
+        manager = ModelReferenceManager(
+            backend=backend,
+            replicate_mode=ReplicateMode.REPLICA,
+            prefetch_strategy=PrefetchStrategy.LAZY,
+        )
+        record_a = manager.get_model(category, "model_a")
+
+        backend._data[category] = {
+            "model_a": self._misc_record("model_a", "first"),
+            "model_b": self._misc_record("model_b", "second"),
+        }
+        backend.mark_stale(category)
+        after = manager.get_model_reference(category)
+
+        assert fingerprint.call_count == 2
+        assert after["model_a"] is record_a
+
+
 @pytest.mark.usefixtures("restore_manager_singleton")
 class TestTypedModelAccessors:
     """Ensure typed accessors enforce runtime safety."""
@@ -416,6 +538,45 @@ class TestTypedModelAccessors:
         with pytest.raises(RuntimeError, match="image_generation"):
             _ = manager.query(MODEL_REFERENCE_CATEGORY.image_generation)
 
+    def test_query_index_reused_until_invalidation(self) -> None:
+        """The category's query index is built once per cache generation."""
+        manager = self._create_manager_with_image_record()
+        category = MODEL_REFERENCE_CATEGORY.image_generation
+
+        first = manager.query(category)
+        second = manager.query(category).where(nsfw=False)
+        assert first._index is not None
+        assert second._index is first._index
+        assert [model.name for model in second.to_list()] == ["valid_model"]
+
+        manager.backend.mark_stale(category)
+
+        assert manager.query(category)._index is not first._index
+
+    def test_cached_query_page_reuses_results_until_invalidation(self) -> None:
+        """Equal query plans share a cached page within a generation; invalidation drops it."""
+        manager = self._create_manager_with_image_record()
+        category = MODEL_REFERENCE_CATEGORY.image_generation
+
+        page, total = manager.cached_query_page(manager.query(category).where(nsfw=False).limit(5))
+        assert ([model.name for model in page], total) == (["valid_model"], 1)
+        assert len(manager._query_results) == 1
+
+        manager.cached_query_page(manager.query(category).limit(5).where(nsfw=False))
+        assert len(manager._query_results) == 1
+
+        manager.cached_query_page(manager.query(category).filter(lambda record: True))
+        assert len(manager._query_results) == 1
+
+        backend = manager.backend
+        assert isinstance(backend, _InMemoryReplicaBackend)
+        backend._data[category] = {}
+        backend.mark_stale(category)
+
+        assert manager._query_results == {}
+        page, total = manager.cached_query_page(manager.query(category).where(nsfw=False).limit(5))
+        assert (page, total) == ([], 0)
+
     def test_deferred_prefetch_strategy_exposes_handle(self) -> None:
         """Ensure PrefetchStrategy.DEFERRED avoids blocking init but provides a handle."""
         backend = _InMemoryReplicaBackend()
@@ -687,6 +848,136 @@ class TestModelReferenceConversion:
 
         assert non_safe_mode_result is None, "Expected None result for invalid input in non-safe mode"
 
+    def test_file_json_dict_to_lazy_model_reference_defers_validation(
+        self,
+        model_reference_manager: ModelReferenceManager,
+    ) -> None:
+        """Lazy conversion validates records on first access only and memoizes the result."""
+        category = MODEL_REFERENCE_CATEGORY.miscellaneous
+        file_json_dict = {
+            "test_model": {
+                "name": "test_model",
+                "model_classification": {"domain": "image", "purpose": "miscellaneous"},
+            },
+            "invalid_model": {
+                "description": "An invalid model without a name or classification",
+            },
+        }
+        result = model_reference_manager._file_json_dict_to_lazy_model_reference(category, file_json_dict)
+        assert isinstance(result, LazyRecordMapping)
+        assert len(result) == 2
+        assert result.validated_count == 0
+
+        record = result["test_model"]
+        assert isinstance(record, GenericModelRecord)
+        assert result["test_model"] is record
+        assert result.validated_count == 1
+
+        with pytest.raises(ValidationError):
+            result["invalid_model"]
+
+    def test_lazy_record_validation_setting_used_on_load(
+        self,
+        restore_manager_singleton: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """With lazy_record_validation enabled, loaded categories are cached as lazy mappings."""
+        monkeypatch.setattr(horde_model_reference_settings, "lazy_record_validation", True)
+        backend = _InMemoryReplicaBackend()
+        backend._data[MODEL_REFERENCE_CATEGORY.miscellaneous] = {
+            "test_model": {
+                "name": "test_model",
+                "model_classification": {"domain": "image", "purpose": "miscellaneous"},
+            },
+        }
+        manager = ModelReferenceManager(
+            backend=backend,
+            replicate_mode=ReplicateMode.REPLICA,
+            prefetch_strategy=PrefetchStrategy.LAZY,
+        )
+
+        reference = manager.get_model_reference_view_or_none(MODEL_REFERENCE_CATEGORY.miscellaneous)
+        assert isinstance(reference, LazyRecordMapping)
+        assert reference.validated_count == 0
+        assert manager.get_model(MODEL_REFERENCE_CATEGORY.miscellaneous, "test_model").name == "test_model"
+        assert reference.validated_count == 1
+
+        materialized = manager.get_model_reference(MODEL_REFERENCE_CATEGORY.miscellaneous)
+        assert type(materialized) is dict
+        assert materialized["test_model"] is reference["test_model"]
+        assert manager.get_model_reference_view_or_none(MODEL_REFERENCE_CATEGORY.miscellaneous) is materialized
+
+    def test_lazy_invalid_record_is_handled_like_an_eager_load(
+        self,
+        restore_manager_singleton: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """An invalid record is None from get_model_or_none, and fails the category once materialized as a dict."""
+        monkeypatch.setattr(horde_model_reference_settings, "lazy_record_validation", True)
+        category = MODEL_REFERENCE_CATEGORY.miscellaneous
+        backend = _InMemoryReplicaBackend()
+        backend._data[category] = {
+            "valid_model": {"name": "valid_model"},
+            "invalid_model": {"name": "invalid_model", "size_on_disk_bytes": "not a number"},
+        }
+        manager = ModelReferenceManager(
+            backend=backend,
+            replicate_mode=ReplicateMode.REPLICA,
+            prefetch_strategy=PrefetchStrategy.LAZY,
+        )
+
+        assert manager.get_models(category, ["valid_model", "invalid_model"]) == {
+            "valid_model": manager.get_model(category, "valid_model"),
+            "invalid_model": None,
+        }
+        with pytest.raises(ValidationError):
+            manager.get_model(category, "invalid_model")
+        assert manager.get_model_reference_or_none(category) is None
+
+    def test_lazy_record_validation_honours_safe_mode(
+        self,
+        restore_manager_singleton: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """safe_mode=True validates a lazy category up front, so an invalid record raises at load time."""
+        monkeypatch.setattr(horde_model_reference_settings, "lazy_record_validation", True)
+        backend = _InMemoryReplicaBackend()
+        backend._data[MODEL_REFERENCE_CATEGORY.miscellaneous] = {
+            "test_model": {"name": "test_model", "size_on_disk_bytes": "not a number"},
+        }
+        manager = ModelReferenceManager(
+            backend=backend,
+            replicate_mode=ReplicateMode.REPLICA,
+            prefetch_strategy=PrefetchStrategy.LAZY,
+        )
+
+        with pytest.raises(ValueError, match="failed validation"):
+            manager.get_all_model_references_or_none(safe_mode=True)
+
+    def test_get_models_batch(self, restore_manager_singleton: None) -> None:
+        """get_models maps every requested name to its record, or None when missing, in request order."""
+        backend = _InMemoryReplicaBackend()
+        raw_records = {
+            name: {"name": name, "model_classification": {"domain": "image", "purpose": "miscellaneous"}}
+            for name in ("model_a", "model_b")
+        }
+        backend._data[MODEL_REFERENCE_CATEGORY.miscellaneous] = raw_records
+        manager = ModelReferenceManager(
+            backend=backend,
+            replicate_mode=ReplicateMode.REPLICA,
+            prefetch_strategy=PrefetchStrategy.LAZY,
+        )
+
+        models = manager.get_models(MODEL_REFERENCE_CATEGORY.miscellaneous, ["model_b", "missing", "model_a"])
+
+        assert list(models) == ["model_b", "missing", "model_a"]
+        assert models["missing"] is None
+        assert models["model_a"] is not None and models["model_a"].name == "model_a"
+        assert manager.get_raw_models_json(MODEL_REFERENCE_CATEGORY.miscellaneous, ["model_a", "missing"]) == {
+            "model_a": raw_records["model_a"],
+            "missing": None,
+        }
+
     def test_model_reference_to_json_dict(self, model_reference_manager: ModelReferenceManager) -> None:
         """Test conversion from model reference to dict (for JSON serialization)."""
         category = MODEL_REFERENCE_CATEGORY.miscellaneous
@@ -0,0 +1,73 @@
+"""Tests for the tiered model-name resolver."""
+
+from __future__ import annotations
+
+import pytest
+
+from horde_model_reference.name_resolution import NameMatch, NameResolver
+
+TEXT_NAMES = [
+    "ReadyArt/Broken-Tutu-24B",
+    "koboldcpp/Broken-Tutu-24B",
+    "aphrodite/ReadyArt/Broken-Tutu-24B",
+    "org/Llama-3-8B-Instruct",
+    "org/Llama-3-8B-Instruct-Q4_K_M",
+    "Mistral-7B-v0.1",
+]
+
+
+@pytest.fixture()
+def text_resolver() -> NameResolver:
+    """Return a resolver over text names including backend-prefixed duplicates and a quantized variant."""
+    return NameResolver(TEXT_NAMES, text_names=True)
+
+
+class TestNameResolver:
+    """Tests for the match tiers and their ordering."""
+
+    def test_exact_match_ranks_first(self, text_resolver: NameResolver) -> None:
+        """An exact name is returned first, followed by its backend-prefixed duplicates."""
+        matches = text_resolver.resolve("ReadyArt/Broken-Tutu-24B", max_results=3)
+        assert matches[0] == NameMatch("ReadyArt/Broken-Tutu-24B", "exact", 1.0)
+        assert {m.name for m in matches[1:]} == {"koboldcpp/Broken-Tutu-24B", "aphrodite/ReadyArt/Broken-Tutu-24B"}
+        assert all(m.match_type == "normalized" for m in matches[1:])
+
+    def test_case_insensitive(self, text_resolver: NameResolver) -> None:
+        """Wrong case resolves through the lowercase table."""
+        match = text_resolver.resolve("readyart/broken-tutu-24b", max_results=1)
+        assert match == [NameMatch("ReadyArt/Broken-Tutu-24B", "case_insensitive", 1.0)]
+
+    def test_backend_prefix_and_separators_are_ignored(self, text_resolver: NameResolver) -> None:
+        """Separators and missing author segments normalize to the canonical (unprefixed) name first."""
+        matches = text_resolver.resolve("broken tutu 24b", max_results=1)
+        assert matches == [NameMatch("ReadyArt/Broken-Tutu-24B", "normalized", 1.0)]
+
+    def test_quant_suffix_is_stripped_for_text_names(self, text_resolver: NameResolver) -> None:
+        """An unknown quantization resolves to the base model and its known quantized variants."""
+        matches = text_resolver.resolve("Llama-3-8B-Instruct-Q5_K_M")
+        assert [(m.name, m.match_type) for m in matches] == [
+            ("org/Llama-3-8B-Instruct", "quant_stripped"),
+            ("org/Llama-3-8B-Instruct-Q4_K_M", "quant_stripped"),
+        ]
+
+    def test_quant_stripping_is_text_only(self) -> None:
+        """Non-text resolvers never strip quantization-looking suffixes."""
+        resolver = NameResolver(["Llama-3-8B-Instruct"])
+        assert all(m.match_type != "quant_stripped" for m in resolver.resolve("Llama-3-8B-Instruct-Q5_K_M"))
+
+    def test_fuzzy_match_reports_similarity(self, text_resolver: NameResolver) -> None:
+        """Typos fall back to trigram similarity, scored below 1.0."""
+        matches = text_resolver.resolve("Mistrall-7B-v0.1", max_results=1)
+        assert len(matches) == 1
+        assert matches[0].name == "Mistral-7B-v0.1"
+        assert matches[0].match_type == "fuzzy"
+        assert 0 < matches[0].score < 1
+
+    def test_unrelated_name_has_no_matches(self, text_resolver: NameResolver) -> None:
+        """Names sharing too few trigrams with every model return nothing."""
+        assert text_resolver.resolve("zzz") == []
+
+    def test_max_results_must_be_positive(self, text_resolver: NameResolver) -> None:
+        """max_results below 1 is rejected."""
+        with pytest.raises(ValueError, match="max_results"):
+            text_resolver.resolve("Mistral", max_results=0)
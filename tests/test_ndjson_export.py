@@ -0,0 +1,103 @@
+"""Tests for the streaming NDJSON export writer and reader."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from horde_model_reference.http_clients import HTTPClientPool
+from horde_model_reference.meta_consts import MODEL_REFERENCE_CATEGORY
+from horde_model_reference.model_reference_records import ImageGenerationModelRecord
+from horde_model_reference.ndjson_export import (
+    iter_export_chunks,
+    iter_export_lines,
+    iter_export_records,
+    parse_export_line,
+    stream_export_records,
+)
+
+MISC = MODEL_REFERENCE_CATEGORY.miscellaneous
+IMAGE = MODEL_REFERENCE_CATEGORY.image_generation
+
+
+def _misc_record(name: str) -> dict[str, Any]:
+    return {
+        "name": name,
+        "record_type": MISC.value,
+        "model_classification": {"domain": "image", "purpose": "miscellaneous"},
+    }
+
+
+def _image_record(name: str) -> dict[str, Any]:
+    return {
+        "name": name,
+        "record_type": IMAGE.value,
+        "model_classification": {"domain": "image", "purpose": "generation"},
+        "baseline": "stable_diffusion_1",
+        "nsfw": False,
+    }
+
+
+class TestNDJSONExport:
+    """Tests for encoding and decoding export lines."""
+
+    def test_one_line_per_record(self) -> None:
+        """Every record becomes one JSON object line tagged with its category and name."""
+        lines = list(iter_export_lines([(MISC, {"a": _misc_record("a"), "b": _misc_record("b")}), (IMAGE, None)]))
+
+        assert len(lines) == 2
+        assert all(line.endswith(b"\n") and line.count(b"\n") == 1 for line in lines)
+        assert json.loads(lines[0]) == {"category": MISC.value, "name": "a", "record": _misc_record("a")}
+
+    def test_chunks_join_whole_lines(self) -> None:
+        """Chunks hold complete lines and together equal the line stream."""
+        categories = [(MISC, {f"m{index}": _misc_record(f"m{index}") for index in range(50)})]
+        chunks = list(iter_export_chunks(categories, chunk_bytes=512))
+
+        assert len(chunks) > 1
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+        assert b"".join(chunks) == b"".join(iter_export_lines(categories))
+
+    def test_records_are_validated_per_category(self) -> None:
+        """Lines are read back into the category's record type; blank lines are skipped."""
+        lines = [*iter_export_lines([(IMAGE, {"img": _image_record("img")}), (MISC, {"m": _misc_record("m")})]), b""]
+        records = list(iter_export_records(lines))
+
+        assert [(exported.category, exported.name) for exported in records] == [(IMAGE, "img"), (MISC, "m")]
+        assert isinstance(records[0].record, ImageGenerationModelRecord)
+
+    def test_unknown_category_is_kept_as_string(self) -> None:
+        """A category this library does not know yet still yields a generic record."""
+        line = json.dumps({"category": "future_category", "name": "x", "record": _misc_record("x")})
+        exported = parse_export_line(line)
+
+        assert exported is not None
+        assert exported.category == "future_category"
+        assert exported.record.name == "x"
+
+    def test_stream_export_records(self, httpx_mock: HTTPXMock) -> None:
+        """Records are streamed from the PRIMARY export endpoint, filtered by category."""
+        body = b"".join(iter_export_lines([(MISC, {"m": _misc_record("m")})]))
+        httpx_mock.add_response(
+            url="https://primary/api/model_references/v2/export.ndjson?category=miscellaneous",
+            content=body,
+        )
+
+        pool = HTTPClientPool()
+        try:
+            records = list(stream_export_records("https://primary/api/", categories=[MISC], http_clients=pool))
+        finally:
+            pool.close()
+
+        assert [exported.name for exported in records] == ["m"]
+
+    def test_stream_export_requires_url(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without a URL argument or setting there is nothing to stream from."""
+        from horde_model_reference import horde_model_reference_settings
+
+        monkeypatch.setattr(horde_model_reference_settings, "primary_api_url", None)
+        with pytest.raises(ValueError, match="PRIMARY API URL"):
+            next(stream_export_records())
@@ -21,18 +21,22 @@ from horde_model_reference.model_reference_records import (
 )
 from horde_model_reference.query import (
     ImageGenerationQuery,
+    ModelQuery,
     TextModelQuery,
+    _field_accessor,
     build_cross_category_query,
     build_image_query,
     build_query,
     build_text_query,
 )
 from horde_model_reference.query_fields import (
+    FieldRef,
     ImageFields,
     TextFields,
     false,
     true,
 )
+from horde_model_reference.query_index import RecordIndex
 
 
 def _img_cls() -> ModelClassification:
@@ -301,6 +305,13 @@ class TestFilter:
         assert len(results) == 1
         assert results[0].name == "ModelA"
 
+    def test_name_contains_and_startswith(self, image_models: dict[str, ImageGenerationModelRecord]) -> None:
+        """name_contains() and name_startswith() match case-insensitively."""
+        q = build_query(image_models, ImageGenerationModelRecord)
+        assert [r.name for r in q.name_contains("DELa").to_list()] == ["ModelA"]
+        assert q.name_startswith("model").count() == len(image_models)
+        assert q.name_startswith("odel").count() == 0
+
 
 class TestOrdering:
     """Tests for order_by."""
@@ -394,6 +405,44 @@ class TestPagination:
         results = q.limit(100).to_list()
         assert len(results) == 4
 
+    def test_top_k_page_matches_full_sort(self, image_models: dict[str, ImageGenerationModelRecord]) -> None:
+        """A small sorted page (heap selection) equals slicing the fully sorted results, None-last included."""
+        q = build_query(image_models, ImageGenerationModelRecord)
+        for descending in (False, True):
+            ordered = q.order_by("size_on_disk_bytes", descending=descending)
+            full = ordered.to_list()
+            for offset in range(len(full) + 1):
+                assert ordered.offset(offset).limit(2).to_list() == full[offset : offset + 2]
+
+    def test_to_list_with_total(self, text_models: dict[str, TextGenerationModelRecord]) -> None:
+        """The total ignores offset/limit while the page honours them."""
+        q = build_query(text_models, TextGenerationModelRecord).where(tags__contains="instruct")
+        page, total = q.order_by("parameters_count", descending=True).offset(1).limit(1).to_list_with_total()
+        assert total == 3
+        assert [m.name for m in page] == ["MediumModel"]
+
+        unsorted_page, unsorted_total = q.offset(2).limit(5).to_list_with_total()
+        assert unsorted_total == 3
+        assert unsorted_page == q.to_list()[2:]
+
+    def test_unsorted_limit_stops_early(self, text_models: dict[str, TextGenerationModelRecord]) -> None:
+        """Without a sort or a requested total, evaluation stops once the page is full."""
+        seen: list[str] = []
+
+        def _spy(record: TextGenerationModelRecord) -> bool:
+            seen.append(record.name)
+            return True
+
+        results = build_query(text_models, TextGenerationModelRecord).filter(_spy).limit(2).to_list()
+        assert len(results) == 2
+        assert len(seen) == 2
+
+    def test_count_respects_pagination(self, text_models: dict[str, TextGenerationModelRecord]) -> None:
+        """count() reflects offset/limit, matching len(to_list())."""
+        q = build_query(text_models, TextGenerationModelRecord)
+        assert q.offset(1).limit(2).count() == 2
+        assert q.offset(3).count() == 1
+
 
 class TestTerminals:
     """Tests for terminal operations (first, count, distinct, group_by)."""
@@ -446,6 +495,27 @@ class TestTerminals:
         by_str = {k: len(v) for k, v in q.group_by("nsfw").items()}
         assert by_ref == by_str
 
+    def test_histogram(self, text_models: dict[str, TextGenerationModelRecord]) -> None:
+        """histogram() counts values per [left, right) bin, closing the last bin and skipping out-of-range."""
+        q = build_query(text_models, TextGenerationModelRecord)
+        edges = [0, 7_000_000_000, 13_000_000_000]
+        # 3B -> bin 0; 7B (left edge) and 13B (closed last edge) -> bin 1; 70B is out of range.
+        assert q.histogram(TextFields.parameters_count, edges) == [1, 2]
+
+    def test_histogram_rejects_bad_edges(self, text_models: dict[str, TextGenerationModelRecord]) -> None:
+        """histogram() needs at least two strictly increasing numeric edges."""
+        q = build_query(text_models, TextGenerationModelRecord)
+        with pytest.raises(ValueError, match="at least two"):
+            q.histogram("parameters_count", [1])
+        with pytest.raises(ValueError, match="strictly increasing"):
+            q.histogram("parameters_count", [5, 5])
+
+    def test_histogram_rejects_non_numeric_field(self, image_models: dict[str, ImageGenerationModelRecord]) -> None:
+        """histogram() of a non-numeric field raises instead of guessing an ordering."""
+        q = build_query(image_models, ImageGenerationModelRecord)
+        with pytest.raises(ValueError, match="not numeric"):
+            q.histogram("name", [0, 1])
+
 
 class TestWhereClassification:
     """Tests for classification-based filtering."""
@@ -510,6 +580,54 @@ class TestNestedFields:
         with pytest.raises(ValueError, match=r"missing attribute|missing key|missing segment"):
             q.where(metadata__nonexistent_field="value").to_list()
 
+    def test_field_accessor_compiled_once_per_record_type(self) -> None:
+        """Accessors are cached per ``(record_type, field_path)`` and keep the missing-segment errors."""
+        accessor = _field_accessor(ImageGenerationModelRecord, "metadata__schema_version")
+        assert _field_accessor(ImageGenerationModelRecord, "metadata__schema_version") is accessor
+        assert _field_accessor(TextGenerationModelRecord, "metadata__schema_version") is not accessor
+
+        record = _make_image_model("ModelA")
+        assert accessor(record) == record.metadata.schema_version
+        assert _field_accessor(ImageGenerationModelRecord, "name")(record) == "ModelA"
+        with pytest.raises(ValueError, match="encountered None"):
+            _field_accessor(ImageGenerationModelRecord, "style__value")(_make_image_model("NoStyle", style=None))
+
+
+class TestPlanSignature:
+    """Tests for the canonical, hashable query plan signature."""
+
+    def test_equal_plans_share_signature(self, image_models: dict[str, ImageGenerationModelRecord]) -> None:
+        """Predicate order does not matter; filters, sort and page all do."""
+        q = build_image_query(image_models)
+        first = q.where(nsfw=False).tags_any(["anime"]).order_by("name").limit(5)
+        second = q.tags_any(["anime"]).where(ImageFields.name != "x").order_by("name").limit(5)
+        same = q.tags_any(["anime"]).where(nsfw=False).order_by("name").limit(5)
+
+        assert first.plan_signature() is not None
+        assert hash(first.plan_signature()) == hash(same.plan_signature())
+        assert first.plan_signature() == same.plan_signature()
+        assert first.plan_signature() != second.plan_signature()
+        assert first.plan_signature() != same.offset(5).plan_signature()
+        flipped = q.where(nsfw=True).tags_any(["anime"]).order_by("name").limit(5)
+        assert first.plan_signature() != flipped.plan_signature()
+
+    def test_dsl_operators_are_distinguished(self) -> None:
+        """Different operations on the same field and operand never collide."""
+        q = ImageGenerationQuery([], ImageGenerationModelRecord)
+        dsl_contains = q.where(ImageFields.name.contains("a")).plan_signature()
+        keyword_contains = q.where(name__contains="a").plan_signature()
+        assert dsl_contains is not None
+        assert keyword_contains is not None
+        assert dsl_contains != keyword_contains
+        assert (ImageFields.nsfw == true()).signature != ImageFields.nsfw.is_true().signature
+        assert ((ImageFields.nsfw == true()) & ImageFields.style.is_none()).signature is not None
+
+    def test_opaque_callables_have_no_signature(self, image_models: dict[str, ImageGenerationModelRecord]) -> None:
+        """Queries using plain callables cannot be described and so are never cached."""
+        q = build_image_query(image_models)
+        assert q.filter(lambda r: r.nsfw).plan_signature() is None
+        assert q.where_source("horde").plan_signature() is None
+
 
 class TestImmutability:
     """Tests that query chaining does not mutate previous instances."""
@@ -614,6 +732,64 @@ class TestCrossCategory:
         assert len(results) == 1
         assert results[0].name == "ImgModel"
 
+    @staticmethod
+    def _mixed_refs() -> dict[MODEL_REFERENCE_CATEGORY, dict[str, GenericModelRecord]]:
+        images = [
+            _make_image_model("Beta", nsfw=True, tags=["anime"]),
+            _make_image_model("Delta", tags=["realistic"]),
+            _make_image_model("Shared", tags=["anime"]),
+        ]
+        texts = [
+            _make_text_model("Alpha", tags=["anime"]),
+            _make_text_model("Gamma", nsfw=True),
+            _make_text_model("Shared", tags=["chat"]),
+        ]
+        return {
+            MODEL_REFERENCE_CATEGORY.image_generation: {m.name: m for m in images},
+            MODEL_REFERENCE_CATEGORY.text_generation: {m.name: m for m in texts},
+        }
+
+    def test_cross_category_matches_concatenated_scan(self) -> None:
+        """Sorted, paginated and filtered results equal a plain query over the concatenated records."""
+        refs = self._mixed_refs()
+        indexes = {category: RecordIndex(list(records.values())) for category, records in refs.items()}
+        streamed = build_cross_category_query(refs, indexes=indexes)
+        concatenated = ModelQuery(
+            [record for records in refs.values() for record in records.values()],
+            GenericModelRecord,
+        )
+
+        for descending in (False, True):
+            for offset in range(4):
+                expected = concatenated.order_by("name", descending=descending).offset(offset).limit(2)
+                actual = streamed.order_by("name", descending=descending).offset(offset).limit(2)
+                assert actual.to_list_with_total() == expected.to_list_with_total()
+
+        tagged = FieldRef("tags").contains_any(["anime"])
+        assert streamed.where(tagged).to_list() == concatenated.where(tagged).to_list()
+        sfw = FieldRef("nsfw") == false()
+        assert streamed.where(sfw).order_by("name").to_list() == concatenated.where(sfw).order_by("name").to_list()
+
+    def test_cross_category_first_category_wins_duplicates(self) -> None:
+        """A name present in several categories is returned once, from the earliest category."""
+        results = build_cross_category_query(self._mixed_refs()).order_by("name").to_list()
+        shared = [record for record in results if record.name == "Shared"]
+        assert len(shared) == 1
+        assert isinstance(shared[0], ImageGenerationModelRecord)
+        assert [record.name for record in results] == ["Alpha", "Beta", "Delta", "Gamma", "Shared"]
+
+    def test_cross_category_unsorted_page_stops_early(self) -> None:
+        """Later categories are not evaluated once an unsorted page is full."""
+        seen: list[str] = []
+
+        def _spy(record: GenericModelRecord) -> bool:
+            seen.append(record.name)
+            return True
+
+        page = build_cross_category_query(self._mixed_refs()).filter(_spy).limit(2).to_list()
+        assert [record.name for record in page] == ["Beta", "Delta"]
+        assert seen == ["Beta", "Delta"]
+
 
 class TestComplexQueries:
     """Tests that replicate aspirational user story patterns."""
@@ -0,0 +1,285 @@
+"""Tests for the secondary query indexes and the planner that consults them."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from horde_model_reference.meta_consts import KNOWN_IMAGE_GENERATION_BASELINE, TEXT_BACKENDS
+from horde_model_reference.model_reference_records import ImageGenerationModelRecord, TextGenerationModelRecord
+from horde_model_reference.query import ImageGenerationQuery, TextModelQuery
+from horde_model_reference.query_fields import FieldRef, ImageFields, Predicate, TextFields, false, true
+from horde_model_reference.query_index import RecordIndex, plan_predicates
+
+from .test_query import _make_image_model, _make_text_model
+
+
+@pytest.fixture()
+def image_records() -> list[ImageGenerationModelRecord]:
+    """Return image records covering every indexed field."""
+    return [
+        _make_image_model("ModelA", nsfw=False, tags=["realistic", "generalist"], style="realistic"),
+        _make_image_model("ModelB", nsfw=True, tags=["anime", "character"], style="anime"),
+        _make_image_model(
+            "ModelC",
+            baseline=KNOWN_IMAGE_GENERATION_BASELINE.stable_diffusion_1,
+            tags=["realistic"],
+        ),
+        _make_image_model("ModelD", tags=["anime", "generalist"], inpainting=True),
+        _make_image_model("ModelE", tags=[]),
+    ]
+
+
+@pytest.fixture()
+def text_records() -> list[TextGenerationModelRecord]:
+    """Return text records with backend prefixes, quantized variants and varied sizes."""
+    return [
+        _make_text_model("org/Llama-3-8B-Instruct", parameters=8_000_000_000, tags=["instruct"]),
+        _make_text_model("org/Llama-3-8B-Instruct-Q4_K_M", parameters=8_000_000_000),
+        _make_text_model("org/Mistral-7B-v0.1", parameters=7_000_000_000, nsfw=True),
+        _make_text_model("koboldcpp/org/Llama-3-8B-Instruct", parameters=8_000_000_000),
+        _make_text_model("aphrodite/org/Llama-3-70B", parameters=70_000_000_000),
+        _make_text_model("org/Tiny-1B", parameters=1_000_000_000, tags=["chat"]),
+    ]
+
+
+def _image_pair(
+    records: list[ImageGenerationModelRecord],
+) -> tuple[ImageGenerationQuery, ImageGenerationQuery]:
+    index = RecordIndex(records)
+    return (
+        ImageGenerationQuery(records, ImageGenerationModelRecord),
+        ImageGenerationQuery(index.records, ImageGenerationModelRecord, index=index),
+    )
+
+
+def _text_pair(records: list[TextGenerationModelRecord]) -> tuple[TextModelQuery, TextModelQuery]:
+    index = RecordIndex(records)
+    return (
+        TextModelQuery(records, TextGenerationModelRecord),
+        TextModelQuery(index.records, TextGenerationModelRecord, index=index),
+    )
+
+
+IMAGE_QUERIES: list[Callable[[ImageGenerationQuery], ImageGenerationQuery]] = [
+    lambda q: q.where(nsfw=False),
+    lambda q: q.where(baseline=KNOWN_IMAGE_GENERATION_BASELINE.stable_diffusion_xl, nsfw=False),
+    lambda q: q.where(baseline__in=["stable_diffusion_1", "flux_1"]),
+    lambda q: q.where(baseline__ne="stable_diffusion_1"),
+    lambda q: q.where(tags__contains="anime"),
+    lambda q: q.where(ImageFields.nsfw == false()),
+    lambda q: q.where(ImageFields.nsfw != true()),
+    lambda q: q.where(ImageFields.style.is_in(["anime", "realistic"])),
+    lambda q: q.where(ImageFields.style.is_none()),
+    lambda q: q.where((ImageFields.nsfw == true()) | (ImageFields.inpainting == true())),
+    lambda q: q.where(~(ImageFields.baseline == "stable_diffusion_xl")),
+    lambda q: q.where((ImageFields.nsfw == false()) & ImageFields.name.contains("Model")),
+    lambda q: q.tags_any(["anime", "missing"]),
+    lambda q: q.tags_all(["realistic", "generalist"]),
+    lambda q: q.tags_all([]),
+    lambda q: q.tags_none(["anime"]),
+    lambda q: q.for_baseline("stable_diffusion_1"),
+    lambda q: q.only_nsfw(),
+    lambda q: q.exclude_nsfw().exclude_inpainting(),
+    lambda q: q.only_inpainting(),
+    lambda q: q.filter(lambda r: r.name.endswith("A")).where(nsfw=False),
+    lambda q: q.name_contains("ODEL"),
+    lambda q: q.name_contains("la"),
+    lambda q: q.name_contains(""),
+    lambda q: q.name_contains("xyz").exclude_nsfw(),
+    lambda q: q.name_startswith("MODELB"),
+    lambda q: q.name_startswith("mod").where(nsfw=False),
+    lambda q: q.name_startswith("zz"),
+    lambda q: q.where(ImageFields.name.icontains("odelc") | ImageFields.name.istartswith("modele")),
+]
+
+TEXT_QUERIES: list[Callable[[TextModelQuery], TextModelQuery]] = [
+    lambda q: q.for_backend(TEXT_BACKENDS.koboldcpp),
+    lambda q: q.exclude_backend_variations(),
+    lambda q: q.only_quantized(),
+    lambda q: q.exclude_quantized().exclude_backend_variations(),
+    lambda q: q.where(parameters_count__gt=7_000_000_000),
+    lambda q: q.where(parameters_count__lte=7_000_000_000),
+    lambda q: q.where(TextFields.parameters_count >= 8_000_000_000),
+    lambda q: q.where(TextFields.parameters_count < 0),
+    lambda q: q.where(TextFields.nsfw == true()).tags_any(["chat"]),
+]
+
+
+class TestIndexedQueryEquivalence:
+    """Indexed queries must return exactly what the unindexed scan returns."""
+
+    @pytest.mark.parametrize("build", IMAGE_QUERIES)
+    def test_image_queries_match_scan(
+        self,
+        image_records: list[ImageGenerationModelRecord],
+        build: Callable[[ImageGenerationQuery], ImageGenerationQuery],
+    ) -> None:
+        """Every index-able image filter agrees with the closure-only evaluation."""
+        plain, indexed = _image_pair(image_records)
+        assert [r.name for r in build(indexed).to_list()] == [r.name for r in build(plain).to_list()]
+
+    @pytest.mark.parametrize("build", TEXT_QUERIES)
+    def test_text_queries_match_scan(
+        self,
+        text_records: list[TextGenerationModelRecord],
+        build: Callable[[TextModelQuery], TextModelQuery],
+    ) -> None:
+        """Every index-able text filter agrees with the closure-only evaluation."""
+        plain, indexed = _text_pair(text_records)
+        assert [r.name for r in build(indexed).to_list()] == [r.name for r in build(plain).to_list()]
+
+    def test_index_survives_fluent_chain(self, image_records: list[ImageGenerationModelRecord]) -> None:
+        """Cloned queries keep the index so later filters are still planned."""
+        _, indexed = _image_pair(image_records)
+        chained = indexed.where(nsfw=False).order_by("name", descending=True).limit(2)
+        assert chained._index is indexed._index
+        assert [r.name for r in chained.to_list()] == ["ModelE", "ModelD"]
+
+    def test_index_length_mismatch_rejected(self, image_records: list[ImageGenerationModelRecord]) -> None:
+        """An index built over different records cannot be attached to a query."""
+        index = RecordIndex(image_records[:2])
+        with pytest.raises(ValueError, match="index length"):
+            ImageGenerationQuery(image_records, ImageGenerationModelRecord, index=index)
+
+
+class TestPlanner:
+    """Tests for how predicates are split between the index and residual evaluation."""
+
+    def test_exact_predicates_are_not_re_evaluated(self, image_records: list[ImageGenerationModelRecord]) -> None:
+        """Exactly-answered predicates are dropped from the residual list."""
+        index = RecordIndex(image_records)
+        calls: list[Any] = []
+
+        def _spy(record: Any) -> bool:  # noqa: ANN401
+            calls.append(record)
+            return record.nsfw is False
+
+        predicate = Predicate(_spy, (ImageFields.nsfw == false()).index_hint)
+        positions, residual = plan_predicates(index, [predicate])
+
+        assert residual == []
+        assert positions == [0, 2, 3, 4]
+        assert calls == []
+
+    def test_unhinted_predicates_stay_residual(self, image_records: list[ImageGenerationModelRecord]) -> None:
+        """Plain callables and non-indexed fields fall back to per-record evaluation."""
+        index = RecordIndex(image_records)
+        name_pred = ImageFields.name == "ModelA"
+
+        def plain(record: Any) -> bool:  # noqa: ANN401
+            return True
+
+        positions, residual = plan_predicates(index, [plain, name_pred])
+
+        assert positions is None
+        assert residual == [plain, name_pred]
+
+    def test_name_text_predicates_are_exact(self) -> None:
+        """Trigram candidates are confirmed against the lowercase names, so shared trigrams do not leak."""
+        records = [_make_image_model("abc-bcd"), _make_image_model("xABCDx"), _make_image_model("abcd")]
+        index = RecordIndex(records)
+
+        positions, residual = plan_predicates(index, [ImageFields.name.icontains("ABCD")])
+        assert residual == []
+        assert positions == [1, 2]
+
+        positions, residual = plan_predicates(index, [ImageFields.name.istartswith("abc")])
+        assert residual == []
+        assert positions == [0, 2]
+
+    def test_range_predicates_narrow_but_remain_residual(self, text_records: list[TextGenerationModelRecord]) -> None:
+        """Bucketed range hints produce a superset and keep the predicate for exact filtering."""
+        index = RecordIndex(text_records)
+        predicate = TextFields.parameters_count > 10_000_000_000
+        positions, residual = plan_predicates(index, [predicate])
+
+        assert residual == [predicate]
+        assert positions is not None
+        assert 4 in positions
+        assert 5 not in positions
+
+
+def _columnar_text_pair(records: list[TextGenerationModelRecord]) -> tuple[TextModelQuery, TextModelQuery]:
+    index = RecordIndex(records, columnar=True)
+    return (
+        TextModelQuery(records, TextGenerationModelRecord),
+        TextModelQuery(index.records, TextGenerationModelRecord, index=index),
+    )
+
+
+@pytest.fixture()
+def sized_text_records(text_records: list[TextGenerationModelRecord]) -> list[TextGenerationModelRecord]:
+    """Return the text records with duplicate, missing and float-comparable ``size_on_disk_bytes`` values."""
+    sizes = [4_000_000_000, None, 4_000_000_000, 2_500_000_000, None, 1_000_000_000]
+    return [
+        record.model_copy(update={"size_on_disk_bytes": size})
+        for record, size in zip(text_records, sizes, strict=True)
+    ]
+
+
+COLUMNAR_QUERIES: list[Callable[[TextModelQuery], TextModelQuery]] = [
+    *TEXT_QUERIES,
+    lambda q: q.where(size_on_disk_bytes__gte=2_500_000_000),
+    lambda q: q.where(TextFields.size_on_disk_bytes < 4_000_000_000.5),
+    lambda q: q.order_by("size_on_disk_bytes"),
+    lambda q: q.order_by("size_on_disk_bytes", descending=True),
+    lambda q: q.order_by("size_on_disk_bytes").offset(1).limit(3),
+    lambda q: q.order_by("size_on_disk_bytes", descending=True).limit(2),
+    lambda q: q.where(parameters_count__lt=70_000_000_000).order_by("parameters_count", descending=True).limit(3),
+    lambda q: q.order_by("name").limit(2),
+]
+
+
+class TestColumnarSnapshot:
+    """NumPy-backed columns must reproduce the pure-Python results exactly."""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self) -> None:
+        pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("build", COLUMNAR_QUERIES)
+    def test_columnar_queries_match_scan(
+        self,
+        sized_text_records: list[TextGenerationModelRecord],
+        build: Callable[[TextModelQuery], TextModelQuery],
+    ) -> None:
+        """Range filters and numeric ordering agree with the closure-only evaluation, ties and None included."""
+        plain, columnar = _columnar_text_pair(sized_text_records)
+        assert [r.name for r in build(columnar).to_list()] == [r.name for r in build(plain).to_list()]
+        assert build(columnar).to_list_with_total()[1] == build(plain).to_list_with_total()[1]
+
+    def test_range_predicates_are_exact(self, text_records: list[TextGenerationModelRecord]) -> None:
+        """With columns, range hints resolve exactly and are dropped from the residual predicates."""
+        index = RecordIndex(text_records, columnar=True)
+        positions, residual = plan_predicates(index, [TextFields.parameters_count > 10_000_000_000])
+
+        assert residual == []
+        assert positions == [4]
+
+    def test_histogram_matches_pure_python(self, sized_text_records: list[TextGenerationModelRecord]) -> None:
+        """Vectorized histograms skip None and out-of-range values exactly like the Python binning."""
+        plain, columnar = _columnar_text_pair(sized_text_records)
+        size = FieldRef("size_on_disk_bytes")
+        edges = [1_000_000_000, 2_500_000_000, 4_000_000_000]
+        expected = plain.histogram(size, edges)
+
+        assert expected == [1, 3]
+        assert columnar.histogram(size, edges) == expected
+        filtered = columnar.exclude_quantized().histogram(size, edges)
+        assert filtered == plain.exclude_quantized().histogram(size, edges)
+
+    def test_non_numeric_fields_have_no_column(self, text_records: list[TextGenerationModelRecord]) -> None:
+        """Fields that cannot be represented exactly fall back to the pure-Python path."""
+        columns = RecordIndex(text_records, columnar=True).columns
+
+        assert columns is not None
+        assert columns.column("name") is None
+        assert columns.column("nsfw") is None
+        assert columns.column("parameters_count") is not None
+
+    def test_columns_are_opt_in(self, text_records: list[TextGenerationModelRecord]) -> None:
+        """Indexes built without ``columnar=True`` keep the bucketed (superset) range planning."""
+        assert RecordIndex(text_records).columns is None
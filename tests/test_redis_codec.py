@@ -0,0 +1,101 @@
+"""Tests for the Redis value codec."""
+
+from __future__ import annotations
+
+import json
+import zlib
+from collections.abc import Callable
+
+import pytest
+
+from horde_model_reference import RedisSettings, redis_codec
+from horde_model_reference.redis_codec import CODEC_FORMAT_VERSION, RedisCodec, RedisCompression
+
+PAYLOAD = {"model": {"name": "model", "description": "x" * 2048, "nsfw": False, "size": 1.5}}
+
+
+class TestRedisCodec:
+    """Tests for encoding, framing and decoding."""
+
+    def test_default_codec_writes_plain_json(self) -> None:
+        """Without a serializer or compression configured, values stay plain JSON text."""
+        codec = RedisCodec()
+        encoded = codec.encode(PAYLOAD)
+
+        assert not codec.framed
+        assert json.loads(encoded) == PAYLOAD
+        assert codec.decode(encoded) == PAYLOAD
+
+    def test_decodes_plain_json_strings(self) -> None:
+        """Entries read with decode_responses=True or written before the codec existed decode as JSON."""
+        codec = RedisCodec(compression="zlib")
+        assert codec.decode(json.dumps(PAYLOAD)) == PAYLOAD
+        assert codec.decode(" [1, 2]") == [1, 2]
+
+    def test_compressed_payload_is_framed(self) -> None:
+        """Compressed values carry the version, serializer and compression bytes and round-trip."""
+        codec = RedisCodec(compression="zlib", min_compress_bytes=64)
+        encoded = codec.encode(PAYLOAD)
+
+        assert encoded[:3] == bytes((CODEC_FORMAT_VERSION, ord("j"), ord("z")))
+        assert len(encoded) < len(json.dumps(PAYLOAD))
+        assert json.loads(zlib.decompress(encoded[3:])) == PAYLOAD
+        assert codec.decode(encoded) == PAYLOAD
+
+    def test_small_values_are_not_compressed(self) -> None:
+        """Values under the threshold are framed without compression."""
+        codec = RedisCodec(compression="zlib", min_compress_bytes=1 << 20)
+        encoded = codec.encode({"a": 1})
+
+        assert encoded[2] == ord("n")
+        assert codec.decode(encoded) == {"a": 1}
+
+    def test_decoding_follows_the_header_not_the_settings(self) -> None:
+        """A plain-JSON codec still reads payloads written by a compressing one."""
+        encoded = RedisCodec(compression="zlib", min_compress_bytes=0).encode(PAYLOAD)
+        assert RedisCodec().decode(encoded) == PAYLOAD
+
+    def test_frame_decoders_are_resolved_once_per_codec(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Decoding many payloads of one kind does not rebuild the (de)compression functions each time."""
+        calls: list[str] = []
+        original = redis_codec._compression_functions
+
+        def counting(compression: RedisCompression) -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+            calls.append(compression)
+            return original(compression)
+
+        monkeypatch.setattr(redis_codec, "_compression_functions", counting)
+        codec = RedisCodec(compression="zlib", min_compress_bytes=0)
+        encoded = codec.encode(PAYLOAD)
+        calls.clear()
+
+        for _ in range(3):
+            assert codec.decode(encoded) == PAYLOAD
+        assert calls == ["zlib"]
+
+    def test_msgpack_round_trip(self) -> None:
+        """Payloads round-trip through msgpack when it is installed."""
+        pytest.importorskip("msgpack")
+        codec = RedisCodec(serializer="msgpack")
+        assert codec.decode(codec.encode(PAYLOAD)) == PAYLOAD
+
+    def test_unknown_format_version_is_rejected(self) -> None:
+        """Payloads framed by a newer format fail loudly instead of being misread."""
+        with pytest.raises(ValueError, match="format version"):
+            RedisCodec().decode(bytes((CODEC_FORMAT_VERSION + 1, ord("j"), ord("n"))) + b"{}")
+
+    def test_missing_optional_package_raises_import_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Configuring a codec whose package is missing names the package to install."""
+
+        def fail_import(name: str) -> None:
+            raise ImportError(name)
+
+        monkeypatch.setattr("horde_model_reference.redis_codec.importlib.import_module", fail_import)
+        with pytest.raises(ImportError, match="zstandard"):
+            RedisCodec(compression="zstd")
+
+    def test_from_settings(self) -> None:
+        """The codec is configured from RedisSettings."""
+        settings = RedisSettings(codec_compression="zlib", codec_min_compress_bytes=0)
+        encoded = RedisCodec.from_settings(settings).encode({"a": 1})
+        assert encoded[2] == ord("z")